@@ -7,7 +7,7 @@ from cryptography.hazmat.primitives import serialization
 from cryptography import x509
 from cryptography.x509.oid import NameOID
 from cryptography.hazmat.primitives import hashes
-from oci_cli import cli_constants, cli_util, cli_setup
+from oci_cli import cli_constants, cli_util, cli_setup, service_loader
 
 import click
 import datetime
@@ -39,6 +39,10 @@ vcr_log = logging.getLogger("vcr")
 vcr_log.setLevel(logging.INFO)
 
 
+# Services are normally loaded on demand, but many tests walk the whole command tree so load everything up front
+service_loader.load_all_services()
+
+
 if not os.path.exists(os.path.join('tests', 'temp')):
     os.makedirs(os.path.join('tests', 'temp'))
 
@@ -0,0 +1,62 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+# Compares writing a large list response with --output json (indented, sorted keys) and --output json-compact, showing
+# the time taken, the size of the output and the peak memory allocated while writing it.
+# Example run: python scripts/benchmarks/json_output_benchmark.py --count 50000
+
+from __future__ import print_function
+
+import argparse
+import os
+import timeit
+import tracemalloc
+
+from oci_cli import cli_util
+
+from to_dict_benchmark import build_audit_event, build_instance
+
+
+class CountingStream(object):
+    def __init__(self):
+        self.size = 0
+
+    def write(self, data):
+        self.size += len(data)
+
+
+def write_json(data, stream):
+    stream.write(cli_util.pretty_print_format(data) + '\n')
+
+
+def measure(write, data, repeat):
+    stream = CountingStream()
+    write(data, stream)
+
+    with open(os.devnull, 'w') as devnull:
+        elapsed = min(timeit.repeat(lambda: write(data, devnull), number=1, repeat=repeat))
+
+    tracemalloc.start()
+    write(data, CountingStream())
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return elapsed, stream.size, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks --output json against --output json-compact')
+    parser.add_argument('--count', type=int, default=50000, help='The number of items in each list')
+    parser.add_argument('--repeat', type=int, default=3, help='The number of times each output is timed (the best time is shown)')
+    args = parser.parse_args()
+
+    mebibyte = 1024.0 * 1024
+    for name, build in [('Instance', build_instance), ('AuditEvent', build_audit_event)]:
+        data = {'data': cli_util.to_dict([build(i) for i in range(args.count)])}
+        for output, write in [('json', write_json), ('json-compact', cli_util.write_json_compact)]:
+            elapsed, size, peak = measure(write, data, args.repeat)
+            print('{:<11} {:>7} items  {:<13} time: {:7.3f}s   size: {:8.1f} MiB   peak memory: {:8.1f} MiB'.format(
+                name, args.count, output, elapsed, size / mebibyte, peak / mebibyte))
+
+
+if __name__ == '__main__':
+    main()
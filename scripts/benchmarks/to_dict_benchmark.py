@@ -0,0 +1,124 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+# Times cli_util.to_dict over lists of representative SDK models, and compares it with a generic conversion which
+# inspects every value (the way to_dict worked before it cached a field plan for each model class).
+# Example run: python scripts/benchmarks/to_dict_benchmark.py --count 50000
+
+from __future__ import print_function
+
+import argparse
+import datetime
+import timeit
+
+import pytz
+import six
+from oci import audit, core, object_storage
+from oci_cli import cli_util
+
+try:
+    import collections.abc as abc
+except ImportError:
+    import collections as abc
+
+
+def generic_to_dict(obj):
+    if isinstance(obj, six.string_types):
+        return obj
+    elif isinstance(obj, (datetime.datetime, datetime.time)):
+        if not obj.tzinfo:
+            obj = pytz.utc.localize(obj)
+        if isinstance(obj, datetime.datetime):
+            return obj.isoformat(sep="T")
+        return obj.isoformat()
+    elif isinstance(obj, datetime.date):
+        return obj.isoformat()
+    elif isinstance(obj, abc.Mapping):
+        return {k: generic_to_dict(v) for k, v in six.iteritems(obj)}
+    elif isinstance(obj, abc.Iterable):
+        return [generic_to_dict(v) for v in obj]
+    elif not hasattr(obj, "swagger_types"):
+        return obj
+
+    as_dict = {}
+    for key in six.iterkeys(obj.swagger_types):
+        value = getattr(obj, key, cli_util.missing_attr)
+        if value is not cli_util.missing_attr:
+            as_dict[key.replace("_", "-")] = generic_to_dict(value)
+    return as_dict
+
+
+def build_instance(i):
+    return core.models.Instance(
+        id='ocid1.instance.oc1.phx.{}'.format(i),
+        availability_domain='Uocm:PHX-AD-1',
+        compartment_id='ocid1.compartment.oc1..aaaaaaaa',
+        display_name='instance-{}'.format(i),
+        defined_tags={'Operations': {'CostCenter': '42'}},
+        freeform_tags={'Department': 'Finance'},
+        image_id='ocid1.image.oc1.phx.aaaaaaaa',
+        launch_mode='NATIVE',
+        launch_options=core.models.LaunchOptions(boot_volume_type='PARAVIRTUALIZED', firmware='UEFI_64', network_type='VFIO', remote_data_volume_type='PARAVIRTUALIZED', is_pv_encryption_in_transit_enabled=False, is_consistent_volume_naming_enabled=True),
+        lifecycle_state='RUNNING',
+        metadata={'ssh_authorized_keys': 'ssh-rsa AAAA'},
+        region='phx',
+        shape='VM.Standard2.1',
+        source_details=core.models.InstanceSourceViaImageDetails(source_type='image', image_id='ocid1.image.oc1.phx.aaaaaaaa', boot_volume_size_in_gbs=50),
+        time_created=datetime.datetime(2019, 11, 12, 10, 30, i % 60)
+    )
+
+
+def build_audit_event(i):
+    return audit.models.AuditEvent(
+        event_type='com.oraclecloud.computeApi.GetInstance',
+        cloud_events_version='0.1',
+        event_type_version='2.0',
+        source='ComputeApi',
+        event_id='event-{}'.format(i),
+        event_time=datetime.datetime(2019, 11, 12, 10, 30, i % 60, tzinfo=pytz.utc),
+        content_type='application/json',
+        data=audit.models.Data(
+            event_grouping_id='group-{}'.format(i),
+            event_name='GetInstance',
+            compartment_id='ocid1.compartment.oc1..aaaaaaaa',
+            compartment_name='compartment',
+            resource_name='instance',
+            resource_id='ocid1.instance.oc1.phx.{}'.format(i),
+            availability_domain='Uocm:PHX-AD-1',
+            freeform_tags={},
+            defined_tags={},
+            identity=audit.models.Identity(principal_name='user', principal_id='ocid1.user.oc1..aaaaaaaa', auth_type='natv', caller_name='caller', caller_id='ocid1.user.oc1..aaaaaaaa', tenant_id='ocid1.tenancy.oc1..aaaaaaaa', ip_address='10.0.0.1', credentials='credentials', user_agent='Oracle-PythonSDK', console_session_id=None),
+            request=audit.models.Request(id='request-{}'.format(i), path='/20160918/instances/', action='GET', parameters={'limit': ['100']}, headers={'opc-request-id': ['id']}),
+            response=audit.models.Response(status='200', response_time=datetime.datetime(2019, 11, 12, 10, 30, 1, tzinfo=pytz.utc), headers={'Content-Type': ['application/json']}, payload={}, message=None),
+            state_change=audit.models.StateChange(previous=None, current=None),
+            additional_details={}
+        )
+    )
+
+
+def build_object_summary(i):
+    return object_storage.models.ObjectSummary(
+        name='path/to/object-{}.dat'.format(i),
+        size=1024 * i,
+        md5='1B2M2Y8AsgTpgAmY7PhCfg==',
+        time_created=datetime.datetime(2019, 11, 12, 10, 30, i % 60, tzinfo=pytz.utc)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks cli_util.to_dict')
+    parser.add_argument('--count', type=int, default=50000, help='The number of models in each list')
+    parser.add_argument('--repeat', type=int, default=3, help='The number of times each conversion is timed (the best time is shown)')
+    args = parser.parse_args()
+
+    for name, build in [('Instance', build_instance), ('AuditEvent', build_audit_event), ('ObjectSummary', build_object_summary)]:
+        models = [build(i) for i in range(args.count)]
+        assert cli_util.to_dict(models) == generic_to_dict(models)
+
+        generic_time = min(timeit.repeat(lambda: generic_to_dict(models), number=1, repeat=args.repeat))
+        to_dict_time = min(timeit.repeat(lambda: cli_util.to_dict(models), number=1, repeat=args.repeat))
+        print('{:<14} {:>8} models   generic: {:7.3f}s   to_dict: {:7.3f}s   speedup: {:4.2f}x'.format(
+            name, args.count, generic_time, to_dict_time, generic_time / to_dict_time))
+
+
+if __name__ == '__main__':
+    main()
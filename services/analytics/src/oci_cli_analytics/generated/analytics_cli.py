@@ -357,6 +357,7 @@ def list_analytics_instances(ctx, from_json, all_pages, page_size, compartment_i
 
         result = cli_util.list_call_get_all_results(
             client.list_analytics_instances,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -410,6 +411,7 @@ def list_work_request_errors(ctx, from_json, all_pages, page_size, work_request_
 
         result = cli_util.list_call_get_all_results(
             client.list_work_request_errors,
+            stream_items=True,
             work_request_id=work_request_id,
             **kwargs
         )
@@ -463,6 +465,7 @@ def list_work_request_logs(ctx, from_json, all_pages, page_size, work_request_id
 
         result = cli_util.list_call_get_all_results(
             client.list_work_request_logs,
+            stream_items=True,
             work_request_id=work_request_id,
             **kwargs
         )
@@ -528,6 +531,7 @@ def list_work_requests(ctx, from_json, all_pages, page_size, compartment_id, res
 
         result = cli_util.list_call_get_all_results(
             client.list_work_requests,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -144,6 +144,7 @@ def list_announcements(ctx, from_json, all_pages, page_size, compartment_id, lim
 
         result = cli_util.list_call_get_all_results(
             client.list_announcements,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
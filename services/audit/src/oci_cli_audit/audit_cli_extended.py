@@ -65,6 +65,7 @@ def list_events(ctx, from_json, all_pages, compartment_id, start_time, end_time,
         result = cli_util.list_call_get_all_results(
             client.list_events,
             stream_output=stream_output,
+            stream_items=True,
             ctx=ctx,
             is_json=True,
             compartment_id=compartment_id,
@@ -83,6 +83,7 @@ def list_events(ctx, from_json, all_pages, compartment_id, start_time, end_time,
     if all_pages:
         result = cli_util.list_call_get_all_results(
             client.list_events,
+            stream_items=True,
             compartment_id=compartment_id,
             start_time=start_time,
             end_time=end_time,
@@ -392,6 +392,7 @@ def list_auto_scaling_configurations(ctx, from_json, all_pages, page_size, compa
 
         result = cli_util.list_call_get_all_results(
             client.list_auto_scaling_configurations,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -452,6 +453,7 @@ def list_auto_scaling_policies(ctx, from_json, all_pages, page_size, auto_scalin
 
         result = cli_util.list_call_get_all_results(
             client.list_auto_scaling_policies,
+            stream_items=True,
             auto_scaling_configuration_id=auto_scaling_configuration_id,
             **kwargs
         )
@@ -392,6 +392,7 @@ def list_alert_rules(ctx, from_json, all_pages, page_size, budget_id, limit, pag
 
         result = cli_util.list_call_get_all_results(
             client.list_alert_rules,
+            stream_items=True,
             budget_id=budget_id,
             **kwargs
         )
@@ -463,6 +464,7 @@ def list_budgets(ctx, from_json, all_pages, page_size, compartment_id, limit, pa
 
         result = cli_util.list_call_get_all_results(
             client.list_budgets,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -6,16 +6,24 @@ from services.container_engine.src.oci_cli_container_engine.generated import con
 from oci_cli import json_skeleton_utils
 from oci_cli import custom_types  # noqa: F401
 from oci_cli import cli_constants  # noqa: F401
+from oci_cli.token_cache import TokenCache
 from oci._vendor.requests import Request
-from oci.auth.signers import InstancePrincipalsDelegationTokenSigner
 import click
 import six
 import os
 import yaml
 import base64
+import calendar
+import time
 from datetime import datetime, timedelta
 
 DEFAULT_KUBECONFIG_LOCATION = os.path.join('~', '.kube', 'config')
+
+EXEC_CREDENTIAL_CACHE_CATEGORY = 'exec_credential'
+
+# Cached ExecCredentials are reused until they are this close to their expirationTimestamp
+EXEC_CREDENTIAL_EXPIRY_MARGIN_SECONDS = 30
+
 cli_util.rename_command(containerengine_cli, containerengine_cli.work_request_log_entry_group, containerengine_cli.list_work_request_logs,
                         "list")
 
@@ -32,6 +40,45 @@ def generate_token(ctx, from_json, cluster_id):
     if isinstance(cluster_id, six.string_types) and len(cluster_id.strip()) == 0:
         raise click.UsageError('Parameter --cluster-id cannot be whitespace or empty string')
 
+    # kubectl runs this command as an exec plugin, often several times per kubectl command. Reuse a previously
+    # generated ExecCredential while it is still valid, which avoids loading the config and private key and
+    # building a client.
+    def fetch():
+        exec_credential, expiration = build_exec_credential(ctx, cluster_id)
+        return {'exec_credential': exec_credential, 'expiration': calendar.timegm(expiration.utctimetuple())}
+
+    def is_valid(entry):
+        return entry['expiration'] - time.time() > EXEC_CREDENTIAL_EXPIRY_MARGIN_SECONDS
+
+    entry = TokenCache().get(EXEC_CREDENTIAL_CACHE_CATEGORY, get_exec_credential_cache_key(ctx, cluster_id), fetch, is_valid)
+    click.echo(entry['exec_credential'])
+
+
+def get_exec_credential_cache_key(ctx, cluster_id):
+    """Returns the token cache key for an ExecCredential, built from the command line options and the environment
+    without reading the config file. The modification time of the config file is included so that changes to the
+    profile (e.g. a new key or region) are picked up."""
+    config_file = os.path.abspath(os.path.expanduser(ctx.obj['config_file']))
+    try:
+        config_file_mtime = os.stat(config_file).st_mtime
+    except OSError:
+        config_file_mtime = None
+
+    return {
+        'cluster_id': cluster_id,
+        'config_file': config_file,
+        'config_file_mtime': config_file_mtime,
+        'profile': ctx.obj['profile'],
+        'region': ctx.obj['region'],
+        'endpoint': ctx.obj['endpoint'],
+        'cert_bundle': ctx.obj['cert_bundle'],
+        'auth': ctx.obj['auth'],
+        'env': {env: os.environ.get(env) for env in cli_constants.OCI_CONFIG_ENV_VARS}
+    }
+
+
+def build_exec_credential(ctx, cluster_id):
+    """Returns the ExecCredential JSON for the cluster, and the time at which Kubernetes should ask for a new one."""
     client = cli_util.build_client('container_engine', ctx)
     signer = client.base_client.signer
 
@@ -52,7 +99,8 @@ def generate_token(ctx, from_json, cluster_id):
         "date": request.headers["date"],
     }
 
-    if isinstance(signer, InstancePrincipalsDelegationTokenSigner):
+    # Set by both the SDK's InstancePrincipalsDelegationTokenSigner and the CLI's cached instance principals signer
+    if getattr(signer, 'delegation_token', None):
         header_params['opc-obo-token'] = signer.delegation_token
 
     token_request = Request(
@@ -68,7 +116,8 @@ def generate_token(ctx, from_json, cluster_id):
     # Get now+4 minutes in RFC3339 format.
     # This informs Kubernetes SDK/CLIs that it's time to refresh the token
     # before the token is actually expired.
-    expiration_timestamp = (datetime.utcnow() + timedelta(minutes=4)).isoformat('T') + "Z"
+    expiration = datetime.utcnow() + timedelta(minutes=4)
+    expiration_timestamp = expiration.isoformat('T') + "Z"
 
     exec_credential = """
 {
@@ -80,7 +129,7 @@ def generate_token(ctx, from_json, cluster_id):
     }
 }
     """ % (token, expiration_timestamp)
-    click.echo(exec_credential)
+    return exec_credential, expiration
 
 
 containerengine_cli.cluster_group.add_command(generate_token)
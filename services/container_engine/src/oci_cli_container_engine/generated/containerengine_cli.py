@@ -562,6 +562,7 @@ def list_clusters(ctx, from_json, all_pages, page_size, compartment_id, lifecycl
 
         result = cli_util.list_call_get_all_results(
             client.list_clusters,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -622,6 +623,7 @@ def list_node_pools(ctx, from_json, all_pages, page_size, compartment_id, cluste
 
         result = cli_util.list_call_get_all_results(
             client.list_node_pools,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -738,6 +740,7 @@ def list_work_requests(ctx, from_json, all_pages, page_size, compartment_id, clu
 
         result = cli_util.list_call_get_all_results(
             client.list_work_requests,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -4,11 +4,23 @@
 import unittest
 from tests import util
 import json
+import mock
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
 
 
 class TestGenerateToken(unittest.TestCase):
     def setUp(self):
-        pass
+        self.cache_dir = tempfile.mkdtemp()
+        self.env_patch = mock.patch.dict(os.environ, {'OCI_CLI_TOKEN_CACHE_DIR': self.cache_dir})
+        self.env_patch.start()
+
+    def tearDown(self):
+        self.env_patch.stop()
+        shutil.rmtree(self.cache_dir)
 
     def test_missing_cluster_id(self):
         result = util.invoke_command(['ce', 'cluster', 'generate-token'])
@@ -22,3 +34,27 @@ class TestGenerateToken(unittest.TestCase):
         assert exec_credential['kind'] == "ExecCredential"
         assert exec_credential['status']['token']
         assert exec_credential['status']['expirationTimestamp']
+
+    @mock.patch('services.container_engine.src.oci_cli_container_engine.containerengine_cli_extended.build_exec_credential')
+    def test_exec_credential_reused_until_close_to_expiry(self, build_exec_credential):
+        build_exec_credential.side_effect = lambda ctx, cluster_id: ('{"token": "%s"}' % build_exec_credential.call_count, datetime.utcnow() + timedelta(minutes=4))
+
+        first = util.invoke_command(['ce', 'cluster', 'generate-token', '--cluster-id', 'fakeocid'])
+        second = util.invoke_command(['ce', 'cluster', 'generate-token', '--cluster-id', 'fakeocid'])
+        assert json.loads(first.output) == json.loads(second.output) == {'token': '1'}
+        assert build_exec_credential.call_count == 1
+
+        # Other clusters get their own credential
+        other = util.invoke_command(['ce', 'cluster', 'generate-token', '--cluster-id', 'otherocid'])
+        assert json.loads(other.output) == {'token': '2'}
+
+        # As do other endpoints and cert bundles
+        other_endpoint = util.invoke_command(['ce', 'cluster', 'generate-token', '--cluster-id', 'fakeocid', '--endpoint', 'https://containerengine.example.com'])
+        other_cert_bundle = util.invoke_command(['ce', 'cluster', 'generate-token', '--cluster-id', 'fakeocid', '--cert-bundle', '/path/to/bundle.pem'])
+        assert json.loads(other_endpoint.output) == {'token': '3'}
+        assert json.loads(other_cert_bundle.output) == {'token': '4'}
+
+        # Credentials within the expiry margin are regenerated
+        with mock.patch('time.time', return_value=time.time() + 4 * 60):
+            refreshed = util.invoke_command(['ce', 'cluster', 'generate-token', '--cluster-id', 'fakeocid'])
+        assert json.loads(refreshed.output) == {'token': '5'}
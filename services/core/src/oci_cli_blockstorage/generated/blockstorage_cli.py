@@ -2238,6 +2238,7 @@ def list_boot_volume_backups(ctx, from_json, all_pages, page_size, compartment_i
 
         result = cli_util.list_call_get_all_results(
             client.list_boot_volume_backups,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -2293,6 +2294,7 @@ def list_boot_volumes(ctx, from_json, all_pages, page_size, availability_domain,
 
         result = cli_util.list_call_get_all_results(
             client.list_boot_volumes,
+            stream_items=True,
             availability_domain=availability_domain,
             compartment_id=compartment_id,
             **kwargs
@@ -2347,6 +2349,7 @@ def list_volume_backup_policies(ctx, from_json, all_pages, page_size, limit, pag
 
         result = cli_util.list_call_get_all_results(
             client.list_volume_backup_policies,
+            stream_items=True,
             **kwargs
         )
     elif limit is not None:
@@ -2413,6 +2416,7 @@ def list_volume_backups(ctx, from_json, all_pages, page_size, compartment_id, vo
 
         result = cli_util.list_call_get_all_results(
             client.list_volume_backups,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -2476,6 +2480,7 @@ def list_volume_group_backups(ctx, from_json, all_pages, page_size, compartment_
 
         result = cli_util.list_call_get_all_results(
             client.list_volume_group_backups,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -2546,6 +2551,7 @@ def list_volume_groups(ctx, from_json, all_pages, page_size, compartment_id, ava
 
         result = cli_util.list_call_get_all_results(
             client.list_volume_groups,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -2619,6 +2625,7 @@ def list_volumes(ctx, from_json, all_pages, page_size, compartment_id, availabil
 
         result = cli_util.list_call_get_all_results(
             client.list_volumes,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
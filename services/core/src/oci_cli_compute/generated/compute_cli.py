@@ -2923,6 +2923,7 @@ def list_app_catalog_listing_resource_versions(ctx, from_json, all_pages, page_s
 
         result = cli_util.list_call_get_all_results(
             client.list_app_catalog_listing_resource_versions,
+            stream_items=True,
             listing_id=listing_id,
             **kwargs
         )
@@ -2983,6 +2984,7 @@ def list_app_catalog_listings(ctx, from_json, all_pages, page_size, limit, page,
 
         result = cli_util.list_call_get_all_results(
             client.list_app_catalog_listings,
+            stream_items=True,
             **kwargs
         )
     elif limit is not None:
@@ -3040,6 +3042,7 @@ def list_app_catalog_subscriptions(ctx, from_json, all_pages, page_size, compart
 
         result = cli_util.list_call_get_all_results(
             client.list_app_catalog_subscriptions,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -3098,6 +3101,7 @@ def list_boot_volume_attachments(ctx, from_json, all_pages, page_size, availabil
 
         result = cli_util.list_call_get_all_results(
             client.list_boot_volume_attachments,
+            stream_items=True,
             availability_domain=availability_domain,
             compartment_id=compartment_id,
             **kwargs
@@ -3171,6 +3175,7 @@ def list_console_histories(ctx, from_json, all_pages, page_size, compartment_id,
 
         result = cli_util.list_call_get_all_results(
             client.list_console_histories,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -3229,6 +3234,7 @@ def list_dedicated_vm_host_instance_shapes(ctx, from_json, all_pages, page_size,
 
         result = cli_util.list_call_get_all_results(
             client.list_dedicated_vm_host_instance_shapes,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -3298,6 +3304,7 @@ def list_dedicated_vm_host_instances(ctx, from_json, all_pages, page_size, compa
 
         result = cli_util.list_call_get_all_results(
             client.list_dedicated_vm_host_instances,
+            stream_items=True,
             compartment_id=compartment_id,
             dedicated_vm_host_id=dedicated_vm_host_id,
             **kwargs
@@ -3359,6 +3366,7 @@ def list_dedicated_vm_host_shapes(ctx, from_json, all_pages, page_size, compartm
 
         result = cli_util.list_call_get_all_results(
             client.list_dedicated_vm_host_shapes,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -3435,6 +3443,7 @@ def list_dedicated_vm_hosts(ctx, from_json, all_pages, page_size, compartment_id
 
         result = cli_util.list_call_get_all_results(
             client.list_dedicated_vm_hosts,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -3513,6 +3522,7 @@ def list_images(ctx, from_json, all_pages, page_size, compartment_id, display_na
 
         result = cli_util.list_call_get_all_results(
             client.list_images,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -3567,6 +3577,7 @@ def list_instance_console_connections(ctx, from_json, all_pages, page_size, comp
 
         result = cli_util.list_call_get_all_results(
             client.list_instance_console_connections,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -3634,6 +3645,7 @@ def list_instance_devices(ctx, from_json, all_pages, page_size, instance_id, is_
 
         result = cli_util.list_call_get_all_results(
             client.list_instance_devices,
+            stream_items=True,
             instance_id=instance_id,
             **kwargs
         )
@@ -3704,6 +3716,7 @@ def list_instances(ctx, from_json, all_pages, page_size, compartment_id, availab
 
         result = cli_util.list_call_get_all_results(
             client.list_instances,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -3761,6 +3774,7 @@ def list_shapes(ctx, from_json, all_pages, page_size, compartment_id, availabili
 
         result = cli_util.list_call_get_all_results(
             client.list_shapes,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -3821,6 +3835,7 @@ def list_vnic_attachments(ctx, from_json, all_pages, page_size, compartment_id,
 
         result = cli_util.list_call_get_all_results(
             client.list_vnic_attachments,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -3883,6 +3898,7 @@ def list_volume_attachments(ctx, from_json, all_pages, page_size, compartment_id
 
         result = cli_util.list_call_get_all_results(
             client.list_volume_attachments,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
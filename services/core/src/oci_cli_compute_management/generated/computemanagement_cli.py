@@ -793,6 +793,7 @@ def list_cluster_network_instances(ctx, from_json, all_pages, page_size, compart
 
         result = cli_util.list_call_get_all_results(
             client.list_cluster_network_instances,
+            stream_items=True,
             compartment_id=compartment_id,
             cluster_network_id=cluster_network_id,
             **kwargs
@@ -859,6 +860,7 @@ def list_cluster_networks(ctx, from_json, all_pages, page_size, compartment_id,
 
         result = cli_util.list_call_get_all_results(
             client.list_cluster_networks,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -916,6 +918,7 @@ def list_instance_configurations(ctx, from_json, all_pages, page_size, compartme
 
         result = cli_util.list_call_get_all_results(
             client.list_instance_configurations,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -980,6 +983,7 @@ def list_instance_pool_instances(ctx, from_json, all_pages, page_size, compartme
 
         result = cli_util.list_call_get_all_results(
             client.list_instance_pool_instances,
+            stream_items=True,
             compartment_id=compartment_id,
             instance_pool_id=instance_pool_id,
             **kwargs
@@ -1046,6 +1050,7 @@ def list_instance_pools(ctx, from_json, all_pages, page_size, compartment_id, di
 
         result = cli_util.list_call_get_all_results(
             client.list_instance_pools,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
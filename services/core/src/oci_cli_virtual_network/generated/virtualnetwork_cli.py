@@ -4904,6 +4904,7 @@ def list_cpes(ctx, from_json, all_pages, page_size, compartment_id, limit, page)
 
         result = cli_util.list_call_get_all_results(
             client.list_cpes,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -4967,6 +4968,7 @@ def list_cross_connect_groups(ctx, from_json, all_pages, page_size, compartment_
 
         result = cli_util.list_call_get_all_results(
             client.list_cross_connect_groups,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -5016,6 +5018,7 @@ def list_cross_connect_locations(ctx, from_json, all_pages, page_size, compartme
 
         result = cli_util.list_call_get_all_results(
             client.list_cross_connect_locations,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -5082,6 +5085,7 @@ def list_cross_connects(ctx, from_json, all_pages, page_size, compartment_id, cr
 
         result = cli_util.list_call_get_all_results(
             client.list_cross_connects,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -5131,6 +5135,7 @@ def list_crossconnect_port_speed_shapes(ctx, from_json, all_pages, page_size, co
 
         result = cli_util.list_call_get_all_results(
             client.list_crossconnect_port_speed_shapes,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -5195,6 +5200,7 @@ def list_dhcp_options(ctx, from_json, all_pages, page_size, compartment_id, vcn_
 
         result = cli_util.list_call_get_all_results(
             client.list_dhcp_options,
+            stream_items=True,
             compartment_id=compartment_id,
             vcn_id=vcn_id,
             **kwargs
@@ -5253,6 +5259,7 @@ def list_drg_attachments(ctx, from_json, all_pages, page_size, compartment_id, v
 
         result = cli_util.list_call_get_all_results(
             client.list_drg_attachments,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -5302,6 +5309,7 @@ def list_drgs(ctx, from_json, all_pages, page_size, compartment_id, limit, page)
 
         result = cli_util.list_call_get_all_results(
             client.list_drgs,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -5355,6 +5363,7 @@ def list_fast_connect_provider_services(ctx, from_json, all_pages, page_size, co
 
         result = cli_util.list_call_get_all_results(
             client.list_fast_connect_provider_services,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -5409,6 +5418,7 @@ def list_fast_connect_provider_virtual_circuit_bandwidth_shapes(ctx, from_json,
 
         result = cli_util.list_call_get_all_results(
             client.list_fast_connect_provider_virtual_circuit_bandwidth_shapes,
+            stream_items=True,
             provider_service_id=provider_service_id,
             **kwargs
         )
@@ -5473,6 +5483,7 @@ def list_internet_gateways(ctx, from_json, all_pages, page_size, compartment_id,
 
         result = cli_util.list_call_get_all_results(
             client.list_internet_gateways,
+            stream_items=True,
             compartment_id=compartment_id,
             vcn_id=vcn_id,
             **kwargs
@@ -5528,6 +5539,7 @@ def list_ip_sec_connection_tunnels(ctx, from_json, all_pages, page_size, ipsc_id
 
         result = cli_util.list_call_get_all_results(
             client.list_ip_sec_connection_tunnels,
+            stream_items=True,
             ipsc_id=ipsc_id,
             **kwargs
         )
@@ -5583,6 +5595,7 @@ def list_ip_sec_connections(ctx, from_json, all_pages, page_size, compartment_id
 
         result = cli_util.list_call_get_all_results(
             client.list_ip_sec_connections,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -5643,6 +5656,7 @@ def list_ipv6s(ctx, from_json, all_pages, page_size, limit, page, ip_address, su
 
         result = cli_util.list_call_get_all_results(
             client.list_ipv6s,
+            stream_items=True,
             **kwargs
         )
     elif limit is not None:
@@ -5690,6 +5704,7 @@ def list_local_peering_gateways(ctx, from_json, all_pages, page_size, compartmen
 
         result = cli_util.list_call_get_all_results(
             client.list_local_peering_gateways,
+            stream_items=True,
             compartment_id=compartment_id,
             vcn_id=vcn_id,
             **kwargs
@@ -5759,6 +5774,7 @@ def list_nat_gateways(ctx, from_json, all_pages, page_size, compartment_id, vcn_
 
         result = cli_util.list_call_get_all_results(
             client.list_nat_gateways,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -5820,6 +5836,7 @@ def list_network_security_group_security_rules(ctx, from_json, all_pages, page_s
 
         result = cli_util.list_call_get_all_results(
             client.list_network_security_group_security_rules,
+            stream_items=True,
             network_security_group_id=network_security_group_id,
             **kwargs
         )
@@ -5878,6 +5895,7 @@ def list_network_security_group_vnics(ctx, from_json, all_pages, page_size, netw
 
         result = cli_util.list_call_get_all_results(
             client.list_network_security_group_vnics,
+            stream_items=True,
             network_security_group_id=network_security_group_id,
             **kwargs
         )
@@ -5944,6 +5962,7 @@ def list_network_security_groups(ctx, from_json, all_pages, page_size, compartme
 
         result = cli_util.list_call_get_all_results(
             client.list_network_security_groups,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -6005,6 +6024,7 @@ def list_private_ips(ctx, from_json, all_pages, page_size, limit, page, ip_addre
 
         result = cli_util.list_call_get_all_results(
             client.list_private_ips,
+            stream_items=True,
             **kwargs
         )
     elif limit is not None:
@@ -6072,6 +6092,7 @@ def list_public_ips(ctx, from_json, all_pages, page_size, scope, compartment_id,
 
         result = cli_util.list_call_get_all_results(
             client.list_public_ips,
+            stream_items=True,
             scope=scope,
             compartment_id=compartment_id,
             **kwargs
@@ -6127,6 +6148,7 @@ def list_remote_peering_connections(ctx, from_json, all_pages, page_size, compar
 
         result = cli_util.list_call_get_all_results(
             client.list_remote_peering_connections,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -6191,6 +6213,7 @@ def list_route_tables(ctx, from_json, all_pages, page_size, compartment_id, vcn_
 
         result = cli_util.list_call_get_all_results(
             client.list_route_tables,
+            stream_items=True,
             compartment_id=compartment_id,
             vcn_id=vcn_id,
             **kwargs
@@ -6258,6 +6281,7 @@ def list_security_lists(ctx, from_json, all_pages, page_size, compartment_id, vc
 
         result = cli_util.list_call_get_all_results(
             client.list_security_lists,
+            stream_items=True,
             compartment_id=compartment_id,
             vcn_id=vcn_id,
             **kwargs
@@ -6324,6 +6348,7 @@ def list_service_gateways(ctx, from_json, all_pages, page_size, compartment_id,
 
         result = cli_util.list_call_get_all_results(
             client.list_service_gateways,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -6372,6 +6397,7 @@ def list_services(ctx, from_json, all_pages, page_size, limit, page):
 
         result = cli_util.list_call_get_all_results(
             client.list_services,
+            stream_items=True,
             **kwargs
         )
     elif limit is not None:
@@ -6433,6 +6459,7 @@ def list_subnets(ctx, from_json, all_pages, page_size, compartment_id, vcn_id, l
 
         result = cli_util.list_call_get_all_results(
             client.list_subnets,
+            stream_items=True,
             compartment_id=compartment_id,
             vcn_id=vcn_id,
             **kwargs
@@ -6499,6 +6526,7 @@ def list_vcns(ctx, from_json, all_pages, page_size, compartment_id, limit, page,
 
         result = cli_util.list_call_get_all_results(
             client.list_vcns,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -6548,6 +6576,7 @@ def list_virtual_circuit_bandwidth_shapes(ctx, from_json, all_pages, page_size,
 
         result = cli_util.list_call_get_all_results(
             client.list_virtual_circuit_bandwidth_shapes,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -6636,6 +6665,7 @@ def list_virtual_circuits(ctx, from_json, all_pages, page_size, compartment_id,
 
         result = cli_util.list_call_get_all_results(
             client.list_virtual_circuits,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -4206,6 +4206,7 @@ def list_autonomous_container_databases(ctx, from_json, all_pages, page_size, co
 
         result = cli_util.list_call_get_all_results(
             client.list_autonomous_container_databases,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -4272,6 +4273,7 @@ def list_autonomous_data_warehouse_backups(ctx, from_json, all_pages, page_size,
 
         result = cli_util.list_call_get_all_results(
             client.list_autonomous_data_warehouse_backups,
+            stream_items=True,
             **kwargs
         )
     elif limit is not None:
@@ -4330,6 +4332,7 @@ def list_autonomous_data_warehouses(ctx, from_json, all_pages, page_size, compar
 
         result = cli_util.list_call_get_all_results(
             client.list_autonomous_data_warehouses,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -4397,6 +4400,7 @@ def list_autonomous_database_backups(ctx, from_json, all_pages, page_size, auton
 
         result = cli_util.list_call_get_all_results(
             client.list_autonomous_database_backups,
+            stream_items=True,
             **kwargs
         )
     elif limit is not None:
@@ -4465,6 +4469,7 @@ def list_autonomous_databases(ctx, from_json, all_pages, page_size, compartment_
 
         result = cli_util.list_call_get_all_results(
             client.list_autonomous_databases,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -4521,6 +4526,7 @@ def list_autonomous_db_preview_versions(ctx, from_json, all_pages, page_size, co
 
         result = cli_util.list_call_get_all_results(
             client.list_autonomous_db_preview_versions,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -4570,6 +4576,7 @@ def list_autonomous_exadata_infrastructure_shapes(ctx, from_json, all_pages, pag
 
         result = cli_util.list_call_get_all_results(
             client.list_autonomous_exadata_infrastructure_shapes,
+            stream_items=True,
             availability_domain=availability_domain,
             compartment_id=compartment_id,
             **kwargs
@@ -4639,6 +4646,7 @@ def list_autonomous_exadata_infrastructures(ctx, from_json, all_pages, page_size
 
         result = cli_util.list_call_get_all_results(
             client.list_autonomous_exadata_infrastructures,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -4690,6 +4698,7 @@ def list_backup_destination(ctx, from_json, all_pages, page_size, compartment_id
 
         result = cli_util.list_call_get_all_results(
             client.list_backup_destination,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -4742,6 +4751,7 @@ def list_backups(ctx, from_json, all_pages, page_size, database_id, compartment_
 
         result = cli_util.list_call_get_all_results(
             client.list_backups,
+            stream_items=True,
             **kwargs
         )
     elif limit is not None:
@@ -4789,6 +4799,7 @@ def list_data_guard_associations(ctx, from_json, all_pages, page_size, database_
 
         result = cli_util.list_call_get_all_results(
             client.list_data_guard_associations,
+            stream_items=True,
             database_id=database_id,
             **kwargs
         )
@@ -4849,6 +4860,7 @@ def list_databases(ctx, from_json, all_pages, page_size, compartment_id, db_home
 
         result = cli_util.list_call_get_all_results(
             client.list_databases,
+            stream_items=True,
             compartment_id=compartment_id,
             db_home_id=db_home_id,
             **kwargs
@@ -4902,6 +4914,7 @@ def list_db_home_patch_history_entries(ctx, from_json, all_pages, page_size, db_
 
         result = cli_util.list_call_get_all_results(
             client.list_db_home_patch_history_entries,
+            stream_items=True,
             db_home_id=db_home_id,
             **kwargs
         )
@@ -4952,6 +4965,7 @@ def list_db_home_patches(ctx, from_json, all_pages, page_size, db_home_id, limit
 
         result = cli_util.list_call_get_all_results(
             client.list_db_home_patches,
+            stream_items=True,
             db_home_id=db_home_id,
             **kwargs
         )
@@ -5017,6 +5031,7 @@ def list_db_homes(ctx, from_json, all_pages, page_size, compartment_id, db_syste
 
         result = cli_util.list_call_get_all_results(
             client.list_db_homes,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -5079,6 +5094,7 @@ def list_db_nodes(ctx, from_json, all_pages, page_size, compartment_id, db_syste
 
         result = cli_util.list_call_get_all_results(
             client.list_db_nodes,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -5129,6 +5145,7 @@ def list_db_system_patch_history_entries(ctx, from_json, all_pages, page_size, d
 
         result = cli_util.list_call_get_all_results(
             client.list_db_system_patch_history_entries,
+            stream_items=True,
             db_system_id=db_system_id,
             **kwargs
         )
@@ -5179,6 +5196,7 @@ def list_db_system_patches(ctx, from_json, all_pages, page_size, db_system_id, l
 
         result = cli_util.list_call_get_all_results(
             client.list_db_system_patches,
+            stream_items=True,
             db_system_id=db_system_id,
             **kwargs
         )
@@ -5229,6 +5247,7 @@ def list_db_system_shapes(ctx, from_json, all_pages, page_size, compartment_id,
 
         result = cli_util.list_call_get_all_results(
             client.list_db_system_shapes,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -5298,6 +5317,7 @@ def list_db_systems(ctx, from_json, all_pages, page_size, compartment_id, limit,
 
         result = cli_util.list_call_get_all_results(
             client.list_db_systems,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -5351,6 +5371,7 @@ def list_db_versions(ctx, from_json, all_pages, page_size, compartment_id, limit
 
         result = cli_util.list_call_get_all_results(
             client.list_db_versions,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -5411,6 +5432,7 @@ def list_exadata_infrastructures(ctx, from_json, all_pages, page_size, compartme
 
         result = cli_util.list_call_get_all_results(
             client.list_exadata_infrastructures,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -5464,6 +5486,7 @@ def list_gi_versions(ctx, from_json, all_pages, page_size, compartment_id, limit
 
         result = cli_util.list_call_get_all_results(
             client.list_gi_versions,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -5536,6 +5559,7 @@ def list_maintenance_runs(ctx, from_json, all_pages, page_size, compartment_id,
 
         result = cli_util.list_call_get_all_results(
             client.list_maintenance_runs,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -5600,6 +5624,7 @@ def list_vm_cluster_networks(ctx, from_json, all_pages, page_size, exadata_infra
 
         result = cli_util.list_call_get_all_results(
             client.list_vm_cluster_networks,
+            stream_items=True,
             exadata_infrastructure_id=exadata_infrastructure_id,
             compartment_id=compartment_id,
             **kwargs
@@ -5666,6 +5691,7 @@ def list_vm_clusters(ctx, from_json, all_pages, page_size, compartment_id, exada
 
         result = cli_util.list_call_get_all_results(
             client.list_vm_clusters,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
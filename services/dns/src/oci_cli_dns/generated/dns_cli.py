@@ -845,6 +845,7 @@ def get_domain_records(ctx, from_json, all_pages, page_size, zone_name_or_id, do
 
         result = cli_util.list_call_get_all_results(
             client.get_domain_records,
+            stream_items=True,
             zone_name_or_id=zone_name_or_id,
             domain=domain,
             **kwargs
@@ -918,6 +919,7 @@ def get_rr_set(ctx, from_json, all_pages, page_size, zone_name_or_id, domain, rt
 
         result = cli_util.list_call_get_all_results(
             client.get_rr_set,
+            stream_items=True,
             zone_name_or_id=zone_name_or_id,
             domain=domain,
             rtype=rtype,
@@ -1085,6 +1087,7 @@ def get_zone_records(ctx, from_json, all_pages, page_size, zone_name_or_id, if_n
 
         result = cli_util.list_call_get_all_results(
             client.get_zone_records,
+            stream_items=True,
             zone_name_or_id=zone_name_or_id,
             **kwargs
         )
@@ -1162,6 +1165,7 @@ def list_steering_policies(ctx, from_json, all_pages, page_size, compartment_id,
 
         result = cli_util.list_call_get_all_results(
             client.list_steering_policies,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -1242,6 +1246,7 @@ def list_steering_policy_attachments(ctx, from_json, all_pages, page_size, compa
 
         result = cli_util.list_call_get_all_results(
             client.list_steering_policy_attachments,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -1313,6 +1318,7 @@ def list_zones(ctx, from_json, all_pages, page_size, compartment_id, limit, page
 
         result = cli_util.list_call_get_all_results(
             client.list_zones,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
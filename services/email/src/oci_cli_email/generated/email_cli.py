@@ -326,6 +326,7 @@ def list_senders(ctx, from_json, all_pages, page_size, compartment_id, lifecycle
 
         result = cli_util.list_call_get_all_results(
             client.list_senders,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -393,6 +394,7 @@ def list_suppressions(ctx, from_json, all_pages, page_size, compartment_id, emai
 
         result = cli_util.list_call_get_all_results(
             client.list_suppressions,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
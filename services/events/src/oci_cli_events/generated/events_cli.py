@@ -282,6 +282,7 @@ def list_rules(ctx, from_json, all_pages, page_size, compartment_id, limit, page
 
         result = cli_util.list_call_get_all_results(
             client.list_rules,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -867,6 +867,7 @@ def list_export_sets(ctx, from_json, all_pages, page_size, compartment_id, avail
 
         result = cli_util.list_call_get_all_results(
             client.list_export_sets,
+            stream_items=True,
             compartment_id=compartment_id,
             availability_domain=availability_domain,
             **kwargs
@@ -944,6 +945,7 @@ def list_exports(ctx, from_json, all_pages, page_size, compartment_id, limit, pa
 
         result = cli_util.list_call_get_all_results(
             client.list_exports,
+            stream_items=True,
             **kwargs
         )
     elif limit is not None:
@@ -1017,6 +1019,7 @@ def list_file_systems(ctx, from_json, all_pages, page_size, compartment_id, avai
 
         result = cli_util.list_call_get_all_results(
             client.list_file_systems,
+            stream_items=True,
             compartment_id=compartment_id,
             availability_domain=availability_domain,
             **kwargs
@@ -1099,6 +1102,7 @@ def list_mount_targets(ctx, from_json, all_pages, page_size, compartment_id, ava
 
         result = cli_util.list_call_get_all_results(
             client.list_mount_targets,
+            stream_items=True,
             compartment_id=compartment_id,
             availability_domain=availability_domain,
             **kwargs
@@ -1165,6 +1169,7 @@ def list_snapshots(ctx, from_json, all_pages, page_size, file_system_id, limit,
 
         result = cli_util.list_call_get_all_results(
             client.list_snapshots,
+            stream_items=True,
             file_system_id=file_system_id,
             **kwargs
         )
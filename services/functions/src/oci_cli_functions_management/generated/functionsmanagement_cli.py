@@ -445,6 +445,7 @@ def list_applications(ctx, from_json, all_pages, page_size, compartment_id, limi
 
         result = cli_util.list_call_get_all_results(
             client.list_applications,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -516,6 +517,7 @@ def list_functions(ctx, from_json, all_pages, page_size, application_id, limit,
 
         result = cli_util.list_call_get_all_results(
             client.list_functions,
+            stream_items=True,
             application_id=application_id,
             **kwargs
         )
@@ -498,6 +498,7 @@ def list_health_checks_vantage_points(ctx, from_json, all_pages, page_size, limi
 
         result = cli_util.list_call_get_all_results(
             client.list_health_checks_vantage_points,
+            stream_items=True,
             **kwargs
         )
     elif limit is not None:
@@ -555,6 +556,7 @@ def list_http_monitors(ctx, from_json, all_pages, page_size, compartment_id, lim
 
         result = cli_util.list_call_get_all_results(
             client.list_http_monitors,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -618,6 +620,7 @@ def list_http_probe_results(ctx, from_json, all_pages, page_size, probe_configur
 
         result = cli_util.list_call_get_all_results(
             client.list_http_probe_results,
+            stream_items=True,
             probe_configuration_id=probe_configuration_id,
             **kwargs
         )
@@ -680,6 +683,7 @@ def list_ping_monitors(ctx, from_json, all_pages, page_size, compartment_id, lim
 
         result = cli_util.list_call_get_all_results(
             client.list_ping_monitors,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -745,6 +749,7 @@ def list_ping_probe_results(ctx, from_json, all_pages, page_size, probe_configur
 
         result = cli_util.list_call_get_all_results(
             client.list_ping_probe_results,
+            stream_items=True,
             probe_configuration_id=probe_configuration_id,
             **kwargs
         )
@@ -2929,6 +2929,7 @@ def list_compartments(ctx, from_json, all_pages, page_size, compartment_id, page
 
         result = cli_util.list_call_get_all_results(
             client.list_compartments,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -2976,6 +2977,7 @@ def list_cost_tracking_tags(ctx, from_json, all_pages, page_size, compartment_id
 
         result = cli_util.list_call_get_all_results(
             client.list_cost_tracking_tags,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -3045,6 +3047,7 @@ def list_dynamic_groups(ctx, from_json, all_pages, page_size, compartment_id, pa
 
         result = cli_util.list_call_get_all_results(
             client.list_dynamic_groups,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -3113,6 +3116,7 @@ def list_groups(ctx, from_json, all_pages, page_size, compartment_id, page, limi
 
         result = cli_util.list_call_get_all_results(
             client.list_groups,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -3163,6 +3167,7 @@ def list_identity_provider_groups(ctx, from_json, all_pages, page_size, identity
 
         result = cli_util.list_call_get_all_results(
             client.list_identity_provider_groups,
+            stream_items=True,
             identity_provider_id=identity_provider_id,
             **kwargs
         )
@@ -3211,6 +3216,7 @@ def list_identity_providers(ctx, from_json, all_pages, page_size, protocol, comp
 
         result = cli_util.list_call_get_all_results(
             client.list_identity_providers,
+            stream_items=True,
             protocol=protocol,
             compartment_id=compartment_id,
             **kwargs
@@ -3264,6 +3270,7 @@ def list_idp_group_mappings(ctx, from_json, all_pages, page_size, identity_provi
 
         result = cli_util.list_call_get_all_results(
             client.list_idp_group_mappings,
+            stream_items=True,
             identity_provider_id=identity_provider_id,
             **kwargs
         )
@@ -3322,6 +3329,7 @@ def list_mfa_totp_devices(ctx, from_json, all_pages, page_size, user_id, page, l
 
         result = cli_util.list_call_get_all_results(
             client.list_mfa_totp_devices,
+            stream_items=True,
             user_id=user_id,
             **kwargs
         )
@@ -3371,6 +3379,7 @@ def list_policies(ctx, from_json, all_pages, page_size, compartment_id, page, li
 
         result = cli_util.list_call_get_all_results(
             client.list_policies,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -3514,6 +3523,7 @@ def list_tag_defaults(ctx, from_json, all_pages, page_size, page, limit, id, com
 
         result = cli_util.list_call_get_all_results(
             client.list_tag_defaults,
+            stream_items=True,
             **kwargs
         )
     elif limit is not None:
@@ -3564,6 +3574,7 @@ def list_tag_namespaces(ctx, from_json, all_pages, page_size, compartment_id, pa
 
         result = cli_util.list_call_get_all_results(
             client.list_tag_namespaces,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -3614,6 +3625,7 @@ def list_tagging_work_request_errors(ctx, from_json, all_pages, page_size, work_
 
         result = cli_util.list_call_get_all_results(
             client.list_tagging_work_request_errors,
+            stream_items=True,
             work_request_id=work_request_id,
             **kwargs
         )
@@ -3664,6 +3676,7 @@ def list_tagging_work_request_logs(ctx, from_json, all_pages, page_size, work_re
 
         result = cli_util.list_call_get_all_results(
             client.list_tagging_work_request_logs,
+            stream_items=True,
             work_request_id=work_request_id,
             **kwargs
         )
@@ -3714,6 +3727,7 @@ def list_tagging_work_requests(ctx, from_json, all_pages, page_size, compartment
 
         result = cli_util.list_call_get_all_results(
             client.list_tagging_work_requests,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -3767,6 +3781,7 @@ def list_tags(ctx, from_json, all_pages, page_size, tag_namespace_id, page, limi
 
         result = cli_util.list_call_get_all_results(
             client.list_tags,
+            stream_items=True,
             tag_namespace_id=tag_namespace_id,
             **kwargs
         )
@@ -3822,6 +3837,7 @@ def list_user_group_memberships(ctx, from_json, all_pages, page_size, compartmen
 
         result = cli_util.list_call_get_all_results(
             client.list_user_group_memberships,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -3875,6 +3891,7 @@ def list_users(ctx, from_json, all_pages, page_size, compartment_id, page, limit
 
         result = cli_util.list_call_get_all_results(
             client.list_users,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -3925,6 +3942,7 @@ def list_work_requests(ctx, from_json, all_pages, page_size, compartment_id, pag
 
         result = cli_util.list_call_get_all_results(
             client.list_work_requests,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -2,6 +2,13 @@
 # Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
 
 import unittest
+
+import mock
+import oci
+import oci_cli
+from click.testing import CliRunner
+
+from oci_cli import cli_util
 from tests import util
 
 
@@ -18,3 +25,19 @@ class TestIdentityCLI(unittest.TestCase):
         assert 'No such command' in result.output
         result = util.invoke_command(['iam', 'tag', 'update-tag-enum-tag-definition-validator'])
         assert 'No such command' in result.output
+
+    def test_policy_update_confirms_replacing_existing_statements(self):
+        policy = oci.identity.models.Policy(id='ocid1.policy.oc1..policy', statements=['Allow group A to read all-resources in tenancy'])
+        client = mock.Mock()
+        client.get_policy.return_value = oci.response.Response(200, {'etag': 'etag-1'}, policy, None)
+
+        with mock.patch.object(cli_util, 'build_client', return_value=client):
+            result = CliRunner().invoke(oci_cli.cli, [
+                'iam', 'policy', 'update', '--policy-id', policy.id, '--statements', '["Allow group B to read all-resources in tenancy"]',
+                '--version-date', '2019-01-01'
+            ], input='n\n')
+
+        assert 'The existing statements are:' in result.output
+        assert 'Allow group A to read all-resources in tenancy' in result.output
+        assert result.exit_code == 1
+        client.update_policy.assert_not_called()
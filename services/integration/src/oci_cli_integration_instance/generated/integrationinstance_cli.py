@@ -314,6 +314,7 @@ def list_integration_instances(ctx, from_json, all_pages, page_size, compartment
 
         result = cli_util.list_call_get_all_results(
             client.list_integration_instances,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -366,6 +367,7 @@ def list_work_request_errors(ctx, from_json, all_pages, page_size, compartment_i
 
         result = cli_util.list_call_get_all_results(
             client.list_work_request_errors,
+            stream_items=True,
             compartment_id=compartment_id,
             work_request_id=work_request_id,
             **kwargs
@@ -421,6 +423,7 @@ def list_work_request_logs(ctx, from_json, all_pages, page_size, compartment_id,
 
         result = cli_util.list_call_get_all_results(
             client.list_work_request_logs,
+            stream_items=True,
             compartment_id=compartment_id,
             work_request_id=work_request_id,
             **kwargs
@@ -475,6 +478,7 @@ def list_work_requests(ctx, from_json, all_pages, page_size, compartment_id, pag
 
         result = cli_util.list_call_get_all_results(
             client.list_work_requests,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
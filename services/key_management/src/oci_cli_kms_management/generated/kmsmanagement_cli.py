@@ -405,6 +405,7 @@ def list_key_versions(ctx, from_json, all_pages, page_size, key_id, limit, page,
 
         result = cli_util.list_call_get_all_results(
             client.list_key_versions,
+            stream_items=True,
             key_id=key_id,
             **kwargs
         )
@@ -461,6 +462,7 @@ def list_keys(ctx, from_json, all_pages, page_size, compartment_id, limit, page,
 
         result = cli_util.list_call_get_all_results(
             client.list_keys,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
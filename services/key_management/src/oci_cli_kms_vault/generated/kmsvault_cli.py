@@ -228,6 +228,7 @@ def list_vaults(ctx, from_json, all_pages, page_size, compartment_id, limit, pag
 
         result = cli_util.list_call_get_all_results(
             client.list_vaults,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
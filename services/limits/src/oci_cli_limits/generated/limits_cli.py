@@ -124,6 +124,7 @@ def list_limit_definitions(ctx, from_json, all_pages, page_size, compartment_id,
 
         result = cli_util.list_call_get_all_results(
             client.list_limit_definitions,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -190,6 +191,7 @@ def list_limit_values(ctx, from_json, all_pages, page_size, compartment_id, serv
 
         result = cli_util.list_call_get_all_results(
             client.list_limit_values,
+            stream_items=True,
             compartment_id=compartment_id,
             service_name=service_name,
             **kwargs
@@ -247,6 +249,7 @@ def list_services(ctx, from_json, all_pages, page_size, compartment_id, sort_by,
 
         result = cli_util.list_call_get_all_results(
             client.list_services,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
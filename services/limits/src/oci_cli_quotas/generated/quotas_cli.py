@@ -218,6 +218,7 @@ def list_quotas(ctx, from_json, all_pages, page_size, compartment_id, page, limi
 
         result = cli_util.list_call_get_all_results(
             client.list_quotas,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -1824,6 +1824,7 @@ def list_load_balancer_healths(ctx, from_json, all_pages, page_size, compartment
 
         result = cli_util.list_call_get_all_results(
             client.list_load_balancer_healths,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -1897,6 +1898,7 @@ def list_load_balancers(ctx, from_json, all_pages, page_size, compartment_id, li
 
         result = cli_util.list_call_get_all_results(
             client.list_load_balancers,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -1972,6 +1974,7 @@ def list_policies(ctx, from_json, all_pages, page_size, compartment_id, limit, p
 
         result = cli_util.list_call_get_all_results(
             client.list_policies,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -2024,6 +2027,7 @@ def list_protocols(ctx, from_json, all_pages, page_size, compartment_id, limit,
 
         result = cli_util.list_call_get_all_results(
             client.list_protocols,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -2099,6 +2103,7 @@ def list_shapes(ctx, from_json, all_pages, page_size, compartment_id, limit, pag
 
         result = cli_util.list_call_get_all_results(
             client.list_shapes,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -2154,6 +2159,7 @@ def list_work_requests(ctx, from_json, all_pages, page_size, load_balancer_id, l
 
         result = cli_util.list_call_get_all_results(
             client.list_work_requests,
+            stream_items=True,
             load_balancer_id=load_balancer_id,
             **kwargs
         )
@@ -454,6 +454,7 @@ def list_alarms(ctx, from_json, all_pages, page_size, compartment_id, page, limi
 
         result = cli_util.list_call_get_all_results(
             client.list_alarms,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -526,6 +527,7 @@ def list_alarms_status(ctx, from_json, all_pages, page_size, compartment_id, com
 
         result = cli_util.list_call_get_all_results(
             client.list_alarms_status,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -630,6 +632,7 @@ def list_metrics(ctx, from_json, all_pages, page_size, compartment_id, name, nam
 
         result = cli_util.list_call_get_all_results(
             client.list_metrics,
+            stream_items=True,
             compartment_id=compartment_id,
             list_metrics_details=details,
             **kwargs
@@ -894,6 +894,7 @@ def list_buckets(ctx, from_json, all_pages, page_size, namespace_name, compartme
 
         result = cli_util.list_call_get_all_results(
             client.list_buckets,
+            stream_items=True,
             namespace_name=namespace_name,
             compartment_id=compartment_id,
             **kwargs
@@ -957,6 +958,7 @@ def list_multipart_upload_parts(ctx, from_json, all_pages, page_size, namespace_
 
         result = cli_util.list_call_get_all_results(
             client.list_multipart_upload_parts,
+            stream_items=True,
             namespace_name=namespace_name,
             bucket_name=bucket_name,
             object_name=object_name,
@@ -1021,6 +1023,7 @@ def list_multipart_uploads(ctx, from_json, all_pages, page_size, namespace_name,
 
         result = cli_util.list_call_get_all_results(
             client.list_multipart_uploads,
+            stream_items=True,
             namespace_name=namespace_name,
             bucket_name=bucket_name,
             **kwargs
@@ -1130,6 +1133,7 @@ def list_preauthenticated_requests(ctx, from_json, all_pages, page_size, namespa
 
         result = cli_util.list_call_get_all_results(
             client.list_preauthenticated_requests,
+            stream_items=True,
             namespace_name=namespace_name,
             bucket_name=bucket_name,
             **kwargs
@@ -1184,6 +1188,7 @@ def list_work_request_errors(ctx, from_json, all_pages, page_size, work_request_
 
         result = cli_util.list_call_get_all_results(
             client.list_work_request_errors,
+            stream_items=True,
             work_request_id=work_request_id,
             **kwargs
         )
@@ -1235,6 +1240,7 @@ def list_work_request_logs(ctx, from_json, all_pages, page_size, work_request_id
 
         result = cli_util.list_call_get_all_results(
             client.list_work_request_logs,
+            stream_items=True,
             work_request_id=work_request_id,
             **kwargs
         )
@@ -1283,6 +1289,7 @@ def list_work_requests(ctx, from_json, all_pages, page_size, compartment_id, pag
 
         result = cli_util.list_call_get_all_results(
             client.list_work_requests,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
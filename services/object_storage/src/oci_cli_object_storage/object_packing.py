@@ -0,0 +1,223 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import io
+import json
+import os
+import posixpath
+import shutil
+import tarfile
+import tempfile
+import threading
+import time
+import uuid
+
+from oci_cli.file_utils import replace_file
+from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager import file_parts
+
+# Packed archives are tar files, with a JSON index of their members alongside them as a separate object
+ARCHIVE_SUFFIX = '.oci-pack.tar'
+INDEX_SUFFIX = '.index.json'
+ARCHIVE_CONTENT_TYPE = 'application/x-tar'
+INDEX_CONTENT_TYPE = 'application/json'
+
+# Increment this if the format of the index changes
+INDEX_VERSION = 1
+
+# Files up to this size (in KiB) are packed, and archives are closed once they reach this size (in MiB)
+DEFAULT_PACK_THRESHOLD_KIB = 1024
+DEFAULT_ARCHIVE_SIZE_MIB = 64
+
+EXTRACT_CHUNK_SIZE = 1024 * 1024
+
+
+def is_archive_name(object_name):
+    return object_name.endswith(ARCHIVE_SUFFIX)
+
+
+def is_index_name(object_name):
+    return object_name.endswith(ARCHIVE_SUFFIX + INDEX_SUFFIX)
+
+
+def get_index_name(archive_name):
+    return archive_name + INDEX_SUFFIX
+
+
+# A tar archive of small files which is written to a temporary file before it is uploaded as one object.
+#
+# The offset and size of the data of each member are recorded, so that a member can be fetched on its own with a
+# ranged GET of the archive object. The index also has the MD5 (base64 encoded, as Object Storage reports it) and
+# modification time of each member.
+class ArchiveWriter(object):
+    def __init__(self, archive_name, directory=None):
+        self.archive_name = archive_name
+        self.members = []
+
+        fd, self.path = tempfile.mkstemp(suffix=ARCHIVE_SUFFIX, dir=directory)
+        self._file = os.fdopen(fd, 'wb')
+        self._tar = tarfile.open(fileobj=self._file, mode='w', format=tarfile.PAX_FORMAT)
+
+    @property
+    def size(self):
+        return self._tar.offset
+
+    def add(self, file_path, member_name):
+        # The files are small, so each is read into memory once to both hash it and add it to the archive
+        with open(file_path, 'rb') as file_object:
+            stat_result = os.fstat(file_object.fileno())
+            data = file_object.read()
+
+        tar_info = tarfile.TarInfo(member_name)
+        tar_info.size = len(data)
+        tar_info.mtime = stat_result.st_mtime
+        tar_info.mode = stat_result.st_mode & 0o777
+        self._tar.addfile(tar_info, io.BytesIO(data))
+
+        # The data is the last thing written, padded to a whole number of blocks
+        padded_size = -(-len(data) // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+        self.members.append({
+            'name': member_name,
+            'offset': self._tar.offset - padded_size,
+            'size': len(data),
+            'md5': file_parts.get_md5(data),
+            'mtime': stat_result.st_mtime
+        })
+
+    def close(self):
+        self._tar.close()
+        self._file.close()
+
+    def get_index(self):
+        return json.dumps({'version': INDEX_VERSION, 'archive': self.archive_name, 'members': self.members}, separators=(',', ':')).encode('utf-8')
+
+    def remove(self, **kwargs):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+# Packs files into archives of about archive_size bytes. When an archive is full it is closed and passed to
+# upload_archive, and flush() does the same for the last archive once all of the files have been added.
+#
+# The archives are named <object prefix>packed-<time>-<random>-<number>.oci-pack.tar so that archives from different
+# uploads to the same prefix do not collide.
+class SmallFilePacker(object):
+    def __init__(self, object_prefix, archive_size, upload_archive, directory=None):
+        self._object_prefix = object_prefix or ''
+        self._archive_size = archive_size
+        self._upload_archive = upload_archive
+        self._directory = directory
+
+        self._name_stem = 'packed-{}-{}'.format(time.strftime('%Y%m%dT%H%M%SZ', time.gmtime()), uuid.uuid4().hex[:8])
+        self._archive_count = 0
+        self._archive = None
+
+    def add(self, file_path, member_name):
+        if self._archive is None:
+            self._archive_count += 1
+            archive_name = '{}{}-{:06d}{}'.format(self._object_prefix, self._name_stem, self._archive_count, ARCHIVE_SUFFIX)
+            self._archive = ArchiveWriter(archive_name, self._directory)
+
+        self._archive.add(file_path, member_name)
+        if self._archive.size >= self._archive_size:
+            self.flush()
+
+    def flush(self):
+        archive, self._archive = self._archive, None
+        if archive is not None:
+            archive.close()
+            self._upload_archive(archive)
+
+
+# Tracks the uploads of an archive and its index, which are made at the same time. The members are only reported as
+# uploaded, through on_complete, once both objects have been uploaded.
+class PackedArchiveUpload(object):
+    def __init__(self, archive, on_complete):
+        self.archive = archive
+        self._on_complete = on_complete
+        self._remaining = 2
+        self._lock = threading.Lock()
+
+        fd, self.index_path = tempfile.mkstemp(suffix=INDEX_SUFFIX, dir=os.path.dirname(archive.path))
+        with os.fdopen(fd, 'wb') as index_file:
+            index_file.write(archive.get_index())
+
+    def record_uploaded(self, **kwargs):
+        with self._lock:
+            self._remaining -= 1
+            complete = self._remaining == 0
+        if complete:
+            self._on_complete(self.archive)
+
+    def remove_index(self, **kwargs):
+        if os.path.exists(self.index_path):
+            os.remove(self.index_path)
+
+
+def get_member(index, member_name):
+    """Returns the entry for a member from the parsed index of an archive, or None if the archive has no such member."""
+    for member in index.get('members', []):
+        if member['name'] == member_name:
+            return member
+    return None
+
+
+def get_member_range(member):
+    """Returns the range header to fetch the data of a member from its archive."""
+    return 'bytes={}-{}'.format(member['offset'], member['offset'] + member['size'] - 1)
+
+
+def extract_archive(archive_path, directory, should_extract):
+    """Extracts the regular files in a downloaded archive into directory, and returns the names of the members which were
+    extracted.
+
+    should_extract is called with the name of each member and the path it would be extracted to, and returns whether to
+    extract it. An archive with a member whose name would place it outside of the directory is not extracted at all. Each
+    member is written to a temporary file which is then renamed, so an interrupted extraction does not leave partially
+    written files."""
+    extracted = []
+    directory = os.path.abspath(directory)
+
+    with tarfile.open(archive_path, mode='r') as tar:
+        members = []
+        for tar_info in tar.getmembers():
+            if not tar_info.isfile():
+                continue
+
+            member_path = _get_member_path(directory, tar_info.name)
+            if member_path is None:
+                raise ValueError('The archive member {} would be extracted outside of {}'.format(tar_info.name, directory))
+            members.append((tar_info, member_path))
+
+        for tar_info, member_path in members:
+            if not should_extract(tar_info.name, member_path):
+                continue
+
+            member_directory = os.path.dirname(member_path)
+            if not os.path.isdir(member_directory):
+                os.makedirs(member_directory)
+
+            fd, temp_path = tempfile.mkstemp(dir=member_directory)
+            try:
+                with os.fdopen(fd, 'wb') as temp_file:
+                    shutil.copyfileobj(tar.extractfile(tar_info), temp_file, EXTRACT_CHUNK_SIZE)
+                os.chmod(temp_path, tar_info.mode & 0o777 or 0o644)
+                os.utime(temp_path, (tar_info.mtime, tar_info.mtime))
+                replace_file(temp_path, member_path)
+            except Exception:
+                os.remove(temp_path)
+                raise
+
+            extracted.append(tar_info.name)
+
+    return extracted
+
+
+def _get_member_path(directory, member_name):
+    normalized_name = posixpath.normpath(member_name)
+    if posixpath.isabs(normalized_name) or normalized_name == '..' or normalized_name.startswith('../'):
+        return None
+
+    member_path = os.path.abspath(os.path.join(directory, *normalized_name.split('/')))
+    if not member_path.startswith(directory + os.sep):
+        return None
+    return member_path
@@ -1,20 +1,27 @@
 # coding: utf-8
 # Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
 
+from .concurrency_limiter import AimdConcurrencyLimiter
 from .transfer_manager_config import TransferManagerConfig
 from .work_pool import WorkPool, WorkPoolFuture
 from .work_pool_task import WorkPoolTask, WorkPoolTaskCallback, WorkPoolTaskErrorCallback, WorkPoolTaskSuccessCallback, WorkPoolTaskCallbacksContainer
+from .copy_tasks import CopyObjectTask
 from .delete_tasks import DeleteObjectTask
 from .get_object_tasks import GetObjectTask, GetObjectMultipartTask
 from .head_object_tasks import HeadObjectTask
 from .upload_tasks import SimpleSingleUploadTask
 from .multipart_upload_tasks import MultipartUploadProcessorTask
+from .stream_upload_tasks import PartBufferRing, StreamingMultipartUploadTask, UploadStreamPartTask
+from .file_parts import MappedFilePart, MemoryViewReader
+from .mapped_multipart_object_assembler import MappedFileMultipartObjectAssembler
 from .pooled_multipart_object_assembler import PooledMultipartObjectAssembler
+from .transfer_journal import TransferJournal
 from .transfer_manager import TransferManager
 
 __all__ = [
-    "TransferManagerConfig", "WorkPool", "WorkPoolFuture", "WorkPoolTask",
+    "AimdConcurrencyLimiter", "TransferManagerConfig", "WorkPool", "WorkPoolFuture", "WorkPoolTask",
     "WorkPoolTaskCallback", "WorkPoolTaskErrorCallback", "WorkPoolTaskSuccessCallback", "WorkPoolTaskCallbacksContainer",
-    "DeleteObjectTask", "GetObjectTask", "GetObjectMultipartTask", "HeadObjectTask", "SimpleSingleUploadTask", "MultipartUploadProcessorTask",
-    "PooledMultipartObjectAssembler", "TransferManager"
+    "CopyObjectTask", "DeleteObjectTask", "GetObjectTask", "GetObjectMultipartTask", "HeadObjectTask", "SimpleSingleUploadTask", "MultipartUploadProcessorTask",
+    "PartBufferRing", "StreamingMultipartUploadTask", "UploadStreamPartTask", "MappedFilePart", "MemoryViewReader",
+    "MappedFileMultipartObjectAssembler", "PooledMultipartObjectAssembler", "TransferJournal", "TransferManager"
 ]
@@ -0,0 +1,943 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+# An alternative to the TransferManager which makes all of its requests from a single asyncio event loop instead of from
+# pools of threads. This module uses async/await, so it is only imported (by the bulk commands) on Python 3.5+.
+
+import asyncio
+import collections
+import concurrent.futures
+import copy
+import errno
+import os
+import random
+import ssl
+import threading
+import types
+
+import oci
+import six
+from oci._vendor import requests
+from oci._vendor.requests.structures import CaseInsensitiveDict
+from oci.object_storage import UploadManager
+from oci.object_storage.models import CommitMultipartUploadDetails, CommitMultipartUploadPartDetails, CreateMultipartUploadDetails
+
+from oci_cli import cli_util
+from oci_cli import retry_utils
+from . import get_object_tasks
+from . import file_parts
+from .get_object_tasks import GetObjectMultipartTask, MemoryBudget, PositionalFileWriter, SpooledPart
+from .work_pool_task import WorkPoolTask, WorkPoolTaskCallback
+from .wrapped_semaphore import WrappedSemaphore
+from .concurrency_limiter import POOL_LIMIT_SHARE
+
+MEBIBYTE = 1024 * 1024
+
+# The size of the reads and writes of request and response bodies
+TRANSFER_CHUNK_SIZE = MEBIBYTE
+
+# Used when the client does not have a timeout configured
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 10
+DEFAULT_READ_TIMEOUT_SECONDS = 60
+
+# The number of threads which read and write local files for the transfers
+FILE_IO_THREADS = 16
+
+# Retries are made in the same cases, and with the same backoff, as the @retry decorated calls of the threaded tasks
+MAX_ATTEMPTS = 3
+RETRY_WAIT_MAX_SECONDS = 10
+RETRY_WAIT_JITTER_MAX_SECONDS = 2
+
+
+def get_unsupported_reason(object_storage_client):
+    """Returns why the asyncio engine cannot make requests for the client, or None if it can."""
+    base_client = object_storage_client.base_client
+    endpoint = base_client.endpoint.lower()
+    if not endpoint.startswith(('https://', 'http://')):
+        return 'the endpoint does not use HTTP or HTTPS'
+
+    # Connections are made directly to the endpoint
+    if base_client.session.proxies or requests.utils.get_environ_proxies(base_client.endpoint):
+        return 'requests cannot be sent through a proxy'
+
+    return None
+
+
+# A TransferManager which makes requests over a pool of keep-alive connections, driven by an asyncio event loop on a
+# background thread. Signing, and building the requests for each operation, is done by the SDK client.
+#
+# Submitting work blocks while the configured number of operations are in flight, as with the WorkPool of the
+# TransferManager, and the callbacks in the callbacks container are run in the same way as for a WorkPoolTask.
+class AsyncTransferManager(object):
+    def __init__(self, object_storage_client, transfer_manager_config):
+        reason = get_unsupported_reason(object_storage_client)
+        if reason:
+            raise RuntimeError(reason)
+
+        self._client = object_storage_client
+        self._config = transfer_manager_config
+        self._requests = _RequestBuilder(object_storage_client)
+        self._logger = object_storage_client.base_client.logger
+
+        self._concurrency_limiter = self._config.concurrency_limiter
+        # As with the TransferManager's pools, the slots for requests and for parts each get a share of an adaptive limit
+        self._object_storage_request_slots = WrappedSemaphore(self._config.max_object_storage_requests, concurrency_limiter=self._concurrency_limiter, limit_share=POOL_LIMIT_SHARE)
+        self._multipart_upload_slots = WrappedSemaphore(self._config.max_multipart_files_to_process)
+
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+
+        self._io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=FILE_IO_THREADS)
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._run_loop)
+        self._loop_thread.daemon = True
+        self._loop_thread.start()
+
+        # asyncio primitives are tied to the loop which is running when they are created
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+
+    def upload_object(self, callbacks_container, namespace_name, bucket_name, object_name, file_path, file_size, verify_checksum, **kwargs):
+        part_size = file_parts.get_part_size(file_size, kwargs.pop('part_size', self._config.multipart_part_size))
+        if self._config.use_multipart_uploads and UploadManager._use_multipart(file_size, part_size=part_size):
+            return self._submit(self._multipart_upload_slots, callbacks_container, self._upload_multipart, namespace_name, bucket_name, object_name, file_path, file_size, part_size, verify_checksum, kwargs)
+
+        kwargs.pop('multipart_part_completion_callback', None)
+        return self._submit(self._object_storage_request_slots, callbacks_container, self._upload_single, namespace_name, bucket_name, object_name, file_path, file_size, verify_checksum, kwargs)
+
+    def get_object(self, callbacks_container, **kwargs):
+        return self._submit(self._object_storage_request_slots, callbacks_container, self._get_object, kwargs)
+
+    def get_object_multipart(self, callbacks_container, destination_file_handle, **kwargs):
+        return self._submit(self._object_storage_request_slots, callbacks_container, self._get_object_multipart, destination_file_handle, kwargs)
+
+    def delete_object(self, callbacks_container, **kwargs):
+        return self._submit(self._object_storage_request_slots, callbacks_container, self._delete_object, kwargs)
+
+    def head_object(self, callbacks_container, **kwargs):
+        return self._submit(self._object_storage_request_slots, callbacks_container, self._head_object, kwargs)
+
+    def wait_for_completion(self):
+        while True:
+            with self._pending_lock:
+                pending = list(self._pending)
+            if not pending:
+                break
+            concurrent.futures.wait(pending)
+
+        # As with the TransferManager's pools, no more work can be submitted once this has been called
+        asyncio.run_coroutine_threadsafe(self._connections.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+        self._io_executor.shutdown()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    async def _start(self):
+        config = self._config
+        if self._concurrency_limiter:
+            self._part_slots = _AdaptiveSlots(self._loop, self._concurrency_limiter, POOL_LIMIT_SHARE)
+            max_connections = 2 * self._concurrency_limiter.max_limit
+        else:
+            self._part_slots = asyncio.Semaphore(config.max_object_storage_multipart_requests)
+            max_connections = config.max_object_storage_requests + config.max_object_storage_multipart_requests
+        self._connections = AsyncHttpConnectionPool(
+            max_connections,
+            _build_ssl_context(self._client.base_client.session.verify),
+            self._client.base_client.timeout,
+            self._run_io
+        )
+
+    def _submit(self, slots, callbacks_container, coroutine_function, *args):
+        slots.acquire()
+
+        task = _CoroutineTask(callbacks_container, coroutine_function, *args)
+        task.add_completion_callback(WorkPoolTaskCallback(slots.release))
+
+        future = asyncio.run_coroutine_threadsafe(task.do_work(), self._loop)
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._remove_pending)
+
+        return AsyncWorkPoolFuture(future)
+
+    def _remove_pending(self, future):
+        with self._pending_lock:
+            self._pending.discard(future)
+
+    async def _run_io(self, func, *args):
+        return await self._loop.run_in_executor(self._io_executor, func, *args)
+
+    async def _send(self, operation_name, *args, **kwargs):
+        # Makes the Object Storage call, retrying it in the same cases as the threaded tasks. If a response sink is
+        # given the body of a successful response is passed to it as it is received.
+        response_sink = kwargs.pop('response_sink', None)
+
+        attempt = 1
+        while True:
+            try:
+                return await self._send_once(operation_name, args, kwargs, response_sink)
+            except Exception as e:
+                can_retry = response_sink is None or response_sink.can_retry()
+                if attempt >= MAX_ATTEMPTS or not can_retry or not retry_utils.retry_on_timeouts_connection_internal_server_and_throttles(e):
+                    raise
+
+            await asyncio.sleep(_get_retry_wait_seconds(attempt))
+            attempt += 1
+
+    async def _send_once(self, operation_name, args, kwargs, response_sink):
+        request, prepared_request, body = self._requests.build(operation_name, *args, **kwargs)
+        self._logger.info(oci.base_client.utc_now() + 'Request: %s %s' % (str(request.method), request.url))
+
+        if response_sink:
+            response_sink.reset()
+
+        started_at = self._concurrency_limiter.start_request() if self._concurrency_limiter else None
+        try:
+            status, headers, content = await self._connections.send(prepared_request, body, response_sink)
+        except oci.exceptions.RequestException:
+            # The connection pool only raises these for timeouts and failed connections
+            if self._concurrency_limiter:
+                self._concurrency_limiter.record_error(started_at, is_overload=True)
+            raise
+
+        if self._concurrency_limiter:
+            self._concurrency_limiter.record_response(started_at, status)
+        self._logger.debug(oci.base_client.utc_now() + 'Response status: %s' % str(status))
+
+        if not 200 <= status <= 299:
+            raise self._requests.build_service_error(request, status, headers, content)
+
+        data = None
+        if request.response_type and request.response_type != 'stream':
+            data = self._requests.base_client.deserialize_response_data(content, request.response_type)
+
+        return oci.response.Response(status, headers, data, request)
+
+    async def _gather(self, coroutines):
+        # Runs the coroutines concurrently, cancelling the rest if one of them fails
+        tasks = [asyncio.ensure_future(c) for c in coroutines]
+        try:
+            return await asyncio.gather(*tasks)
+        except Exception:
+            for task in tasks:
+                task.cancel()
+            await asyncio.wait(tasks)
+            raise
+
+    async def _head_object(self, kwargs):
+        try:
+            return await self._send('head_object', **kwargs)
+        except oci.exceptions.ServiceError as e:
+            if e.status == 404:
+                return None
+            raise
+
+    async def _delete_object(self, kwargs):
+        await self._send(
+            'delete_object',
+            kwargs['namespace'],
+            kwargs['bucket_name'],
+            kwargs['object_name'],
+            if_match=kwargs.get('if_match'),
+            opc_client_request_id=kwargs.get('request_id')
+        )
+
+    async def _get_object_call(self, kwargs, response_sink, object_range=None):
+        return await self._send(
+            'get_object',
+            kwargs['namespace'],
+            kwargs['bucket_name'],
+            kwargs['object_name'],
+            if_match=kwargs.get('if_match'),
+            if_none_match=kwargs.get('if_none_match'),
+            range=object_range if object_range else kwargs.get('range'),
+            opc_client_request_id=kwargs.get('request_id'),
+            response_sink=response_sink
+        )
+
+    async def _get_object(self, kwargs):
+        sink = _FileSink(self._run_io, file_path=kwargs['full_file_path'])
+        try:
+            await self._get_object_call(kwargs, sink)
+            await sink.open()
+        except IOError as e:
+            # IsADirectoryError, for objects whose names end with the path separator
+            if e.errno != errno.EISDIR:
+                raise
+        finally:
+            sink.close()
+
+    async def _get_object_multipart(self, destination_file_handle, kwargs):
+        kwargs = kwargs.copy()
+        multipart_download_threshold = kwargs.pop('multipart_download_threshold')
+        chunk_written_callback = kwargs.pop('chunk_written_callback', None)
+        part_completed_callback = kwargs.pop('part_completed_callback', None)
+        part_size = kwargs.pop('part_size', GetObjectMultipartTask.DEFAULT_MULTIPART_DOWNLOAD_SIZE)
+
+        if 'total_size' in kwargs:
+            content_length = kwargs['total_size']
+        else:
+            head_object_result = await self._head_object({
+                'namespace_name': kwargs['namespace'],
+                'bucket_name': kwargs['bucket_name'],
+                'object_name': kwargs['object_name'],
+                'if_match': kwargs.get('if_match'),
+                'if_none_match': kwargs.get('if_none_match'),
+                'opc_client_request_id': kwargs.get('request_id')
+            })
+            if not head_object_result:
+                raise RuntimeError('Cannot download object as it does not exist')
+            content_length = int(head_object_result.headers['Content-Length'])
+            if part_completed_callback:
+                part_completed_callback(1, total_bytes=content_length)
+
+        if isinstance(destination_file_handle, six.string_types):
+            sink = _FileSink(self._run_io, file_path=destination_file_handle)
+        else:
+            sink = _FileSink(self._run_io, file_handle=destination_file_handle)
+
+        try:
+            if content_length <= multipart_download_threshold:
+                await self._get_object_call(kwargs, sink)
+            else:
+                await sink.open()
+                ranges = [(start, min(start + part_size, content_length) - 1) for start in range(0, content_length, part_size)]
+
+                # Ranges are written straight to their offsets in regular files, and in order to anything else (e.g. stdout)
+                positional_writer = await self._run_io(PositionalFileWriter.create, sink.file_handle, content_length)
+                if positional_writer:
+                    await self._gather(
+                        self._get_object_range_to_offset(kwargs, object_range, positional_writer, chunk_written_callback, part_completed_callback)
+                        for object_range in ranges
+                    )
+                    await self._run_io(positional_writer.finish)
+                else:
+                    writer = _OrderedPartWriter(sink, self._run_io)
+                    memory_budget = MemoryBudget(get_object_tasks.PENDING_WRITES_MEMORY_LIMIT)
+                    try:
+                        await self._gather(
+                            self._get_object_range(kwargs, index, object_range, writer, memory_budget, chunk_written_callback, part_completed_callback)
+                            for index, object_range in enumerate(ranges)
+                        )
+                    finally:
+                        writer.close()
+            await sink.open()
+        finally:
+            sink.close()
+
+    async def _get_object_range_to_offset(self, kwargs, object_range, positional_writer, chunk_written_callback, part_completed_callback):
+        # According to https://tools.ietf.org/rfc/rfc7233 section 2.1, ranges are inclusive, e.g. bytes=0-499
+        offset_sink = _PositionalSink(self._run_io, positional_writer, object_range[0], chunk_written_callback)
+        async with self._part_slots:
+            await self._get_object_call(kwargs, offset_sink, object_range='bytes={}-{}'.format(*object_range))
+
+        if part_completed_callback:
+            part_completed_callback(object_range[1] - object_range[0] + 1)
+
+    async def _get_object_range(self, kwargs, index, object_range, writer, memory_budget, chunk_written_callback, part_completed_callback):
+        part_sink = _SpooledPartSink(self._run_io, memory_budget, chunk_written_callback)
+        try:
+            async with self._part_slots:
+                await self._get_object_call(kwargs, part_sink, object_range='bytes={}-{}'.format(*object_range))
+        except BaseException:
+            part_sink.close()
+            raise
+
+        # The writer closes the part once it has been written
+        part_size = part_sink.part.size
+        await writer.write(index, part_sink.part)
+
+        if part_completed_callback:
+            part_completed_callback(part_size / 2)
+
+    async def _upload_single(self, namespace_name, bucket_name, object_name, file_path, file_size, verify_checksum, kwargs):
+        put_kwargs = kwargs.copy()
+        put_kwargs.pop('allow_parallel_uploads', None)
+        put_kwargs.pop('parallel_process_count', None)
+        if 'metadata' in put_kwargs:
+            put_kwargs['opc_meta'] = put_kwargs.pop('metadata')
+
+        # The checksum is calculated from the data as it is sent, so the file is only read once
+        body = _FileRange(file_path, 0, file_size, hash_data=verify_checksum)
+        try:
+            response = await self._send('put_object', namespace_name, bucket_name, object_name, body, content_length=file_size, **put_kwargs)
+        finally:
+            body.close()
+
+        return response, body.get_checksum() if verify_checksum else None
+
+    async def _upload_multipart(self, namespace_name, bucket_name, object_name, file_path, file_size, part_size, verify_checksum, kwargs):
+        progress_callback = kwargs.get('multipart_part_completion_callback')
+        request_id = kwargs.get('opc_client_request_id')
+        transfer_journal = self._config.transfer_journal
+
+        # As with the threaded tasks, resume the upload recorded in the transfer journal if the file has not changed since
+        upload = transfer_journal.get_multipart_upload(object_name) if transfer_journal else None
+        if upload:
+            file_stat = await self._run_io(os.stat, file_path)
+            if upload['size'] == file_stat.st_size and upload['mtime'] == file_stat.st_mtime:
+                try:
+                    return await self._complete_multipart_upload(
+                        namespace_name, bucket_name, object_name, file_path, file_size, upload, verify_checksum, request_id, progress_callback
+                    )
+                except oci.exceptions.ServiceError as e:
+                    # The recorded upload no longer exists (it may have been committed or aborted after it was recorded)
+                    if e.status != 404:
+                        raise
+            else:
+                try:
+                    await self._send('abort_multipart_upload', namespace_name, bucket_name, object_name, upload['upload_id'])
+                except oci.exceptions.ServiceError:
+                    pass
+
+        metadata = None
+        if kwargs.get('metadata'):
+            metadata = {(key if key.startswith('opc-meta-') else 'opc-meta-' + key): value for key, value in six.iteritems(kwargs['metadata'])}
+
+        create_details = CreateMultipartUploadDetails(
+            object=object_name,
+            content_type=kwargs.get('content_type'),
+            content_language=kwargs.get('content_language'),
+            content_encoding=kwargs.get('content_encoding'),
+            metadata=metadata
+        )
+        create_kwargs = {key: kwargs[key] for key in ['opc_client_request_id', 'if_match', 'if_none_match'] if kwargs.get(key)}
+        create_response = await self._send('create_multipart_upload', namespace_name, bucket_name, create_details, **create_kwargs)
+        upload = {'upload_id': create_response.data.upload_id, 'part_size': part_size, 'parts': {}}
+        if transfer_journal:
+            transfer_journal.record_multipart_upload(object_name, upload['upload_id'], part_size, await self._run_io(os.stat, file_path))
+
+        return await self._complete_multipart_upload(namespace_name, bucket_name, object_name, file_path, file_size, upload, verify_checksum, request_id, progress_callback)
+
+    # Uploads the parts of a multipart upload which have not been uploaded already (upload['parts'] has the etags and MD5s of
+    # those, keyed by part number) and commits it
+    async def _complete_multipart_upload(self, namespace_name, bucket_name, object_name, file_path, file_size, upload, verify_checksum, request_id, progress_callback):
+        upload_id = upload['upload_id']
+        part_size = upload['part_size']
+        parts = [{'offset': offset, 'size': min(part_size, file_size - offset)} for offset in range(0, file_size, part_size)]
+        for part_num, part in six.iteritems(upload['parts']):
+            parts[part_num - 1].update({'hash': part['md5'], 'etag': part['etag'], 'opc_md5': part['md5']})
+
+        await self._gather(
+            self._upload_part(namespace_name, bucket_name, object_name, upload_id, file_path, part_num, part, request_id, progress_callback)
+            for part_num, part in enumerate(parts, start=1)
+        )
+
+        commit_details = CommitMultipartUploadDetails(
+            parts_to_commit=[CommitMultipartUploadPartDetails(part_num=part_num, etag=part['etag']) for part_num, part in enumerate(parts, start=1)],
+            parts_to_exclude=[]
+        )
+        commit_kwargs = {'opc_client_request_id': request_id} if request_id else {}
+        response = await self._send('commit_multipart_upload', namespace_name, bucket_name, object_name, upload_id, commit_details, **commit_kwargs)
+
+        multipart_hash = None
+        if verify_checksum:
+            # verify_checksum only needs the part hashes from the manifest of a MultipartObjectAssembler, and the parts were
+            # hashed for their uploads, so the file is not read again
+            manifest = types.SimpleNamespace(manifest={'parts': parts})
+            multipart_hash = await self._run_io(cli_util.verify_checksum, file_path, False, manifest)
+
+        return response, multipart_hash
+
+    async def _upload_part(self, namespace_name, bucket_name, object_name, upload_id, file_path, part_num, part, request_id, progress_callback):
+        # Parts which were uploaded before the upload was resumed are only counted for the progress
+        if 'etag' not in part:
+            async with self._part_slots:
+                part['hash'] = await self._run_io(file_parts.calculate_md5, file_path, part['offset'], part['size'])
+
+                part_kwargs = {'content_length': part['size'], 'content_md5': part['hash']}
+                if request_id:
+                    part_kwargs['opc_client_request_id'] = request_id
+
+                body = _FileRange(file_path, part['offset'], part['size'])
+                try:
+                    response = await self._send('upload_part', namespace_name, bucket_name, object_name, upload_id, part_num, body, **part_kwargs)
+                finally:
+                    body.close()
+
+            part['etag'] = response.headers['etag']
+            part['opc_md5'] = str(response.headers['opc-content-md5'])
+            if self._config.transfer_journal:
+                self._config.transfer_journal.record_part(upload_id, part_num, part['etag'], part['opc_md5'])
+
+        if progress_callback:
+            progress_callback(part['size'])
+
+
+def _get_retry_wait_seconds(attempt):
+    return min(2 ** attempt, RETRY_WAIT_MAX_SECONDS) + random.uniform(0, RETRY_WAIT_JITTER_MAX_SECONDS)
+
+
+# An asyncio equivalent of a WrappedSemaphore with a concurrency limiter: at most limit_share of the limiter's current limit
+# of coroutines can hold the slots at once. The limiter may be updated from other threads, so waiters are woken on the event
+# loop.
+class _AdaptiveSlots(object):
+    def __init__(self, loop, concurrency_limiter, limit_share=1.0):
+        self._loop = loop
+        self._concurrency_limiter = concurrency_limiter
+        self._limit_share = limit_share
+        self._holders = 0
+        self._waiters = collections.deque()
+        concurrency_limiter.add_listener(self._on_limit_changed)
+
+    async def __aenter__(self):
+        while self._holders >= self._concurrency_limiter.get_limit_share(self._limit_share):
+            waiter = self._loop.create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Pass on a wake up which this waiter can no longer use
+                if waiter.done() and not waiter.cancelled():
+                    self._wake()
+                raise
+        self._holders += 1
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._holders -= 1
+        self._wake()
+
+    def _wake(self):
+        available = self._concurrency_limiter.get_limit_share(self._limit_share) - self._holders
+        while available > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                available -= 1
+
+    def _on_limit_changed(self, old_limit, new_limit):
+        if new_limit > old_limit:
+            self._loop.call_soon_threadsafe(self._wake)
+
+
+# A WorkPoolTask whose work is a coroutine run on the AsyncTransferManager's event loop
+class _CoroutineTask(WorkPoolTask):
+    def __init__(self, callbacks_container, coroutine_function, *args):
+        super(_CoroutineTask, self).__init__(callbacks_container=callbacks_container)
+        self._coroutine_function = coroutine_function
+        self._args = args
+
+    async def do_work(self):
+        result = None
+        try:
+            result = await self._coroutine_function(*self._args)
+            self._run_success_callbacks(result, self._success_callbacks)
+        except Exception as e:
+            self._run_error_callbacks(e, self._error_callbacks)
+            raise
+        finally:
+            self._run_callbacks(self._completion_callbacks)
+
+        return result
+
+
+# A future returned from the AsyncTransferManager, with the same methods as a WorkPoolFuture
+class AsyncWorkPoolFuture(object):
+    def __init__(self, future):
+        # A concurrent.futures.Future for the coroutine running on the event loop
+        self._future = future
+
+    def result(self):
+        # This will block until the result is available. If the result is an exception, it'll throw it
+        return self._future.result()
+
+    def done(self):
+        return self._future.done()
+
+    def successful(self):
+        if not self._future.done():
+            raise ValueError('{} not ready'.format(self))
+        return self._future.exception() is None
+
+
+# Builds and signs the requests for Object Storage operations. The requests are built by calling the operation on a copy
+# of the client whose base client returns the request rather than sending it, so the paths, query parameters and headers
+# are exactly the ones the SDK would send.
+class _RequestBuilder(object):
+    def __init__(self, object_storage_client):
+        self.base_client = object_storage_client.base_client
+
+        building_base_client = copy.copy(self.base_client)
+        building_base_client.request = lambda request: request
+
+        self._building_client = copy.copy(object_storage_client)
+        self._building_client.base_client = building_base_client
+        self._building_client.retry_strategy = None
+
+    def build(self, operation_name, *args, **kwargs):
+        """Returns the oci.request.Request for the operation, the signed requests.PreparedRequest to send, and the body
+        (None, bytes, or a _FileRange which is streamed)."""
+        request = getattr(self._building_client, operation_name)(*args, **kwargs)
+
+        body = request.body
+        if isinstance(body, six.text_type):
+            body = body.encode('utf-8')
+        is_streamed = body is not None and not isinstance(body, six.binary_type)
+
+        prepared_request = requests.Request(
+            request.method,
+            request.url,
+            params=request.query_params,
+            headers=request.header_params,
+            data=None if is_streamed else body
+        ).prepare()
+        prepared_request.headers.setdefault('host', six.moves.urllib.parse.urlsplit(prepared_request.url).netloc)
+
+        signer = self.base_client.signer
+        if not request.enforce_content_headers:
+            signer = signer.without_content_headers
+        signer(prepared_request)
+
+        return request, prepared_request, body
+
+    def build_service_error(self, request, status, headers, content):
+        # The same error that the SDK raises for an unsuccessful response
+        deserialized_data = self.base_client.deserialize_response_data(content, 'object')
+        service_code = None
+        message = deserialized_data
+        if isinstance(deserialized_data, dict):
+            service_code = deserialized_data.get('code')
+            message = deserialized_data.get('message')
+
+        return oci.exceptions.ServiceError(status, service_code, headers, message, original_request=request)
+
+
+# The body of a request which is the given range of bytes from a file. It is read by the threads of the file IO
+# executor, one chunk at a time, as the request is sent. If hash_data is True the MD5 checksum of the range is
+# calculated as it is read.
+class _FileRange(object):
+    def __init__(self, file_path, offset, size, hash_data=False):
+        self.file_path = file_path
+        self.offset = offset
+        self.size = size
+        self._hash_data = hash_data
+        self._reader = None
+        self._file = None
+        self._remaining = 0
+
+    def rewind(self):
+        if self._file is None:
+            self._file = open(self.file_path, 'rb')
+        self._file.seek(self.offset)
+        self._remaining = self.size
+
+        # Each attempt to send the body starts a new checksum
+        self._reader = cli_util.HashingReader(self._file) if self._hash_data else self._file
+
+    def read(self, size):
+        data = self._reader.read(min(size, self._remaining))
+        self._remaining -= len(data)
+        return data
+
+    def get_checksum(self):
+        if self._reader is None:
+            self.rewind()
+        return self._reader.get_checksum()
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+# Writes the body of a successful GetObject response to a file. A file given by its path is opened (and truncated)
+# when the first chunk is received, so the file is left alone if the request fails.
+class _FileSink(object):
+    def __init__(self, run_io, file_path=None, file_handle=None):
+        self._run_io = run_io
+        self._file_path = file_path
+        self._file = file_handle
+        self._bytes_written = 0
+
+    def can_retry(self):
+        # Once data has been written to a file handle (e.g. stdout) it cannot be taken back
+        return self._file_path is not None or self._bytes_written == 0
+
+    def reset(self):
+        if self._file_path is not None:
+            self.close()
+        self._bytes_written = 0
+
+    @property
+    def file_handle(self):
+        return self._file
+
+    async def write(self, chunk):
+        await self.open()
+        await self._run_io(self._file.write, chunk)
+        self._bytes_written += len(chunk)
+
+    async def open(self):
+        # This is also called once the response has been received, so empty objects still give an empty file
+        if self._file is None:
+            self._file = await self._run_io(open, self._file_path, 'wb')
+
+    def close(self):
+        if self._file_path is not None and self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+# Writes a range of an object to its offset in a regular file
+class _PositionalSink(object):
+    def __init__(self, run_io, positional_writer, offset, chunk_written_callback=None):
+        self._run_io = run_io
+        self._positional_writer = positional_writer
+        self._start_offset = offset
+        self._offset = offset
+        self._chunk_written_callback = chunk_written_callback
+
+    def can_retry(self):
+        # A retry writes the same bytes to the same offsets
+        return True
+
+    def reset(self):
+        self._offset = self._start_offset
+
+    async def write(self, chunk):
+        await self._run_io(self._positional_writer.write, self._offset, chunk)
+        self._offset += len(chunk)
+        if self._chunk_written_callback:
+            self._chunk_written_callback(len(chunk))
+
+
+# Holds a range of an object which is written once the ranges before it are, in memory or in a temporary file depending
+# on the memory budget of the download
+class _SpooledPartSink(object):
+    def __init__(self, run_io, memory_budget, chunk_written_callback=None):
+        self._run_io = run_io
+        self._memory_budget = memory_budget
+        self._chunk_written_callback = chunk_written_callback
+        self.part = SpooledPart(memory_budget)
+
+    def can_retry(self):
+        return True
+
+    def reset(self):
+        self.part.close()
+        self.part = SpooledPart(self._memory_budget)
+
+    async def write(self, chunk):
+        await self._run_io(self.part.write, chunk)
+        if self._chunk_written_callback:
+            self._chunk_written_callback(len(chunk) / 2)
+
+    def close(self):
+        self.part.close()
+
+
+# Writes the ranges of a multipart download to the sink in order, as they become available
+class _OrderedPartWriter(object):
+    def __init__(self, sink, run_io):
+        self._sink = sink
+        self._run_io = run_io
+        self._pending = {}
+        self._next_index = 0
+        self._lock = asyncio.Lock()
+
+    async def write(self, index, part):
+        self._pending[index] = part
+        async with self._lock:
+            while self._next_index in self._pending:
+                part = self._pending.pop(self._next_index)
+                try:
+                    # Parts in temporary files are read a chunk at a time
+                    chunks = part.read_chunks(TRANSFER_CHUNK_SIZE)
+                    while True:
+                        chunk = await self._run_io(next, chunks, None)
+                        if chunk is None:
+                            break
+                        await self._sink.write(chunk)
+                finally:
+                    part.close()
+                self._next_index += 1
+
+    def close(self):
+        for part in self._pending.values():
+            part.close()
+        self._pending = {}
+
+
+def _build_ssl_context(verify):
+    # Verifies certificates in the same way as the client's requests session
+    if verify is False:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        return context
+
+    ca_bundle = verify if isinstance(verify, six.string_types) else requests.certs.where()
+    return ssl.create_default_context(cafile=ca_bundle)
+
+
+class _StaleConnectionError(Exception):
+    pass
+
+
+# Sends HTTP/1.1 requests using asyncio streams. Connections are kept open after each response so that later requests
+# to the same host can reuse them, and at most max_connections requests are sent at once.
+class AsyncHttpConnectionPool(object):
+    def __init__(self, max_connections, ssl_context, timeout, run_io):
+        self._slots = asyncio.Semaphore(max_connections)
+        self._ssl_context = ssl_context
+        self._run_io = run_io
+        self._idle_connections = {}
+
+        connect_timeout, read_timeout = DEFAULT_CONNECT_TIMEOUT_SECONDS, DEFAULT_READ_TIMEOUT_SECONDS
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+        elif timeout:
+            connect_timeout = read_timeout = timeout
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+
+    async def send(self, prepared_request, body, response_sink=None):
+        """Sends the request and returns the status, headers and content of the response. If a response sink is given
+        the body of a successful response is written to it instead of being returned as the content."""
+        url = six.moves.urllib.parse.urlsplit(prepared_request.url)
+        is_https = url.scheme == 'https'
+        key = (url.scheme, url.hostname, url.port or (443 if is_https else 80))
+
+        async with self._slots:
+            while True:
+                reader, writer, is_reused = await self._get_connection(key, is_https)
+                keep_alive = False
+                try:
+                    await self._write_request(writer, prepared_request, body)
+                    status, headers, content, keep_alive = await self._read_response(reader, prepared_request.method, response_sink)
+                    return status, headers, content
+                except _StaleConnectionError:
+                    # The server closed a connection which had been idle, so send the request on a new one
+                    if not is_reused:
+                        raise oci.exceptions.RequestException('Connection closed without a response')
+                except asyncio.TimeoutError:
+                    raise oci.exceptions.RequestException('Timed out waiting for a response from {}'.format(url.netloc))
+                except (OSError, asyncio.IncompleteReadError) as e:
+                    if not is_reused or getattr(e, 'partial', None):
+                        raise oci.exceptions.RequestException(e)
+                finally:
+                    if keep_alive:
+                        self._idle_connections.setdefault(key, []).append((reader, writer))
+                    else:
+                        writer.close()
+
+    async def close(self):
+        for connections in self._idle_connections.values():
+            for reader, writer in connections:
+                writer.close()
+        self._idle_connections = {}
+
+    async def _get_connection(self, key, is_https):
+        idle_connections = self._idle_connections.get(key)
+        while idle_connections:
+            reader, writer = idle_connections.pop()
+            if not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(key[1], key[2], ssl=self._ssl_context if is_https else None, limit=2 ** 16),
+                self._connect_timeout
+            )
+        except asyncio.TimeoutError as e:
+            raise oci.exceptions.ConnectTimeout(e)
+        except OSError as e:
+            raise oci.exceptions.RequestException(e)
+
+        return reader, writer, False
+
+    async def _with_read_timeout(self, awaitable):
+        return await asyncio.wait_for(awaitable, self._read_timeout)
+
+    async def _write_request(self, writer, prepared_request, body):
+        lines = ['{} {} HTTP/1.1'.format(prepared_request.method, prepared_request.path_url)]
+        lines.extend('{}: {}'.format(name, value) for name, value in six.iteritems(prepared_request.headers))
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+
+        if isinstance(body, six.binary_type):
+            writer.write(body)
+        elif body is not None:
+            await self._run_io(body.rewind)
+            while True:
+                chunk = await self._run_io(body.read, TRANSFER_CHUNK_SIZE)
+                if not chunk:
+                    break
+                writer.write(chunk)
+                await self._with_read_timeout(writer.drain())
+
+        await self._with_read_timeout(writer.drain())
+
+    async def _read_response(self, reader, method, response_sink):
+        status_line = await self._with_read_timeout(reader.readline())
+        if not status_line:
+            raise _StaleConnectionError()
+
+        version, status, headers = await self._read_status_and_headers(reader, status_line)
+        while 100 <= status < 200:
+            # Informational responses are followed by the real one
+            version, status, headers = await self._read_status_and_headers(reader, await self._with_read_timeout(reader.readline()))
+
+        content = []
+
+        async def consume(chunk):
+            if response_sink and 200 <= status <= 299:
+                await response_sink.write(chunk)
+            else:
+                content.append(chunk)
+
+        keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+        if method == 'HEAD' or status in (204, 304):
+            pass
+        elif 'chunked' in headers.get('transfer-encoding', '').lower():
+            while True:
+                size_line = await self._with_read_timeout(reader.readline())
+                size = int(size_line.split(b';')[0].strip(), 16)
+                if size == 0:
+                    # Skip any trailers
+                    while size_line not in (b'\r\n', b'\n', b''):
+                        size_line = await self._with_read_timeout(reader.readline())
+                    break
+                await self._read_body(reader, size, consume)
+                await self._with_read_timeout(reader.readexactly(2))
+        elif 'content-length' in headers:
+            await self._read_body(reader, int(headers['content-length']), consume)
+        else:
+            # The body ends when the server closes the connection
+            keep_alive = False
+            while True:
+                chunk = await self._with_read_timeout(reader.read(TRANSFER_CHUNK_SIZE))
+                if not chunk:
+                    break
+                await consume(chunk)
+
+        return status, headers, b''.join(content), keep_alive
+
+    async def _read_status_and_headers(self, reader, status_line):
+        parts = status_line.decode('latin-1').split(None, 2)
+        if len(parts) < 2:
+            raise oci.exceptions.RequestException('Invalid status line: {}'.format(status_line))
+
+        headers = CaseInsensitiveDict()
+        while True:
+            line = await self._with_read_timeout(reader.readline())
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            name = name.strip()
+            value = value.strip()
+            headers[name] = '{}, {}'.format(headers[name], value) if name in headers else value
+
+        return parts[0], int(parts[1]), headers
+
+    async def _read_body(self, reader, size, consume):
+        remaining = size
+        while remaining > 0:
+            chunk = await self._with_read_timeout(reader.read(min(remaining, TRANSFER_CHUNK_SIZE)))
+            if not chunk:
+                raise oci.exceptions.RequestException('Connection closed with {} bytes of the response body left to read'.format(remaining))
+            remaining -= len(chunk)
+            await consume(chunk)
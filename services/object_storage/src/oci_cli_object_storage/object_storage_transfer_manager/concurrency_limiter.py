@@ -0,0 +1,107 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import threading
+import time
+
+# The most requests which an adaptive limit will allow in flight, unless the starting limit is higher
+DEFAULT_MAX_LIMIT = 128
+
+# The window grows by ADDITIVE_INCREASE for every window's worth of successful requests, and is multiplied by
+# MULTIPLICATIVE_DECREASE when a request is throttled or times out
+ADDITIVE_INCREASE = 1.0
+MULTIPLICATIVE_DECREASE = 0.5
+
+# The window only grows while the average latency is within this factor of the lowest average latency seen (or within the
+# slack of it, so that the noise in very short latencies is not taken for the latency climbing)
+LATENCY_TOLERANCE = 2.0
+LATENCY_SLACK_SECONDS = 0.05
+LATENCY_SMOOTHING = 0.1
+
+# Responses with these statuses mean that the service wants fewer requests
+OVERLOAD_STATUSES = (429, 503)
+
+# Transfer managers send requests for whole objects and for parts of multipart transfers from separate pools, and give each
+# pool this share of the limit, so that between them they do not have more than the limit in flight
+POOL_LIMIT_SHARE = 0.5
+
+
+# An AIMD (additive increase, multiplicative decrease) limit on the number of requests in flight, which is adjusted from the
+# outcomes of the requests in the same way as a TCP congestion window:
+#
+#   - While requests succeed, and their latency is not climbing, the window grows by one for each window's worth of requests
+#   - When a request is throttled (429), the service is unavailable (503) or a request times out, the window is halved. Further
+#     overloaded requests which were sent before the window was halved don't halve it again, since they were sent at the old rate
+#   - Other server errors stop the window from growing, but do not shrink it
+#
+# Semaphores using the limit register a listener, which is called with the old and new limits whenever the limit changes.
+class AimdConcurrencyLimiter(object):
+    def __init__(self, initial_limit, max_limit=None, min_limit=1):
+        self.min_limit = min_limit
+        self.max_limit = max(initial_limit, max_limit or DEFAULT_MAX_LIMIT)
+        self._window = float(max(min_limit, min(initial_limit, self.max_limit)))
+        self._average_latency = None
+        self._baseline_latency = None
+        self._last_decrease = 0
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self):
+        return int(self._window)
+
+    def get_limit_share(self, share):
+        """Returns the given share of the current limit, which is at least one so that a pool with a share can always make progress."""
+        return max(1, int(self._window * share))
+
+    def add_listener(self, listener):
+        self._listeners.append(listener)
+
+    def start_request(self):
+        """Returns a token to pass to record_response or record_error when the request completes."""
+        return time.time()
+
+    def record_response(self, started_at, status):
+        if status in OVERLOAD_STATUSES:
+            self._decrease(started_at)
+        elif status < 500:
+            self._record_success(time.time() - started_at)
+
+    def record_error(self, started_at, is_overload):
+        """Records a request which failed without a response: is_overload should be True for timeouts and refused connections."""
+        if is_overload:
+            self._decrease(started_at)
+
+    def _record_success(self, latency):
+        with self._lock:
+            if self._average_latency is None:
+                self._average_latency = latency
+            else:
+                self._average_latency += LATENCY_SMOOTHING * (latency - self._average_latency)
+
+            if self._baseline_latency is None or self._average_latency < self._baseline_latency:
+                self._baseline_latency = self._average_latency
+
+            if self._average_latency > max(LATENCY_TOLERANCE * self._baseline_latency, self._baseline_latency + LATENCY_SLACK_SECONDS):
+                return
+
+            self._set_window(min(self.max_limit, self._window + ADDITIVE_INCREASE / self._window))
+
+    def _decrease(self, started_at):
+        with self._lock:
+            if started_at < self._last_decrease:
+                return
+
+            self._last_decrease = time.time()
+
+            # The latency at the new window is measured afresh
+            self._average_latency = None
+            self._baseline_latency = None
+            self._set_window(max(self.min_limit, self._window * MULTIPLICATIVE_DECREASE))
+
+    def _set_window(self, window):
+        old_limit = self.limit
+        self._window = window
+        if self.limit != old_limit:
+            for listener in self._listeners:
+                listener(old_limit, self.limit)
@@ -0,0 +1,31 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+from .work_pool_task import WorkPoolTask
+
+from retrying import retry
+from oci_cli import retry_utils
+
+
+# A task which starts a server-side copy of an object. The copy is done asynchronously by Object Storage, so the result of
+# the task is the ID of the work request which tracks it
+class CopyObjectTask(WorkPoolTask):
+    def __init__(self, object_storage_client, callbacks_container, **kwargs):
+        super(CopyObjectTask, self).__init__(callbacks_container=callbacks_container)
+
+        self.object_storage_client = object_storage_client
+        self.kwargs = kwargs
+
+    def do_work_hook(self):
+        response = self._make_retrying_copy_object_call(self.object_storage_client, **self.kwargs)
+        return response.headers['opc-work-request-id']
+
+    @retry(stop_max_attempt_number=3, wait_exponential_multiplier=1000, wait_exponential_max=10000, wait_jitter_max=2000,
+           retry_on_exception=retry_utils.retry_on_timeouts_connection_internal_server_and_throttles)
+    def _make_retrying_copy_object_call(self, client, **kwargs):
+        return client.copy_object(
+            kwargs['namespace'],
+            kwargs['bucket_name'],
+            kwargs['copy_object_details'],
+            opc_client_request_id=kwargs.get('request_id')
+        )
@@ -0,0 +1,118 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import io
+import mmap
+
+from oci.object_storage.transfer.internal.multipart_object_assembler import MultipartObjectAssembler
+from oci_cli import cli_util
+
+# Object Storage allows at most this many parts in a multipart upload
+MAX_PARTS = 10000
+
+MEBIBYTE = 1024 * 1024
+
+
+def get_part_size(file_size, part_size):
+    """Returns part_size, unless a file of file_size bytes would need more than MAX_PARTS parts of that size, in which case
+    the smallest whole number of MiB which fits the file into MAX_PARTS parts is returned instead."""
+    if file_size <= part_size * MAX_PARTS:
+        return part_size
+
+    smallest_part_size = -(-file_size // MAX_PARTS)
+    return -(-smallest_part_size // MEBIBYTE) * MEBIBYTE
+
+
+def get_md5(view):
+    """Returns the base64 encoded MD5 hash of a buffer (e.g. a memoryview), as it is given in the Content-MD5 header."""
+    md5 = cli_util.new_md5()
+    md5.update(view)
+    return cli_util.format_md5_checksum(md5.hexdigest())
+
+
+# A read-only memory map of a part of a file. view is a memoryview of the bytes of the part, so the part can be hashed and
+# sent as a request body straight from the page cache, without reading it into Python objects.
+#
+# The start of a mapping must be a multiple of the allocation granularity, so the part is mapped from the boundary before
+# its offset. The file must not be truncated while it is mapped.
+class MappedFilePart(object):
+    def __init__(self, file_path, offset, size):
+        start = offset - offset % mmap.ALLOCATIONGRANULARITY
+        with io.open(file_path, mode='rb') as file_object:
+            self._map = mmap.mmap(file_object.fileno(), offset - start + size, offset=start, access=mmap.ACCESS_READ)
+
+        try:
+            if hasattr(self._map, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                self._map.madvise(mmap.MADV_SEQUENTIAL)
+            self.view = memoryview(self._map)[offset - start:offset - start + size]
+        except Exception:
+            self._map.close()
+            raise
+
+    def close(self):
+        # A request body may still hold slices of the view (e.g. in a connection's send buffer). The map is then closed
+        # when the last of them is garbage collected instead
+        try:
+            self.view.release()
+            self._map.close()
+        except BufferError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def map_file_part(file_path, offset, size):
+    """Returns a MappedFilePart for the given part of a file, or None if the part cannot be mapped (e.g. it is empty, the
+    file is on a filesystem which does not support memory maps, or the Python version cannot make a memoryview of one)."""
+    if size == 0:
+        return None
+
+    try:
+        return MappedFilePart(file_path, offset, size)
+    except (EnvironmentError, ValueError, TypeError, OverflowError):
+        return None
+
+
+def calculate_md5(file_path, offset, size):
+    """Returns the base64 encoded MD5 hash of a part of a file, hashing it from a memory map of the part if it can be mapped."""
+    mapped_part = map_file_part(file_path, offset, size)
+    if mapped_part is None:
+        return MultipartObjectAssembler.calculate_md5(file_path, offset, size)
+
+    with mapped_part:
+        return get_md5(mapped_part.view)
+
+
+# A file-like object which reads from a memoryview, so that a request body can be sent from a buffer without copying it.
+# Reads return views of the buffer, and the length is given by len() so that requests sends a Content-Length
+class MemoryViewReader(object):
+    def __init__(self, view):
+        self._view = view
+        self._position = 0
+
+    def __len__(self):
+        return len(self._view)
+
+    def read(self, n=-1):
+        end = len(self._view) if n is None or n < 0 else min(len(self._view), self._position + n)
+        data = self._view[self._position:end]
+        self._position = end
+        return data
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        elif whence == io.SEEK_END:
+            self._position = len(self._view) + offset
+        else:
+            raise RuntimeError("Unhandled whence value: {}".format(whence))
+        return self._position
+
+    def tell(self):
+        return self._position
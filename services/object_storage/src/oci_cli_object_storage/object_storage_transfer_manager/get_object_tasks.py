@@ -10,13 +10,20 @@ from oci_cli import retry_utils
 
 import heapq
 import oci
+import os
 import six
+import stat
+import tempfile
 import threading
 
 
 MEBIBYTE = 1024 * 1024
 OBJECT_GET_CHUNK_SIZE = MEBIBYTE
 
+# When a multipart download is written to a pipe (e.g. stdout), parts which arrive before the parts ahead of them are
+# held in memory up to this limit, and in temporary files beyond it
+PENDING_WRITES_MEMORY_LIMIT = 128 * MEBIBYTE
+
 
 @retry(stop_max_attempt_number=3, wait_exponential_multiplier=1000, wait_exponential_max=10000, wait_jitter_max=2000,
        retry_on_exception=retry_utils.retry_on_timeouts_connection_internal_server_and_throttles)
@@ -59,8 +66,9 @@ class GetObjectTask(WorkPoolTask):
 #
 #   - Figuring out what the ranges are
 #   - Sending those to be procesed by the appropriate worker pool
-#   - Spawning an extra thread to coordinate writing data in the right order and as it becomes ready to the destination. We have an
-#     extra thread for this so that we can write as we go rather than waiting until the end (this is also handier for piping/streaming scenarios
+#   - If the destination is a regular file, each range is written straight to its offset in the file as it is downloaded
+#   - Otherwise (e.g. a pipe), spawning an extra thread to coordinate writing data in the right order and as it becomes ready to the destination. We
+#     have an extra thread for this so that we can write as we go rather than waiting until the end (this is also handier for piping/streaming scenarios
 #     since the other end is probably not expecting to get everything all at once)
 class GetObjectMultipartTask(WorkPoolTask):
     DEFAULT_MULTIPART_DOWNLOAD_SIZE = 10 * MEBIBYTE
@@ -130,31 +138,17 @@ class GetObjectMultipartTask(WorkPoolTask):
             #
             #   bytes=0-499 (first 500 bytes, inclusive)
             #   bytes=500-999 (second 500 bytes, inclusive)
-            start_byte = 0
-            end_byte = self.part_size - 1
-            tuple_counter = 0
-
-            while end_byte < content_length:
-                if start_byte != end_byte:
-                    self.range_tuples.append(
-                        (
-                            tuple_counter,
-                            {'range': 'bytes={}-{}'.format(start_byte, end_byte)}
-                        )
+            for tuple_counter, start_byte in enumerate(range(0, content_length, self.part_size)):
+                end_byte = min(start_byte + self.part_size, content_length) - 1
+                self.range_tuples.append(
+                    (
+                        tuple_counter,
+                        {'range': 'bytes={}-{}'.format(start_byte, end_byte), 'offset': start_byte}
                     )
+                )
 
-                tuple_counter += 1
-
-                # Next window of bytes
-                start_byte = start_byte + self.part_size
-                end_byte = end_byte + self.part_size
-
-                if start_byte >= content_length:
-                    break
-
-                # Don't overshoot the end part of the window
-                if end_byte >= content_length:
-                    end_byte = content_length - 1
+            positional_writer = PositionalFileWriter.create(self.destination_file_handle, content_length)
+            memory_budget = None if positional_writer else MemoryBudget(PENDING_WRITES_MEMORY_LIMIT)
 
             self.pending_writes.total_parts = len(self.range_tuples)
 
@@ -181,6 +175,9 @@ class GetObjectMultipartTask(WorkPoolTask):
                     self.io_writer_pool,
                     self.add_pending_write_lock,
                     self.pending_writes,
+                    positional_writer=positional_writer,
+                    offset=rt[1]['offset'],
+                    memory_budget=memory_budget,
                     **copy_kwargs
                 )
 
@@ -198,6 +195,9 @@ class GetObjectMultipartTask(WorkPoolTask):
 
             self._handle_errors(errors)
 
+            if positional_writer:
+                positional_writer.finish()
+
         if self.auto_close_destination_file:
             self.destination_file_handle.close()
 
@@ -230,8 +230,12 @@ class GetObjectMultipartTask(WorkPoolTask):
 
 
 # A task which can retrieve a range of bytes for an object from object storage. Intended for internal use by GetObjectMultipartTask and not as a general task.
+#
+# If there is a positional writer the range is written to its offset in the destination as it is downloaded. Otherwise it is held (in memory
+# or in a temporary file, depending on the memory budget) until the ranges before it have been written.
 class GetObjectRangeTask(WorkPoolTask):
-    def __init__(self, object_storage_client, callbacks_container, destination_file_handle, tuple_counter, io_writer_pool, add_pending_write_lock, pending_writes, **kwargs):
+    def __init__(self, object_storage_client, callbacks_container, destination_file_handle, tuple_counter, io_writer_pool, add_pending_write_lock, pending_writes,
+                 positional_writer=None, offset=0, memory_budget=None, **kwargs):
         super(GetObjectRangeTask, self).__init__(callbacks_container=callbacks_container)
 
         self.object_storage_client = object_storage_client
@@ -242,7 +246,9 @@ class GetObjectRangeTask(WorkPoolTask):
         self.add_pending_write_lock = add_pending_write_lock
 
         self.destination_file_handle = destination_file_handle
-        self.downloaded_data = six.BytesIO()
+        self.positional_writer = positional_writer
+        self.offset = offset
+        self.memory_budget = memory_budget
 
         if 'chunk_written_callback' in self.kwargs:
             self.chunk_written_callback = self.kwargs['chunk_written_callback']
@@ -257,20 +263,27 @@ class GetObjectRangeTask(WorkPoolTask):
             self.part_completed_callback = None
 
     def do_work_hook(self):
-        get_object_response = _make_retrying_get_call(self.object_storage_client, **self.kwargs)
-        total_size = 0
-        for chunk in get_object_response.data.raw.stream(OBJECT_GET_CHUNK_SIZE, decode_content=False):
-            self.downloaded_data.write(chunk)
-            total_size += len(chunk)
-            if self.chunk_written_callback:
-                self.chunk_written_callback(len(chunk) / 2)
+        if self.positional_writer:
+            self._write_to_offset()
+            return
+
+        downloaded_data = SpooledPart(self.memory_budget)
+        try:
+            get_object_response = _make_retrying_get_call(self.object_storage_client, **self.kwargs)
+            for chunk in get_object_response.data.raw.stream(OBJECT_GET_CHUNK_SIZE, decode_content=False):
+                downloaded_data.write(chunk)
+                if self.chunk_written_callback:
+                    self.chunk_written_callback(len(chunk) / 2)
+        except Exception:
+            downloaded_data.close()
+            raise
 
         if self.part_completed_callback:
-            self.part_completed_callback(total_size)
+            self.part_completed_callback(downloaded_data.size)
 
         # PendingWrites uses heapq, which is not thread safe, so we need to lock it
         with self.add_pending_write_lock:
-            parts_to_write = self.pending_writes.process_pending_write(self.tuple_counter, self.downloaded_data)
+            parts_to_write = self.pending_writes.process_pending_write(self.tuple_counter, downloaded_data)
             self.io_writer_pool.submit(
                 GetObjectRangeIOWriterTask(
                     WorkPoolTaskCallbacksContainer(error_callbacks=self.get_error_callbacks()),  # Pass along any error callbacks so that we can signal the parent task that something bad has happened
@@ -282,6 +295,20 @@ class GetObjectRangeTask(WorkPoolTask):
                 )
             )
 
+    def _write_to_offset(self):
+        get_object_response = _make_retrying_get_call(self.object_storage_client, **self.kwargs)
+        offset = self.offset
+        for chunk in get_object_response.data.raw.stream(OBJECT_GET_CHUNK_SIZE, decode_content=False):
+            self.positional_writer.write(offset, chunk)
+            offset += len(chunk)
+            if self.chunk_written_callback:
+                self.chunk_written_callback(len(chunk))
+
+        if self.part_completed_callback:
+            self.part_completed_callback(offset - self.offset)
+
+        self.pending_writes.mark_part_written()
+
 
 class GetObjectRangeIOWriterTask(WorkPoolTask):
     READ_WRITE_CHUNK_SIZE = 10 * MEBIBYTE
@@ -297,10 +324,10 @@ class GetObjectRangeIOWriterTask(WorkPoolTask):
     def do_work_hook(self):
         total_size = 0
         for part in self.parts_to_write:
-            part[1].seek(0)
-            self.destination_file_handle.write(part[1].read())
+            for chunk in part[1].read_chunks(self.READ_WRITE_CHUNK_SIZE):
+                self.destination_file_handle.write(chunk)
             if self.part_completed_callback:
-                self.part_completed_callback(part[1].tell() / 2)
+                self.part_completed_callback(part[1].size / 2)
             part[1].close()
             self.pending_writes.increment_written_parts()
 
@@ -337,6 +364,13 @@ class PendingWrites(object):
         with self.written_parts_lock:
             self._written_parts += 1
 
+    def mark_part_written(self):
+        # Parts written from more than one thread must only release the lock once
+        with self.written_parts_lock:
+            self._written_parts += 1
+            if self._written_parts == self._total_parts:
+                self.all_done_lock.release()
+
     def process_pending_write(self, tuple_counter, data):
         heapq.heappush(self.pending, (tuple_counter, data))
 
@@ -353,3 +387,117 @@ class PendingWrites(object):
 
     def release_lock_on_error(self, **kwargs):
         self.all_done_lock.release()
+
+
+# Writes the parts of a download to their offsets in a regular file, from any number of threads, without buffering them
+class PositionalFileWriter(object):
+    def __init__(self, file_handle, content_length):
+        self.file_handle = file_handle
+        self.file_handle.flush()
+        self.fileno = file_handle.fileno()
+        self.base_offset = file_handle.tell()
+        self.end_offset = self.base_offset + content_length
+        self.seek_write_lock = threading.Lock()
+
+        # Size the file up front, rather than extending it as later parts are written first
+        if hasattr(os, 'ftruncate'):
+            os.ftruncate(self.fileno, self.end_offset)
+
+    @classmethod
+    def create(cls, file_handle, content_length):
+        """Returns a writer for the file handle if it is a seekable regular file, otherwise None (e.g. for pipes and stdout)."""
+        try:
+            if not stat.S_ISREG(os.fstat(file_handle.fileno()).st_mode):
+                return None
+            file_handle.tell()
+        except (AttributeError, IOError, OSError, ValueError):
+            return None
+
+        return cls(file_handle, content_length)
+
+    def write(self, offset, data):
+        offset += self.base_offset
+        if hasattr(os, 'pwrite'):
+            view = memoryview(data)
+            while view:
+                written = os.pwrite(self.fileno, view, offset)
+                view = view[written:]
+                offset += written
+        else:
+            # Python 2 and Windows do not have pwrite, so the seek and the write need to happen together
+            with self.seek_write_lock:
+                os.lseek(self.fileno, offset, os.SEEK_SET)
+                os.write(self.fileno, data)
+
+    def finish(self):
+        # Leave the handle after the object, as though it had been written sequentially
+        self.file_handle.seek(self.end_offset)
+
+
+# A limit on the memory used to hold the parts of a download which are waiting to be written
+class MemoryBudget(object):
+    def __init__(self, limit):
+        self.available = limit
+        self.lock = threading.Lock()
+
+    def reserve(self, size):
+        with self.lock:
+            if size > self.available:
+                return False
+            self.available -= size
+            return True
+
+    def release(self, size):
+        with self.lock:
+            self.available += size
+
+
+# The data of a downloaded part. It is held in memory while the memory budget allows and in a temporary file otherwise.
+class SpooledPart(object):
+    def __init__(self, memory_budget):
+        self.memory_budget = memory_budget
+        self.chunks = []
+        self.reserved = 0
+        self.spill_file = None
+        self.size = 0
+
+    def write(self, chunk):
+        self.size += len(chunk)
+        if self.spill_file is None:
+            if self.memory_budget is None or self.memory_budget.reserve(len(chunk)):
+                self.chunks.append(chunk)
+                self.reserved += len(chunk)
+                return
+            self._spill()
+
+        self.spill_file.write(chunk)
+
+    def read_chunks(self, chunk_size):
+        for chunk in self.chunks:
+            yield chunk
+
+        if self.spill_file is not None:
+            self.spill_file.seek(0)
+            while True:
+                chunk = self.spill_file.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    def close(self):
+        self._release()
+        if self.spill_file is not None:
+            self.spill_file.close()
+            self.spill_file = None
+
+    def _spill(self):
+        self.spill_file = tempfile.TemporaryFile()
+        for chunk in self.chunks:
+            self.spill_file.write(chunk)
+        self._release()
+
+    def _release(self):
+        self.chunks = []
+        if self.memory_budget is not None and self.reserved:
+            self.memory_budget.release(self.reserved)
+        self.reserved = 0
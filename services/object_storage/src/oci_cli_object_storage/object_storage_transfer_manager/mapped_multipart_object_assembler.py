@@ -0,0 +1,54 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+from oci.object_storage.transfer.internal.multipart_object_assembler import MultipartObjectAssembler
+from .file_parts import MemoryViewReader, get_md5, map_file_part
+
+
+# A version of MultipartObjectAssembler which uploads each part of a file from a memory map of the part. The part is hashed
+# from the same view it is sent from, so it is read from the page cache once rather than read into memory to be hashed
+# and then again to be sent. Parts which cannot be mapped are uploaded as MultipartObjectAssembler would
+class MappedFileMultipartObjectAssembler(MultipartObjectAssembler, object):
+    def _upload_part(self, part_num, part, **kwargs):
+        if "opc_md5" in part:
+            # The part was uploaded before the upload was resumed
+            if 'progress_callback' in kwargs:
+                kwargs['progress_callback'](part["size"])
+            return
+
+        mapped_part = map_file_part(part["file_path"], part["offset"], part["size"])
+        if mapped_part is None:
+            return super(MappedFileMultipartObjectAssembler, self)._upload_part(part_num, part, **kwargs)
+
+        with mapped_part:
+            if part["hash"] is None:
+                part["hash"] = get_md5(mapped_part.view)
+
+            new_kwargs = {'content_md5': part["hash"]}
+            if 'opc_client_request_id' in kwargs:
+                new_kwargs['opc_client_request_id'] = kwargs['opc_client_request_id']
+
+            remaining_tries = self.max_retries
+            while True:
+                try:
+                    response = self.object_storage_client.upload_part(self.manifest["namespace"],
+                                                                      self.manifest["bucketName"],
+                                                                      self.manifest["objectName"],
+                                                                      self.manifest["uploadId"],
+                                                                      part_num,
+                                                                      MemoryViewReader(mapped_part.view),
+                                                                      **new_kwargs)
+                except Exception as e:
+                    if self._is_exception_retryable(e) and remaining_tries > 1:
+                        remaining_tries -= 1
+                    else:
+                        raise
+                else:
+                    break
+
+        if response.status == 200:
+            part["etag"] = response.headers['etag']
+            part["opc_md5"] = str(response.headers['opc-content-md5'])
+
+        if 'progress_callback' in kwargs:
+            kwargs['progress_callback'](part["size"])
@@ -1,6 +1,9 @@
 # coding: utf-8
 # Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
 
+import os
+
+from oci import exceptions
 from .pooled_multipart_object_assembler import PooledMultipartObjectAssembler
 from .work_pool_task import WorkPoolTask
 from oci_cli import cli_util
@@ -8,7 +11,7 @@ from oci_cli import cli_util
 
 # A task which prepares a multipart upload by:
 #
-#   - Creating a new multipart upload
+#   - Creating a new multipart upload, or resuming the one recorded for the object in the transfer journal (if there is one)
 #   - Breaking the file to upload into parts
 #   - Sending the upload tasks to the main request pool
 #   - Committing the multipart upload when done
@@ -25,6 +28,7 @@ class MultipartUploadProcessorTask(WorkPoolTask):
         self.part_size = part_size
         self.object_storage_request_pool = object_storage_request_pool
         self.verify_checksum = verify_checksum
+        self.transfer_journal = self.multipart_kwargs.pop('transfer_journal', None)
 
         if 'multipart_part_completion_callback' in self.multipart_kwargs:
             self.multipart_part_completion_callback = self.multipart_kwargs['multipart_part_completion_callback']
@@ -36,16 +40,71 @@ class MultipartUploadProcessorTask(WorkPoolTask):
         if 'content_md5' in self.multipart_kwargs:
             self.multipart_kwargs.pop('content_md5')
 
-        self.multipart_kwargs['part_size'] = self.part_size
-        ma = PooledMultipartObjectAssembler(self.object_storage_client, self.namespace_name, self.bucket_name, self.object_name, self.object_storage_request_pool, **self.multipart_kwargs)
+        ma = self._get_recorded_upload()
+        if ma:
+            try:
+                return self._upload_and_commit(ma)
+            except exceptions.ServiceError as e:
+                # The recorded upload no longer exists (it may have been committed or aborted after it was recorded), so start a new one
+                if e.status != 404:
+                    raise
 
+        ma = self._build_assembler(self.part_size)
         ma.new_upload()
         ma.add_parts_from_file(self.file_path)
+        if self.transfer_journal:
+            self.transfer_journal.record_multipart_upload(self.object_name, ma.manifest['uploadId'], self.part_size, os.stat(self.file_path))
+
+        return self._upload_and_commit(ma)
+
+    def _build_assembler(self, part_size):
+        multipart_kwargs = self.multipart_kwargs.copy()
+        multipart_kwargs['part_size'] = part_size
+        return PooledMultipartObjectAssembler(self.object_storage_client, self.namespace_name, self.bucket_name, self.object_name, self.object_storage_request_pool, **multipart_kwargs)
+
+    # Returns an assembler for the multipart upload recorded for the object in the transfer journal, with the parts which were
+    # already uploaded filled in so that only the remaining parts are uploaded. Returns None if there is no recorded upload, or
+    # the file has changed since it was started
+    def _get_recorded_upload(self):
+        upload = self.transfer_journal.get_multipart_upload(self.object_name) if self.transfer_journal else None
+        if not upload:
+            return None
+
+        file_stat = os.stat(self.file_path)
+        if upload['size'] != file_stat.st_size or upload['mtime'] != file_stat.st_mtime:
+            # The parts which were uploaded are no use now, so don't leave them behind
+            try:
+                self.object_storage_client.abort_multipart_upload(self.namespace_name, self.bucket_name, self.object_name, upload['upload_id'])
+            except exceptions.ServiceError:
+                pass
+            return None
+
+        ma = self._build_assembler(upload['part_size'])
+        ma.manifest['uploadId'] = upload['upload_id']
+        ma.add_parts_from_file(self.file_path)
+        for part_num, part in upload['parts'].items():
+            ma.manifest['parts'][part_num - 1].update({'hash': part['md5'], 'etag': part['etag'], 'opc_md5': part['md5']})
+
+        return ma
+
+    def _upload_and_commit(self, ma):
+        upload_kwargs = {}
         if self.multipart_part_completion_callback:
-            ma.upload(progress_callback=self.multipart_part_completion_callback)
-        else:
-            ma.upload()
+            upload_kwargs['progress_callback'] = self.multipart_part_completion_callback
+
+        if self.transfer_journal:
+            recorded_parts = set(self.transfer_journal.get_multipart_upload(self.object_name)['parts'])
+            upload_id = ma.manifest['uploadId']
+
+            def record_part(part_num, part):
+                if part_num not in recorded_parts:
+                    self.transfer_journal.record_part(upload_id, part_num, part['etag'], part['opc_md5'])
+
+            upload_kwargs['part_completed_callback'] = record_part
+
+        ma.upload(**upload_kwargs)
         response = ma.commit()
 
+        # The parts were hashed from the file for the upload, so the checksum comes from those hashes without reading the file again
         multipart_hash = cli_util.verify_checksum(self.file_path, no_multipart=False, ma=ma) if self.verify_checksum else None
         return response, multipart_hash
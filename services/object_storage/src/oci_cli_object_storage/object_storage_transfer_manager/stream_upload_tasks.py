@@ -0,0 +1,233 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import threading
+
+from oci import exceptions
+from oci.object_storage import models
+import six
+from six.moves import queue
+from .file_parts import MAX_PARTS, MemoryViewReader, get_md5
+from .work_pool_task import WorkPoolTask, WorkPoolTaskCallback, WorkPoolTaskSuccessCallback, WorkPoolTaskErrorCallback, WorkPoolTaskCallbacksContainer
+from retrying import retry
+from oci_cli import retry_utils
+from oci_cli import cli_util
+
+
+# A fixed number of reusable buffers which parts of a stream are read into. A buffer is only allocated when there is no
+# free one and fewer than buffer_count have been allocated, so a short stream does not allocate all of them. acquire()
+# blocks until a buffer is released once they are all in use.
+class PartBufferRing(object):
+    def __init__(self, buffer_count, buffer_size):
+        self.buffer_size = buffer_size
+        self._buffer_count = buffer_count
+        self._allocated = 0
+        self._free = queue.Queue()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            if self._free.empty() and self._allocated < self._buffer_count:
+                self._allocated += 1
+                return bytearray(self.buffer_size)
+        return self._free.get()
+
+    def release(self, buffer):
+        self._free.put(buffer)
+
+
+# A task which uploads the content of a stream (e.g. STDIN or a pipe) whose size is not known in advance by:
+#
+#   - Reading a part at a time into a buffer from a PartBufferRing, and hashing it as it is read
+#   - Uploading the parts concurrently in the multipart request pool, straight from the buffers. Reading waits for a buffer
+#     to be released by an uploaded part, so at most buffer_count parts are held in memory however long the stream is
+#   - Committing the multipart upload once the stream ends, or aborting it if a part fails
+#
+# A stream which ends within the first part is uploaded with a single put instead.
+class StreamingMultipartUploadTask(WorkPoolTask):
+    def __init__(self, object_storage_client, namespace_name, bucket_name, object_name, stream, callbacks_container, object_storage_request_pool, part_size, buffer_count, verify_checksum, **kwargs):
+        super(StreamingMultipartUploadTask, self).__init__(callbacks_container=callbacks_container)
+
+        self.object_storage_client = object_storage_client
+        self.namespace_name = namespace_name
+        self.bucket_name = bucket_name
+        self.object_name = object_name
+        self.stream = stream
+        self.object_storage_request_pool = object_storage_request_pool
+        self.part_size = part_size
+        self.buffer_count = buffer_count
+        self.verify_checksum = verify_checksum
+
+        self.kwargs = kwargs.copy()
+        self.progress_callback = self.kwargs.pop('progress_callback', None)
+
+        # The MD5 of each part is calculated as it is read, so a given MD5 for the whole content is not used
+        self.kwargs.pop('content_md5', None)
+
+        self._failed = threading.Event()
+
+    def do_work_hook(self):
+        buffer_ring = PartBufferRing(self.buffer_count, self.part_size)
+        buffer = buffer_ring.acquire()
+        size = _read_part(self.stream, buffer)
+
+        if size < self.part_size:
+            return self._put_single_part(memoryview(buffer)[:size])
+
+        upload_id = self._make_retrying_create_multipart_upload_call().data.upload_id
+        try:
+            parts = self._upload_parts(upload_id, buffer_ring, buffer, size)
+            response = self._make_retrying_commit_multipart_upload_call(upload_id, parts)
+        except Exception:
+            # Don't leave the parts which were uploaded behind
+            try:
+                self.object_storage_client.abort_multipart_upload(self.namespace_name, self.bucket_name, self.object_name, upload_id)
+            except exceptions.ServiceError:
+                pass
+            raise
+
+        checksum = cli_util.get_multipart_checksum([part['md5'] for part in parts]) if self.verify_checksum else None
+        return response, checksum
+
+    def _upload_parts(self, upload_id, buffer_ring, buffer, size):
+        parts = []
+        futures = []
+
+        while not self._failed.is_set():
+            if len(parts) == MAX_PARTS:
+                raise RuntimeError('The stream is larger than {} parts of {} bytes. Use a larger part size.'.format(MAX_PARTS, self.part_size))
+
+            part_view = memoryview(buffer)[:size]
+            part = {'part_num': len(parts) + 1, 'md5': get_md5(part_view), 'size': size}
+            parts.append(part)
+
+            callbacks_container = WorkPoolTaskCallbacksContainer(
+                completion_callbacks=[WorkPoolTaskCallback(buffer_ring.release, buffer)],
+                success_callbacks=[WorkPoolTaskSuccessCallback(self._record_part, part)],
+                error_callbacks=[WorkPoolTaskErrorCallback(self._stop_reading)]
+            )
+            part_task = UploadStreamPartTask(
+                self.object_storage_client, self.namespace_name, self.bucket_name, self.object_name, upload_id,
+                part['part_num'], part_view, part['md5'], callbacks_container, opc_client_request_id=self.kwargs.get('opc_client_request_id')
+            )
+            futures.append(self.object_storage_request_pool.submit(part_task))
+
+            if size < self.part_size:
+                break
+
+            buffer = buffer_ring.acquire()
+            size = _read_part(self.stream, buffer)
+            if size == 0:
+                buffer_ring.release(buffer)
+                break
+
+        # This will throw the exception of the first part which failed
+        for future in futures:
+            future.result()
+
+        return parts
+
+    def _record_part(self, part, **kwargs):
+        part['etag'] = kwargs['work_pool_task_result'].headers['etag']
+        if self.progress_callback:
+            self.progress_callback(part['size'])
+
+    def _stop_reading(self, **kwargs):
+        self._failed.set()
+
+    def _put_single_part(self, part_view):
+        md5 = get_md5(part_view)
+        response = self._make_retrying_put_object_call(part_view, md5)
+        if self.progress_callback:
+            self.progress_callback(len(part_view))
+
+        return response, md5 if self.verify_checksum else None
+
+    @retry(stop_max_attempt_number=3, wait_exponential_multiplier=1000, wait_exponential_max=10000, wait_jitter_max=2000,
+           retry_on_exception=retry_utils.retry_on_timeouts_connection_internal_server_and_throttles)
+    def _make_retrying_put_object_call(self, part_view, md5):
+        kwargs = self.kwargs.copy()
+        kwargs['content_md5'] = md5
+
+        # put_object expects 'opc_meta' not metadata
+        if 'metadata' in kwargs:
+            kwargs['opc_meta'] = kwargs.pop('metadata')
+
+        # Empty bodies are sent as bytes, since requests cannot tell the length of an empty stream
+        body = MemoryViewReader(part_view) if len(part_view) else b''
+        return self.object_storage_client.put_object(self.namespace_name, self.bucket_name, self.object_name, body, **kwargs)
+
+    @retry(stop_max_attempt_number=3, wait_exponential_multiplier=1000, wait_exponential_max=10000, wait_jitter_max=2000,
+           retry_on_exception=retry_utils.retry_on_timeouts_connection_internal_server_and_throttles)
+    def _make_retrying_create_multipart_upload_call(self):
+        # Unlike put_object, create_multipart_upload does not add the opc-meta- prefix to the metadata keys
+        metadata = None
+        if self.kwargs.get('metadata'):
+            metadata = {(key if key.startswith('opc-meta-') else 'opc-meta-' + key): value for key, value in six.iteritems(self.kwargs['metadata'])}
+
+        details = models.CreateMultipartUploadDetails(
+            object=self.object_name,
+            content_type=self.kwargs.get('content_type'),
+            content_language=self.kwargs.get('content_language'),
+            content_encoding=self.kwargs.get('content_encoding'),
+            metadata=metadata
+        )
+        return self.object_storage_client.create_multipart_upload(self.namespace_name, self.bucket_name, details, **self._get_condition_kwargs())
+
+    @retry(stop_max_attempt_number=3, wait_exponential_multiplier=1000, wait_exponential_max=10000, wait_jitter_max=2000,
+           retry_on_exception=retry_utils.retry_on_timeouts_connection_internal_server_and_throttles)
+    def _make_retrying_commit_multipart_upload_call(self, upload_id, parts):
+        details = models.CommitMultipartUploadDetails(
+            parts_to_commit=[models.CommitMultipartUploadPartDetails(part_num=part['part_num'], etag=part['etag']) for part in parts]
+        )
+        return self.object_storage_client.commit_multipart_upload(self.namespace_name, self.bucket_name, self.object_name, upload_id, details, **self._get_condition_kwargs())
+
+    def _get_condition_kwargs(self):
+        return {key: self.kwargs[key] for key in ('if_match', 'if_none_match', 'opc_client_request_id') if self.kwargs.get(key) is not None}
+
+
+# A task which uploads one part of a stream from the buffer it was read into
+class UploadStreamPartTask(WorkPoolTask):
+    def __init__(self, object_storage_client, namespace_name, bucket_name, object_name, upload_id, part_num, part_view, part_md5, callbacks_container, **kwargs):
+        super(UploadStreamPartTask, self).__init__(callbacks_container=callbacks_container)
+
+        self.object_storage_client = object_storage_client
+        self.namespace_name = namespace_name
+        self.bucket_name = bucket_name
+        self.object_name = object_name
+        self.upload_id = upload_id
+        self.part_num = part_num
+        self.part_view = part_view
+        self.part_md5 = part_md5
+        self.kwargs = {key: value for key, value in kwargs.items() if value is not None}
+
+    def do_work_hook(self):
+        return self._make_retrying_upload_part_call()
+
+    # The part is sent from the buffer it was read into, and each attempt reads it from the start
+    @retry(stop_max_attempt_number=3, wait_exponential_multiplier=1000, wait_exponential_max=10000, wait_jitter_max=2000,
+           retry_on_exception=retry_utils.retry_on_timeouts_connection_internal_server_and_throttles)
+    def _make_retrying_upload_part_call(self):
+        return self.object_storage_client.upload_part(
+            self.namespace_name, self.bucket_name, self.object_name, self.upload_id, self.part_num, MemoryViewReader(self.part_view),
+            content_md5=self.part_md5, **self.kwargs
+        )
+
+
+# Reads from the stream until the buffer is full or the stream ends, and returns the number of bytes read
+def _read_part(stream, buffer):
+    view = memoryview(buffer)
+    size = 0
+    while size < len(buffer):
+        if hasattr(stream, 'readinto'):
+            read = stream.readinto(view[size:])
+        else:
+            data = stream.read(len(buffer) - size)
+            read = len(data)
+            view[size:size + read] = data
+
+        if not read:
+            break
+        size += read
+
+    return size
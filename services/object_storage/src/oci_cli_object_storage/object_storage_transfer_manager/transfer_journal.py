@@ -0,0 +1,131 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import json
+import os
+import threading
+
+# Increment this if the format of the records changes, so journals written by older versions are not misread
+JOURNAL_VERSION = 1
+
+# Records are written to the journal (and the journal is fsync'd) once this many are waiting, or after the interval
+FLUSH_RECORD_COUNT = 1000
+FLUSH_INTERVAL_SECONDS = 1
+
+
+# An append-only record of the progress of a bulk operation, so that an interrupted operation can be resumed. Each line of the
+# file is a compact JSON record of one of these kinds:
+#
+#   - {"journal": <version>, "operation": ..., "namespace": ..., "bucket": ...}: The first line, identifying the operation
+#   - {"done": <object name>}: An object was uploaded or downloaded
+#   - {"upload": <object name>, "id": <upload ID>, "part_size": ..., "size": ..., "mtime": ...}: A multipart upload was created
+#     for a file with the given size and modification time
+#   - {"part": <upload ID>, "num": <part number>, "etag": ..., "md5": ...}: A part of a multipart upload was uploaded
+#
+# Records are batched and written by a background thread, which fsyncs the file after each batch, so recording progress does
+# not hold up the transfers. If the process dies, at most the last FLUSH_INTERVAL_SECONDS of records are lost, and those items
+# are just transferred again when the operation is resumed.
+class TransferJournal(object):
+    def __init__(self, path, operation, namespace_name, bucket_name):
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self._completed = set()
+        self._multipart_uploads = {}
+        self._pending_records = []
+        self._lock = threading.Condition(threading.Lock())
+        self._closed = False
+
+        header = {'journal': JOURNAL_VERSION, 'operation': operation, 'namespace': namespace_name, 'bucket': bucket_name}
+        if os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+            ends_with_newline = self._load(header)
+            self._file = open(self.path, 'ab')
+            if not ends_with_newline:
+                # Start the next record on a new line, after the record which was cut short
+                self._file.write(b'\n')
+        else:
+            self._file = open(self.path, 'ab')
+            self._write_records([header])
+
+        self._flush_thread = threading.Thread(target=self._flush_periodically)
+        self._flush_thread.daemon = True
+        self._flush_thread.start()
+
+    def is_completed(self, object_name):
+        return object_name in self._completed
+
+    def get_multipart_upload(self, object_name):
+        """Returns the last multipart upload recorded for the object as a dictionary with the keys upload_id, part_size, size,
+        mtime and parts (a dictionary of the etag and md5 of each uploaded part, keyed by part number), or None."""
+        return self._multipart_uploads.get(object_name)
+
+    def record_completed(self, object_name, **kwargs):
+        self._completed.add(object_name)
+        self._append({'done': object_name})
+
+    def record_multipart_upload(self, object_name, upload_id, part_size, file_stat):
+        self._multipart_uploads[object_name] = {
+            'upload_id': upload_id, 'part_size': part_size, 'size': file_stat.st_size, 'mtime': file_stat.st_mtime, 'parts': {}
+        }
+        self._append({'upload': object_name, 'id': upload_id, 'part_size': part_size, 'size': file_stat.st_size, 'mtime': file_stat.st_mtime})
+
+    def record_part(self, upload_id, part_num, etag, md5):
+        self._append({'part': upload_id, 'num': part_num, 'etag': etag, 'md5': md5})
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._lock.notify()
+        self._flush_thread.join()
+        self._file.close()
+
+    def _append(self, record):
+        with self._lock:
+            self._pending_records.append(record)
+            if len(self._pending_records) >= FLUSH_RECORD_COUNT:
+                self._lock.notify()
+
+    def _flush_periodically(self):
+        while True:
+            with self._lock:
+                if not self._closed and len(self._pending_records) < FLUSH_RECORD_COUNT:
+                    self._lock.wait(FLUSH_INTERVAL_SECONDS)
+                records = self._pending_records
+                self._pending_records = []
+                closed = self._closed
+
+            if records:
+                self._write_records(records)
+            if closed:
+                return
+
+    def _write_records(self, records):
+        self._file.write(''.join(json.dumps(record, separators=(',', ':')) + '\n' for record in records).encode('utf-8'))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _load(self, expected_header):
+        uploads_by_id = {}
+        line = b''
+        with open(self.path, 'rb') as f:
+            for line_number, line in enumerate(f):
+                try:
+                    record = json.loads(line.decode('utf-8'))
+                except ValueError:
+                    if line_number == 0:
+                        raise ValueError('The file {} is not a transfer journal'.format(self.path))
+
+                    # The last line may have been cut short if the process died while it was being written
+                    continue
+
+                if line_number == 0:
+                    if record != expected_header:
+                        raise ValueError('The journal {} is for a different operation: {}'.format(self.path, line.decode('utf-8').strip()))
+                elif 'done' in record:
+                    self._completed.add(record['done'])
+                elif 'upload' in record:
+                    upload = {'upload_id': record['id'], 'part_size': record['part_size'], 'size': record['size'], 'mtime': record['mtime'], 'parts': {}}
+                    self._multipart_uploads[record['upload']] = upload
+                    uploads_by_id[record['id']] = upload
+                elif 'part' in record and record['part'] in uploads_by_id:
+                    uploads_by_id[record['part']]['parts'][record['num']] = {'etag': record['etag'], 'md5': record['md5']}
+
+        return line.endswith(b'\n')
@@ -5,20 +5,48 @@ from oci._vendor import requests
 from oci.object_storage import UploadManager
 
 from .work_pool import WorkPool
+from .concurrency_limiter import POOL_LIMIT_SHARE
+from .file_parts import get_part_size
+from .copy_tasks import CopyObjectTask
 from .delete_tasks import DeleteObjectTask
 from .get_object_tasks import GetObjectTask, GetObjectMultipartTask
 from .head_object_tasks import HeadObjectTask
 from .multipart_upload_tasks import MultipartUploadProcessorTask
+from .stream_upload_tasks import StreamingMultipartUploadTask
 from .upload_tasks import SimpleSingleUploadTask
 
 
+# An HTTPAdapter which tells a concurrency limiter about the outcome of each request it sends. The latency is the time until
+# the response headers are received, since the bodies of downloads are streamed afterwards.
+class ConcurrencyLimitingHTTPAdapter(requests.adapters.HTTPAdapter):
+    def __init__(self, concurrency_limiter, **kwargs):
+        self._concurrency_limiter = concurrency_limiter
+        super(ConcurrencyLimitingHTTPAdapter, self).__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        started_at = self._concurrency_limiter.start_request()
+        try:
+            response = super(ConcurrencyLimitingHTTPAdapter, self).send(request, **kwargs)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            self._concurrency_limiter.record_error(started_at, is_overload=True)
+            raise
+
+        self._concurrency_limiter.record_response(started_at, response.status_code)
+        return response
+
+
 class TransferManager():
     REQUESTS_POOL_SIZE_FACTOR = 4
 
     def __init__(self, object_storage_client, transfer_manager_config):
         self._client = object_storage_client
         self._config = transfer_manager_config
-        self._object_storage_request_pool = WorkPool(pool_size=self._config.max_object_storage_requests, max_workers=self._config.max_object_storage_requests)
+        concurrency_limiter = self._config.concurrency_limiter
+
+        # The request pool and the multipart request pool each get a share of an adaptive limit. They can't share one
+        # semaphore, since a multipart download holds a slot in the request pool while its parts wait for slots in the
+        # multipart request pool
+        self._object_storage_request_pool = WorkPool(pool_size=self._config.max_object_storage_requests, max_workers=self._config.max_object_storage_requests, concurrency_limiter=concurrency_limiter, limit_share=POOL_LIMIT_SHARE)
 
         # This is an intermediary pool where multipart uploads will go to be processed. "Processed" in this context means setting up a multipart upload (e.g. manifest,
         # what the file chunks are) and then put those requests in the main request pool to be done, and then committing the upload at the end.
@@ -27,12 +55,16 @@ class TransferManager():
         # This is a pool which is intended to process multipart upload/download requests to Object Storage only. We have a separate pool to prevent too much contention between
         # very big uploads/downloads and other tasks (as a single multipart could consume all the processes in the pool, which may be undesirable depending on other
         # work which has been queued)
-        self._object_storage_multipart_request_pool = WorkPool(pool_size=self._config.max_object_storage_multipart_requests, max_workers=self._config.max_object_storage_multipart_requests)
+        self._object_storage_multipart_request_pool = WorkPool(pool_size=self._config.max_object_storage_multipart_requests, max_workers=self._config.max_object_storage_multipart_requests, concurrency_limiter=concurrency_limiter, limit_share=POOL_LIMIT_SHARE)
 
         # Increase the pool_maxsize since we'll have multiple threads/processes doing work and calling service operations.
         # See: https://laike9m.com/blog/requests-secret-pool_connections-and-pool_maxsize,89/
-        requests_pool_size = self.REQUESTS_POOL_SIZE_FACTOR * self._config.max_object_storage_requests
-        adapter = requests.adapters.HTTPAdapter(pool_maxsize=requests_pool_size)
+        if concurrency_limiter:
+            requests_pool_size = self.REQUESTS_POOL_SIZE_FACTOR * concurrency_limiter.max_limit
+            adapter = ConcurrencyLimitingHTTPAdapter(concurrency_limiter, pool_maxsize=requests_pool_size)
+        else:
+            requests_pool_size = self.REQUESTS_POOL_SIZE_FACTOR * self._config.max_object_storage_requests
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=requests_pool_size)
 
         endpoint = object_storage_client.base_client.endpoint.lower()
         if endpoint.startswith('https://'):
@@ -52,6 +84,9 @@ class TransferManager():
             part_size = kwargs['part_size']
             kwargs.pop('part_size')
 
+        # Larger parts are used if the file would otherwise need more parts than a multipart upload allows
+        part_size = get_part_size(file_size, part_size)
+
         if not UploadManager._use_multipart(file_size, part_size=part_size):
             if 'multipart_part_completion_callback' in kwargs:
                 kwargs.pop('multipart_part_completion_callback')
@@ -62,10 +97,20 @@ class TransferManager():
             multipart_upload_processor_task = MultipartUploadProcessorTask(
                 self._client, namespace_name, bucket_name, object_name, file_path, callbacks_container,
                 self._object_storage_multipart_request_pool, part_size, verify_checksum,
-                **kwargs
+                transfer_journal=self._config.transfer_journal, **kwargs
             )
             return self._multipart_upload_processor_pool.submit(multipart_upload_processor_task)
 
+    # Uploads the content of a stream in parts of part_size bytes, which are uploaded in the multipart request pool. At most
+    # max_object_storage_multipart_requests parts are held in memory at once
+    def upload_stream(self, callbacks_container, namespace_name, bucket_name, object_name, stream, verify_checksum, **kwargs):
+        part_size = kwargs.pop('part_size', self._config.multipart_part_size)
+        streaming_upload_task = StreamingMultipartUploadTask(
+            self._client, namespace_name, bucket_name, object_name, stream, callbacks_container,
+            self._object_storage_multipart_request_pool, part_size, self._config.max_object_storage_multipart_requests, verify_checksum, **kwargs
+        )
+        return self._multipart_upload_processor_pool.submit(streaming_upload_task)
+
     def get_object(self, callbacks_container, **kwargs):
         get_object_task = GetObjectTask(self._client, callbacks_container, **kwargs)
         return self._object_storage_request_pool.submit(get_object_task)
@@ -78,6 +123,11 @@ class TransferManager():
         delete_task = DeleteObjectTask(self._client, callbacks_container, **kwargs)
         return self._object_storage_request_pool.submit(delete_task)
 
+    # Starts a server-side copy of an object. The result of the returned future is the ID of the copy's work request
+    def copy_object(self, callbacks_container, **kwargs):
+        copy_task = CopyObjectTask(self._client, callbacks_container, **kwargs)
+        return self._object_storage_request_pool.submit(copy_task)
+
     def head_object(self, callbacks_container, **kwargs):
         head_object_task = HeadObjectTask(self._client, callbacks_container, **kwargs)
         return self._object_storage_request_pool.submit(head_object_task)
@@ -12,6 +12,10 @@ from oci.object_storage.transfer import constants
 #   - max_object_storage_multipart_requests: The total number of put requests we can issue at any one time, where the put request relates to part of a multipart upload
 #   - multipart_part_size: Threshold (in MiB) after which we'll upload a file in multiple parts
 #   - use_multipart_uploads: Whether to use multipart uploads or not
+#   - transfer_journal: An optional TransferJournal which multipart uploads record their upload IDs and parts in, and which
+#     they are resumed from
+#   - concurrency_limiter: An optional AimdConcurrencyLimiter which adjusts the number of requests in flight from the responses to them. The
+#     max_object_storage_requests and max_object_storage_multipart_requests are then only used to start the limiter
 class TransferManagerConfig():
     DEFAULT_MAX_REQUESTS = 10
     DEFAULT_MAX_MULTIPART_TO_PROCESS = 10
@@ -22,10 +26,14 @@ class TransferManagerConfig():
                  max_object_storage_multipart_requests=DEFAULT_MAX_MULTIPART_REQUESTS,
                  max_multipart_files_to_process=DEFAULT_MAX_MULTIPART_TO_PROCESS,
                  multipart_part_size=constants.DEFAULT_PART_SIZE,
-                 use_multipart_uploads=True
+                 use_multipart_uploads=True,
+                 transfer_journal=None,
+                 concurrency_limiter=None
                  ):
         self.max_object_storage_requests = max_object_storage_requests
         self.max_object_storage_multipart_requests = max_object_storage_multipart_requests
         self.max_multipart_files_to_process = max_multipart_files_to_process
         self.multipart_part_size = multipart_part_size
         self.use_multipart_uploads = use_multipart_uploads
+        self.transfer_journal = transfer_journal
+        self.concurrency_limiter = concurrency_limiter
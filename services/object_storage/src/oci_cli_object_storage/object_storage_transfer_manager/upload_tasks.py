@@ -1,7 +1,10 @@
 # coding: utf-8
 # Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
 
+import os
+
 from oci.object_storage import UploadManager
+from oci.object_storage.transfer.internal.file_read_callback_stream import FileReadCallbackStream
 from .work_pool_task import WorkPoolTask
 from retrying import retry
 from oci_cli import retry_utils
@@ -27,11 +30,39 @@ class SimpleSingleUploadTask(WorkPoolTask):
         self.kwargs.pop('part_size', None)
 
     def do_work_hook(self):
-        multipart_hash = cli_util.verify_checksum(self.file_path, no_multipart=True, ma=None) if self.verify_checksum else None
-        return self._make_retrying_upload_file_call(), multipart_hash
+        if self.verify_checksum:
+            return self._make_retrying_hashing_upload_call()
+
+        return self._make_retrying_upload_file_call(), None
 
     @retry(stop_max_attempt_number=3, wait_exponential_multiplier=1000, wait_exponential_max=10000, wait_jitter_max=2000,
            retry_on_exception=retry_utils.retry_on_timeouts_connection_internal_server_and_throttles)
     def _make_retrying_upload_file_call(self):
         upload_manager = UploadManager(self.object_storage_client, allow_multipart_uploads=False)
         return upload_manager.upload_file(self.namespace_name, self.bucket_name, self.object_name, self.file_path, **self.kwargs)
+
+    # Uploads the file and calculates its checksum from the data as it is sent, so the file is only read once. Each attempt
+    # starts a new checksum
+    @retry(stop_max_attempt_number=3, wait_exponential_multiplier=1000, wait_exponential_max=10000, wait_jitter_max=2000,
+           retry_on_exception=retry_utils.retry_on_timeouts_connection_internal_server_and_throttles)
+    def _make_retrying_hashing_upload_call(self):
+        kwargs = self.kwargs.copy()
+        progress_callback = kwargs.pop('progress_callback', None)
+
+        # put_object expects 'opc_meta' not metadata
+        if 'metadata' in kwargs:
+            kwargs['opc_meta'] = kwargs.pop('metadata')
+
+        with open(self.file_path, 'rb') as file_object:
+            reader = cli_util.HashingReader(file_object)
+            # Empty bodies are sent as they are, since requests cannot tell the length of an empty stream. Progress is reported
+            # the same way UploadManager reports it, as the body is read
+            if not os.fstat(file_object.fileno()).st_size:
+                body = file_object
+            elif progress_callback:
+                body = FileReadCallbackStream(reader, progress_callback)
+            else:
+                body = reader
+            response = self.object_storage_client.put_object(self.namespace_name, self.bucket_name, self.object_name, body, **kwargs)
+
+        return response, reader.get_checksum()
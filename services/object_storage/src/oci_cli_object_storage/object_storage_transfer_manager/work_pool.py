@@ -9,11 +9,13 @@ from .wrapped_semaphore import WrappedSemaphore
 from .work_pool_task import WorkPoolTaskCallback
 
 
-# Represents a generic pool to which work (tasks) can be submitted and executed.
+# Represents a generic pool to which work (tasks) can be submitted and executed. If a concurrency limiter is given, the pool
+# has enough workers for the limiter's maximum, and the number of tasks running at once follows the limiter's current limit
+# (or limit_share of it, when the limiter is shared with other pools).
 class WorkPool():
-    def __init__(self, pool_size, max_workers):
-        self._sempahore = WrappedSemaphore(pool_size)
-        self._inner_pool = Pool(processes=pool_size)
+    def __init__(self, pool_size, max_workers, concurrency_limiter=None, limit_share=1.0):
+        self._sempahore = WrappedSemaphore(pool_size, concurrency_limiter=concurrency_limiter, limit_share=limit_share)
+        self._inner_pool = Pool(processes=concurrency_limiter.max_limit if concurrency_limiter else pool_size)
 
     def submit(self, work_pool_task, blocking=True):
         self._sempahore.acquire(blocking)
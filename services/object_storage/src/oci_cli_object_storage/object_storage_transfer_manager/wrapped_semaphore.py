@@ -4,13 +4,43 @@
 import threading
 
 
-# A wrapper around threading's Semaphore class so we can inject our own behaviour if/when needed
+# A wrapper around threading's Semaphore class so we can inject our own behaviour if/when needed. If a concurrency limiter
+# is given, the number of holders is instead bounded by the limiter's current limit, which can go up or down while the
+# semaphore is in use. When the limit goes down, holders are not interrupted but no one else can acquire the semaphore until
+# enough of them have released it. Semaphores which share a limiter with others can be given a limit_share of its limit.
 class WrappedSemaphore():
-    def __init__(self, limit):
-        self._semaphore = threading.Semaphore(limit)
+    def __init__(self, limit, concurrency_limiter=None, limit_share=1.0):
+        self._concurrency_limiter = concurrency_limiter
+        self._limit_share = limit_share
+        if concurrency_limiter:
+            self._holders = 0
+            self._condition = threading.Condition(threading.Lock())
+            concurrency_limiter.add_listener(self._on_limit_changed)
+        else:
+            self._semaphore = threading.Semaphore(limit)
 
     def acquire(self, blocking=True):
-        self._semaphore.acquire(blocking)
+        if not self._concurrency_limiter:
+            return self._semaphore.acquire(blocking)
+
+        with self._condition:
+            while self._holders >= self._concurrency_limiter.get_limit_share(self._limit_share):
+                if not blocking:
+                    return False
+                self._condition.wait()
+            self._holders += 1
+            return True
 
     def release(self):
-        self._semaphore.release()
+        if not self._concurrency_limiter:
+            self._semaphore.release()
+            return
+
+        with self._condition:
+            self._holders -= 1
+            self._condition.notify()
+
+    def _on_limit_changed(self, old_limit, new_limit):
+        if new_limit > old_limit:
+            with self._condition:
+                self._condition.notify_all()
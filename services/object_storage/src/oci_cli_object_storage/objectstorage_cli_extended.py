@@ -4,25 +4,35 @@
 from __future__ import division
 import arrow
 import click
-import math
+import functools
+import json
 import os
 import os.path
 import stat
 import sys
+import tempfile
+import threading
 import services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager  # noqa: F401,E402
 from oci import exceptions
+from six.moves import queue
 from oci.object_storage.transfer import constants
 from oci_cli.cli_util import render, render_response, parse_json_parameter, help_option, help_option_group, build_client, wrap_exceptions, filter_object_headers, get_param
-from oci.object_storage import UploadManager, MultipartObjectAssembler
+from oci.object_storage import UploadManager
+from oci.object_storage.models import CopyObjectDetails
 from oci_cli.file_filters import BaseFileFilterCollection
 from oci_cli.file_filters import SingleTypeFileFilterCollection
 from retrying import retry
 from oci_cli import retry_utils
-from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager import TransferManager, TransferManagerConfig, WorkPoolTaskCallback, WorkPoolTaskErrorCallback, WorkPoolTaskSuccessCallback, WorkPoolTaskCallbacksContainer
+from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager import AimdConcurrencyLimiter, MappedFileMultipartObjectAssembler, TransferJournal, TransferManager, TransferManagerConfig, WorkPoolTaskCallback, WorkPoolTaskErrorCallback, WorkPoolTaskSuccessCallback, WorkPoolTaskCallbacksContainer
 from oci_cli import json_skeleton_utils
 from oci_cli.aliasing import CommandGroupWithAlias
 from oci_cli import custom_types  # noqa: F401
-from oci_cli.custom_types import BulkPutOperationOutput, BulkGetOperationOutput, BulkDeleteOperationOutput
+from oci_cli.custom_types import BulkPutOperationOutput, BulkGetOperationOutput, BulkDeleteOperationOutput, BulkSyncOperationOutput, BulkCopyOperationOutput
+from services.object_storage.src.oci_cli_object_storage import object_packing
+from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager import file_parts
+from services.object_storage.src.oci_cli_object_storage import sync_index
+from services.object_storage.src.oci_cli_object_storage.sharded_object_lister import ShardedObjectLister
+from services.object_storage.src.oci_cli_object_storage.work_request_poller import WorkRequestPoller
 from services.object_storage.src.oci_cli_object_storage.generated import objectstorage_cli
 from oci_cli import cli_util
 from mimetypes import guess_type
@@ -80,11 +90,20 @@ final_command_processor.SERVICE_FUNCTIONS_TO_EXECUTE.append(remove_namespace_req
 OBJECT_LIST_PAGE_SIZE = 100
 OBJECT_LIST_PAGE_SIZE_BULK_OPERATIONS = 1000
 
-MAX_MULTIPART_SIZE = 10000
 MEBIBYTE = constants.MEBIBYTE
 
 OBJECT_GET_CHUNK_SIZE = MEBIBYTE
 
+# The number of parts of a stream which are uploaded at once, if --parallel-upload-count is not given
+STREAMING_DEFAULT_PARALLEL_UPLOAD_COUNT = 3
+
+# The engines which can perform the operations of the bulk commands
+TRANSFER_ENGINE_THREADS = 'threads'
+TRANSFER_ENGINE_ASYNCIO = 'asyncio'
+TRANSFER_ENGINES = [TRANSFER_ENGINE_THREADS, TRANSFER_ENGINE_ASYNCIO]
+TRANSFER_ENGINE_HELP = 'How the parallel operations are performed. threads uses a pool of threads, each making one request at a time. asyncio makes all of the requests from a single event loop over a pool of reused connections, which uses less memory and fewer threads when the number of parallel operations is high. asyncio requires Python 3.5 or later and cannot be used with a proxy.'
+ADAPTIVE_CONCURRENCY_HELP = 'Adjust the number of parallel operations while the command runs: start with the given count, add more while requests keep succeeding without slowing down, and halve them when Object Storage throttles requests (429), is unavailable (503) or requests time out. With --debug, each change to the number of parallel operations is printed.'
+
 OBJECT_PUT_DISPLAY_HEADERS = {
     "etag",
     "opc-content-md5",
@@ -212,6 +231,22 @@ def object_list(ctx, from_json, namespace, bucket_name, prefix, start, end, limi
         limit = 100
     client = build_client('object_storage', ctx)
 
+    if all_pages:
+        # Shards of the range are listed in parallel, so the objects are put back in order once they have all been listed
+        object_lister = _build_object_lister(
+            client, ctx.obj['request_id'], namespace, bucket_name,
+            prefix=prefix, start=start, end=end, delimiter=delimiter, fields=fields, page_size=page_size or OBJECT_LIST_PAGE_SIZE
+        )
+        all_objects = []
+        prefixes = set()
+        for response in object_lister.responses():
+            all_objects.extend(response.data.objects)
+            prefixes.update(response.data.prefixes or [])
+
+        all_objects.sort(key=lambda obj: obj.name)
+        render(all_objects, {'prefixes': sorted(prefixes)}, ctx, display_all_headers=True)
+        return
+
     args = {
         'fields': fields,
         'opc_client_request_id': ctx.obj['request_id']
@@ -232,23 +267,16 @@ def object_list(ctx, from_json, namespace, bucket_name, prefix, start, end, limi
     prefixes = list()
 
     remaining_item_count = limit
-    keep_paginating_for_all = True
 
     # if the user explicitly sets limit to 0 we will still call the service once with limit=0
     fetched_at_least_once = False
-    while (not all_pages and (remaining_item_count > 0 or not fetched_at_least_once)) or (all_pages and keep_paginating_for_all):
+    while remaining_item_count > 0 or not fetched_at_least_once:
         fetched_at_least_once = True
 
-        if all_pages:
-            if page_size:
-                args['limit'] = page_size
-            else:
-                args['limit'] = OBJECT_LIST_PAGE_SIZE
+        if page_size:
+            args['limit'] = min(page_size, remaining_item_count)
         else:
-            if page_size:
-                args['limit'] = min(page_size, remaining_item_count)
-            else:
-                args['limit'] = min(remaining_item_count, OBJECT_LIST_PAGE_SIZE)
+            args['limit'] = min(remaining_item_count, OBJECT_LIST_PAGE_SIZE)
 
         response = client.list_objects(
             namespace,
@@ -266,11 +294,9 @@ def object_list(ctx, from_json, namespace, bucket_name, prefix, start, end, limi
         all_objects.extend(objects)
 
         if next_start:
-            if remaining_item_count:
-                remaining_item_count -= len(objects)
+            remaining_item_count -= len(objects)
             args['start'] = next_start
         else:
-            keep_paginating_for_all = False
             remaining_item_count = 0
 
     metadata = {'prefixes': prefixes}
@@ -316,7 +342,7 @@ def object_put(ctx, from_json, namespace, bucket_name, name, file, if_match, con
 
     The object can be uploaded as a single part or as multiple parts. Below are the rules for whether an object will be uploaded via single or multipart upload (listed in order of precedence):
 
-        * If the object is being uploaded from STDIN, it will be uploaded as a multipart upload (if the object content is smaller than --part-size, default for STDIN is 10 MiB, the multipart upload may contain only one part, but it will still use the MultipartUpload API)
+        * If the object is being uploaded from STDIN or a pipe, it will be read and uploaded in parts of --part-size (default for STDIN is 10 MiB), with up to --parallel-upload-count parts uploaded at once and held in memory. If the content is smaller than --part-size, it will be uploaded as a single part
 
         * If the --no-multipart flag is specified, the object will be uploaded as a single part regardless of size (specifying --no-multipart when uploading from STDIN will result in an error)
 
@@ -342,6 +368,9 @@ def object_put(ctx, from_json, namespace, bucket_name, name, file, if_match, con
         if no_multipart:
             raise click.UsageError('The option --parallel-upload-count is not applicable when using the --no-multipart flag.')
 
+    # STDIN, pipes and other files which are not regular files can only be read once, from start to end
+    is_stream = not hasattr(file, 'name') or file.name == '<stdin>' or not stat.S_ISREG(os.fstat(file.fileno()).st_mode)
+
     # default object name is filename without path
     if not name:
         if not hasattr(file, 'name') or file.name == '<stdin>':
@@ -396,44 +425,56 @@ def object_put(ctx, from_json, namespace, bucket_name, name, file, if_match, con
 
     total_size = os.fstat(file.fileno()).st_size
 
-    if math.ceil(total_size / part_size_mib) > MAX_MULTIPART_SIZE:
-        part_size = math.ceil(math.ceil(total_size / MAX_MULTIPART_SIZE) / MEBIBYTE)
-        kwargs['part_size'] = part_size * MEBIBYTE
+    # Larger parts are used if the file would otherwise need more parts than a multipart upload allows
+    adjusted_part_size = file_parts.get_part_size(total_size, part_size_mib)
+    if adjusted_part_size != part_size_mib:
+        part_size = adjusted_part_size // MEBIBYTE
+        kwargs['part_size'] = adjusted_part_size
 
     size_qualifies_for_multipart = UploadManager._use_multipart(total_size, part_size) if part_size else UploadManager._use_multipart(total_size)
 
     ma = None
+    stream_checksum = None
 
-    if not hasattr(file, 'name') or file.name == '<stdin>':
+    if is_stream:
         if no_multipart:
-            raise click.UsageError('The --no-multipart flag is not valid when taking input from STDIN.')
+            raise click.UsageError('The --no-multipart flag is not valid when taking input from STDIN or a pipe.')
 
-        # For data coming from standard in, stream it up to Object Storage. This handles both being put in as here string (<<<)
-        # and data being piped in.
+        # For data coming from standard in or a pipe, stream it up to Object Storage. This handles both being put in as here
+        # string (<<<) and data being piped in.
         #
         # As an aside, for the here string the total size is known, but for data being piped its not determinable (without reading
-        # all the data off)
-
-        upload_manager = UploadManager(client)
+        # all the data off). Parts are read into a fixed number of buffers and uploaded as they are read, so memory use is
+        # bounded by the parallel upload count times the part size
+        kwargs.pop('part_size', None)
+        stream_part_size = part_size * MEBIBYTE if part_size else constants.STREAMING_DEFAULT_PART_SIZE
 
         if disable_parallel_uploads:
-            upload_manager.allow_parallel_uploads = False
-
-        if parallel_upload_count:
-            upload_manager.parallel_process_count = parallel_upload_count
+            stream_parallel_upload_count = 1
+        else:
+            stream_parallel_upload_count = parallel_upload_count or STREAMING_DEFAULT_PARALLEL_UPLOAD_COUNT
 
         # The total_size won't be accurate for pipes, so give the bar some arbitrary size. If the
         # progress bar gets full, we'll rotate it back to the beginning
-        if stat.S_ISFIFO(os.fstat(file.fileno()).st_mode):
-            if part_size:
-                total_size = part_size * MEBIBYTE * 3
-            else:
-                total_size = constants.STREAMING_DEFAULT_PART_SIZE * 3
+        if not stat.S_ISREG(os.fstat(file.fileno()).st_mode):
+            total_size = stream_part_size * 3
 
         bar = ProgressBar(total_size, 'Uploading object part')
         kwargs['progress_callback'] = bar.update_indeterminate_size
 
-        response = upload_manager.upload_stream(namespace, bucket_name, name, sys.stdin, **kwargs)
+        transfer_manager = TransferManager(
+            client,
+            TransferManagerConfig(
+                max_object_storage_requests=1,
+                max_object_storage_multipart_requests=stream_parallel_upload_count,
+                max_multipart_files_to_process=1
+            )
+        )
+        streaming_upload = transfer_manager.upload_stream(WorkPoolTaskCallbacksContainer(), namespace, bucket_name, name, file, verify_checksum, part_size=stream_part_size, **kwargs)
+        try:
+            response, stream_checksum = streaming_upload.result()
+        finally:
+            transfer_manager.wait_for_completion()
 
         # Close the bar, but make sure that we end up at 100% (otherwise we could end on something like 33%, which looks odd)
         if bar:
@@ -470,11 +511,11 @@ def object_put(ctx, from_json, namespace, bucket_name, name, file, if_match, con
 
         UploadManager._add_adapter_to_service_client(client, not disable_parallel_uploads, parallel_upload_count)
 
-        ma = MultipartObjectAssembler(client,
-                                      namespace,
-                                      bucket_name,
-                                      name,
-                                      **kwargs)
+        ma = MappedFileMultipartObjectAssembler(client,
+                                                namespace,
+                                                bucket_name,
+                                                name,
+                                                **kwargs)
         ma.new_upload()
         click.echo('Upload ID: {}'.format(ma.manifest["uploadId"]), file=sys.stderr)
         ma.add_parts_from_file(file.name)
@@ -494,7 +535,11 @@ def object_put(ctx, from_json, namespace, bucket_name, name, file, if_match, con
     is_not_multipart = not size_qualifies_for_multipart or no_multipart
 
     if verify_checksum:
-        multipart_hash = cli_util.verify_checksum(file.name, is_not_multipart, ma)
+        if is_stream:
+            # The stream can't be read again, so the checksum is the one calculated from the parts as they were read
+            multipart_hash = stream_checksum
+        else:
+            multipart_hash = cli_util.verify_checksum(file.name, is_not_multipart, ma, parallel_count=parallel_upload_count or 1)
         message, match = cli_util.get_checksum_message(response.headers, multipart_hash)
         click.echo(message, file=sys.stderr)
         exit(0 if match else 1)
@@ -522,6 +567,13 @@ Specifying this flag will also allow for faster uploads as the CLI will not init
 @cli_util.option('--parallel-upload-count', type=click.IntRange(1, 1000), default=10, show_default=True,
                  help='The number of parallel operations to perform. Decreasing this value will make bulk uploads less resource intensive but they may take longer. Increasing this value may improve bulk upload times, but the upload process will consume more system resources and network bandwidth. The maximum is 1000.')
 @cli_util.option('--verify-checksum', is_flag=True, help='Verify the checksum of the uploaded object with the local file.')
+@cli_util.option('--transfer-engine', type=custom_types.CliCaseInsensitiveChoice(TRANSFER_ENGINES), default=TRANSFER_ENGINE_THREADS, show_default=True,
+                 help=TRANSFER_ENGINE_HELP)
+@cli_util.option('--adaptive-concurrency', is_flag=True, help=ADAPTIVE_CONCURRENCY_HELP)
+@cli_util.option('--resume', 'resume_journal', help='A journal file which records the progress of the upload: the files which have been uploaded, and the parts of files which are being uploaded in multiple parts. If the upload is interrupted, run the same command with the same journal file to skip the files which were uploaded and to resume the multipart uploads of partially uploaded files. The journal file is created if it does not exist.')
+@cli_util.option('--pack-small-files', is_flag=True, help='Pack small files into tar archive objects instead of uploading each as its own object. Each archive is uploaded with an index object (the archive name followed by {}) which records where each file is in the archive. Packed files are not checked against existing objects, so --overwrite and --no-overwrite do not apply to them. Use bulk-download --unpack to download and expand the archives, or get-member to download a single file from an archive.'.format(object_packing.INDEX_SUFFIX))
+@cli_util.option('--pack-threshold', type=click.IntRange(1, None), default=object_packing.DEFAULT_PACK_THRESHOLD_KIB, show_default=True, help='With --pack-small-files, files up to this size (in KiB) are packed into archives.')
+@cli_util.option('--pack-archive-size', type=click.IntRange(1, None), default=object_packing.DEFAULT_ARCHIVE_SIZE_MIB, show_default=True, help='With --pack-small-files, the size (in MiB) at which an archive is closed and uploaded.')
 @cli_util.option('--include', multiple=True, help="""Only upload files which match the provided pattern. Patterns are taken relative to the CURRENT directory. This option can be provided mulitple times to match on mulitple patterns. Supported pattern symbols are:
 \b
 {}
@@ -535,7 +587,7 @@ Specifying this flag will also allow for faster uploads as the CLI will not init
 @click.pass_context
 @json_skeleton_utils.json_skeleton_generation_handler(input_params_to_complex_types={'metadata': {'module': 'object_storage', 'class': 'dict(str, str)'}})
 @wrap_exceptions
-def object_bulk_put(ctx, from_json, namespace, bucket_name, src_dir, object_prefix, metadata, content_type, content_language, content_encoding, overwrite, no_overwrite, no_multipart, part_size, disable_parallel_uploads, parallel_upload_count, verify_checksum, include, exclude):
+def object_bulk_put(ctx, from_json, namespace, bucket_name, src_dir, object_prefix, metadata, content_type, content_language, content_encoding, overwrite, no_overwrite, no_multipart, part_size, disable_parallel_uploads, parallel_upload_count, verify_checksum, transfer_engine, adaptive_concurrency, resume_journal, pack_small_files, pack_threshold, pack_archive_size, include, exclude):
     """
     Uploads all files in a given directory and all subdirectories.
 
@@ -576,6 +628,34 @@ def object_bulk_put(ctx, from_json, namespace, bucket_name, src_dir, object_pref
     \b
     If a file being uploaded already exists in Object Storage with the same name, it can be preserved (not overwritten) without a
     prompt by using the --no-overwrite flag.
+
+    \b
+    Resuming an interrupted upload
+    ------------------------------
+    oci os object bulk-upload -ns mynamespace -bn mybucket --src-dir path/to/upload/directory --resume path/to/journal
+
+    \b
+    The progress of the upload is recorded in the journal file. If the upload is interrupted, running the same command again
+    skips the files which were uploaded and resumes the multipart uploads of files which were partially uploaded.
+
+    \b
+    Adjusting the number of parallel uploads to the service
+    --------------------------------------------------------
+    oci os object bulk-upload -ns mynamespace -bn mybucket --src-dir path/to/upload/directory --adaptive-concurrency --debug
+
+    \b
+    The upload starts with --parallel-upload-count parallel operations, adds more while requests succeed and halves them when
+    requests are throttled. With --debug, each change is printed.
+
+    \b
+    Packing many small files into archives
+    --------------------------------------
+    oci os object bulk-upload -ns mynamespace -bn mybucket --src-dir path/to/upload/directory --pack-small-files
+
+    \b
+    Files of up to 1 MiB (see --pack-threshold) are packed into tar archive objects of about 64 MiB (see --pack-archive-size),
+    so that many small files take a few large uploads rather than one request each. The output lists the archive each file
+    was packed into.
     """
     # there is existing retry logic for bulk_put so we don't want the Python SDK level retries to interfere / overlap with that
     ctx.obj['no_retry'] = True
@@ -620,17 +700,30 @@ def object_bulk_put(ctx, from_json, namespace, bucket_name, src_dir, object_pref
     # Progress bar which we can reuse over and over again
     reusable_progress_bar = ProgressBar(0, '')
 
-    transfer_manager = TransferManager(
+    transfer_journal = _open_transfer_journal(ctx, resume_journal, 'bulk-upload', namespace, bucket_name)
+    transfer_manager = _build_transfer_manager(
         client,
         TransferManagerConfig(
             max_object_storage_requests=parallel_upload_count,
             max_object_storage_multipart_requests=parallel_upload_count,
             max_multipart_files_to_process=parallel_upload_count,
-            use_multipart_uploads=(not no_multipart)
-        )
+            use_multipart_uploads=(not no_multipart),
+            transfer_journal=transfer_journal,
+            concurrency_limiter=_build_concurrency_limiter(ctx, adaptive_concurrency, parallel_upload_count)
+        ),
+        transfer_engine
     )
     head_object_results = {}
 
+    small_file_packer = None
+    if pack_small_files:
+        upload_archive = functools.partial(
+            _upload_packed_archive,
+            ctx=ctx, transfer_manager=transfer_manager, output=output, transfer_journal=transfer_journal,
+            namespace=namespace, bucket_name=bucket_name, client_request_id=client_request_id, verify_checksum=verify_checksum
+        )
+        small_file_packer = object_packing.SmallFilePacker(object_prefix, pack_archive_size * MEBIBYTE, upload_archive)
+
     # If we need to check for overwrites then we'll need to make HEAD object calls. We can queue these up in the
     # transfer_manager to be processed by the worker pool in the background so we potentially have to wait less per loop iteration.
     # This window variable controls how much (how many objects) we should look ahead by so that we make sure that all the HEAD requests
@@ -657,6 +750,19 @@ def object_bulk_put(ctx, from_json, namespace, bucket_name, src_dir, object_pref
             if object_prefix:
                 object_name = '{}{}'.format(object_prefix, object_name)
 
+            if transfer_journal and transfer_journal.is_completed(object_name):
+                output.add_skipped(object_name)
+                continue
+
+            if small_file_packer:
+                try:
+                    if os.path.getsize(full_file_path) <= pack_threshold * 1024:
+                        small_file_packer.add(full_file_path, object_name)
+                        continue
+                except Exception as e:
+                    output.add_failure(object_name, callback_exception=e)
+                    continue
+
             # If content type is set to auto, then the CLI will guess the content type of the file
             if auto_content_type:
                 base_kwargs['content_type'], _ = guess_type(object_name)
@@ -716,7 +822,11 @@ def object_bulk_put(ctx, from_json, namespace, bucket_name, src_dir, object_pref
                 add_to_uploaded_objects_callback = WorkPoolTaskSuccessCallback(output.add_uploaded, **success_callback_kwargs)
                 add_to_upload_failures_callback = WorkPoolTaskErrorCallback(output.add_failure, **error_callback_kwargs)
 
-                callbacks_container = WorkPoolTaskCallbacksContainer(completion_callbacks=[update_progress_callback], success_callbacks=[add_to_uploaded_objects_callback], error_callbacks=[add_to_upload_failures_callback])
+                success_callbacks = [add_to_uploaded_objects_callback]
+                if transfer_journal:
+                    success_callbacks.append(WorkPoolTaskSuccessCallback(transfer_journal.record_completed, object_name=object_name))
+
+                callbacks_container = WorkPoolTaskCallbacksContainer(completion_callbacks=[update_progress_callback], success_callbacks=success_callbacks, error_callbacks=[add_to_upload_failures_callback])
 
                 if ctx.obj['debug']:
                     click.echo('Uploading {}'.format(full_file_path), file=sys.stderr)
@@ -740,6 +850,9 @@ def object_bulk_put(ctx, from_json, namespace, bucket_name, src_dir, object_pref
                 if ctx.obj['debug']:
                     click.echo('Failed to upload {}'.format(object_name), file=sys.stderr)
 
+    if small_file_packer:
+        small_file_packer.flush()
+
     transfer_manager.wait_for_completion()
     reusable_progress_bar.render_finish()
 
@@ -862,6 +975,59 @@ def object_get(ctx, from_json, namespace, bucket_name, name, file, if_match, if_
         bar.render_finish()
 
 
+@objectstorage_cli.object_group.command(name='get-member')
+@cli_util.option('-ns', '--namespace', '--namespace-name', 'namespace', required=True, help='The top-level namespace used for the request.')
+@cli_util.option('-bn', '--bucket-name', required=True, help='The name of the bucket.')
+@cli_util.option('--archive-name', required=True, help='The name of the archive object which the file was packed into by bulk-upload --pack-small-files.')
+@cli_util.option('--name', required=True, help='The name of the file in the archive. This is the name the object would have had if the file had been uploaded on its own.')
+@cli_util.option('--file', type=click.File(mode='wb', lazy=False), required=True,
+                 help="The name of the file that will receive the content, or '-' to write to STDOUT.")
+@json_skeleton_utils.get_cli_json_input_option({})
+@help_option
+@click.pass_context
+@json_skeleton_utils.json_skeleton_generation_handler(input_params_to_complex_types={})
+@wrap_exceptions
+def object_get_member(ctx, from_json, namespace, bucket_name, archive_name, name, file):
+    """
+    Gets a single file from an archive object which was uploaded by bulk-upload --pack-small-files.
+
+    The index object of the archive is read to find where the file is in the archive, and only that range of the archive is
+    downloaded. The content is checked against the MD5 recorded in the index.
+
+    Example:
+        oci os object get-member -ns mynamespace -bn mybucket --archive-name packed-20190101T000000Z-1a2b3c4d-000001.oci-pack.tar --name dir/myfile.txt --file /Users/me/myfile.txt
+    """
+    client = build_client('object_storage', ctx)
+
+    index_response = client.get_object(namespace, bucket_name, object_packing.get_index_name(archive_name), opc_client_request_id=ctx.obj['request_id'])
+    index = json.loads(index_response.data.content.decode('utf-8'))
+    if index.get('version') != object_packing.INDEX_VERSION:
+        raise click.ClickException('The index of {} has an unsupported version: {}'.format(archive_name, index.get('version')))
+
+    member = object_packing.get_member(index, name)
+    if not member:
+        raise click.ClickException('The archive {} does not contain {}'.format(archive_name, name))
+
+    md5 = cli_util.new_md5()
+    if member['size'] > 0:
+        response = client.get_object(
+            namespace,
+            bucket_name,
+            archive_name,
+            range=object_packing.get_member_range(member),
+            opc_client_request_id=ctx.obj['request_id']
+        )
+
+        # Stream using the raw urllib3.HTTPResponse, since using the Requests response
+        # will automatically try to decode.
+        for chunk in response.data.raw.stream(OBJECT_GET_CHUNK_SIZE, decode_content=False):
+            md5.update(chunk)
+            file.write(chunk)
+
+    if cli_util.format_md5_checksum(md5.hexdigest()) != member['md5']:
+        raise click.ClickException('The content downloaded for {} does not match the MD5 in the index of {}'.format(name, archive_name))
+
+
 @objectstorage_cli.object_group.command(name='bulk-download')
 @cli_util.option('-ns', '--namespace', '--namespace-name', 'namespace', required=True, help='The top-level namespace used for the request.')
 @cli_util.option('-bn', '--bucket-name', required=True, help='The name of the bucket.')
@@ -877,6 +1043,11 @@ def object_get(ctx, from_json, namespace, bucket_name, name, file, if_match, if_
 @cli_util.option('--no-overwrite', is_flag=True, help='If a file with the same name as an object already exists in the download directory, do not overwite it. If neither this flag nor --overwrite is specified, you will be prompted each time a file would be overwritten')
 @cli_util.option('--parallel-operations-count', type=click.INT, default=10, show_default=True,
                  help='The number of parallel operations to perform. Decreasing this value will make bulk downloads less resource intensive but they may take longer. Increasing this value may improve bulk download times, but the upload process will consume more system resources and network bandwidth.')
+@cli_util.option('--transfer-engine', type=custom_types.CliCaseInsensitiveChoice(TRANSFER_ENGINES), default=TRANSFER_ENGINE_THREADS, show_default=True,
+                 help=TRANSFER_ENGINE_HELP)
+@cli_util.option('--adaptive-concurrency', is_flag=True, help=ADAPTIVE_CONCURRENCY_HELP)
+@cli_util.option('--resume', 'resume_journal', help='A journal file which records the objects which have been downloaded. If the download is interrupted, run the same command with the same journal file to skip the objects which were downloaded. The journal file is created if it does not exist.')
+@cli_util.option('--unpack', is_flag=True, help='Expand the archives uploaded by bulk-upload --pack-small-files into the files which were packed into them, instead of downloading the archives as files. The index objects of the archives are not downloaded. Files in an archive which already exist in the download directory are only replaced if --overwrite is specified, and the --include and --exclude patterns are applied to the files in the archives.')
 @cli_util.option('--multipart-download-threshold', type=click.IntRange(128, None), help='Objects larger than this size (in MiB) will be downloaded in multiple parts. The minimum allowable threshold is 128 MiB.')
 @cli_util.option('--part-size', type=click.IntRange(128, None), help='Part size (in MiB) to use when downloading an object in multiple parts. The minimum allowable size is 128 MiB.')
 @cli_util.option('--include', multiple=True, help="""Only download objects which match the provided pattern. Patterns are taken relative to the DOWNLOAD directory. This option can be provided mulitple times to match on mulitple patterns. Supported pattern symbols are:
@@ -892,7 +1063,7 @@ def object_get(ctx, from_json, namespace, bucket_name, name, file, if_match, if_
 @click.pass_context
 @json_skeleton_utils.json_skeleton_generation_handler(input_params_to_complex_types={})
 @wrap_exceptions
-def object_bulk_get(ctx, from_json, namespace, bucket_name, prefix, delimiter, download_dir, overwrite, no_overwrite, include, exclude, parallel_operations_count, multipart_download_threshold, part_size):
+def object_bulk_get(ctx, from_json, namespace, bucket_name, prefix, delimiter, download_dir, overwrite, no_overwrite, include, exclude, parallel_operations_count, transfer_engine, adaptive_concurrency, resume_journal, unpack, multipart_download_threshold, part_size):
     """
     Downloads all objects which match the given prefix to a given directory.
 
@@ -946,6 +1117,24 @@ def object_bulk_get(ctx, from_json, namespace, bucket_name, prefix, delimiter, d
     \b
     If files with the same name as the objects being downloaded already exist in the download directory, you can opt to overwrite them with the
     --overwrite option, or preserve them with the --no-overwrite option.
+
+    \b
+    Resuming an interrupted download
+    --------------------------------
+    oci os object bulk-download -ns mynamespace -bn mybucket --download-dir path/to/download/directory --resume path/to/journal
+
+    \b
+    The objects which have been downloaded are recorded in the journal file. If the download is interrupted, running the same
+    command again skips the objects which were downloaded.
+
+    \b
+    Expanding archives of packed small files
+    ----------------------------------------
+    oci os object bulk-download -ns mynamespace -bn mybucket --download-dir path/to/download/directory --unpack
+
+    \b
+    Archives which were uploaded by bulk-upload --pack-small-files are downloaded and expanded into the files which were packed
+    into them, so the download directory ends up with the same files as if each had been uploaded as its own object.
     """
     if include and exclude:
         raise click.UsageError('The --include and --exclude parameters cannot both be provided.')
@@ -964,19 +1153,11 @@ def object_bulk_get(ctx, from_json, namespace, bucket_name, prefix, delimiter, d
     if not os.path.exists(expanded_directory):
         os.makedirs(expanded_directory)
 
-    kwargs = {
-        'client': client,
-        'request_id': ctx.obj['request_id'],
-        'namespace': namespace,
-        'bucket_name': bucket_name,
-        'prefix': prefix,
-        'start': None,
-        'end': None,
-        'limit': OBJECT_LIST_PAGE_SIZE_BULK_OPERATIONS,
-        'delimiter': delimiter,
-        'fields': 'name,size'
-    }
-    keep_paginating = True
+    # The objects are listed in parallel shards, and each page is downloaded as it arrives
+    object_lister = _build_object_lister(
+        client, ctx.obj['request_id'], namespace, bucket_name,
+        prefix=prefix, delimiter=delimiter, fields='name,size', page_size=OBJECT_LIST_PAGE_SIZE_BULK_OPERATIONS
+    )
     ask_overwrite = True
 
     output = BulkGetOperationOutput()
@@ -984,14 +1165,27 @@ def object_bulk_get(ctx, from_json, namespace, bucket_name, prefix, delimiter, d
     # Progress bar which we can reuse over and over again
     reusable_progress_bar = ProgressBar(0, '')
 
-    transfer_manager = TransferManager(client, TransferManagerConfig(max_object_storage_requests=parallel_operations_count))
+    transfer_journal = _open_transfer_journal(ctx, resume_journal, 'bulk-download', namespace, bucket_name)
+    transfer_manager = _build_transfer_manager(
+        client,
+        TransferManagerConfig(
+            max_object_storage_requests=parallel_operations_count,
+            concurrency_limiter=_build_concurrency_limiter(ctx, adaptive_concurrency, parallel_operations_count)
+        ),
+        transfer_engine
+    )
     file_filter_collection = _get_file_filter_collection(expanded_directory, include, exclude, prefix)
 
-    while keep_paginating:
-        list_objects_response = retrying_list_objects_single_page(**kwargs)
+    # Archives are expanded on this thread as they finish downloading, so that the expansion does not hold up the transfers
+    downloaded_archives = queue.Queue()
+
+    for list_objects_response in object_lister.responses():
         next_start = list_objects_response.data.next_start_with
         to_download = []
 
+        if unpack:
+            _unpack_downloaded_archives(downloaded_archives, expanded_directory, file_filter_collection, overwrite, output, transfer_journal)
+
         if next_start is not None and not overwrite and not no_overwrite and ask_overwrite:
             if click.confirm("You are downloading more than 1000 objects, do you want to overwrite all?"):
                 overwrite = True
@@ -1001,6 +1195,20 @@ def object_bulk_get(ctx, from_json, namespace, bucket_name, prefix, delimiter, d
         for obj in list_objects_response.data.objects:
             object_name = obj.name
 
+            if unpack and object_packing.is_index_name(object_name):
+                continue
+
+            if unpack and object_packing.is_archive_name(object_name):
+                if transfer_journal and transfer_journal.is_completed(object_name):
+                    output.add_skipped(object_name)
+                    continue
+
+                # The archive is downloaded to a temporary file in the download directory, which is removed once it is expanded
+                fd, archive_path = tempfile.mkstemp(suffix=object_packing.ARCHIVE_SUFFIX, dir=expanded_directory)
+                os.close(fd)
+                to_download.append({"name": object_name, "size": obj.size, "full_file_path": archive_path, "is_archive": True})
+                continue
+
             # If the object name starts with the path separator (account for Unix and Windows paths) then remove it when we
             # do the joining to create a full file name, otherwise we could get an unexpected result
             if object_name[0] == '/' or object_name[0] == '\\':
@@ -1012,6 +1220,10 @@ def object_bulk_get(ctx, from_json, namespace, bucket_name, prefix, delimiter, d
                 if file_filter_collection.get_action(full_file_path) == BaseFileFilterCollection.EXCLUDE:
                     continue
 
+            if transfer_journal and transfer_journal.is_completed(object_name):
+                output.add_skipped(object_name)
+                continue
+
             if os.path.exists(full_file_path):
                 if no_overwrite:
                     output.add_skipped(object_name)
@@ -1061,7 +1273,15 @@ def object_bulk_get(ctx, from_json, namespace, bucket_name, prefix, delimiter, d
                 error_callback_kwargs = {'failed_item': object_name}
                 add_to_download_failures_callback = WorkPoolTaskErrorCallback(output.add_failure, **error_callback_kwargs)
 
-                callbacks_container = WorkPoolTaskCallbacksContainer(completion_callbacks=[update_progress_callback], error_callbacks=[add_to_download_failures_callback])
+                success_callbacks = []
+                error_callbacks = [add_to_download_failures_callback]
+                if obj.get('is_archive'):
+                    success_callbacks.append(WorkPoolTaskSuccessCallback(_add_downloaded_archive, downloaded_archives=downloaded_archives, archive_name=object_name, archive_path=full_file_path))
+                    error_callbacks.append(WorkPoolTaskErrorCallback(_remove_file_if_exists, file_path=full_file_path))
+                elif transfer_journal:
+                    success_callbacks.append(WorkPoolTaskSuccessCallback(transfer_journal.record_completed, object_name=object_name))
+
+                callbacks_container = WorkPoolTaskCallbacksContainer(completion_callbacks=[update_progress_callback], success_callbacks=success_callbacks, error_callbacks=error_callbacks)
 
                 if ctx.obj['debug']:
                     click.echo('Downloading {} to {}'.format(object_name, full_file_path), file=sys.stderr)
@@ -1102,11 +1322,9 @@ def object_bulk_get(ctx, from_json, namespace, bucket_name, prefix, delimiter, d
                 if ctx.obj['debug']:
                     click.echo('Failed to download {}'.format(object_name), file=sys.stderr)
 
-        # Keep going if we have more pages
-        kwargs['start'] = next_start
-        keep_paginating = (next_start is not None)
-
     transfer_manager.wait_for_completion()
+    if unpack:
+        _unpack_downloaded_archives(downloaded_archives, expanded_directory, file_filter_collection, overwrite, output, transfer_journal)
     reusable_progress_bar.render_finish()
 
     render(data=output.get_output(ctx.obj['output']), headers=None, ctx=ctx, nest_data_in_data_attribute=False)
@@ -1159,6 +1377,9 @@ def object_head(ctx, from_json, namespace, bucket_name, name, if_match, if_none_
 @cli_util.option('--force', is_flag=True, help='Do not ask for confirmation prior to performing the bulk delete.')
 @cli_util.option('--parallel-operations-count', type=click.INT, default=10, show_default=True,
                  help='The number of parallel operations to perform. Decreasing this value will make bulk deletes less resource intensive but they may take longer. Increasing this value may improve bulk delete times, but the upload process will consume more system resources and network bandwidth.')
+@cli_util.option('--transfer-engine', type=custom_types.CliCaseInsensitiveChoice(TRANSFER_ENGINES), default=TRANSFER_ENGINE_THREADS, show_default=True,
+                 help=TRANSFER_ENGINE_HELP)
+@cli_util.option('--adaptive-concurrency', is_flag=True, help=ADAPTIVE_CONCURRENCY_HELP)
 @cli_util.option('--include', multiple=True, help="""Only delete objects which match the provided pattern. Patterns are taken relative to the bucket root. This option can be provided mulitple times to match on mulitple patterns. Supported pattern symbols are:
 \b
 {}
@@ -1172,7 +1393,7 @@ def object_head(ctx, from_json, namespace, bucket_name, name, if_match, if_none_
 @click.pass_context
 @json_skeleton_utils.json_skeleton_generation_handler(input_params_to_complex_types={})
 @wrap_exceptions
-def object_bulk_delete(ctx, from_json, namespace, bucket_name, prefix, delimiter, dry_run, force, include, exclude, parallel_operations_count):
+def object_bulk_delete(ctx, from_json, namespace, bucket_name, prefix, delimiter, dry_run, force, include, exclude, parallel_operations_count, transfer_engine, adaptive_concurrency):
     """
     Deletes all objects in a bucket which match the provided criteria.
 
@@ -1249,22 +1470,15 @@ def object_bulk_delete(ctx, from_json, namespace, bucket_name, prefix, delimiter
     # use the bucket name as a fake base directory
     file_filter_collection = _get_file_filter_collection(bucket_name, include, exclude, prefix)
 
-    if dry_run:
-        list_all_objects_responses = retrying_list_objects(
-            client=client,
-            request_id=ctx.obj['request_id'],
-            namespace=namespace,
-            bucket_name=bucket_name,
-            prefix=prefix,
-            start=None,
-            end=None,
-            limit=OBJECT_LIST_PAGE_SIZE_BULK_OPERATIONS,
-            delimiter=delimiter,
-            fields='name',
-            retrieve_all=True
-        )
+    # The objects are listed in parallel shards, and each page is deleted as it arrives
+    object_lister = _build_object_lister(
+        client, ctx.obj['request_id'], namespace, bucket_name,
+        prefix=prefix, delimiter=delimiter, fields='name', page_size=OBJECT_LIST_PAGE_SIZE_BULK_OPERATIONS
+    )
+    list_objects_responses = object_lister.responses()
 
-        for response in list_all_objects_responses:
+    if dry_run:
+        for response in list_objects_responses:
             for obj in response.data.objects:
                 if file_filter_collection:
                     pseudo_path = os.path.join(bucket_name, obj.name)
@@ -1279,23 +1493,8 @@ def object_bulk_delete(ctx, from_json, namespace, bucket_name, prefix, delimiter
     #
     # CLI should do a list for 1000 items, and ask for confirmation with a message saying either that more than 1000 items will be deleted,
     # or the exact number of items that will be deleted
-    list_objects_responses = retrying_list_objects(
-        client=client,
-        request_id=ctx.obj['request_id'],
-        namespace=namespace,
-        bucket_name=bucket_name,
-        prefix=prefix,
-        start=None,
-        end=None,
-        limit=OBJECT_LIST_PAGE_SIZE_BULK_OPERATIONS,
-        delimiter=delimiter,
-        fields='name',
-        retrieve_all=False
-    )
-
-    objects_to_delete = []
-    for response in list_objects_responses:
-        objects_to_delete.extend(map(lambda obj: obj.name, response.data.objects))
+    first_response = next(list_objects_responses)
+    objects_to_delete = list(map(lambda obj: obj.name, first_response.data.objects))
 
     if not force:
         if include or exclude:
@@ -1303,7 +1502,7 @@ def object_bulk_delete(ctx, from_json, namespace, bucket_name, prefix, delimiter
             # case that the only matching items are on the last few pages). So in this case just use a generic message
             confirm_prompt = 'WARNING: This command will delete all matching objects in the bucket. Please use --dry-run to list the objects which would be deleted. Are you sure you wish to continue?'
         else:
-            if list_objects_responses[-1].data.next_start_with:
+            if first_response.data.next_start_with:
                 # There are more pages of data
                 confirm_prompt = 'WARNING: This command will delete at least {} objects. Are you sure you wish to continue?'.format(len(objects_to_delete))
             else:
@@ -1317,11 +1516,17 @@ def object_bulk_delete(ctx, from_json, namespace, bucket_name, prefix, delimiter
         if not click.confirm(confirm_prompt):
             ctx.abort()
 
-    transfer_manager = TransferManager(client, TransferManagerConfig(max_object_storage_requests=parallel_operations_count))
+    transfer_manager = _build_transfer_manager(
+        client,
+        TransferManagerConfig(
+            max_object_storage_requests=parallel_operations_count,
+            concurrency_limiter=_build_concurrency_limiter(ctx, adaptive_concurrency, parallel_operations_count)
+        ),
+        transfer_engine
+    )
     reusable_progress_bar = ProgressBar(100, '')
 
-    next_start_with = list_objects_responses[-1].data.next_start_with
-    while next_start_with or len(objects_to_delete) > 0:
+    while objects_to_delete is not None:
         for obj in objects_to_delete:
             if file_filter_collection:
                 pseudo_path = os.path.join(bucket_name, obj)
@@ -1364,31 +1569,391 @@ def object_bulk_delete(ctx, from_json, namespace, bucket_name, prefix, delimiter
                 if ctx.obj['debug']:
                     click.echo('Failed to delete {}'.format(obj), file=sys.stderr)
 
-        objects_to_delete = []  # New list (though we could also clear the existing list) in case we need to delete more stuff
-        if next_start_with:
-            # Because we may not be deleting objects for a while when there are filters, show a dummy message so the caller still knows that there
-            # is progress
-            if include or exclude:
-                reusable_progress_bar.reset_progress(100, 'Searching for matching objects to delete')
+        # Because we may not be deleting objects for a while when there are filters, show a dummy message so the caller still knows that there
+        # is progress
+        if (include or exclude) and first_response.data.next_start_with:
+            reusable_progress_bar.reset_progress(100, 'Searching for matching objects to delete')
+
+        list_objects_response = next(list_objects_responses, None)
+        objects_to_delete = list(map(lambda obj: obj.name, list_objects_response.data.objects)) if list_objects_response else None
+
+    transfer_manager.wait_for_completion()
+    reusable_progress_bar.render_finish()
+
+    render(data=output.get_output(ctx.obj['output']), headers=None, ctx=ctx, nest_data_in_data_attribute=False)
+
+    if output.has_failures():
+        sys.exit(1)
+
+
+@objectstorage_cli.object_group.command(name='bulk-copy')
+@cli_util.option('-ns', '--namespace', '--namespace-name', 'namespace', required=True, help='The top-level namespace of the bucket to copy objects from.')
+@cli_util.option('-bn', '--bucket-name', required=True, help='The name of the bucket to copy objects from.')
+@cli_util.option('--destination-bucket', required=True, help='The name of the bucket to copy objects to.')
+@cli_util.option('--destination-namespace', help='The namespace of the bucket to copy objects to. Defaults to the namespace of your tenancy.')
+@cli_util.option('--destination-region', help='The region of the bucket to copy objects to. Defaults to the region in your config.')
+@cli_util.option('--prefix', help='Copy all objects with the given prefix. Omit this parameter to copy all objects in the bucket.')
+@cli_util.option('--destination-prefix', help='A prefix to add to the names of the copies. Omit this parameter to give the copies the same names as the objects they are copied from.')
+@cli_util.option('--dry-run', is_flag=True, help='Displays a list of objects which would be copied by this command, and the names they would be copied to, if it were run without --dry-run. If --dry-run is passed, no objects will actually be copied.')
+@cli_util.option('--parallel-operations-count', type=click.IntRange(1, 1000), default=10, show_default=True,
+                 help='The maximum number of copies in progress at once. A copy is in progress from the request which starts it until its work request finishes. Increasing this value may improve bulk copy times, but more copies will compete for the bandwidth of Object Storage. The maximum is 1000.')
+@cli_util.option('--include', multiple=True, help="""Only copy objects which match the provided pattern. Patterns are taken relative to the bucket root. This option can be provided mulitple times to match on mulitple patterns. Supported pattern symbols are:
+\b
+{}
+""".format(INCLUDE_EXCLUDE_PATTERN))
+@cli_util.option('--exclude', multiple=True, help="""Only copy objects which do not match the provided pattern. Patterns are taken relative to the bucket root. This option can be provided mulitple times to match on mulitple patterns. Supported pattern symbols are:
+\b
+{}
+""".format(INCLUDE_EXCLUDE_PATTERN))
+@json_skeleton_utils.get_cli_json_input_option({})
+@help_option
+@click.pass_context
+@json_skeleton_utils.json_skeleton_generation_handler(input_params_to_complex_types={})
+@wrap_exceptions
+def object_bulk_copy(ctx, from_json, namespace, bucket_name, destination_bucket, destination_namespace, destination_region, prefix, destination_prefix, dry_run, parallel_operations_count, include, exclude):
+    """
+    Copies all objects in a bucket which match the provided criteria to another bucket, which may be in another region.
+
+    The objects are copied by Object Storage, so their data does not pass through the machine running the command. Each
+    copy is tracked by a work request, and the command waits for all of them to finish before reporting the objects which
+    were copied and the copies which failed.
+
+
+    \b
+    Examples
+    ========
+
+    \b
+    Copying all objects in a bucket to a bucket in another region
+    -------------------------------------------------------------
+    oci os object bulk-copy -ns mynamespace -bn mybucket --destination-bucket mybackup --destination-region us-ashburn-1
+
+    \b
+    Copying the objects with a given prefix
+    ---------------------------------------
+    oci os object bulk-copy -ns mynamespace -bn mybucket --destination-bucket mybackup --prefix level1/level2/
+
+    \b
+    This will copy all objects of the form level1/level2/<object name>, level1/level2/level3/<object name> etc. to objects
+    with the same names in the destination bucket.
+
+    \b
+    Copying objects to a different prefix in the same bucket
+    --------------------------------------------------------
+    oci os object bulk-copy -ns mynamespace -bn mybucket --destination-bucket mybucket --prefix logs/ --destination-prefix archive/
+
+    \b
+    This will copy logs/<object name> to archive/logs/<object name>.
+
+    \b
+    Previewing what would be copied
+    -------------------------------
+    oci os object bulk-copy -ns mynamespace -bn mybucket --destination-bucket mybackup --include '*.jpg' --dry-run
+    """
+    if include and exclude:
+        raise click.UsageError('The --include and --exclude parameters cannot both be provided')
+
+    client = build_client('object_storage', ctx)
+
+    if destination_namespace is None:
+        destination_namespace = client.get_namespace().data
+
+    if destination_region is None:
+        if destination_bucket == bucket_name and destination_namespace == namespace and not destination_prefix:
+            raise click.UsageError('The objects cannot be copied onto themselves. Provide a different --destination-bucket, --destination-region or a --destination-prefix')
+        destination_region = ctx.obj['config']['region']
+
+    # Check the output format before any copies are started, rather than after they have all finished
+    output = BulkCopyOperationOutput()
+    output.validate_output_format(ctx.obj['output'])
+
+    # As with bulk-delete, the bucket name is used as a fake base directory for the filters
+    file_filter_collection = _get_file_filter_collection(bucket_name, include, exclude, prefix)
+
+    # The objects are listed in parallel shards, and the copies of each page are started as it arrives
+    object_lister = _build_object_lister(
+        client, ctx.obj['request_id'], namespace, bucket_name,
+        prefix=prefix, fields='name', page_size=OBJECT_LIST_PAGE_SIZE_BULK_OPERATIONS
+    )
+
+    if dry_run:
+        for response in object_lister.responses():
+            for obj in response.data.objects:
+                if file_filter_collection and file_filter_collection.get_action(os.path.join(bucket_name, obj.name)) == BaseFileFilterCollection.EXCLUDE:
+                    continue
+                output.add_copied(obj.name, (destination_prefix or '') + obj.name)
+
+        render(data=output.get_output(ctx.obj['output'], dry_run=True), headers=None, ctx=ctx, nest_data_in_data_attribute=False)
+        ctx.exit()
+
+    transfer_manager = TransferManager(client, TransferManagerConfig(max_object_storage_requests=parallel_operations_count))
+    progress = BulkCopyProgress(output, parallel_operations_count, ctx.obj['debug'])
+    work_request_poller = WorkRequestPoller(client.get_work_request, client.list_work_request_errors, on_poll=progress.update_work_request)
+
+    for response in object_lister.responses():
+        for obj in response.data.objects:
+            if file_filter_collection and file_filter_collection.get_action(os.path.join(bucket_name, obj.name)) == BaseFileFilterCollection.EXCLUDE:
+                continue
+
+            destination_object_name = (destination_prefix or '') + obj.name
+            copy_object_details = CopyObjectDetails(
+                source_object_name=obj.name,
+                destination_region=destination_region,
+                destination_namespace=destination_namespace,
+                destination_bucket=destination_bucket,
+                destination_object_name=destination_object_name
+            )
+
+            # This waits until there is room in the window of copies in progress
+            progress.start_copy(obj.name)
 
-            list_objects_response = retrying_list_objects_single_page(
-                client=client,
-                request_id=ctx.obj['request_id'],
+            callbacks_container = WorkPoolTaskCallbacksContainer(
+                success_callbacks=[WorkPoolTaskSuccessCallback(progress.track_copy, work_request_poller, obj.name, destination_object_name)],
+                error_callbacks=[WorkPoolTaskErrorCallback(progress.finish_copy, obj.name, destination_object_name, None)]
+            )
+            transfer_manager.copy_object(
+                callbacks_container,
                 namespace=namespace,
                 bucket_name=bucket_name,
-                prefix=prefix,
-                start=next_start_with,
-                end=None,
-                limit=OBJECT_LIST_PAGE_SIZE_BULK_OPERATIONS,
-                delimiter=delimiter,
-                fields='name'
+                copy_object_details=copy_object_details,
+                request_id=ctx.obj['request_id']
             )
-            objects_to_delete.extend(map(lambda obj: obj.name, list_objects_response.data.objects))
-            next_start_with = list_objects_response.data.next_start_with
+
+    transfer_manager.wait_for_completion()
+    work_request_poller.wait_for_completion()
+    progress.render_finish()
+
+    render(data=output.get_output(ctx.obj['output']), headers=None, ctx=ctx, nest_data_in_data_attribute=False)
+
+    if output.has_failures():
+        sys.exit(1)
+
+
+@objectstorage_cli.object_group.command(name='sync')
+@cli_util.option('-ns', '--namespace', '--namespace-name', 'namespace', required=True, help='The top-level namespace used for the request.')
+@cli_util.option('-bn', '--bucket-name', required=True, help='The name of the bucket.')
+@cli_util.option('--src-dir', help='Upload new and changed files from this directory (and all subdirectories) to the bucket. Exactly one of --src-dir or --download-dir must be provided.')
+@cli_util.option('--download-dir', help='Download new and changed objects from the bucket to this directory. The directory will be created if it does not exist. Exactly one of --src-dir or --download-dir must be provided.')
+@cli_util.option('--prefix', help='The prefix of the objects kept in sync with the directory. A file at path/to/file in the directory is kept in sync with the object named <prefix>path/to/file. Omit this parameter to sync the whole bucket.')
+@cli_util.option('--delete', is_flag=True, help='Also delete objects (when uploading) or files (when downloading) which are not in the source.')
+@cli_util.option('--dry-run', is_flag=True, help='Displays the items which would be transferred or deleted by this command, if it were run without --dry-run. If --dry-run is passed, nothing is transferred or deleted.')
+@cli_util.option('--index-file', help='The file used to remember the sizes, modification times and MD5 hashes of the files which were in sync after the last run, so that unchanged files are not read again to compare them with their objects. By default an index for the directory and bucket prefix is kept in {}.'.format(sync_index.DEFAULT_INDEX_DIRECTORY))
+@cli_util.option('--parallel-operations-count', type=click.IntRange(1, 1000), default=10, show_default=True,
+                 help='The number of parallel operations to perform. Decreasing this value will make syncs less resource intensive but they may take longer. Increasing this value may improve sync times, but the sync process will consume more system resources and network bandwidth. The maximum is 1000.')
+@cli_util.option('--transfer-engine', type=custom_types.CliCaseInsensitiveChoice(TRANSFER_ENGINES), default=TRANSFER_ENGINE_THREADS, show_default=True,
+                 help=TRANSFER_ENGINE_HELP)
+@cli_util.option('--adaptive-concurrency', is_flag=True, help=ADAPTIVE_CONCURRENCY_HELP)
+@cli_util.option('--part-size', type=click.IntRange(10, None),
+                 help='Part size (in MiB) to use for files which are uploaded in multiple parts, and for objects which are downloaded in multiple parts. By default, files above 128 MiB are uploaded in multiple parts and objects above 128 MiB are downloaded in 128 MiB parts.')
+@cli_util.option('--include', multiple=True, help="""Only sync files which match the provided pattern. Patterns are taken relative to the local directory. This option can be provided mulitple times to match on mulitple patterns. Supported pattern symbols are:
+\b
+{}
+""".format(INCLUDE_EXCLUDE_PATTERN))
+@cli_util.option('--exclude', multiple=True, help="""Only sync files which do not match the provided pattern. Patterns are taken relative to the local directory. This option can be provided mulitple times to match on mulitple patterns. Supported pattern symbols are:
+\b
+{}
+""".format(INCLUDE_EXCLUDE_PATTERN))
+@json_skeleton_utils.get_cli_json_input_option({})
+@help_option
+@click.pass_context
+@json_skeleton_utils.json_skeleton_generation_handler(input_params_to_complex_types={})
+@wrap_exceptions
+def object_sync(ctx, from_json, namespace, bucket_name, src_dir, download_dir, prefix, delete, dry_run, index_file, parallel_operations_count, transfer_engine, adaptive_concurrency, part_size, include, exclude):
+    """
+    Makes the objects with a given prefix the same as the files in a local directory (when uploading with --src-dir), or
+    the files in a local directory the same as the objects with a given prefix (when downloading with --download-dir).
+
+    The bucket prefix is listed once and the directory is walked once. A file and its object are considered the same when
+    they have the same size and content: the MD5 of the file is compared with the MD5 reported by Object Storage. Objects
+    which were uploaded in multiple parts do not have the MD5 of their content, so if the object was not synced with this
+    file before they are considered the same when the object was created after the file was last modified (when uploading)
+    or before it (when downloading). Only new and changed items are transferred.
+
+    The sizes, modification times and MD5 hashes of the files which were in sync are remembered in an index file, so a
+    file which has not been modified since the last sync is not read again.
+
+
+    \b
+    Examples
+    ========
+
+    \b
+    Upload new and changed files
+    ----------------------------
+    oci os object sync -ns mynamespace -bn mybucket --src-dir path/to/directory --prefix backups/
+
+    \b
+    Download new and changed objects, and delete files which no longer have an object
+    ---------------------------------------------------------------------------------
+    oci os object sync -ns mynamespace -bn mybucket --download-dir path/to/directory --prefix backups/ --delete
+
+    \b
+    Previewing what would be synced
+    -------------------------------
+    oci os object sync -ns mynamespace -bn mybucket --src-dir path/to/directory --delete --dry-run
+    """
+    # there is existing retry logic for the transfers so we don't want the Python SDK level retries to interfere / overlap with that
+    ctx.obj['no_retry'] = True
+
+    if include and exclude:
+        raise click.UsageError('The --include and --exclude parameters cannot both be provided.')
+
+    if (src_dir is None) == (download_dir is None):
+        raise click.UsageError('Exactly one of --src-dir (to upload to the bucket) or --download-dir (to download from the bucket) must be provided.')
+
+    uploading = src_dir is not None
+    expanded_directory = os.path.expandvars(os.path.expanduser(src_dir if uploading else download_dir))
+    if uploading and not os.path.isdir(expanded_directory):
+        raise click.UsageError('The specified --src-dir {} (expanded to: {}) does not exist'.format(src_dir, expanded_directory))
+
+    client = build_client('object_storage', ctx)
+    client_request_id = ctx.obj['request_id']
+    prefix = prefix or ''
+
+    file_filter_collection = _get_file_filter_collection(expanded_directory, include, exclude, None)
+    index = sync_index.SyncIndex.for_location(index_file, namespace, bucket_name, prefix, expanded_directory)
+    output = BulkSyncOperationOutput('Uploaded' if uploading else 'Downloaded')
+
+    def is_excluded(relative_path):
+        return file_filter_collection and file_filter_collection.get_action(_get_sync_file_path(expanded_directory, relative_path)) == BaseFileFilterCollection.EXCLUDE
+
+    # Both sides are listed once up front, keyed by the path relative to the directory (with / as the separator)
+    local_files = _list_files_for_sync(expanded_directory)
+    objects = _list_objects_for_sync(client, client_request_id, namespace, bucket_name, prefix)
+
+    sources, destinations = (local_files, objects) if uploading else (objects, local_files)
+    to_transfer = []
+    for relative_path in sorted(sources):
+        if is_excluded(relative_path):
+            continue
+
+        file_path = _get_sync_file_path(expanded_directory, relative_path)
+        if relative_path in local_files and relative_path in objects:
+            try:
+                if _is_in_sync(index, relative_path, file_path, local_files[relative_path], objects[relative_path], uploading):
+                    output.add_unchanged()
+                    continue
+            except (IOError, OSError) as e:
+                output.add_failure(relative_path, callback_exception=e)
+                continue
+
+        to_transfer.append(relative_path)
+
+    to_delete = []
+    if delete:
+        to_delete = [relative_path for relative_path in sorted(destinations) if relative_path not in sources and not is_excluded(relative_path)]
+
+    if dry_run:
+        for relative_path in to_transfer:
+            output.add_transferred(relative_path)
+        for relative_path in to_delete:
+            output.add_deleted(relative_path)
+
+        render(data=output.get_output(ctx.obj['output'], dry_run=True), headers=None, ctx=ctx, nest_data_in_data_attribute=False)
+        ctx.exit()
+
+    transfer_manager = _build_transfer_manager(
+        client,
+        TransferManagerConfig(
+            max_object_storage_requests=parallel_operations_count,
+            max_object_storage_multipart_requests=parallel_operations_count,
+            max_multipart_files_to_process=parallel_operations_count,
+            concurrency_limiter=_build_concurrency_limiter(ctx, adaptive_concurrency, parallel_operations_count)
+        ),
+        transfer_engine
+    )
+    reusable_progress_bar = ProgressBar(0, '')
+    verb = 'Upload' if uploading else 'Download'
+
+    for relative_path in to_transfer:
+        file_path = _get_sync_file_path(expanded_directory, relative_path)
+        object_name = prefix + relative_path
+
+        try:
+            if ctx.obj['debug']:
+                update_progress_callback = WorkPoolTaskCallback(_print_to_console, message='{}ed {}'.format(verb, object_name))
+                click.echo('{}ing {}'.format(verb, object_name), file=sys.stderr)
+            else:
+                update_progress_callback = WorkPoolTaskCallback(reusable_progress_bar.update_label_to_end, new_label=_get_progress_bar_label(None, object_name, verb + 'ed'))
+                reusable_progress_bar.reset_progress(100, _get_progress_bar_label(None, object_name, verb + 'ing'))
+
+            success_callbacks = [
+                WorkPoolTaskSuccessCallback(_record_synced_upload if uploading else _record_synced_download, index=index, relative_path=relative_path, file_path=file_path, object_summary=objects.get(relative_path)),
+                WorkPoolTaskSuccessCallback(output.add_transferred, transferred=relative_path)
+            ]
+            callbacks_container = WorkPoolTaskCallbacksContainer(
+                completion_callbacks=[update_progress_callback],
+                success_callbacks=success_callbacks,
+                error_callbacks=[WorkPoolTaskErrorCallback(output.add_failure, failed_item=relative_path)]
+            )
+
+            if uploading:
+                file_size = local_files[relative_path].st_size
+                upload_kwargs = {'opc_client_request_id': client_request_id}
+                if part_size:
+                    upload_kwargs['part_size'] = part_size * MEBIBYTE
+                if not ctx.obj['debug']:
+                    upload_kwargs['multipart_part_completion_callback'] = BulkOperationMultipartUploadProgressBar(reusable_progress_bar, file_size, _get_progress_bar_label(None, object_name, 'Uploading part for')).update
+
+                transfer_manager.upload_object(callbacks_container, namespace, bucket_name, object_name, file_path, file_size, False, **upload_kwargs)
+            else:
+                directory_for_file = os.path.dirname(file_path)
+                if not os.path.isdir(directory_for_file):
+                    os.makedirs(directory_for_file)
+
+                get_object_kwargs = {
+                    'namespace': namespace,
+                    'bucket_name': bucket_name,
+                    'object_name': object_name,
+                    'request_id': client_request_id
+                }
+                object_size = objects[relative_path].size
+                download_part_size = (part_size or 128) * MEBIBYTE
+                if object_size is not None and object_size <= download_part_size:
+                    transfer_manager.get_object(callbacks_container, full_file_path=file_path, **get_object_kwargs)
+                else:
+                    if object_size and not ctx.obj['debug']:
+                        multipart_callback_reference = BulkOperationMultipartUploadProgressBar(reusable_progress_bar, object_size, _get_progress_bar_label(None, object_name, 'Downloading part for')).update
+                        get_object_kwargs['chunk_written_callback'] = multipart_callback_reference
+                        get_object_kwargs['part_completed_callback'] = multipart_callback_reference
+
+                    transfer_manager.get_object_multipart(callbacks_container, file_path, total_size=object_size, part_size=download_part_size, multipart_download_threshold=download_part_size, **get_object_kwargs)
+        except Exception as e:
+            # Don't let one failure fail the entire sync, but store the error for output later
+            output.add_failure(relative_path, callback_exception=e)
+
+            if ctx.obj['debug']:
+                click.echo('Failed to {} {}'.format(verb.lower(), object_name), file=sys.stderr)
+
+    for relative_path in to_delete:
+        if uploading:
+            delete_kwargs = {
+                'namespace': namespace,
+                'bucket_name': bucket_name,
+                'object_name': prefix + relative_path,
+                'if_match': None,
+                'request_id': client_request_id
+            }
+            callbacks_container = WorkPoolTaskCallbacksContainer(
+                success_callbacks=[WorkPoolTaskSuccessCallback(output.add_deleted, deleted=relative_path)],
+                error_callbacks=[WorkPoolTaskErrorCallback(output.add_failure, failed_item=relative_path)]
+            )
+            transfer_manager.delete_object(callbacks_container, **delete_kwargs)
+        else:
+            try:
+                os.remove(_get_sync_file_path(expanded_directory, relative_path))
+                output.add_deleted(relative_path)
+            except (IOError, OSError) as e:
+                output.add_failure(relative_path, callback_exception=e)
 
     transfer_manager.wait_for_completion()
     reusable_progress_bar.render_finish()
 
+    try:
+        index.save()
+    except (IOError, OSError) as e:
+        click.echo('Unable to save the sync index {}: {}'.format(index.path, e), file=sys.stderr)
+
     render(data=output.get_output(ctx.obj['output']), headers=None, ctx=ctx, nest_data_in_data_attribute=False)
 
     if output.has_failures():
@@ -1644,20 +2209,17 @@ def retrying_list_objects_single_page(client, request_id, namespace, bucket_name
 # Retrieves multiple pages of objects, retrying each list page call if we received a retryable exception. This will return a list of
 # the raw responses we received in the order we received them
 #
-# This method can retrieve all matching objects or only up to a given limit. The default is only to retrieve up to the given limit
+# This method can retrieve all matching objects or only up to a given limit. The default is only to retrieve up to the given limit. When
+# retrieving all objects, shards of the range are listed in parallel, so the pages are not in the order of the object names
 def retrying_list_objects(client, request_id, namespace, bucket_name, prefix, start, end, limit, delimiter, fields, retrieve_all=False):
     all_responses = list()
 
     if retrieve_all:
-        response = retrying_list_objects_single_page(client, request_id, namespace, bucket_name, prefix, start, end, limit, delimiter, fields)
-        all_responses.append(response)
-        next_start = response.data.next_start_with
-
-        while next_start:
-            response = retrying_list_objects_single_page(client, request_id, namespace, bucket_name, prefix, next_start, end, limit, delimiter, fields)
-
-            all_responses.append(response)
-            next_start = response.data.next_start_with
+        object_lister = _build_object_lister(
+            client, request_id, namespace, bucket_name,
+            prefix=prefix, start=start, end=end, delimiter=delimiter, fields=fields, page_size=limit
+        )
+        all_responses.extend(object_lister.responses())
     else:
         next_start = start
         while limit > 0:
@@ -1674,6 +2236,12 @@ def retrying_list_objects(client, request_id, namespace, bucket_name, prefix, st
     return all_responses
 
 
+# Returns a ShardedObjectLister for objects in the bucket, which lists each page with retries
+def _build_object_lister(client, request_id, namespace, bucket_name, **kwargs):
+    list_page = functools.partial(retrying_list_objects_single_page, client, request_id, namespace, bucket_name)
+    return ShardedObjectLister(list_page, **kwargs)
+
+
 # Normalizes the object name path of an object we're going to upload to object storage (e.g. a/b/c/object.txt) so that
 # it uses the object storage delimiter character (/)
 #
@@ -1722,6 +2290,54 @@ def _make_retrying_head_object_call(client, namespace, bucket_name, name, client
             raise
 
 
+def _build_transfer_manager(client, transfer_manager_config, transfer_engine):
+    if transfer_engine != TRANSFER_ENGINE_ASYNCIO:
+        return TransferManager(client, transfer_manager_config)
+
+    if sys.version_info < (3, 5):
+        raise click.UsageError('--transfer-engine {} requires Python 3.5 or later'.format(TRANSFER_ENGINE_ASYNCIO))
+
+    # The asyncio engine uses syntax which is only valid on Python 3.5+, so it is only imported when it is used
+    from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager import async_transfer_manager
+
+    reason = async_transfer_manager.get_unsupported_reason(client)
+    if reason:
+        raise click.UsageError('--transfer-engine {} cannot be used as {}'.format(TRANSFER_ENGINE_ASYNCIO, reason))
+
+    return async_transfer_manager.AsyncTransferManager(client, transfer_manager_config)
+
+
+def _build_concurrency_limiter(ctx, adaptive_concurrency, initial_limit):
+    if not adaptive_concurrency:
+        return None
+
+    concurrency_limiter = AimdConcurrencyLimiter(initial_limit)
+    if ctx.obj['debug']:
+        click.echo('Adaptive concurrency: starting with {} parallel operations, up to {}'.format(concurrency_limiter.limit, concurrency_limiter.max_limit), file=sys.stderr)
+        concurrency_limiter.add_listener(_print_concurrency_limit_change)
+
+    return concurrency_limiter
+
+
+def _print_concurrency_limit_change(old_limit, new_limit):
+    _print_to_console(message='Adaptive concurrency: {} parallel operations (was {})'.format(new_limit, old_limit))
+
+
+def _open_transfer_journal(ctx, journal_file, operation, namespace, bucket_name):
+    if not journal_file:
+        return None
+
+    try:
+        transfer_journal = TransferJournal(journal_file, operation, namespace, bucket_name)
+    except ValueError as e:
+        raise click.UsageError(str(e))
+
+    # The journal is closed (writing out the records it has buffered) when the command finishes, whether it succeeds,
+    # exits with failures or is stopped by an error, so that a later run can resume from everything which was done
+    ctx.call_on_close(transfer_journal.close)
+    return transfer_journal
+
+
 def _get_progress_bar_label(original_label, object_name, prefix='Processing'):
     if original_label:
         formatted_progress_bar_label = original_label
@@ -1756,6 +2372,85 @@ def _print_to_console(**kwargs):
     click.echo(kwargs['message'], file=sys.stderr)
 
 
+# Uploads an archive of small files and its index at the same time. The archive and index are reported as uploaded objects,
+# and once both have been uploaded the files in the archive are reported as packed (and recorded in the journal, if there is
+# one). The temporary files are removed once their uploads are done
+def _upload_packed_archive(archive, ctx, transfer_manager, output, transfer_journal, namespace, bucket_name, client_request_id, verify_checksum):
+    try:
+        packed_archive_upload = object_packing.PackedArchiveUpload(archive, functools.partial(_record_packed_archive, output=output, transfer_journal=transfer_journal))
+    except Exception as e:
+        archive.remove()
+        output.add_failure(archive.archive_name, callback_exception=e)
+        return
+
+    if ctx.obj['debug']:
+        click.echo('Uploading {} with {} packed files'.format(archive.archive_name, len(archive.members)), file=sys.stderr)
+
+    uploads = [
+        (archive.archive_name, archive.path, object_packing.ARCHIVE_CONTENT_TYPE, archive.remove),
+        (object_packing.get_index_name(archive.archive_name), packed_archive_upload.index_path, object_packing.INDEX_CONTENT_TYPE, packed_archive_upload.remove_index)
+    ]
+    for object_name, file_path, content_type, remove_file in uploads:
+        callbacks_container = WorkPoolTaskCallbacksContainer(
+            completion_callbacks=[WorkPoolTaskCallback(remove_file)],
+            success_callbacks=[WorkPoolTaskSuccessCallback(output.add_uploaded, uploaded_object=object_name), WorkPoolTaskSuccessCallback(packed_archive_upload.record_uploaded)],
+            error_callbacks=[WorkPoolTaskErrorCallback(output.add_failure, failed_item=object_name)]
+        )
+
+        try:
+            transfer_manager.upload_object(
+                callbacks_container, namespace, bucket_name, object_name, file_path, os.path.getsize(file_path), verify_checksum,
+                opc_client_request_id=client_request_id, content_type=content_type
+            )
+        except Exception as e:
+            remove_file()
+            output.add_failure(object_name, callback_exception=e)
+
+
+def _record_packed_archive(archive, output, transfer_journal):
+    member_names = [member['name'] for member in archive.members]
+    output.add_packed(archive.archive_name, member_names)
+    if transfer_journal:
+        for member_name in member_names:
+            transfer_journal.record_completed(member_name)
+
+
+# Expands the archives which have been downloaded so far into the download directory. Files which already exist are only
+# replaced when overwriting, otherwise they are skipped. The downloaded archives are removed once they are expanded
+def _unpack_downloaded_archives(downloaded_archives, directory, file_filter_collection, overwrite, output, transfer_journal):
+    def should_extract(member_name, member_path):
+        if file_filter_collection and file_filter_collection.get_action(member_path) == BaseFileFilterCollection.EXCLUDE:
+            return False
+        if not overwrite and os.path.exists(member_path):
+            output.add_skipped(member_name)
+            return False
+        return True
+
+    while True:
+        try:
+            archive_name, archive_path = downloaded_archives.get_nowait()
+        except queue.Empty:
+            return
+
+        try:
+            output.add_unpacked(archive_name, object_packing.extract_archive(archive_path, directory, should_extract))
+            if transfer_journal:
+                transfer_journal.record_completed(archive_name)
+        except Exception as e:
+            output.add_failure(archive_name, callback_exception=e)
+        finally:
+            _remove_file_if_exists(archive_path)
+
+
+def _add_downloaded_archive(**kwargs):
+    kwargs['downloaded_archives'].put((kwargs['archive_name'], kwargs['archive_path']))
+
+
+def _remove_file_if_exists(file_path, **kwargs):
+    if os.path.exists(file_path):
+        os.remove(file_path)
+
+
 def _get_file_filter_collection(base_directory, include, exclude, object_prefix):
     file_filter_collection = None
     if include:
@@ -1779,6 +2474,100 @@ def _get_file_filter_collection(base_directory, include, exclude, object_prefix)
     return file_filter_collection
 
 
+# Returns the local path of a file from its path relative to the directory being synced (which uses / as the separator, as
+# object names do)
+def _get_sync_file_path(directory, relative_path):
+    return os.path.join(directory, *relative_path.split('/'))
+
+
+# Walks the directory being synced, returning the stat results of the regular files in it keyed by their relative paths
+def _list_files_for_sync(directory):
+    files = {}
+    if not os.path.isdir(directory):
+        return files
+
+    for dir_name, subdir_list, file_list in os.walk(directory):
+        for file_name in file_list:
+            full_file_path = os.path.join(dir_name, file_name)
+            try:
+                stat_result = os.stat(full_file_path)
+            except OSError:
+                # The file was removed while walking the directory, or is a broken link
+                continue
+
+            if stat.S_ISREG(stat_result.st_mode):
+                files[normalize_object_name_path_for_object_storage(os.path.relpath(full_file_path, directory))] = stat_result
+
+    return files
+
+
+# Lists the objects with the prefix being synced, returning their summaries keyed by their names without the prefix. Objects
+# whose names end in / (which are often used as placeholders for directories) have no file to sync with, so they are left out
+def _list_objects_for_sync(client, request_id, namespace, bucket_name, prefix):
+    objects = {}
+    object_lister = _build_object_lister(client, request_id, namespace, bucket_name, prefix=prefix or None, fields='name,size,md5,timeCreated', page_size=OBJECT_LIST_PAGE_SIZE_BULK_OPERATIONS)
+    for response in object_lister.responses():
+        for obj in response.data.objects:
+            relative_path = obj.name[len(prefix):]
+            if relative_path and not relative_path.endswith('/'):
+                objects[relative_path] = obj
+
+    return objects
+
+
+# Returns whether a file has the same content as its object, without reading the file if it has not changed since it was
+# last found to be in sync
+def _is_in_sync(index, relative_path, file_path, stat_result, object_summary, uploading):
+    if stat_result.st_size != object_summary.size:
+        return False
+
+    entry = index.get(relative_path, stat_result)
+    if entry and entry['object_md5'] and entry['object_md5'] == object_summary.md5:
+        return True
+
+    md5 = entry['md5'] if entry else None
+    if object_summary.md5 and not _is_multipart_md5(object_summary.md5):
+        if not md5:
+            md5 = cli_util.get_file_md5(file_path)
+        in_sync = (md5 == object_summary.md5)
+    else:
+        # The MD5 of an object uploaded in multiple parts is built from the MD5s of its parts, so it can't be compared with the
+        # MD5 of the file. Instead, the object is in sync if it was created after the file was modified (or before, for downloads)
+        time_created = arrow.get(object_summary.time_created).float_timestamp
+        in_sync = (stat_result.st_mtime <= time_created) if uploading else (stat_result.st_mtime >= time_created)
+
+    if in_sync:
+        index.put(relative_path, stat_result, md5=md5, object_md5=object_summary.md5)
+
+    return in_sync
+
+
+def _is_multipart_md5(md5):
+    return '-' in md5
+
+
+def _record_synced_upload(**kwargs):
+    response = kwargs['work_pool_task_result'][0]
+    content_md5 = response.headers.get('opc-content-md5')
+    try:
+        stat_result = os.stat(kwargs['file_path'])
+    except OSError:
+        return
+
+    kwargs['index'].put(kwargs['relative_path'], stat_result, md5=content_md5, object_md5=content_md5 or response.headers.get('opc-multipart-md5'))
+
+
+def _record_synced_download(**kwargs):
+    object_summary = kwargs['object_summary']
+    try:
+        stat_result = os.stat(kwargs['file_path'])
+    except OSError:
+        return
+
+    md5 = object_summary.md5 if object_summary.md5 and not _is_multipart_md5(object_summary.md5) else None
+    kwargs['index'].put(kwargs['relative_path'], stat_result, md5=md5, object_md5=object_summary.md5)
+
+
 class FileReadCallbackStream:
     def __init__(self, file, progress_callback):
         self.progress_callback = progress_callback
@@ -1865,3 +2654,73 @@ class ProgressBar:
 
     def render_finish(self):
         self._progressbar.render_finish()
+
+
+# Tracks the copies made by bulk-copy. At most max_in_progress copies are in progress at once: start_copy waits for one of
+# them to finish before another can start. A copy finishes when its work request does, or when the request to start it
+# fails. The progress bar shows how many of the copies started so far have finished, and how far the copies in progress
+# have got by the percent_complete of their work requests. With --debug, each copy is printed instead.
+class BulkCopyProgress:
+    def __init__(self, output, max_in_progress, debug):
+        self._output = output
+        self._window = threading.BoundedSemaphore(max_in_progress)
+        self._debug = debug
+        self._lock = threading.Lock()
+        self._started = 0
+        self._finished = 0
+        self._failed = 0
+        self._percent_complete = {}
+        self._progress_bar = None if debug else ProgressBar(1, 'Copying objects')
+
+    def start_copy(self, object_name):
+        self._window.acquire()
+        with self._lock:
+            self._started += 1
+            if self._debug:
+                click.echo('Copying {}'.format(object_name), file=sys.stderr)
+            self._render()
+
+    def track_copy(self, work_request_poller, object_name, destination_object_name, **kwargs):
+        work_request_id = kwargs['work_pool_task_result']
+        with self._lock:
+            self._percent_complete[work_request_id] = 0
+        work_request_poller.track(work_request_id, functools.partial(self.finish_copy, object_name, destination_object_name))
+
+    def update_work_request(self, work_request):
+        with self._lock:
+            self._percent_complete[work_request.id] = work_request.percent_complete or 0
+            self._render()
+
+    def finish_copy(self, object_name, destination_object_name, work_request_id, failure=None, **kwargs):
+        if 'callback_exception' in kwargs:
+            failure = str(kwargs['callback_exception'])
+
+        try:
+            with self._lock:
+                self._percent_complete.pop(work_request_id, None)
+                self._finished += 1
+                if failure is None:
+                    self._output.add_copied(object_name, destination_object_name, work_request_id)
+                else:
+                    self._failed += 1
+                    self._output.add_failure(object_name, callback_exception=failure)
+
+                if self._debug:
+                    click.echo('Copied {}'.format(object_name) if failure is None else 'Failed to copy {}: {}'.format(object_name, failure), file=sys.stderr)
+                self._render()
+        finally:
+            # Whatever happens, make room in the window for the next copy so that start_copy can't wait forever
+            self._window.release()
+
+    def render_finish(self):
+        if self._progress_bar:
+            self._progress_bar.render_finish()
+
+    def _render(self):
+        if self._progress_bar:
+            label = 'Copied {} of {} objects'.format(self._finished - self._failed, self._started)
+            if self._failed:
+                label = '{} ({} failed)'.format(label, self._failed)
+
+            self._progress_bar.reset_progress(100 * self._started, label)
+            self._progress_bar.update(100 * self._finished + sum(self._percent_complete.values()))
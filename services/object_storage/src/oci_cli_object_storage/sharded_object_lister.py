@@ -0,0 +1,206 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import os
+import sys
+import threading
+
+import six
+from six.moves import queue
+
+# The number of list requests which are made at once
+DEFAULT_PARALLEL_LIST_COUNT = 8
+
+# When a shard has more than one page of objects, the rest of it is split into at most this many more shards
+MAX_SPLIT_POINTS = 32
+
+# The number of levels of the / hierarchy which are listed to look for the prefixes to split a shard at
+MAX_PREFIX_DISCOVERY_LEVELS = 4
+MAX_HIERARCHY_SPLIT_POINTS = 8
+
+# How long a lister thread waits for room in the queue of pages before checking whether it should stop
+QUEUE_PUT_TIMEOUT_SECONDS = 1
+
+_DONE = object()
+
+
+class ShardedObjectLister(object):
+    """Lists the objects in a range of a bucket by listing shards of the range in parallel.
+
+    The first page of the range is listed in the calling thread. If there are more objects, the rest of the range is split
+    into shards, each bounded by start and end, and threads list the shards concurrently. The shards are split at the
+    prefixes in the rest of the range, which are found by listing it with a / delimiter (e.g. photos/2018/, photos/2019/).
+    If the names have no / hierarchy, the split points come from the names in the page just listed instead. A shard which
+    turns out to have more than one page is split again in the same way, so the listing spreads out over the parts of the
+    bucket which have the most objects.
+
+    The responses are yielded by responses() as they arrive, and at most max_queued_pages of them are held waiting for the
+    caller, so a caller which takes each page to transfer its objects slows the listing down to its own pace. Pages from
+    different shards arrive in no particular order.
+
+    list_page is called with the keyword arguments prefix, start, end, limit, delimiter and fields and must return the
+    list_objects response, retrying as needed.
+    """
+
+    def __init__(self, list_page, prefix=None, start=None, end=None, delimiter=None, fields=None, page_size=1000, parallel_count=DEFAULT_PARALLEL_LIST_COUNT, max_queued_pages=None):
+        self._list_page = list_page
+        self._prefix = prefix
+        self._start = start
+        self._end = end
+        self._delimiter = delimiter
+        self._fields = fields
+        self._page_size = page_size
+        self._parallel_count = parallel_count
+
+        self._responses = queue.Queue(maxsize=max_queued_pages or 2 * parallel_count)
+        self._shards = queue.Queue()
+        self._pending_shards = 0
+        self._lock = threading.Lock()
+        self._stopped = False
+
+    def responses(self):
+        """Yields the list responses. The first is for the first page of the range, so its next_start_with tells whether
+        there is more than one page of objects."""
+        response = self._list(self._start, self._end)
+        yield response
+
+        if not response.data.next_start_with:
+            return
+
+        self._add_shards(self._split(response, self._end))
+        for _ in range(self._parallel_count):
+            thread = threading.Thread(target=self._work)
+            thread.daemon = True
+            thread.start()
+
+        try:
+            while True:
+                item = self._responses.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, tuple):
+                    six.reraise(*item)
+                yield item
+        finally:
+            self._stop()
+
+    def _list(self, start, end):
+        return self._list_page(prefix=self._prefix, start=start, end=end, limit=self._page_size, delimiter=self._delimiter, fields=self._fields)
+
+    def _work(self):
+        while True:
+            shard = self._shards.get()
+            if shard is None:
+                return
+
+            try:
+                response = self._list(*shard)
+            except Exception:
+                # The caller stops the listing when it gets the error
+                self._put(sys.exc_info())
+                return
+
+            if not self._put(response):
+                return
+
+            if response.data.next_start_with:
+                self._add_shards(self._split(response, shard[1]))
+            self._finish_shard()
+
+    def _put(self, item):
+        while not self._stopped:
+            try:
+                self._responses.put(item, timeout=QUEUE_PUT_TIMEOUT_SECONDS)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _add_shards(self, shards):
+        with self._lock:
+            self._pending_shards += len(shards)
+        for shard in shards:
+            self._shards.put(shard)
+
+    def _finish_shard(self):
+        with self._lock:
+            self._pending_shards -= 1
+            done = self._pending_shards == 0
+        if done:
+            self._put(_DONE)
+            self._stop()
+
+    def _stop(self):
+        self._stopped = True
+        for _ in range(self._parallel_count):
+            self._shards.put(None)
+
+    def _split(self, response, end):
+        next_start = response.data.next_start_with
+
+        # Prefixes within the listing's own delimiter would hold no objects which are listed
+        points = self._get_prefix_split_points(next_start, end) if self._delimiter is None else []
+        if not points:
+            names = [obj.name for obj in response.data.objects] + [next_start]
+            points = get_split_points(names, end, self._prefix)
+
+        bounds = [next_start] + points + [end]
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    def _get_prefix_split_points(self, next_start, end):
+        # Start from the deepest level of the hierarchy which the whole range is in, and go down a level while the
+        # rest of the range is all in one prefix
+        shared = os.path.commonprefix([next_start, end]) if end is not None else ''
+        level = shared[:shared.rfind('/') + 1]
+        if len(level) < len(self._prefix or ''):
+            level = self._prefix
+
+        for _ in range(MAX_PREFIX_DISCOVERY_LEVELS):
+            response = self._list_page(prefix=level or None, start=next_start, end=end, limit=self._page_size, delimiter='/', fields='name')
+            prefixes = response.data.prefixes or []
+            points = [prefix for prefix in prefixes if prefix > next_start]
+            if points:
+                return _get_evenly_spaced(points, MAX_SPLIT_POINTS)
+
+            if len(prefixes) != 1 or not next_start.startswith(prefixes[0]):
+                break
+            level = prefixes[0]
+
+        return []
+
+
+def get_split_points(names, end, prefix=None):
+    """Returns the sorted points at which to split the rest of a range, from the last of the names up to end, after a page
+    of objects with the other names."""
+    next_start = names[-1]
+    shared_length = len(os.path.commonprefix([names[0], next_start]))
+    prefix_length = len(prefix or '')
+
+    def in_range(point):
+        return point > next_start and (end is None or point < end)
+
+    # After each shorter prefix of the next name, deepest first
+    hierarchy_points = []
+    for depth in range(shared_length - 1, prefix_length - 1, -1):
+        point = next_start[:depth] + _get_next_character(next_start[depth])
+        if in_range(point):
+            hierarchy_points.append(point)
+    hierarchy_points = hierarchy_points[:MAX_HIERARCHY_SPLIT_POINTS]
+
+    # Within the prefix which the page's names share, spread out over the characters in the names
+    shared_prefix = next_start[:shared_length]
+    characters = sorted(set(c for name in names for c in name[shared_length:]))
+    character_points = [shared_prefix + c for c in characters if in_range(shared_prefix + c)]
+    character_points = _get_evenly_spaced(character_points, MAX_SPLIT_POINTS - len(hierarchy_points))
+
+    return sorted(set(hierarchy_points + character_points))
+
+
+def _get_evenly_spaced(items, count):
+    if len(items) <= count:
+        return items
+    return [items[i * len(items) // count] for i in range(count)]
+
+
+def _get_next_character(character):
+    return six.unichr(min(ord(character) + 1, sys.maxunicode))
@@ -0,0 +1,101 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from oci_cli.file_utils import replace_file
+
+DEFAULT_INDEX_DIRECTORY = '~/.oci/object-sync-index'
+
+# Increment this if the format of the entries changes, so indexes written by older versions are ignored
+INDEX_VERSION = 1
+
+
+class SyncIndex(object):
+    """A record of the local files which were in sync with their objects after the last `oci os object sync` between
+    a local directory and a bucket prefix.
+
+    Each entry is keyed by the path of the file relative to the directory and holds the size and modification time
+    of the file, the MD5 hash of its content (if it is known) and the MD5 reported by Object Storage for the object
+    (which for multipart objects is built from the hashes of the parts). While a file keeps its size and modification
+    time its content is assumed to be unchanged, so the file does not need to be read again to compare it with the
+    object.
+
+    Only the entries which are looked up or updated are written back by save(), so files which no longer exist drop
+    out of the index. Problems reading the index are not fatal, the files are just compared by content.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._previous = self._read()
+        self._current = {}
+
+    @classmethod
+    def for_location(cls, index_file, namespace, bucket_name, prefix, local_directory):
+        """Returns the index at index_file, or if that is not given the one kept for the directory and bucket prefix
+        under the default index directory."""
+        if index_file:
+            return cls(os.path.abspath(os.path.expanduser(index_file)))
+
+        key = json.dumps([namespace, bucket_name, prefix or '', os.path.abspath(local_directory)])
+        name = hashlib.sha256(key.encode('utf-8')).hexdigest()[:32] + '.json'
+        return cls(os.path.join(os.path.expanduser(DEFAULT_INDEX_DIRECTORY), name))
+
+    def get(self, relative_path, stat_result):
+        """Returns the entry for the file if its size and modification time are the ones recorded, otherwise None."""
+        with self._lock:
+            entry = self._current.get(relative_path) or self._previous.get(relative_path)
+            if not entry or entry['size'] != stat_result.st_size or entry['mtime'] != stat_result.st_mtime:
+                return None
+
+            self._current[relative_path] = entry
+            return entry
+
+    def put(self, relative_path, stat_result, md5=None, object_md5=None):
+        with self._lock:
+            self._current[relative_path] = {
+                'size': stat_result.st_size,
+                'mtime': stat_result.st_mtime,
+                'md5': md5,
+                'object_md5': object_md5
+            }
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory, 0o700)
+            except OSError:
+                # Another process may have created it first
+                if not os.path.isdir(directory):
+                    raise
+
+        with self._lock:
+            data = json.dumps({'version': INDEX_VERSION, 'entries': self._current}, separators=(',', ':'))
+
+        # Write to a temporary file and rename it over the index, so an interrupted sync leaves the previous index
+        fd, temp_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(data)
+            replace_file(temp_path, self.path)
+        except Exception:
+            os.remove(temp_path)
+            raise
+
+    def _read(self):
+        try:
+            with open(self.path, 'r') as f:
+                index = json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+
+        if not isinstance(index, dict) or index.get('version') != INDEX_VERSION:
+            return {}
+
+        return index.get('entries', {})
@@ -0,0 +1,151 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import heapq
+import itertools
+import threading
+import time
+
+from oci_cli import retry_utils
+
+# A work request is polled after this many seconds, then twice as long after each poll which finds it still running
+DEFAULT_INITIAL_POLL_INTERVAL_SECONDS = 1
+DEFAULT_MAX_POLL_INTERVAL_SECONDS = 30
+
+# A work request is reported as failed once this many polls in a row have failed with retryable errors
+DEFAULT_MAX_FAILED_POLLS = 10
+
+COMPLETED_STATUS = 'COMPLETED'
+FAILED_STATUSES = ('FAILED', 'CANCELED')
+
+
+class WorkRequestPoller(object):
+    """Waits for many work requests at once from a single thread.
+
+    Each tracked work request is polled with get_work_request on its own schedule: first after initial_interval seconds,
+    then with the interval doubling up to max_interval each time it is found to be still running, so long running work
+    requests are polled less and less often. The thread sleeps until the next work request is due. A poll which fails
+    with a timeout, connection error, throttle or server error is tried again on the same backoff, until max_failed_polls
+    polls in a row have failed. Any other error is reported as the failure of the work request.
+
+    on_finished is called from the poller's thread with the ID of the work request and None if it completed, or a
+    message describing why it failed. The messages of failed work requests come from list_work_request_errors.
+    on_poll, if given, is called with each work request which is still running, e.g. to report its percent_complete.
+    Exceptions raised by either callback are ignored, so that they cannot stop the other work requests being polled.
+    """
+
+    def __init__(self, get_work_request, list_work_request_errors, initial_interval=DEFAULT_INITIAL_POLL_INTERVAL_SECONDS, max_interval=DEFAULT_MAX_POLL_INTERVAL_SECONDS, on_poll=None, max_failed_polls=DEFAULT_MAX_FAILED_POLLS):
+        self._get_work_request = get_work_request
+        self._list_work_request_errors = list_work_request_errors
+        self._initial_interval = initial_interval
+        self._max_interval = max_interval
+        self._on_poll = on_poll
+        self._max_failed_polls = max_failed_polls
+
+        # Entries are (time of the next poll, sequence number, work request ID, interval, number of polls in a row which
+        # have failed, on_finished). The sequence number orders work requests which are due at the same time without
+        # comparing the rest of the entries
+        self._due = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._closing = False
+        self._thread = None
+
+    def track(self, work_request_id, on_finished):
+        with self._condition:
+            if self._closing:
+                raise RuntimeError('Cannot track a work request once the poller is waiting for completion')
+
+            self._schedule(work_request_id, self._initial_interval, 0, on_finished)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run)
+                self._thread.daemon = True
+                self._thread.start()
+
+    def wait_for_completion(self):
+        """Waits until every tracked work request has finished. No more work requests can be tracked after this is called."""
+        with self._condition:
+            self._closing = True
+            self._condition.notify()
+            thread = self._thread
+
+        if thread is not None:
+            # Joining with a timeout keeps the main thread responsive to KeyboardInterrupt
+            while thread.is_alive():
+                thread.join(1)
+
+    def _schedule(self, work_request_id, interval, failed_polls, on_finished):
+        heapq.heappush(self._due, (time.time() + interval, next(self._sequence), work_request_id, interval, failed_polls, on_finished))
+        self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if not self._due:
+                        if self._closing:
+                            return
+                        self._condition.wait()
+                        continue
+
+                    delay = self._due[0][0] - time.time()
+                    if delay <= 0:
+                        break
+                    self._condition.wait(delay)
+
+                due = []
+                while self._due and self._due[0][0] <= time.time():
+                    due.append(heapq.heappop(self._due))
+
+            for due_time, sequence, work_request_id, interval, failed_polls, on_finished in due:
+                next_interval = min(interval * 2, self._max_interval)
+                try:
+                    failure = self._poll(work_request_id)
+                    failed_polls = 0
+                except Exception as e:
+                    failed_polls += 1
+                    failure = False
+                    if failed_polls >= self._max_failed_polls:
+                        failure = 'Work request {} could not be polled after {} attempts: {}'.format(work_request_id, failed_polls, e)
+
+                if failure is False:
+                    with self._condition:
+                        self._schedule(work_request_id, next_interval, failed_polls, on_finished)
+                else:
+                    try:
+                        on_finished(work_request_id, failure)
+                    except Exception:
+                        pass
+
+    # Returns False if the work request is still running, None if it completed, or the reason it failed. Raises the
+    # error if the work request could not be polled this time but may be next time
+    def _poll(self, work_request_id):
+        try:
+            work_request = self._get_work_request(work_request_id).data
+        except Exception as e:
+            if retry_utils.retry_on_timeouts_connection_internal_server_and_throttles(e):
+                raise
+            return str(e)
+
+        if work_request.status == COMPLETED_STATUS:
+            return None
+        if work_request.status in FAILED_STATUSES:
+            return self._get_failure_message(work_request)
+
+        if self._on_poll:
+            try:
+                self._on_poll(work_request)
+            except Exception:
+                pass
+        return False
+
+    def _get_failure_message(self, work_request):
+        message = 'Work request {} {}'.format(work_request.id, work_request.status.lower())
+        try:
+            errors = self._list_work_request_errors(work_request.id).data
+        except Exception:
+            return message
+
+        if errors:
+            message = '{}: {}'.format(message, '; '.join('{} ({})'.format(error.message, error.code) for error in errors))
+        return message
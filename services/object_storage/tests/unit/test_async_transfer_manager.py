@@ -0,0 +1,327 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import base64
+import hashlib
+import importlib
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+import mock
+import oci
+import six
+from six.moves import BaseHTTPServer, socketserver
+from six.moves.urllib.parse import parse_qs, unquote, urlsplit
+
+from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager import get_object_tasks
+from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager import TransferManagerConfig, WorkPoolTaskCallbacksContainer, WorkPoolTaskErrorCallback, WorkPoolTaskSuccessCallback
+
+NAMESPACE = 'ns'
+BUCKET = 'bucket'
+MEBIBYTE = 1024 * 1024
+
+
+def _md5(data):
+    return base64.b64encode(hashlib.md5(data).digest()).decode('utf-8')
+
+
+# Serves the Object Storage operations used by the transfer manager from memory, over keep-alive connections
+class StubObjectStorageHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _respond(self, status, body=b'', headers=None):
+        self.send_response(status)
+        for name, value in six.iteritems(headers or {}):
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _route(self):
+        self.server.requests.append((self.command, self.path, self.headers.get('authorization')))
+        url = urlsplit(self.path)
+        match = re.match(r'^/n/([^/]+)/b/([^/]+)/(o|u)(?:/(.*))?$', url.path)
+        name = unquote(match.group(4)) if match.group(4) else None
+        return match.group(3), name, {key: values[0] for key, values in parse_qs(url.query).items()}
+
+    def _read_body(self):
+        return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+    def _send_not_found(self):
+        self._respond(404, json.dumps({'code': 'ObjectNotFound', 'message': 'Not found'}).encode('utf-8'), {'Content-Type': 'application/json'})
+
+    def do_HEAD(self):
+        kind, name, query = self._route()
+        if name not in self.server.objects:
+            self._respond(404)
+            return
+        data = self.server.objects[name]
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('etag', 'etag-' + name)
+        self.end_headers()
+
+    def do_GET(self):
+        kind, name, query = self._route()
+        if kind == 'o' and name is None:
+            self._list_objects(query)
+            return
+
+        if name not in self.server.objects:
+            self._send_not_found()
+            return
+
+        data = self.server.objects[name]
+        object_range = self.headers.get('range')
+        if object_range:
+            start, end = [int(value) for value in object_range[len('bytes='):].split('-')]
+            self._respond(206, data[start:end + 1])
+        else:
+            self._respond(200, data)
+
+    def _list_objects(self, query):
+        names = sorted(
+            name for name in self.server.objects
+            if name.startswith(query.get('prefix', '')) and name >= query.get('start', '') and ('end' not in query or name < query['end'])
+        )
+        limit = int(query.get('limit', 1000))
+        delimiter = query.get('delimiter')
+        objects = []
+        prefixes = []
+        next_start_with = None
+        for name in names:
+            if len(objects) + len(prefixes) == limit:
+                next_start_with = name
+                break
+
+            # Names with the delimiter after the prefix are returned as the prefix up to the delimiter
+            position = name.find(delimiter, len(query.get('prefix', ''))) if delimiter else -1
+            if position != -1:
+                if name[:position + 1] not in prefixes:
+                    prefixes.append(name[:position + 1])
+                continue
+
+            data = self.server.objects[name]
+            md5 = self.server.md5s.get(name, _md5(data))
+            objects.append({'name': name, 'size': len(data), 'md5': md5, 'timeCreated': self.server.times_created.get(name, '2019-01-01T00:00:00.000Z')})
+
+        body = {'objects': objects, 'prefixes': prefixes}
+        if next_start_with:
+            body['nextStartWith'] = next_start_with
+        self._respond(200, json.dumps(body).encode('utf-8'), {'Content-Type': 'application/json'})
+
+    def do_PUT(self):
+        kind, name, query = self._route()
+        data = self._read_body()
+        if kind == 'o':
+            self.server.objects[name] = data
+            self.server.md5s.pop(name, None)
+            self.server.metadata[name] = {key: value for key, value in self.headers.items() if key.lower().startswith('opc-meta-')}
+        elif query['uploadId'] not in self.server.parts:
+            self._send_not_found()
+            return
+        else:
+            self.server.parts[query['uploadId']][int(query['uploadPartNum'])] = data
+        self._respond(200, headers={'etag': _md5(data), 'opc-content-md5': _md5(data)})
+
+    def do_POST(self):
+        kind, name, query = self._route()
+        details = json.loads(self._read_body().decode('utf-8'))
+        if name is None:
+            upload_id = 'upload-{}'.format(len(self.server.parts))
+            self.server.parts[upload_id] = {}
+            body = {'namespace': NAMESPACE, 'bucket': BUCKET, 'object': details['object'], 'uploadId': upload_id, 'timeCreated': '2019-01-01T00:00:00.000Z'}
+            self._respond(200, json.dumps(body).encode('utf-8'), {'Content-Type': 'application/json'})
+        elif query['uploadId'] not in self.server.parts:
+            self._send_not_found()
+        else:
+            parts = self.server.parts.pop(query['uploadId'])
+            self.server.objects[name] = b''.join(parts[part['partNum']] for part in details['partsToCommit'])
+            self.server.md5s[name] = 'multipart-md5-{}'.format(len(parts))
+            self._respond(200, headers={'etag': 'committed', 'opc-multipart-md5': self.server.md5s[name]})
+
+    def do_DELETE(self):
+        kind, name, query = self._route()
+        with self.server.lock:
+            throttled = self.server.throttled_deletes > 0
+            self.server.throttled_deletes -= throttled
+        if throttled:
+            self._respond(429, json.dumps({'code': 'TooManyRequests', 'message': 'Too many requests'}).encode('utf-8'), {'Content-Type': 'application/json'})
+            return
+
+        if kind == 'u':
+            self.server.parts.pop(query['uploadId'], None)
+            self._respond(204)
+            return
+
+        self.server.md5s.pop(name, None)
+        if self.server.objects.pop(name, None) is None:
+            self._send_not_found()
+        else:
+            self._respond(204)
+
+
+class StubObjectStorageServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        BaseHTTPServer.HTTPServer.__init__(self, ('127.0.0.1', 0), StubObjectStorageHandler)
+        self.objects = {}
+        self.metadata = {}
+        self.md5s = {}
+        self.times_created = {}
+        self.parts = {}
+        self.requests = []
+        self.throttled_deletes = 0
+        self.lock = threading.Lock()
+
+
+# A security token signer needs no keys in the client's config
+class StubSigner(oci.auth.signers.SecurityTokenSigner):
+    def __init__(self):
+        pass
+
+    @property
+    def without_content_headers(self):
+        return self
+
+    def __call__(self, request):
+        request.headers['authorization'] = 'signed'
+        return request
+
+
+@unittest.skipIf(sys.version_info < (3, 5), 'The asyncio transfer engine requires Python 3.5 or later')
+class TestAsyncTransferManager(unittest.TestCase):
+    def setUp(self):
+        self.async_transfer_manager = importlib.import_module('services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager.async_transfer_manager')
+
+        self.server = StubObjectStorageServer()
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.daemon = True
+        self.server_thread.start()
+
+        endpoint = 'http://127.0.0.1:{}'.format(self.server.server_address[1])
+        self.client = oci.object_storage.ObjectStorageClient({}, signer=StubSigner(), service_endpoint=endpoint)
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.temp_dir)
+
+    def _transfer_manager(self, **config):
+        return self.async_transfer_manager.AsyncTransferManager(self.client, TransferManagerConfig(**config))
+
+    def _write_file(self, name, data):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_upload_object(self):
+        small = os.urandom(1000)
+        large = os.urandom(3 * MEBIBYTE + 5)
+        small_path = self._write_file('small', small)
+        large_path = self._write_file('large', large)
+
+        results = {}
+
+        def add_result(**kwargs):
+            results[kwargs['name']] = kwargs['work_pool_task_result']
+
+        transfer_manager = self._transfer_manager(multipart_part_size=MEBIBYTE, max_object_storage_multipart_requests=2)
+        for name, path, data in [('dir/small', small_path, small), ('large', large_path, large)]:
+            callbacks_container = WorkPoolTaskCallbacksContainer(success_callbacks=[WorkPoolTaskSuccessCallback(add_result, name=name)])
+            transfer_manager.upload_object(callbacks_container, NAMESPACE, BUCKET, name, path, len(data), True, metadata={'key': 'value'})
+        transfer_manager.wait_for_completion()
+
+        self.assertEqual(small, self.server.objects['dir/small'])
+        self.assertEqual(large, self.server.objects['large'])
+        self.assertEqual({'opc-meta-key': 'value'}, self.server.metadata['dir/small'])
+        self.assertEqual(_md5(small), results['dir/small'][0].headers['opc-content-md5'])
+        self.assertEqual('committed', results['large'][0].headers['etag'])
+
+        # The parts were uploaded separately, and every request was signed
+        part_puts = [path for method, path, authorization in self.server.requests if method == 'PUT' and '/u/' in path]
+        self.assertEqual(4, len(part_puts))
+        self.assertTrue(all(authorization == 'signed' for method, path, authorization in self.server.requests))
+
+    def test_get_object(self):
+        data = os.urandom(5 * MEBIBYTE + 17)
+        self.server.objects['single'] = data
+        self.server.objects['multipart'] = data
+        self.server.objects['empty'] = b''
+
+        transfer_manager = self._transfer_manager(max_object_storage_multipart_requests=3)
+        futures = [
+            transfer_manager.get_object(WorkPoolTaskCallbacksContainer(), namespace=NAMESPACE, bucket_name=BUCKET, object_name='single', full_file_path=os.path.join(self.temp_dir, 'single')),
+            transfer_manager.get_object(WorkPoolTaskCallbacksContainer(), namespace=NAMESPACE, bucket_name=BUCKET, object_name='empty', full_file_path=os.path.join(self.temp_dir, 'empty')),
+            transfer_manager.get_object_multipart(
+                WorkPoolTaskCallbacksContainer(), os.path.join(self.temp_dir, 'multipart'),
+                namespace=NAMESPACE, bucket_name=BUCKET, object_name='multipart', multipart_download_threshold=MEBIBYTE, part_size=MEBIBYTE
+            )
+        ]
+        transfer_manager.wait_for_completion()
+
+        self.assertTrue(all(future.successful() for future in futures))
+        for name, expected in [('single', data), ('empty', b''), ('multipart', data)]:
+            with open(os.path.join(self.temp_dir, name), 'rb') as f:
+                self.assertEqual(expected, f.read())
+
+        ranges = [path for method, path, authorization in self.server.requests if method == 'GET' and path.endswith('/multipart')]
+        self.assertEqual(6, len(ranges))
+
+    def test_get_object_multipart_to_stream(self):
+        data = os.urandom(3 * MEBIBYTE + 1)
+        self.server.objects['multipart'] = data
+        stream = six.BytesIO()
+
+        # Ranges which arrive early are spilled to temporary files beyond the memory limit
+        with mock.patch.object(get_object_tasks, 'PENDING_WRITES_MEMORY_LIMIT', MEBIBYTE):
+            transfer_manager = self._transfer_manager(max_object_storage_multipart_requests=4)
+            future = transfer_manager.get_object_multipart(
+                WorkPoolTaskCallbacksContainer(), stream,
+                namespace=NAMESPACE, bucket_name=BUCKET, object_name='multipart', multipart_download_threshold=MEBIBYTE, part_size=MEBIBYTE
+            )
+            transfer_manager.wait_for_completion()
+
+        future.result()
+        self.assertEqual(data, stream.getvalue())
+
+    def test_head_and_delete_object(self):
+        self.server.objects['exists'] = b'data'
+        errors = []
+
+        transfer_manager = self._transfer_manager()
+        existing = transfer_manager.head_object(WorkPoolTaskCallbacksContainer(), namespace_name=NAMESPACE, bucket_name=BUCKET, object_name='exists')
+        missing = transfer_manager.head_object(WorkPoolTaskCallbacksContainer(), namespace_name=NAMESPACE, bucket_name=BUCKET, object_name='missing')
+        self.assertEqual('etag-exists', existing.result().headers['etag'])
+        self.assertIsNone(missing.result())
+
+        transfer_manager.delete_object(WorkPoolTaskCallbacksContainer(), namespace=NAMESPACE, bucket_name=BUCKET, object_name='exists')
+        callbacks_container = WorkPoolTaskCallbacksContainer(error_callbacks=[WorkPoolTaskErrorCallback(lambda **kwargs: errors.append(kwargs['callback_exception']))])
+        failed = transfer_manager.delete_object(callbacks_container, namespace=NAMESPACE, bucket_name=BUCKET, object_name='missing')
+        transfer_manager.wait_for_completion()
+
+        self.assertNotIn('exists', self.server.objects)
+        self.assertFalse(failed.successful())
+        with self.assertRaises(oci.exceptions.ServiceError) as context:
+            failed.result()
+        self.assertEqual(404, context.exception.status)
+        # As with the threaded tasks, the error callbacks get the traceback of service errors
+        self.assertIn('ObjectNotFound', str(errors[0]))
+
+    def test_unsupported_reason(self):
+        self.assertIsNone(self.async_transfer_manager.get_unsupported_reason(self.client))
+        with mock.patch.dict(self.client.base_client.session.proxies, {'http': 'http://proxy:80'}):
+            self.assertIsNotNone(self.async_transfer_manager.get_unsupported_reason(self.client))
@@ -0,0 +1,223 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import functools
+import json
+import threading
+import time
+import unittest
+
+import mock
+import oci
+import oci_cli
+from click.testing import CliRunner
+
+from services.object_storage.src.oci_cli_object_storage import objectstorage_cli_extended
+from services.object_storage.src.oci_cli_object_storage.work_request_poller import WorkRequestPoller
+from services.object_storage.tests.unit.test_sharded_object_lister import FakeBucket
+
+NAMESPACE = 'ns'
+BUCKET = 'bucket'
+
+
+# Starts copies as work requests which complete (or, for objects named fail*, fail) after a number of polls, and counts
+# the copies in progress at once
+class FakeCopyClient(object):
+    def __init__(self, names, polls_to_finish=3):
+        self.bucket = FakeBucket(names)
+        self.polls_to_finish = polls_to_finish
+        self.copies = {}
+        self.polls = {}
+        self.in_progress = 0
+        self.max_in_progress = 0
+        self.lock = threading.Lock()
+
+        # The transfer manager mounts its connection pool on the client's session
+        self.base_client = mock.Mock(endpoint='https://objectstorage.us-phoenix-1.oraclecloud.com')
+
+    def get_namespace(self, **kwargs):
+        return oci.response.Response(200, {}, 'tenancy-namespace', None)
+
+    def list_objects(self, namespace_name, bucket_name, **kwargs):
+        return self.bucket.list_page(kwargs.get('prefix'), kwargs.get('start'), kwargs.get('end'), kwargs['limit'], kwargs.get('delimiter'), kwargs.get('fields'))
+
+    def copy_object(self, namespace_name, bucket_name, copy_object_details, **kwargs):
+        with self.lock:
+            work_request_id = 'wr-{}'.format(len(self.copies))
+            self.copies[work_request_id] = copy_object_details
+            self.polls[work_request_id] = 0
+            self.in_progress += 1
+            self.max_in_progress = max(self.max_in_progress, self.in_progress)
+        return oci.response.Response(200, {'opc-work-request-id': work_request_id}, None, None)
+
+    def get_work_request(self, work_request_id, **kwargs):
+        with self.lock:
+            self.polls[work_request_id] += 1
+            status = 'IN_PROGRESS'
+            if self.polls[work_request_id] == self.polls_to_finish:
+                self.in_progress -= 1
+                status = 'FAILED' if self.copies[work_request_id].source_object_name.startswith('fail') else 'COMPLETED'
+        work_request = oci.object_storage.models.WorkRequest(id=work_request_id, status=status, percent_complete=50.0)
+        return oci.response.Response(200, {}, work_request, None)
+
+    def list_work_request_errors(self, work_request_id, **kwargs):
+        errors = [oci.object_storage.models.WorkRequestError(code='ObjectNotFound', message='The source object was deleted')]
+        return oci.response.Response(200, {}, errors, None)
+
+
+class TestWorkRequestPoller(unittest.TestCase):
+    def test_polls_each_work_request_with_backoff_until_it_finishes(self):
+        client = FakeCopyClient(['a', 'fail', 'c'], polls_to_finish=4)
+        for name in ['a', 'fail', 'c']:
+            client.copy_object(NAMESPACE, BUCKET, oci.object_storage.models.CopyObjectDetails(source_object_name=name))
+
+        finished = {}
+        polled = []
+        poller = WorkRequestPoller(client.get_work_request, client.list_work_request_errors, initial_interval=0.01, max_interval=0.04, on_poll=polled.append)
+        start = time.time()
+        for work_request_id in sorted(client.copies):
+            poller.track(work_request_id, lambda work_request_id, failure: finished.__setitem__(work_request_id, failure))
+        poller.wait_for_completion()
+
+        # The intervals between polls double up to the maximum: 0.01 + 0.02 + 0.04 + 0.04
+        self.assertGreaterEqual(time.time() - start, 0.11)
+        self.assertEqual({'wr-0': 4, 'wr-1': 4, 'wr-2': 4}, client.polls)
+        self.assertEqual(9, len(polled))
+        self.assertIsNone(finished['wr-0'])
+        self.assertIsNone(finished['wr-2'])
+        self.assertEqual('Work request wr-1 failed: The source object was deleted (ObjectNotFound)', finished['wr-1'])
+
+    def test_retryable_poll_errors_are_retried(self):
+        client = FakeCopyClient(['a'], polls_to_finish=1)
+        client.copy_object(NAMESPACE, BUCKET, oci.object_storage.models.CopyObjectDetails(source_object_name='a'))
+        responses = [oci.exceptions.ServiceError(429, 'TooManyRequests', {}, 'Throttled'), oci.exceptions.ServiceError(404, 'NotFound', {}, 'Missing')]
+
+        def get_work_request(work_request_id):
+            if responses:
+                raise responses.pop(0)
+            return client.get_work_request(work_request_id)
+
+        finished = []
+        poller = WorkRequestPoller(get_work_request, client.list_work_request_errors, initial_interval=0.01)
+        poller.track('wr-0', lambda work_request_id, failure: finished.append(failure))
+        poller.wait_for_completion()
+
+        self.assertEqual(1, len(finished))
+        self.assertIn('Missing', finished[0])
+        self.assertEqual([], responses)
+        self.assertRaises(RuntimeError, poller.track, 'wr-1', None)
+
+    def test_work_request_fails_after_too_many_failed_polls(self):
+        polls = []
+
+        def get_work_request(work_request_id):
+            polls.append(work_request_id)
+            raise oci.exceptions.ServiceError(503, 'ServiceUnavailable', {}, 'Unavailable')
+
+        finished = []
+        poller = WorkRequestPoller(get_work_request, None, initial_interval=0.001, max_interval=0.001, max_failed_polls=3)
+        poller.track('wr-0', lambda work_request_id, failure: finished.append(failure))
+        poller.wait_for_completion()
+
+        self.assertEqual(3, len(polls))
+        self.assertEqual(1, len(finished))
+        self.assertIn('could not be polled after 3 attempts', finished[0])
+
+    def test_callback_errors_do_not_stop_polling(self):
+        client = FakeCopyClient(['a', 'b'], polls_to_finish=2)
+        for name in ['a', 'b']:
+            client.copy_object(NAMESPACE, BUCKET, oci.object_storage.models.CopyObjectDetails(source_object_name=name))
+
+        finished = []
+
+        def on_finished(work_request_id, failure):
+            finished.append(work_request_id)
+            raise ValueError('Callback failed')
+
+        def on_poll(work_request):
+            raise ValueError('Callback failed')
+
+        poller = WorkRequestPoller(client.get_work_request, client.list_work_request_errors, initial_interval=0.01, on_poll=on_poll)
+        for work_request_id in sorted(client.copies):
+            poller.track(work_request_id, on_finished)
+        poller.wait_for_completion()
+
+        self.assertEqual(['wr-0', 'wr-1'], sorted(finished))
+
+
+class TestBulkCopy(unittest.TestCase):
+    def run_bulk_copy(self, client, *args):
+        poller_class = functools.partial(WorkRequestPoller, initial_interval=0.01, max_interval=0.02)
+        with mock.patch.object(objectstorage_cli_extended, 'build_client', return_value=client):
+            with mock.patch.object(objectstorage_cli_extended, 'WorkRequestPoller', poller_class):
+                return CliRunner().invoke(oci_cli.cli, ['os', 'object', 'bulk-copy', '-ns', NAMESPACE, '-bn', BUCKET] + list(args))
+
+    def invoke(self, client, *args):
+        result = self.run_bulk_copy(client, *args)
+        return result.exit_code, json.loads(result.output[result.output.index('{'):])
+
+    def test_copies_matching_objects_within_the_window(self):
+        names = ['photos/{:03d}.jpg'.format(i) for i in range(40)] + ['photos/{:03d}.txt'.format(i) for i in range(5)] + ['other/a.jpg']
+        client = FakeCopyClient(names)
+
+        exit_code, output = self.invoke(
+            client, '--prefix', 'photos/', '--include', '*.jpg', '--destination-bucket', 'backup', '--destination-region', 'us-ashburn-1',
+            '--destination-prefix', 'copied/', '--parallel-operations-count', '4'
+        )
+
+        self.assertEqual(0, exit_code)
+        self.assertEqual({}, output['copy-failures'])
+        self.assertEqual(sorted(names[:40]), sorted(output['copied-objects']))
+        self.assertEqual('copied/photos/000.jpg', output['copied-objects']['photos/000.jpg']['destination-object-name'])
+        self.assertLessEqual(client.max_in_progress, 4)
+
+        details = list(client.copies.values())
+        self.assertEqual(40, len(details))
+        self.assertTrue(all(detail.destination_bucket == 'backup' for detail in details))
+        self.assertTrue(all(detail.destination_namespace == 'tenancy-namespace' for detail in details))
+        self.assertTrue(all(detail.destination_region == 'us-ashburn-1' for detail in details))
+
+    def test_failed_copies_are_reported(self):
+        client = FakeCopyClient(['a', 'fail-1', 'b'])
+        exit_code, output = self.invoke(client, '--destination-bucket', 'backup', '--destination-namespace', 'other', '--destination-region', 'us-phoenix-1')
+
+        self.assertEqual(1, exit_code)
+        self.assertEqual(['a', 'b'], sorted(output['copied-objects']))
+        self.assertEqual(['fail-1'], list(output['copy-failures']))
+        self.assertIn('The source object was deleted', output['copy-failures']['fail-1'])
+
+    def test_dry_run(self):
+        client = FakeCopyClient(['a', 'b'])
+        exit_code, output = self.invoke(client, '--destination-bucket', 'backup', '--destination-region', 'us-phoenix-1', '--dry-run')
+
+        self.assertEqual(0, exit_code)
+        self.assertEqual({'a': {'destination-object-name': 'a'}, 'b': {'destination-object-name': 'b'}}, output['copied-objects'])
+        self.assertEqual({}, client.copies)
+
+    def test_json_compact_output(self):
+        client = FakeCopyClient(['a', 'fail-1'])
+        exit_code, output = self.invoke(client, '--destination-bucket', 'backup', '--destination-region', 'us-phoenix-1', '--output', 'json-compact')
+
+        self.assertEqual(1, exit_code)
+        self.assertEqual(['a'], list(output['copied-objects']))
+        self.assertEqual(['fail-1'], list(output['copy-failures']))
+
+    def test_every_output_format(self):
+        output_formats = [param.type.choices for param in oci_cli.cli.params if param.name == 'output'][0]
+        self.assertIn('tsv', output_formats)
+        for output_format in output_formats:
+            result = self.run_bulk_copy(FakeCopyClient(['a', 'fail-1']), '--destination-bucket', 'backup', '--destination-region', 'us-phoenix-1', '--output', output_format)
+
+            # The exit code reports the failed copy rather than an error rendering the output
+            self.assertEqual(1, result.exit_code, output_format)
+            self.assertIsInstance(result.exception, SystemExit, output_format)
+            self.assertIn('fail-1', result.output, output_format)
+            if output_format == 'ndjson':
+                records = [json.loads(line) for line in result.output.splitlines() if line.startswith('{')]
+                self.assertEqual([('Copied', 'a'), ('Failed', 'fail-1')], sorted((record['action'], record['object']) for record in records))
+            elif output_format in ['csv', 'tsv']:
+                delimiter = ',' if output_format == 'csv' else '\t'
+                lines = result.output.splitlines()
+                header = [line for line in lines if line.startswith('action')][0].split(delimiter)
+                rows = [dict(zip(header, line.split(delimiter))) for line in lines[lines.index(delimiter.join(header)) + 1:] if delimiter in line]
+                self.assertEqual([('Copied', 'a'), ('Failed', 'fail-1')], sorted((row['action'], row['object']) for row in rows))
@@ -0,0 +1,185 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import importlib
+import sys
+import threading
+import time
+import unittest
+
+import mock
+import oci
+
+from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager import AimdConcurrencyLimiter, TransferManager, TransferManagerConfig, WorkPoolTaskCallbacksContainer
+from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager.concurrency_limiter import POOL_LIMIT_SHARE
+from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager.wrapped_semaphore import WrappedSemaphore
+from services.object_storage.tests.unit.test_async_transfer_manager import BUCKET, NAMESPACE, StubObjectStorageServer, StubSigner
+
+
+class TestAimdConcurrencyLimiter(unittest.TestCase):
+    def test_grows_by_one_per_window_of_successes(self):
+        limiter = AimdConcurrencyLimiter(4, max_limit=6)
+        changes = []
+        limiter.add_listener(lambda old_limit, new_limit: changes.append((old_limit, new_limit)))
+
+        for _ in range(5):
+            limiter.record_response(limiter.start_request(), 200)
+        self.assertEqual(5, limiter.limit)
+
+        for _ in range(100):
+            limiter.record_response(limiter.start_request(), 200)
+        self.assertEqual(6, limiter.limit)
+        self.assertEqual([(4, 5), (5, 6)], changes)
+
+    def test_halves_on_throttles_and_timeouts(self):
+        limiter = AimdConcurrencyLimiter(16)
+
+        limiter.record_response(limiter.start_request(), 429)
+        self.assertEqual(8, limiter.limit)
+
+        limiter.record_response(limiter.start_request(), 503)
+        self.assertEqual(4, limiter.limit)
+
+        limiter.record_error(limiter.start_request(), is_overload=True)
+        self.assertEqual(2, limiter.limit)
+
+        limiter.record_error(limiter.start_request(), is_overload=True)
+        limiter.record_error(limiter.start_request(), is_overload=True)
+        self.assertEqual(1, limiter.limit)
+
+    def test_requests_sent_before_a_decrease_do_not_decrease_again(self):
+        limiter = AimdConcurrencyLimiter(16)
+        started_at = limiter.start_request()
+        time.sleep(0.01)
+
+        limiter.record_response(limiter.start_request(), 429)
+        limiter.record_response(started_at, 429)
+        self.assertEqual(8, limiter.limit)
+
+    def test_other_errors_do_not_change_the_limit(self):
+        limiter = AimdConcurrencyLimiter(1)
+        for _ in range(10):
+            limiter.record_response(limiter.start_request(), 500)
+            limiter.record_error(limiter.start_request(), is_overload=False)
+        self.assertEqual(1, limiter.limit)
+
+    def test_does_not_grow_while_latency_climbs(self):
+        limiter = AimdConcurrencyLimiter(2)
+        with mock.patch('time.time', return_value=100.0):
+            for _ in range(3):
+                limiter.record_response(99.9, 200)
+            self.assertEqual(3, limiter.limit)
+
+            for _ in range(20):
+                limiter.record_response(90.0, 200)
+            self.assertEqual(3, limiter.limit)
+
+    def test_maximum_is_at_least_the_initial_limit(self):
+        self.assertEqual(500, AimdConcurrencyLimiter(500).max_limit)
+
+
+class TestAdaptiveWrappedSemaphore(unittest.TestCase):
+    def test_follows_the_limit(self):
+        limiter = AimdConcurrencyLimiter(2)
+        semaphore = WrappedSemaphore(2, concurrency_limiter=limiter)
+
+        self.assertTrue(semaphore.acquire(blocking=False))
+        self.assertTrue(semaphore.acquire(blocking=False))
+        self.assertFalse(semaphore.acquire(blocking=False))
+
+        # A blocked acquire is let through when the limit grows
+        acquired = threading.Event()
+        thread = threading.Thread(target=lambda: semaphore.acquire() and acquired.set())
+        thread.start()
+        self.assertFalse(acquired.wait(0.1))
+        for _ in range(3):
+            limiter.record_response(limiter.start_request(), 200)
+        self.assertEqual(3, limiter.limit)
+        self.assertTrue(acquired.wait(5))
+        thread.join()
+
+        # After the limit shrinks, holders must release until they are under it
+        limiter.record_response(limiter.start_request(), 429)
+        self.assertEqual(1, limiter.limit)
+        semaphore.release()
+        semaphore.release()
+        self.assertFalse(semaphore.acquire(blocking=False))
+        semaphore.release()
+        self.assertTrue(semaphore.acquire(blocking=False))
+
+    def test_semaphores_sharing_a_limiter_stay_within_the_limit_together(self):
+        limiter = AimdConcurrencyLimiter(8)
+        requests = WrappedSemaphore(8, concurrency_limiter=limiter, limit_share=POOL_LIMIT_SHARE)
+        parts = WrappedSemaphore(8, concurrency_limiter=limiter, limit_share=POOL_LIMIT_SHARE)
+
+        held = 0
+        for semaphore in [requests, parts]:
+            while semaphore.acquire(blocking=False):
+                held += 1
+        self.assertEqual(8, held)
+
+        # Each keeps at least one slot however far the limit falls
+        for _ in range(3):
+            limiter.record_response(limiter.start_request(), 429)
+            time.sleep(0.01)
+        self.assertEqual(1, limiter.limit)
+        for _ in range(4):
+            requests.release()
+            parts.release()
+        self.assertTrue(requests.acquire(blocking=False))
+        self.assertTrue(parts.acquire(blocking=False))
+        self.assertFalse(requests.acquire(blocking=False))
+
+
+class TestTransferManagersWithConcurrencyLimiter(unittest.TestCase):
+    def setUp(self):
+        self.server = StubObjectStorageServer()
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.daemon = True
+        self.server_thread.start()
+
+        endpoint = 'http://127.0.0.1:{}'.format(self.server.server_address[1])
+        self.client = oci.object_storage.ObjectStorageClient({}, signer=StubSigner(), service_endpoint=endpoint)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_threaded_requests_update_the_limit(self):
+        limiter = AimdConcurrencyLimiter(8)
+        transfer_manager = TransferManager(self.client, TransferManagerConfig(concurrency_limiter=limiter))
+
+        self.server.objects['a'] = b'a'
+        self.server.throttled_deletes = 1
+        with self.assertRaises(oci.exceptions.ServiceError):
+            self.client.delete_object(NAMESPACE, BUCKET, 'a')
+        self.assertEqual(4, limiter.limit)
+
+        for _ in range(5):
+            self.client.head_object(NAMESPACE, BUCKET, 'a')
+        self.assertEqual(5, limiter.limit)
+        transfer_manager.wait_for_completion()
+
+    @unittest.skipIf(sys.version_info < (3, 5), 'The asyncio transfer engine requires Python 3.5 or later')
+    def test_async_requests_update_the_limit(self):
+        async_transfer_manager = importlib.import_module('services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager.async_transfer_manager')
+        limiter = AimdConcurrencyLimiter(8)
+        changes = []
+        limiter.add_listener(lambda old_limit, new_limit: changes.append((old_limit, new_limit)))
+
+        for i in range(20):
+            self.server.objects['object-{}'.format(i)] = b'data'
+        self.server.throttled_deletes = 3
+
+        with mock.patch.object(async_transfer_manager, '_get_retry_wait_seconds', return_value=0):
+            transfer_manager = async_transfer_manager.AsyncTransferManager(self.client, TransferManagerConfig(concurrency_limiter=limiter))
+            futures = [
+                transfer_manager.delete_object(WorkPoolTaskCallbacksContainer(), namespace=NAMESPACE, bucket_name=BUCKET, object_name='object-{}'.format(i))
+                for i in range(20)
+            ]
+            transfer_manager.wait_for_completion()
+
+        for future in futures:
+            future.result()
+        self.assertEqual({}, self.server.objects)
+        self.assertEqual((8, 4), changes[0])
@@ -0,0 +1,115 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+import mock
+import oci
+import oci_cli
+from click.testing import CliRunner
+from oci.object_storage.transfer.internal.multipart_object_assembler import MultipartObjectAssembler
+
+from oci_cli import cli_util
+from services.object_storage.src.oci_cli_object_storage import objectstorage_cli_extended
+from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager import TransferManager, TransferManagerConfig, WorkPoolTaskCallbacksContainer
+from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager import file_parts
+from services.object_storage.tests.unit.test_async_transfer_manager import BUCKET, MEBIBYTE, NAMESPACE, StubObjectStorageServer, StubSigner, _md5
+
+TEBIBYTE = 1024 * 1024 * MEBIBYTE
+
+
+class TestFileParts(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.data = os.urandom(3 * mmap.ALLOCATIONGRANULARITY + 100)
+        self.file_path = os.path.join(self.directory, 'file')
+        with open(self.file_path, 'wb') as f:
+            f.write(self.data)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_part_size_fits_the_maximum_number_of_parts(self):
+        self.assertEqual(128 * MEBIBYTE, file_parts.get_part_size(TEBIBYTE, 128 * MEBIBYTE))
+        self.assertEqual(128 * MEBIBYTE, file_parts.get_part_size(128 * MEBIBYTE * file_parts.MAX_PARTS, 128 * MEBIBYTE))
+
+        for file_size in [128 * MEBIBYTE * file_parts.MAX_PARTS + 1, 2 * TEBIBYTE, 10 * TEBIBYTE - 1]:
+            part_size = file_parts.get_part_size(file_size, 128 * MEBIBYTE)
+            self.assertEqual(0, part_size % MEBIBYTE)
+            self.assertLessEqual(-(-file_size // part_size), file_parts.MAX_PARTS)
+            self.assertGreater(-(-file_size // (part_size - MEBIBYTE)), file_parts.MAX_PARTS)
+
+    def test_maps_parts_at_any_offset(self):
+        for offset, size in [(0, len(self.data)), (1, 10), (mmap.ALLOCATIONGRANULARITY - 5, 10), (2 * mmap.ALLOCATIONGRANULARITY, 100), (len(self.data) - 1, 1)]:
+            with file_parts.map_file_part(self.file_path, offset, size) as mapped_part:
+                self.assertEqual(self.data[offset:offset + size], mapped_part.view.tobytes())
+                self.assertEqual(_md5(self.data[offset:offset + size]), file_parts.get_md5(mapped_part.view))
+
+        # Empty parts can't be mapped, so are hashed from the file instead
+        self.assertIsNone(file_parts.map_file_part(self.file_path, 0, 0))
+        self.assertIsNone(file_parts.map_file_part(self.file_path, 10, 0))
+        self.assertEqual(_md5(b''), file_parts.calculate_md5(self.file_path, 10, 0))
+
+    def test_view_can_outlive_the_map(self):
+        mapped_part = file_parts.map_file_part(self.file_path, 5, 100)
+        part_slice = file_parts.MemoryViewReader(mapped_part.view).read(10)
+        mapped_part.close()
+        self.assertEqual(self.data[5:15], part_slice.tobytes())
+
+
+class TestMappedMultipartUpload(unittest.TestCase):
+    def setUp(self):
+        self.server = StubObjectStorageServer()
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.daemon = True
+        self.server_thread.start()
+
+        endpoint = 'http://127.0.0.1:{}'.format(self.server.server_address[1])
+        self.client = oci.object_storage.ObjectStorageClient({}, signer=StubSigner(), service_endpoint=endpoint)
+
+        self.directory = tempfile.mkdtemp()
+        self.data = os.urandom(int(MEBIBYTE * 3.5))
+        self.file_path = os.path.join(self.directory, 'large')
+        with open(self.file_path, 'wb') as f:
+            f.write(self.data)
+        self.part_md5s = [_md5(self.data[offset:offset + MEBIBYTE]) for offset in range(0, len(self.data), MEBIBYTE)]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.directory)
+
+    def test_parts_are_hashed_and_sent_from_the_map(self):
+        transfer_manager = TransferManager(self.client, TransferManagerConfig(multipart_part_size=MEBIBYTE))
+        with mock.patch.object(MultipartObjectAssembler, 'calculate_md5', side_effect=AssertionError('The part was read to hash it')):
+            future = transfer_manager.upload_object(WorkPoolTaskCallbacksContainer(), NAMESPACE, BUCKET, 'large', self.file_path, len(self.data), True)
+            transfer_manager.wait_for_completion()
+            response, checksum = future.result()
+
+        self.assertEqual(self.data, self.server.objects['large'])
+        self.assertEqual(cli_util.get_multipart_checksum(self.part_md5s), checksum)
+
+    def test_unmappable_parts_are_read_from_the_file(self):
+        transfer_manager = TransferManager(self.client, TransferManagerConfig(multipart_part_size=MEBIBYTE))
+        with mock.patch.object(file_parts, 'MappedFilePart', side_effect=EnvironmentError('Not supported')):
+            future = transfer_manager.upload_object(WorkPoolTaskCallbacksContainer(), NAMESPACE, BUCKET, 'large', self.file_path, len(self.data), False)
+            transfer_manager.wait_for_completion()
+            future.result()
+
+        self.assertEqual(self.data, self.server.objects['large'])
+
+    def test_put_uses_larger_parts_for_files_beyond_the_part_limit(self):
+        with mock.patch.object(file_parts, 'MAX_PARTS', 2):
+            with mock.patch.object(objectstorage_cli_extended, 'build_client', return_value=self.client):
+                result = CliRunner().invoke(oci_cli.cli, [
+                    'os', 'object', 'put', '-ns', NAMESPACE, '-bn', BUCKET, '--file', self.file_path, '--part-size', '1', '--force'
+                ])
+
+        self.assertEqual(0, result.exit_code, result.output)
+        self.assertEqual(self.data, self.server.objects['large'])
+        self.assertIn('Split file into 2 parts for upload.', result.output)
@@ -0,0 +1,82 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import mock
+import os
+import shutil
+import six
+import tempfile
+import unittest
+from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager import get_object_tasks
+from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager.get_object_tasks import GetObjectMultipartTask, MemoryBudget, PositionalFileWriter, SpooledPart
+from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager.work_pool import WorkPool
+from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager.work_pool_task import WorkPoolTaskCallbacksContainer
+
+DATA = os.urandom(1000 * 3 + 1)
+
+
+def get_object(namespace, bucket_name, object_name, **kwargs):
+    start, end = [int(value) for value in kwargs['range'][len('bytes='):].split('-')]
+    response = mock.MagicMock()
+    response.data.raw.stream.return_value = [DATA[offset:min(offset + 300, end + 1)] for offset in range(start, end + 1, 300)]
+    return response
+
+
+class TestGetObjectTasks(unittest.TestCase):
+    def setUp(self):
+        self.client = mock.MagicMock()
+        self.client.get_object.side_effect = get_object
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def download(self, destination):
+        task = GetObjectMultipartTask(
+            self.client, WorkPoolTaskCallbacksContainer(), WorkPool(4, 4), destination,
+            namespace='ns', bucket_name='bucket', object_name='object', multipart_download_threshold=100, part_size=1000, total_size=len(DATA)
+        )
+        task.do_work_hook()
+
+    def test_download_to_file_path(self):
+        path = os.path.join(self.temp_dir, 'object')
+        self.download(path)
+        with open(path, 'rb') as f:
+            self.assertEqual(DATA, f.read())
+
+        # The last range is a single byte
+        ranges = sorted(call[1]['range'] for call in self.client.get_object.call_args_list)
+        self.assertEqual(['bytes=0-999', 'bytes=1000-1999', 'bytes=2000-2999', 'bytes=3000-3000'], ranges)
+
+    def test_download_to_open_file_after_existing_content(self):
+        path = os.path.join(self.temp_dir, 'object')
+        with open(path, 'wb') as f:
+            f.write(b'header')
+            self.download(f)
+            f.write(b'footer')
+        with open(path, 'rb') as f:
+            self.assertEqual(b'header' + DATA + b'footer', f.read())
+
+    @mock.patch.object(get_object_tasks, 'PENDING_WRITES_MEMORY_LIMIT', 500)
+    def test_download_to_stream_spills_parts_over_memory_limit(self):
+        stream = six.BytesIO()
+        self.assertIsNone(PositionalFileWriter.create(stream, len(DATA)))
+        self.download(stream)
+        self.assertEqual(DATA, stream.getvalue())
+
+    def test_spooled_part(self):
+        budget = MemoryBudget(10)
+        in_memory = SpooledPart(budget)
+        in_memory.write(b'abcdef')
+        spilled = SpooledPart(budget)
+        spilled.write(b'ghi')
+        spilled.write(b'jkl')
+        self.assertIsNone(in_memory.spill_file)
+        self.assertIsNotNone(spilled.spill_file)
+        self.assertEqual(4, budget.available)
+
+        self.assertEqual(b'ghijkl', b''.join(spilled.read_chunks(4)))
+        self.assertEqual(b'abcdef', b''.join(in_memory.read_chunks(4)))
+        in_memory.close()
+        spilled.close()
+        self.assertEqual(10, budget.available)
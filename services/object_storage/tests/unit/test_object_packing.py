@@ -0,0 +1,181 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import io
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import threading
+import unittest
+
+import mock
+import oci
+import oci_cli
+from click.testing import CliRunner
+
+from services.object_storage.src.oci_cli_object_storage import objectstorage_cli_extended
+from services.object_storage.src.oci_cli_object_storage import object_packing
+from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager import file_parts
+from services.object_storage.tests.unit.test_async_transfer_manager import BUCKET, NAMESPACE, StubObjectStorageServer, StubSigner
+
+
+class TestArchiveWriter(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write_file(self, name, data):
+        path = os.path.join(self.directory, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_index_locates_each_member(self):
+        contents = {
+            'a.txt': b'a',
+            'empty': b'',
+            'block': b'b' * 512,
+            u'déjà/' + 'x' * 150: b'long name',
+        }
+        archive = object_packing.ArchiveWriter('packed.oci-pack.tar', self.directory)
+        for i, (name, data) in enumerate(sorted(contents.items())):
+            archive.add(self.write_file('file-{}'.format(i), data), name)
+        archive.close()
+
+        with open(archive.path, 'rb') as f:
+            archive_data = f.read()
+        self.assertEqual(len(archive_data) % tarfile.BLOCKSIZE, 0)
+
+        index = json.loads(archive.get_index().decode('utf-8'))
+        self.assertEqual(sorted(contents), [member['name'] for member in index['members']])
+        for member in index['members']:
+            data = archive_data[member['offset']:member['offset'] + member['size']]
+            self.assertEqual(contents[member['name']], data)
+            self.assertEqual(file_parts.get_md5(data), member['md5'])
+
+        # The archive is an ordinary tar file
+        with tarfile.open(archive.path) as tar:
+            self.assertEqual(sorted(contents), sorted(tar.getnames()))
+
+        archive.remove()
+        self.assertFalse(os.path.exists(archive.path))
+
+    def test_packer_rotates_archives(self):
+        archives = []
+        packer = object_packing.SmallFilePacker('prefix/', 4096, archives.append, self.directory)
+        for i in range(10):
+            packer.add(self.write_file('file-{}'.format(i), b'x' * 1000), 'file-{}'.format(i))
+        packer.flush()
+
+        self.assertEqual(10, sum(len(archive.members) for archive in archives))
+        self.assertGreater(len(archives), 1)
+        self.assertEqual(len(archives), len(set(archive.archive_name for archive in archives)))
+        for archive in archives:
+            self.assertTrue(archive.archive_name.startswith('prefix/packed-'))
+            self.assertTrue(object_packing.is_archive_name(archive.archive_name))
+            archive.remove()
+
+    def test_extract_rejects_members_outside_the_directory(self):
+        archive_path = os.path.join(self.directory, 'bad.tar')
+        with tarfile.open(archive_path, 'w') as tar:
+            tar_info = tarfile.TarInfo('../escaped')
+            tar_info.size = 1
+            tar.addfile(tar_info, io.BytesIO(b'x'))
+
+        extract_directory = os.path.join(self.directory, 'out')
+        with self.assertRaises(ValueError):
+            object_packing.extract_archive(archive_path, extract_directory, lambda name, path: True)
+        self.assertFalse(os.path.exists(os.path.join(self.directory, 'escaped')))
+
+
+class TestPackingCommands(unittest.TestCase):
+    def setUp(self):
+        self.server = StubObjectStorageServer()
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.daemon = True
+        self.server_thread.start()
+
+        endpoint = 'http://127.0.0.1:{}'.format(self.server.server_address[1])
+        self.client = oci.object_storage.ObjectStorageClient({}, signer=StubSigner(), service_endpoint=endpoint)
+
+        self.directory = tempfile.mkdtemp()
+        self.source = os.path.join(self.directory, 'source')
+        self.files = {'big': os.urandom(3000)}
+        for i in range(25):
+            self.files['small/{:02d}.txt'.format(i)] = 'file {}'.format(i).encode('utf-8') * (i + 1)
+        for name, data in self.files.items():
+            path = os.path.join(self.source, *name.split('/'))
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            with open(path, 'wb') as f:
+                f.write(data)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.directory)
+
+    def invoke(self, *args):
+        with mock.patch.object(objectstorage_cli_extended, 'build_client', return_value=self.client):
+            result = CliRunner().invoke(oci_cli.cli, ['os', 'object'] + list(args) + ['-ns', NAMESPACE, '-bn', BUCKET])
+        self.assertEqual(0, result.exit_code, result.output)
+        return result.output
+
+    def pack(self):
+        output = self.invoke('bulk-upload', '--src-dir', self.source, '--object-prefix', 'up/', '--pack-small-files', '--pack-threshold', '1', '--overwrite')
+        return json.loads(output[output.index('{'):])
+
+    def test_upload_packs_small_files(self):
+        output = self.pack()
+
+        self.assertEqual({}, output['upload-failures'])
+        self.assertEqual(sorted('up/' + name for name in self.files if name != 'big'), sorted(output['packed-objects']))
+        self.assertEqual(self.files['big'], self.server.objects['up/big'])
+
+        archive_names = set(output['packed-objects'].values())
+        for archive_name in archive_names:
+            self.assertIn(archive_name, output['uploaded-objects'])
+            self.assertIn(object_packing.get_index_name(archive_name), self.server.objects)
+        self.assertEqual(1 + 2 * len(archive_names), len(self.server.objects))
+
+    def test_get_member(self):
+        output = self.pack()
+        archive_name = output['packed-objects']['up/small/07.txt']
+
+        member_file = os.path.join(self.directory, 'member')
+        self.invoke('get-member', '--archive-name', archive_name, '--name', 'up/small/07.txt', '--file', member_file)
+        with open(member_file, 'rb') as f:
+            self.assertEqual(self.files['small/07.txt'], f.read())
+
+        # Only the member's range of the archive is fetched
+        ranged_gets = [path for method, path, authorization in self.server.requests if method == 'GET' and path.endswith(archive_name)]
+        self.assertEqual(1, len(ranged_gets))
+
+    def test_download_unpacks_archives(self):
+        self.pack()
+
+        download_directory = os.path.join(self.directory, 'download')
+        existing_path = os.path.join(download_directory, 'up', 'small', '00.txt')
+        os.makedirs(os.path.dirname(existing_path))
+        with open(existing_path, 'wb') as f:
+            f.write(b'existing')
+
+        output = self.invoke('bulk-download', '--download-dir', download_directory, '--unpack', '--no-overwrite')
+        output = json.loads(output[output.index('{'):])
+        self.assertEqual({}, output['download-failures'])
+        self.assertEqual(['up/small/00.txt'], output['skipped-objects'])
+
+        downloaded = {}
+        for dir_name, subdir_list, file_list in os.walk(download_directory):
+            for file_name in file_list:
+                path = os.path.join(dir_name, file_name)
+                with open(path, 'rb') as f:
+                    downloaded[os.path.relpath(path, os.path.join(download_directory, 'up')).replace(os.sep, '/')] = f.read()
+
+        expected = dict(self.files)
+        expected['small/00.txt'] = b'existing'
+        self.assertEqual(expected, downloaded)
@@ -0,0 +1,157 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+import mock
+import oci
+import oci_cli
+from click.testing import CliRunner
+
+from services.object_storage.src.oci_cli_object_storage import objectstorage_cli_extended
+from services.object_storage.src.oci_cli_object_storage.sync_index import SyncIndex
+from services.object_storage.tests.unit.test_async_transfer_manager import BUCKET, NAMESPACE, StubObjectStorageServer, StubSigner
+
+
+class TestObjectSync(unittest.TestCase):
+    def setUp(self):
+        self.server = StubObjectStorageServer()
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.daemon = True
+        self.server_thread.start()
+
+        endpoint = 'http://127.0.0.1:{}'.format(self.server.server_address[1])
+        self.client = oci.object_storage.ObjectStorageClient({}, signer=StubSigner(), service_endpoint=endpoint)
+        self.temp_dir = tempfile.mkdtemp()
+        self.local_dir = os.path.join(self.temp_dir, 'local')
+        self.index_file = os.path.join(self.temp_dir, 'index.json')
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.temp_dir)
+
+    def sync(self, *args):
+        del self.server.requests[:]
+        command = ['os', 'object', 'sync', '-ns', NAMESPACE, '-bn', BUCKET, '--prefix', 'backup/', '--index-file', self.index_file] + list(args)
+        with mock.patch.object(objectstorage_cli_extended, 'build_client', return_value=self.client):
+            result = CliRunner().invoke(oci_cli.cli, command)
+        self.assertEqual(0, result.exit_code, result.output)
+        # The progress written to stderr comes before the JSON in the output
+        return json.loads(result.output[result.output.index('{'):])
+
+    def write_file(self, relative_path, data):
+        path = os.path.join(self.local_dir, *relative_path.split('/'))
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def requests(self, method):
+        return [path for request_method, path, authorization in self.server.requests if request_method == method]
+
+    def test_upload(self):
+        self.write_file('a', b'a')
+        self.write_file('dir/b', b'b')
+        self.write_file('dir/c', b'c')
+        self.server.objects['backup/dir/c'] = b'c'
+        self.server.objects['backup/extra'] = b'extra'
+        self.server.objects['other'] = b'other'
+
+        result = self.sync('--src-dir', self.local_dir, '--delete', '--dry-run')
+        self.assertEqual(['a', 'dir/b'], result['transferred-items'])
+        self.assertEqual(['extra'], result['deleted-items'])
+        self.assertEqual(1, result['unchanged-count'])
+        self.assertIn('backup/extra', self.server.objects)
+
+        result = self.sync('--src-dir', self.local_dir, '--delete')
+        self.assertEqual(['a', 'dir/b'], result['transferred-items'])
+        self.assertEqual(['extra'], result['deleted-items'])
+        self.assertEqual({'backup/a': b'a', 'backup/dir/b': b'b', 'backup/dir/c': b'c', 'other': b'other'}, self.server.objects)
+
+        # Only the changed file is uploaded, and the unchanged files are not read again
+        self.write_file('dir/b', b'B')
+        with mock.patch('oci_cli.cli_util.get_file_md5', wraps=oci_cli.cli_util.get_file_md5) as get_file_md5:
+            result = self.sync('--src-dir', self.local_dir)
+        self.assertEqual(['dir/b'], result['transferred-items'])
+        self.assertEqual(2, result['unchanged-count'])
+        self.assertEqual(1, get_file_md5.call_count)
+        self.assertEqual(b'B', self.server.objects['backup/dir/b'])
+
+        result = self.sync('--src-dir', self.local_dir)
+        self.assertEqual([], result['transferred-items'])
+        self.assertEqual(3, result['unchanged-count'])
+        self.assertEqual(1, len(self.requests('GET')))
+        self.assertIn('fields=name%2Csize%2Cmd5%2CtimeCreated', self.requests('GET')[0])
+        self.assertEqual([], self.requests('PUT'))
+
+    def test_download(self):
+        self.server.objects['backup/a'] = b'a'
+        self.server.objects['backup/dir/b'] = b'b'
+        self.server.objects['backup/dir/'] = b''
+        self.write_file('dir/b', b'x')
+        self.write_file('extra', b'extra')
+
+        result = self.sync('--download-dir', self.local_dir, '--delete')
+        self.assertEqual(['a', 'dir/b'], result['transferred-items'])
+        self.assertEqual(['extra'], result['deleted-items'])
+        self.assertFalse(os.path.exists(os.path.join(self.local_dir, 'extra')))
+        for relative_path, data in [('a', b'a'), ('dir/b', b'b')]:
+            with open(os.path.join(self.local_dir, relative_path), 'rb') as f:
+                self.assertEqual(data, f.read())
+
+        result = self.sync('--download-dir', self.local_dir)
+        self.assertEqual([], result['transferred-items'])
+        self.assertEqual(2, result['unchanged-count'])
+        self.assertEqual(1, len(self.requests('GET')))
+
+    def test_multipart_objects_are_compared_by_time(self):
+        path = self.write_file('large', b'large')
+        os.utime(path, (1546300800, 1546300800))
+        self.server.objects['backup/large'] = b'large'
+        self.server.md5s['backup/large'] = 'multipart-md5-2'
+
+        # The object was created after the file was modified
+        self.server.times_created['backup/large'] = '2019-01-02T00:00:00.000Z'
+        self.assertEqual([], self.sync('--src-dir', self.local_dir)['transferred-items'])
+
+        # Once the file is in the index, it stays in sync with the object in both directions
+        self.assertEqual([], self.sync('--download-dir', self.local_dir, '--dry-run')['transferred-items'])
+        os.remove(self.index_file)
+        self.assertEqual(['large'], self.sync('--download-dir', self.local_dir, '--dry-run')['transferred-items'])
+
+        # The file was modified after the object was created
+        self.server.times_created['backup/large'] = '2018-12-31T00:00:00.000Z'
+        self.assertEqual(['large'], self.sync('--src-dir', self.local_dir, '--dry-run')['transferred-items'])
+        self.assertEqual([], self.sync('--download-dir', self.local_dir, '--dry-run')['transferred-items'])
+
+    def test_sync_index(self):
+        path = self.write_file('a', b'a')
+        stat_result = os.stat(path)
+
+        index = SyncIndex(self.index_file)
+        index.put('a', stat_result, md5='md5', object_md5='object-md5')
+        index.put('removed', stat_result)
+        index.save()
+
+        index = SyncIndex(self.index_file)
+        self.assertEqual('object-md5', index.get('a', stat_result)['object_md5'])
+        index.save()
+
+        # Entries which were not used are dropped, and entries for modified files are ignored
+        index = SyncIndex(self.index_file)
+        self.assertIsNone(index.get('removed', stat_result))
+        os.utime(path, (stat_result.st_atime, stat_result.st_mtime + 10))
+        self.assertIsNone(index.get('a', os.stat(path)))
+
+    def test_src_dir_or_download_dir_required(self):
+        with mock.patch.object(objectstorage_cli_extended, 'build_client', return_value=self.client):
+            result = CliRunner().invoke(oci_cli.cli, ['os', 'object', 'sync', '-ns', NAMESPACE, '-bn', BUCKET])
+        self.assertNotEqual(0, result.exit_code)
+        self.assertIn('Exactly one of --src-dir', result.output)
@@ -0,0 +1,165 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import bisect
+import json
+import threading
+import unittest
+
+import mock
+import oci
+import oci_cli
+from click.testing import CliRunner
+
+from services.object_storage.src.oci_cli_object_storage import objectstorage_cli_extended
+from services.object_storage.src.oci_cli_object_storage.sharded_object_lister import ShardedObjectLister, get_split_points
+from services.object_storage.tests.unit.test_async_transfer_manager import BUCKET, NAMESPACE, StubObjectStorageServer, StubSigner
+
+
+# Lists pages of a sorted list of names in the same way as Object Storage, counting the calls
+class FakeBucket(object):
+    def __init__(self, names):
+        self.names = sorted(names)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def list_page(self, prefix, start, end, limit, delimiter, fields):
+        with self.lock:
+            self.calls.append((start, end))
+
+        index = bisect.bisect_left(self.names, start or '')
+        names = []
+        prefixes = []
+        next_start_with = None
+        while index < len(self.names) and (end is None or self.names[index] < end):
+            name = self.names[index]
+            index += 1
+            if prefix and not name.startswith(prefix):
+                continue
+            if len(names) + len(prefixes) == limit:
+                next_start_with = name
+                break
+
+            position = name.find(delimiter, len(prefix or '')) if delimiter else -1
+            if position == -1:
+                names.append(name)
+            elif name[:position + 1] not in prefixes:
+                prefixes.append(name[:position + 1])
+
+        data = oci.object_storage.models.ListObjects()
+        data.objects = [oci.object_storage.models.ObjectSummary(name=name) for name in names]
+        data.prefixes = prefixes
+        data.next_start_with = next_start_with
+        return oci.response.Response(200, {}, data, None)
+
+
+class TestShardedObjectLister(unittest.TestCase):
+    def list_names(self, bucket, **kwargs):
+        lister = ShardedObjectLister(bucket.list_page, page_size=10, parallel_count=4, **kwargs)
+        names = []
+        for response in lister.responses():
+            names.extend(obj.name for obj in response.data.objects)
+        return names
+
+    def test_lists_every_object_once(self):
+        buckets = {
+            'flat': ['{:05x}'.format(i) for i in range(0, 100000, 97)],
+            'hierarchy': ['photos/{}/{:02d}/img{}.jpg'.format(year, month, i) for year in range(2015, 2020) for month in range(1, 13) for i in range(5)],
+            'skewed': ['a{}'.format(i) for i in range(5)] + ['logs/{:04d}'.format(i) for i in range(600)] + ['z', '~', u'été'],
+        }
+        for description, names in buckets.items():
+            bucket = FakeBucket(names)
+            listed = self.list_names(bucket)
+            self.assertEqual(sorted(names), sorted(listed), description)
+            self.assertEqual(len(names), len(listed), description)
+
+    def test_lists_within_the_range(self):
+        bucket = FakeBucket(['photos/{:03d}'.format(i) for i in range(300)] + ['videos/{:03d}'.format(i) for i in range(300)])
+        self.assertEqual(['photos/{:03d}'.format(i) for i in range(300)], sorted(self.list_names(bucket, prefix='photos/')))
+        self.assertEqual(['photos/{:03d}'.format(i) for i in range(50, 300)] + ['videos/{:03d}'.format(i) for i in range(100)],
+                         sorted(self.list_names(bucket, start='photos/050', end='videos/100')))
+
+    def test_first_response_is_the_first_page(self):
+        bucket = FakeBucket(['{:03d}'.format(i) for i in range(100)])
+        responses = ShardedObjectLister(bucket.list_page, page_size=10).responses()
+        first_response = next(responses)
+        self.assertEqual(['{:03d}'.format(i) for i in range(10)], [obj.name for obj in first_response.data.objects])
+        self.assertEqual('010', first_response.data.next_start_with)
+
+    def test_single_page_is_listed_once(self):
+        bucket = FakeBucket(['a', 'b'])
+        self.assertEqual(['a', 'b'], self.list_names(bucket))
+        self.assertEqual([(None, None)], bucket.calls)
+
+    def test_list_errors_are_raised(self):
+        bucket = FakeBucket(['{:03d}'.format(i) for i in range(100)])
+        list_page = bucket.list_page
+
+        def failing_list_page(**kwargs):
+            if kwargs['start']:
+                raise oci.exceptions.ServiceError(500, 'InternalError', {}, 'Failed')
+            return list_page(**kwargs)
+
+        with self.assertRaises(oci.exceptions.ServiceError):
+            list(ShardedObjectLister(failing_list_page, page_size=10).responses())
+
+    def test_splits_at_discovered_prefixes(self):
+        bucket = FakeBucket(['photos/{}/img{:02d}.jpg'.format(year, i) for year in range(2015, 2020) for i in range(20)])
+        self.list_names(bucket)
+        shard_starts = set(start for start, end in bucket.calls)
+        for year in range(2016, 2020):
+            self.assertIn('photos/{}/'.format(year), shard_starts)
+
+    def test_split_points(self):
+        # After each level of the hierarchy of the next name, and within the prefix shared by the names in the page
+        points = get_split_points(['photos/2019/a0001', 'photos/2019/a4567', 'photos/2019/a1000'], None)
+        self.assertIn('photos/2019/b', points)
+        self.assertIn('photos/201:', points)
+        self.assertIn('photos0', points)
+        self.assertIn('photos/2019/a4', points)
+
+        for point in points:
+            self.assertGreater(point, 'photos/2019/a1000')
+        self.assertEqual(sorted(points), points)
+
+        # Only points within the range and the prefix are used
+        points = get_split_points(['photos/2019/a0001', 'photos/2019/a4567', 'photos/2019/a1000'], 'photos/2019/a5', 'photos/')
+        self.assertTrue(all('photos/2019/a1000' < point < 'photos/2019/a5' for point in points))
+        self.assertNotIn('photos0', get_split_points(['photos/2019/a0001', 'photos/2019/a4567', 'photos/2019/a1000'], None, 'photos/'))
+
+
+class TestShardedListingCommands(unittest.TestCase):
+    def setUp(self):
+        self.server = StubObjectStorageServer()
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.daemon = True
+        self.server_thread.start()
+
+        endpoint = 'http://127.0.0.1:{}'.format(self.server.server_address[1])
+        self.client = oci.object_storage.ObjectStorageClient({}, signer=StubSigner(), service_endpoint=endpoint)
+
+        self.names = ['data/{:04d}'.format(i) for i in range(1500)] + ['other/{}'.format(i) for i in range(30)]
+        for name in self.names:
+            self.server.objects[name] = b'x'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def invoke(self, *args):
+        with mock.patch.object(objectstorage_cli_extended, 'build_client', return_value=self.client):
+            result = CliRunner().invoke(oci_cli.cli, ['os', 'object'] + list(args) + ['-ns', NAMESPACE, '-bn', BUCKET])
+        self.assertEqual(0, result.exit_code, result.output)
+        return json.loads(result.output[result.output.index('{'):])
+
+    def test_list_all_is_sorted(self):
+        output = self.invoke('list', '--all', '--page-size', '100')
+        self.assertEqual(sorted(self.names), [obj['name'] for obj in output['data']])
+
+    def test_bulk_delete(self):
+        output = self.invoke('bulk-delete', '--dry-run')
+        self.assertEqual(sorted(self.names), sorted(output['deleted-objects']))
+
+        output = self.invoke('bulk-delete', '--force')
+        self.assertEqual(sorted(self.names), sorted(output['deleted-objects']))
+        self.assertEqual({}, self.server.objects)
@@ -0,0 +1,173 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import io
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+import mock
+import oci
+import oci_cli
+from click.testing import CliRunner
+
+from oci_cli import cli_util
+from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager import PartBufferRing, TransferManager, TransferManagerConfig, WorkPoolTaskCallbacksContainer
+from services.object_storage.src.oci_cli_object_storage import objectstorage_cli_extended
+from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager import stream_upload_tasks
+from services.object_storage.tests.unit.test_async_transfer_manager import BUCKET, MEBIBYTE, NAMESPACE, StubObjectStorageServer, StubSigner, _md5
+
+PART_SIZE = 1024
+
+
+# A stream which can only be read from start to end, in reads of at most max_read bytes, like a pipe
+class PipeLikeStream(object):
+    def __init__(self, data, max_read=300):
+        self._stream = io.BytesIO(data)
+        self._max_read = max_read
+
+    def read(self, n):
+        return self._stream.read(min(n, self._max_read))
+
+
+class TestPartBufferRing(unittest.TestCase):
+    def test_buffers_are_allocated_lazily_and_reused(self):
+        ring = PartBufferRing(2, 16)
+        first = ring.acquire()
+        ring.release(first)
+        self.assertIs(first, ring.acquire())
+
+        second = ring.acquire()
+        self.assertIsNot(first, second)
+        self.assertEqual(16, len(second))
+
+        # Once all of the buffers are in use, acquire waits for one to be released
+        acquired = []
+        thread = threading.Thread(target=lambda: acquired.append(ring.acquire()))
+        thread.start()
+        thread.join(0.1)
+        self.assertEqual([], acquired)
+        ring.release(second)
+        thread.join(5)
+        self.assertEqual([second], acquired)
+
+
+class TestStreamingMultipartUpload(unittest.TestCase):
+    def setUp(self):
+        self.server = StubObjectStorageServer()
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.daemon = True
+        self.server_thread.start()
+
+        endpoint = 'http://127.0.0.1:{}'.format(self.server.server_address[1])
+        self.client = oci.object_storage.ObjectStorageClient({}, signer=StubSigner(), service_endpoint=endpoint)
+        self.transfer_manager = TransferManager(self.client, TransferManagerConfig(max_object_storage_multipart_requests=3))
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def upload(self, stream, **kwargs):
+        future = self.transfer_manager.upload_stream(WorkPoolTaskCallbacksContainer(), NAMESPACE, BUCKET, 'streamed', stream, True, part_size=PART_SIZE, **kwargs)
+        try:
+            return future.result()
+        finally:
+            self.transfer_manager.wait_for_completion()
+
+    def test_uploads_parts_from_a_bounded_number_of_buffers(self):
+        data = os.urandom(int(PART_SIZE * 10.5))
+        allocated_buffers = []
+        acquire = PartBufferRing.acquire
+
+        def recording_acquire(ring):
+            buffer = acquire(ring)
+            if not any(buffer is allocated for allocated in allocated_buffers):
+                allocated_buffers.append(buffer)
+            return buffer
+
+        progress = []
+        with mock.patch.object(PartBufferRing, 'acquire', recording_acquire):
+            response, checksum = self.upload(PipeLikeStream(data), progress_callback=progress.append, content_md5='ignored')
+
+        self.assertEqual(data, self.server.objects['streamed'])
+        self.assertEqual(len(data), sum(progress))
+        self.assertLessEqual(len(allocated_buffers), 3)
+
+        part_md5s = [_md5(data[offset:offset + PART_SIZE]) for offset in range(0, len(data), PART_SIZE)]
+        self.assertEqual(cli_util.get_multipart_checksum(part_md5s), checksum)
+        self.assertTrue(checksum.endswith('-11'))
+
+    def test_stream_of_whole_parts(self):
+        data = os.urandom(PART_SIZE * 2)
+        self.upload(PipeLikeStream(data))
+        self.assertEqual(data, self.server.objects['streamed'])
+
+    def test_short_stream_is_put_as_one_part(self):
+        for data in [b'', b'short']:
+            response, checksum = self.upload(io.BytesIO(data), metadata={'key': 'value'})
+            self.assertEqual(data, self.server.objects['streamed'])
+            self.assertEqual(_md5(data), checksum)
+            self.assertEqual({'opc-meta-key': 'value'}, self.server.metadata['streamed'])
+            self.assertEqual(0, len([request for request in self.server.requests if request[0] == 'POST']))
+            self.transfer_manager = TransferManager(self.client, TransferManagerConfig(max_object_storage_multipart_requests=3))
+
+    def test_metadata_keys_are_prefixed_for_multipart_uploads(self):
+        data = os.urandom(PART_SIZE * 2)
+        with mock.patch.object(self.client, 'create_multipart_upload', wraps=self.client.create_multipart_upload) as create_multipart_upload:
+            self.upload(PipeLikeStream(data), metadata={'key': 'value', 'opc-meta-prefixed': 'value'}, content_type='text/plain')
+
+        details = create_multipart_upload.call_args[0][2]
+        self.assertEqual({'opc-meta-key': 'value', 'opc-meta-prefixed': 'value'}, details.metadata)
+        self.assertEqual('text/plain', details.content_type)
+        self.assertEqual(data, self.server.objects['streamed'])
+
+    def test_failed_part_aborts_the_upload(self):
+        upload_part = self.client.upload_part
+
+        def failing_upload_part(*args, **kwargs):
+            if args[4] == 3:
+                raise oci.exceptions.ServiceError(400, 'InvalidParameter', {}, 'Bad part')
+            return upload_part(*args, **kwargs)
+
+        with mock.patch.object(self.client, 'upload_part', side_effect=failing_upload_part):
+            with self.assertRaises(oci.exceptions.ServiceError):
+                self.upload(PipeLikeStream(os.urandom(PART_SIZE * 20)))
+
+        self.assertNotIn('streamed', self.server.objects)
+        self.assertEqual({}, self.server.parts)
+        self.assertIn('DELETE', [request[0] for request in self.server.requests])
+
+    def test_stream_must_fit_in_the_maximum_number_of_parts(self):
+        with mock.patch.object(stream_upload_tasks, 'MAX_PARTS', 2):
+            with self.assertRaises(RuntimeError):
+                self.upload(PipeLikeStream(os.urandom(PART_SIZE * 3)))
+        self.assertEqual({}, self.server.parts)
+
+    @unittest.skipIf(not hasattr(os, 'mkfifo'), 'Named pipes are not available')
+    def test_put_from_a_named_pipe(self):
+        data = os.urandom(int(MEBIBYTE * 2.5))
+        directory = tempfile.mkdtemp()
+        pipe_path = os.path.join(directory, 'pipe')
+        os.mkfifo(pipe_path)
+
+        def write_to_pipe():
+            with open(pipe_path, 'wb') as pipe:
+                pipe.write(data)
+
+        writer = threading.Thread(target=write_to_pipe)
+        writer.start()
+        try:
+            with mock.patch.object(objectstorage_cli_extended, 'build_client', return_value=self.client):
+                result = CliRunner().invoke(oci_cli.cli, [
+                    'os', 'object', 'put', '-ns', NAMESPACE, '-bn', BUCKET, '--name', 'piped', '--file', pipe_path,
+                    '--part-size', '1', '--parallel-upload-count', '2', '--force', '--verify-checksum'
+                ])
+        finally:
+            writer.join()
+            shutil.rmtree(directory)
+
+        self.assertEqual(data, self.server.objects['piped'])
+        self.assertEqual(3, len([request for request in self.server.requests if request[0] == 'PUT']))
+        self.assertIn('[Local: {}]'.format(cli_util.get_multipart_checksum([_md5(data[offset:offset + MEBIBYTE]) for offset in range(0, len(data), MEBIBYTE)])), result.output)
@@ -0,0 +1,161 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+import mock
+import oci
+import oci_cli
+from click.testing import CliRunner
+
+from services.object_storage.src.oci_cli_object_storage import objectstorage_cli_extended
+from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager import TransferJournal, TransferManager, TransferManagerConfig, WorkPoolTaskCallbacksContainer
+from services.object_storage.tests.unit.test_async_transfer_manager import BUCKET, MEBIBYTE, NAMESPACE, StubObjectStorageServer, StubSigner, _md5
+
+
+class TestTransferJournal(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.journal_path = os.path.join(self.temp_dir, 'journal')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_records_are_read_back(self):
+        file_stat = os.stat(self.temp_dir)
+        journal = TransferJournal(self.journal_path, 'bulk-upload', NAMESPACE, BUCKET)
+        journal.record_completed('a')
+        journal.record_multipart_upload('b', 'upload-1', MEBIBYTE, file_stat)
+        journal.record_part('upload-1', 2, 'etag-2', 'md5-2')
+        journal.close()
+
+        # A record which was cut short when the process died is ignored, and later records go on the next line
+        with open(self.journal_path, 'ab') as f:
+            f.write(b'{"done":"c')
+        journal = TransferJournal(self.journal_path, 'bulk-upload', NAMESPACE, BUCKET)
+        journal.record_completed('d')
+        journal.close()
+
+        journal = TransferJournal(self.journal_path, 'bulk-upload', NAMESPACE, BUCKET)
+        journal.close()
+        self.assertTrue(journal.is_completed('a'))
+        self.assertFalse(journal.is_completed('c'))
+        self.assertTrue(journal.is_completed('d'))
+        self.assertEqual(
+            {'upload_id': 'upload-1', 'part_size': MEBIBYTE, 'size': file_stat.st_size, 'mtime': file_stat.st_mtime, 'parts': {2: {'etag': 'etag-2', 'md5': 'md5-2'}}},
+            journal.get_multipart_upload('b')
+        )
+
+    def test_journal_for_another_operation(self):
+        TransferJournal(self.journal_path, 'bulk-upload', NAMESPACE, BUCKET).close()
+        with self.assertRaises(ValueError):
+            TransferJournal(self.journal_path, 'bulk-download', NAMESPACE, BUCKET)
+        with self.assertRaises(ValueError):
+            TransferJournal(self.journal_path, 'bulk-upload', NAMESPACE, 'other-bucket')
+
+
+class TestResumeMultipartUpload(unittest.TestCase):
+    def setUp(self):
+        self.server = StubObjectStorageServer()
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.daemon = True
+        self.server_thread.start()
+
+        endpoint = 'http://127.0.0.1:{}'.format(self.server.server_address[1])
+        self.client = oci.object_storage.ObjectStorageClient({}, signer=StubSigner(), service_endpoint=endpoint)
+        self.temp_dir = tempfile.mkdtemp()
+
+        self.data = os.urandom(3 * MEBIBYTE + 5)
+        self.file_path = os.path.join(self.temp_dir, 'large')
+        with open(self.file_path, 'wb') as f:
+            f.write(self.data)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.temp_dir)
+
+    def upload(self, transfer_manager_class, journal):
+        config = TransferManagerConfig(multipart_part_size=MEBIBYTE, transfer_journal=journal)
+        transfer_manager = transfer_manager_class(self.client, config)
+        future = transfer_manager.upload_object(WorkPoolTaskCallbacksContainer(), NAMESPACE, BUCKET, 'large', self.file_path, len(self.data), False)
+        transfer_manager.wait_for_completion()
+        journal.close()
+        return future.result()
+
+    def part_puts(self):
+        return sorted(path for method, path, authorization in self.server.requests if method == 'PUT' and '/u/' in path)
+
+    def check_resume(self, transfer_manager_class):
+        # The upload was interrupted after the second part was uploaded
+        journal = TransferJournal(os.path.join(self.temp_dir, 'journal'), 'bulk-upload', NAMESPACE, BUCKET)
+        journal.record_multipart_upload('large', 'upload-interrupted', MEBIBYTE, os.stat(self.file_path))
+        journal.record_part('upload-interrupted', 2, 'etag-2', _md5(self.data[MEBIBYTE:2 * MEBIBYTE]))
+        journal.close()
+        self.server.parts['upload-interrupted'] = {2: self.data[MEBIBYTE:2 * MEBIBYTE]}
+
+        journal = TransferJournal(os.path.join(self.temp_dir, 'journal'), 'bulk-upload', NAMESPACE, BUCKET)
+        self.upload(transfer_manager_class, journal)
+        self.assertEqual(self.data, self.server.objects['large'])
+        self.assertEqual(3, len(self.part_puts()))
+        self.assertTrue(all('uploadId=upload-interrupted' in path for path in self.part_puts()))
+        self.assertNotIn('uploadPartNum=2&', ''.join(path + '&' for path in self.part_puts()))
+
+        # The uploaded parts were recorded too
+        journal = TransferJournal(os.path.join(self.temp_dir, 'journal'), 'bulk-upload', NAMESPACE, BUCKET)
+        journal.close()
+        self.assertEqual([1, 2, 3, 4], sorted(journal.get_multipart_upload('large')['parts']))
+
+    def check_upload_which_no_longer_exists(self, transfer_manager_class):
+        journal = TransferJournal(os.path.join(self.temp_dir, 'journal'), 'bulk-upload', NAMESPACE, BUCKET)
+        journal.record_multipart_upload('large', 'upload-committed', MEBIBYTE, os.stat(self.file_path))
+        self.upload(transfer_manager_class, journal)
+
+        self.assertEqual(self.data, self.server.objects['large'])
+        self.assertTrue(any('uploadId=upload-0' in path for path in self.part_puts()))
+
+    def test_journal_is_closed_when_the_upload_fails(self):
+        journal_path = os.path.join(self.temp_dir, 'journal')
+        wait_for_completion = TransferManager.wait_for_completion
+
+        def failing_wait_for_completion(transfer_manager):
+            wait_for_completion(transfer_manager)
+            raise RuntimeError('Interrupted')
+
+        with mock.patch.object(objectstorage_cli_extended, 'build_client', return_value=self.client):
+            with mock.patch.object(TransferManager, 'wait_for_completion', failing_wait_for_completion):
+                result = CliRunner().invoke(oci_cli.cli, [
+                    'os', 'object', 'bulk-upload', '-ns', NAMESPACE, '-bn', BUCKET, '--src-dir', self.temp_dir, '--part-size', '1', '--resume', journal_path
+                ])
+
+        self.assertNotEqual(0, result.exit_code)
+        self.assertIn('Interrupted', result.output)
+        self.assertEqual(self.data, self.server.objects['large'])
+
+        # The records buffered by the journal were written out when it was closed
+        journal = TransferJournal(journal_path, 'bulk-upload', NAMESPACE, BUCKET)
+        journal.close()
+        self.assertTrue(journal.is_completed('large'))
+
+    def test_resume_threads(self):
+        self.check_resume(TransferManager)
+
+    def test_upload_which_no_longer_exists_threads(self):
+        self.check_upload_which_no_longer_exists(TransferManager)
+
+    @unittest.skipIf(sys.version_info < (3, 5), 'The asyncio transfer engine requires Python 3.5 or later')
+    def test_resume_asyncio(self):
+        self.check_resume(self._async_transfer_manager_class())
+
+    @unittest.skipIf(sys.version_info < (3, 5), 'The asyncio transfer engine requires Python 3.5 or later')
+    def test_upload_which_no_longer_exists_asyncio(self):
+        self.check_upload_which_no_longer_exists(self._async_transfer_manager_class())
+
+    def _async_transfer_manager_class(self):
+        return importlib.import_module('services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager.async_transfer_manager').AsyncTransferManager
@@ -0,0 +1,60 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import mock
+import os
+import shutil
+import tempfile
+import unittest
+from oci_cli import cli_util
+from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager.upload_tasks import SimpleSingleUploadTask
+from services.object_storage.src.oci_cli_object_storage.object_storage_transfer_manager.work_pool_task import WorkPoolTaskCallbacksContainer
+
+DATA = os.urandom(1000 * 3 + 1)
+
+
+def md5(data):
+    hasher = cli_util.new_md5()
+    hasher.update(data)
+    return cli_util.format_md5_checksum(hasher.hexdigest())
+
+
+def put_object(namespace, bucket_name, object_name, body, **kwargs):
+    while body.read(1000):
+        pass
+    return mock.MagicMock()
+
+
+class TestUploadTasks(unittest.TestCase):
+    def setUp(self):
+        self.client = mock.MagicMock()
+        self.client.put_object.side_effect = put_object
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'file')
+        with open(self.path, 'wb') as f:
+            f.write(DATA)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def upload(self, **kwargs):
+        task = SimpleSingleUploadTask(self.client, 'ns', 'bucket', 'object', self.path, WorkPoolTaskCallbacksContainer(), True, **kwargs)
+        return task.do_work_hook()
+
+    def test_verify_checksum_reports_progress(self):
+        progress = []
+        response, checksum = self.upload(progress_callback=progress.append, metadata={'key': 'value'})
+
+        # Like UploadManager, each read reports the size that was asked for
+        self.assertEqual([1000] * 5, progress)
+        self.assertEqual(md5(DATA), checksum)
+
+        # progress_callback is not passed on to put_object, and metadata is renamed for it
+        kwargs = self.client.put_object.call_args[1]
+        self.assertNotIn('progress_callback', kwargs)
+        self.assertEqual({'key': 'value'}, kwargs['opc_meta'])
+
+    def test_verify_checksum_without_progress_callback(self):
+        response, checksum = self.upload()
+
+        self.assertEqual(md5(DATA), checksum)
@@ -322,6 +322,7 @@ def list_oce_instances(ctx, from_json, all_pages, page_size, compartment_id, dis
 
         result = cli_util.list_call_get_all_results(
             client.list_oce_instances,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -373,6 +374,7 @@ def list_work_request_errors(ctx, from_json, all_pages, page_size, work_request_
 
         result = cli_util.list_call_get_all_results(
             client.list_work_request_errors,
+            stream_items=True,
             work_request_id=work_request_id,
             **kwargs
         )
@@ -424,6 +426,7 @@ def list_work_request_logs(ctx, from_json, all_pages, page_size, work_request_id
 
         result = cli_util.list_call_get_all_results(
             client.list_work_request_logs,
+            stream_items=True,
             work_request_id=work_request_id,
             **kwargs
         )
@@ -475,6 +478,7 @@ def list_work_requests(ctx, from_json, all_pages, page_size, compartment_id, res
 
         result = cli_util.list_call_get_all_results(
             client.list_work_requests,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
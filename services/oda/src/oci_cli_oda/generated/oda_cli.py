@@ -324,6 +324,7 @@ def list_oda_instances(ctx, from_json, all_pages, page_size, compartment_id, dis
 
         result = cli_util.list_call_get_all_results(
             client.list_oda_instances,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -389,6 +390,7 @@ def list_work_request_errors(ctx, from_json, all_pages, page_size, work_request_
 
         result = cli_util.list_call_get_all_results(
             client.list_work_request_errors,
+            stream_items=True,
             work_request_id=work_request_id,
             **kwargs
         )
@@ -454,6 +456,7 @@ def list_work_request_logs(ctx, from_json, all_pages, page_size, work_request_id
 
         result = cli_util.list_call_get_all_results(
             client.list_work_request_logs,
+            stream_items=True,
             work_request_id=work_request_id,
             **kwargs
         )
@@ -519,6 +522,7 @@ def list_work_requests(ctx, from_json, all_pages, page_size, compartment_id, oda
 
         result = cli_util.list_call_get_all_results(
             client.list_work_requests,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -212,6 +212,7 @@ def list_topics(ctx, from_json, all_pages, page_size, compartment_id, id, name,
 
         result = cli_util.list_call_get_all_results(
             client.list_topics,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -337,6 +337,7 @@ def list_subscriptions(ctx, from_json, all_pages, page_size, compartment_id, top
 
         result = cli_util.list_call_get_all_results(
             client.list_subscriptions,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -1112,6 +1112,7 @@ def list_jobs(ctx, from_json, all_pages, page_size, compartment_id, stack_id, id
 
         result = cli_util.list_call_get_all_results(
             client.list_jobs,
+            stream_items=True,
             **kwargs
         )
     elif limit is not None:
@@ -1176,6 +1177,7 @@ def list_stacks(ctx, from_json, all_pages, page_size, compartment_id, id, lifecy
 
         result = cli_util.list_call_get_all_results(
             client.list_stacks,
+            stream_items=True,
             **kwargs
         )
     elif limit is not None:
@@ -1251,6 +1253,7 @@ def list_work_request_errors(ctx, from_json, all_pages, page_size, work_request_
 
         result = cli_util.list_call_get_all_results(
             client.list_work_request_errors,
+            stream_items=True,
             work_request_id=work_request_id,
             **kwargs
         )
@@ -1308,6 +1311,7 @@ def list_work_request_logs(ctx, from_json, all_pages, page_size, work_request_id
 
         result = cli_util.list_call_get_all_results(
             client.list_work_request_logs,
+            stream_items=True,
             work_request_id=work_request_id,
             **kwargs
         )
@@ -1359,6 +1363,7 @@ def list_work_requests(ctx, from_json, all_pages, page_size, compartment_id, res
 
         result = cli_util.list_call_get_all_results(
             client.list_work_requests,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
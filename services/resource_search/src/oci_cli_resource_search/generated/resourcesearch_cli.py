@@ -86,6 +86,7 @@ def list_resource_types(ctx, from_json, all_pages, page_size, limit, page):
 
         result = cli_util.list_call_get_all_results(
             client.list_resource_types,
+            stream_items=True,
             **kwargs
         )
     elif limit is not None:
@@ -350,6 +350,7 @@ def list_streams(ctx, from_json, all_pages, page_size, compartment_id, id, name,
 
         result = cli_util.list_call_get_all_results(
             client.list_streams,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -258,6 +258,7 @@ def list_http_redirects(ctx, from_json, all_pages, page_size, compartment_id, li
 
         result = cli_util.list_call_get_all_results(
             client.list_http_redirects,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
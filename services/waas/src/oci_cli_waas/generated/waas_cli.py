@@ -1308,6 +1308,7 @@ def list_access_rules(ctx, from_json, all_pages, page_size, waas_policy_id, limi
 
         result = cli_util.list_call_get_all_results(
             client.list_access_rules,
+            stream_items=True,
             waas_policy_id=waas_policy_id,
             **kwargs
         )
@@ -1377,6 +1378,7 @@ def list_address_lists(ctx, from_json, all_pages, page_size, compartment_id, lim
 
         result = cli_util.list_call_get_all_results(
             client.list_address_lists,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -1428,6 +1430,7 @@ def list_caching_rules(ctx, from_json, all_pages, page_size, waas_policy_id, lim
 
         result = cli_util.list_call_get_all_results(
             client.list_caching_rules,
+            stream_items=True,
             waas_policy_id=waas_policy_id,
             **kwargs
         )
@@ -1481,6 +1484,7 @@ def list_captchas(ctx, from_json, all_pages, page_size, waas_policy_id, limit, p
 
         result = cli_util.list_call_get_all_results(
             client.list_captchas,
+            stream_items=True,
             waas_policy_id=waas_policy_id,
             **kwargs
         )
@@ -1550,6 +1554,7 @@ def list_certificates(ctx, from_json, all_pages, page_size, compartment_id, limi
 
         result = cli_util.list_call_get_all_results(
             client.list_certificates,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -1619,6 +1624,7 @@ def list_custom_protection_rules(ctx, from_json, all_pages, page_size, compartme
 
         result = cli_util.list_call_get_all_results(
             client.list_custom_protection_rules,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -1672,6 +1678,7 @@ def list_edge_subnets(ctx, from_json, all_pages, page_size, limit, page, sort_by
 
         result = cli_util.list_call_get_all_results(
             client.list_edge_subnets,
+            stream_items=True,
             **kwargs
         )
     elif limit is not None:
@@ -1722,6 +1729,7 @@ def list_good_bots(ctx, from_json, all_pages, page_size, waas_policy_id, limit,
 
         result = cli_util.list_call_get_all_results(
             client.list_good_bots,
+            stream_items=True,
             waas_policy_id=waas_policy_id,
             **kwargs
         )
@@ -1779,6 +1787,7 @@ def list_protection_rules(ctx, from_json, all_pages, page_size, waas_policy_id,
 
         result = cli_util.list_call_get_all_results(
             client.list_protection_rules,
+            stream_items=True,
             waas_policy_id=waas_policy_id,
             **kwargs
         )
@@ -1835,6 +1844,7 @@ def list_recommendations(ctx, from_json, all_pages, page_size, waas_policy_id, r
 
         result = cli_util.list_call_get_all_results(
             client.list_recommendations,
+            stream_items=True,
             waas_policy_id=waas_policy_id,
             **kwargs
         )
@@ -1886,6 +1896,7 @@ def list_threat_feeds(ctx, from_json, all_pages, page_size, waas_policy_id, limi
 
         result = cli_util.list_call_get_all_results(
             client.list_threat_feeds,
+            stream_items=True,
             waas_policy_id=waas_policy_id,
             **kwargs
         )
@@ -1955,6 +1966,7 @@ def list_waas_policies(ctx, from_json, all_pages, page_size, compartment_id, lim
 
         result = cli_util.list_call_get_all_results(
             client.list_waas_policies,
+            stream_items=True,
             compartment_id=compartment_id,
             **kwargs
         )
@@ -2012,6 +2024,7 @@ def list_waas_policy_custom_protection_rules(ctx, from_json, all_pages, page_siz
 
         result = cli_util.list_call_get_all_results(
             client.list_waas_policy_custom_protection_rules,
+            stream_items=True,
             waas_policy_id=waas_policy_id,
             **kwargs
         )
@@ -2072,6 +2085,7 @@ def list_waf_blocked_requests(ctx, from_json, all_pages, page_size, waas_policy_
 
         result = cli_util.list_call_get_all_results(
             client.list_waf_blocked_requests,
+            stream_items=True,
             waas_policy_id=waas_policy_id,
             **kwargs
         )
@@ -2180,6 +2194,7 @@ def list_waf_logs(ctx, from_json, all_pages, page_size, waas_policy_id, limit, p
 
         result = cli_util.list_call_get_all_results(
             client.list_waf_logs,
+            stream_items=True,
             waas_policy_id=waas_policy_id,
             **kwargs
         )
@@ -2237,6 +2252,7 @@ def list_waf_requests(ctx, from_json, all_pages, page_size, waas_policy_id, time
 
         result = cli_util.list_call_get_all_results(
             client.list_waf_requests,
+            stream_items=True,
             waas_policy_id=waas_policy_id,
             **kwargs
         )
@@ -2294,6 +2310,7 @@ def list_waf_traffic(ctx, from_json, all_pages, page_size, waas_policy_id, time_
 
         result = cli_util.list_call_get_all_results(
             client.list_waf_traffic,
+            stream_items=True,
             waas_policy_id=waas_policy_id,
             **kwargs
         )
@@ -2345,6 +2362,7 @@ def list_whitelists(ctx, from_json, all_pages, page_size, waas_policy_id, limit,
 
         result = cli_util.list_call_get_all_results(
             client.list_whitelists,
+            stream_items=True,
             waas_policy_id=waas_policy_id,
             **kwargs
         )
@@ -2400,6 +2418,7 @@ def list_work_requests(ctx, from_json, all_pages, page_size, waas_policy_id, com
 
         result = cli_util.list_call_get_all_results(
             client.list_work_requests,
+            stream_items=True,
             waas_policy_id=waas_policy_id,
             compartment_id=compartment_id,
             **kwargs
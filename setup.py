@@ -85,11 +85,13 @@ setup(
     long_description=readme,
     entry_points={
         'console_scripts': ["oci=oci_cli.cli:cli",
+                            "oci-shim=oci_cli_daemon_shim:main",
                             "create_backup_from_onprem=oci_cli.scripts.database.dbaas:create_backup_from_onprem"]
     },
     install_requires=requires,
     extras_require=extras,
     packages=all_packages,
+    py_modules=['oci_cli_daemon_shim'],
     package_dir=package_dirs,
     include_package_data=True,
     license="Universal Permissive License 1.0 or Apache License 2.0",
@@ -3,7 +3,6 @@
 
 import os
 import sys
-import pkgutil
 from inspect import getsourcefile
 from os.path import abspath
 
@@ -35,33 +34,21 @@ sys.path.append(python_cli_root_dir)
 services_dir = os.path.join(python_cli_root_dir, ALL_SERVICES_DIR)
 
 # These imports are used by tests. The primary entry point for the CLI is cli.py.
+#
+# The generated and extended code for each service under the platformization directories is not imported here. It is
+# imported on demand by the root command group (see service_loader) when one of the service's commands is invoked.
 from .cli_root import cli  # noqa: F401,E402
 from .custom_types import cli_datetime  # noqa: F401,E402
 from .custom_types import cli_from_json  # noqa: F401,E402
 
-# Import generated and extended code from platformization directories.
-# This has to be done after importing cli_root
-for importer1, modname1, ispkg1 in pkgutil.iter_modules(path=[services_dir]):
-    for importer, modname, ispkg in pkgutil.iter_modules(path=[services_dir + '/' + modname1 + '/src']):
-        if ispkg and modname.startswith("oci_cli_"):
-            oci_cli_module_name = modname.split(".")[0]
-            service_name = oci_cli_module_name[8:]
-            oci_cli_module = __import__(ALL_SERVICES_DIR + '.' + modname1 + '.src.' + oci_cli_module_name)
-            service_dir = os.path.join(services_dir, modname1, 'src', oci_cli_module_name)
-            generated_module = service_name.replace('_', '') + "_cli"
-            if os.path.isfile(os.path.join(service_dir, 'generated', generated_module + ".py")):
-                __import__(ALL_SERVICES_DIR + '.' + modname1 + '.src.' + oci_cli_module_name + ".generated." + generated_module)
-
-            for file_name in os.listdir(service_dir):
-                if 'extended' in file_name and os.path.isfile(os.path.join(service_dir, file_name)):
-                    extended_module = file_name[:-3]
-                    __import__(ALL_SERVICES_DIR + '.' + modname1 + '.src.' + oci_cli_module_name + "." + extended_module)
-
 from . import aliasing  # noqa: F401,E402
 from . import file_filters  # noqa: F401,E402
 from . import final_command_processor  # noqa: F401,E402
 from . import cli_setup  # noqa: F401,E402
 from . import cli_session  # noqa: F401,E402
+from . import cli_batch  # noqa: F401,E402
+from . import cli_daemon  # noqa: F401,E402
+from . import cli_token_cache  # noqa: F401,E402
 from . import cli_setup_bootstrap  # noqa: F401,E402
 from . import cli_util  # noqa: F401,E402
 from . import cli_exceptions  # noqa: F401,E402
@@ -7,6 +7,15 @@ import sys
 
 class CommandGroupWithAlias(click.Group):
     def get_command(self, ctx, cmd_name):
+        rv = self.resolve_command_or_alias(ctx, cmd_name)
+        if rv is not None:
+            # Inline import to avoid a circular dependency
+            from ..final_command_processor import prepare_command
+            prepare_command(rv)
+
+        return rv
+
+    def resolve_command_or_alias(self, ctx, cmd_name):
         command_chain = self.get_command_chain(ctx)
 
         rv = click.Group.get_command(self, ctx, cmd_name)
@@ -2,7 +2,6 @@
 # Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
 
 from copy import deepcopy
-import click
 import six
 
 ALIASES = {}
@@ -15,16 +14,17 @@ def get_aliases_for_long_parameter(long_param_name):
         return []
 
 
-def shim_in_aliases(command_group):
-    remove_redundant_aliases()
-    collision_errors = set()
-    for cmd_name, cmd_obj in six.iteritems(command_group.commands):
-        if isinstance(cmd_obj, click.Group):
-            collision_errors.update(shim_in_aliases(cmd_obj))
-        elif isinstance(cmd_obj, click.Command):
-            collision_errors.update(add_alias_to_command_params(cmd_obj.params))
+def apply_aliases_to_command(command):
+    # ALIASES is replaced each time the OCI CLI rc file is read, so remember which aliases a command has
+    # already had applied rather than applying them again every time it is resolved
+    if getattr(command, 'applied_aliases', None) is ALIASES:
+        return set()
 
-    return collision_errors
+    command.applied_aliases = ALIASES
+    if not ALIASES:
+        return set()
+
+    return add_alias_to_command_params(command.params)
 
 
 def add_alias_to_command_params(params):
@@ -43,7 +43,9 @@ def add_alias_to_command_params(params):
                         'Could not add alias {} to param {} as it conflicts with existing options for parameter {}'.format(alias_exists_tuple[0], available_opts[0], alias_exists_tuple[2][0])
                     )
                 else:
-                    available_opts.extend(ALIASES[o])
+                    # Params can be shared between commands (see cli_util.copy_params_from_generated_command) so
+                    # they may already have the alias
+                    available_opts.extend([a for a in ALIASES[o] if a not in available_opts])
 
     return collision_errors
 
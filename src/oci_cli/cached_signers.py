@@ -0,0 +1,128 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import socket
+import threading
+
+import oci
+from oci.auth.security_token_container import SecurityTokenContainer
+from oci.auth.signers.security_token_signer import X509FederationClientBasedSecurityTokenSigner
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+
+from .token_cache import TokenCache
+
+INSTANCE_PRINCIPAL_CACHE_CATEGORY = 'instance_principal'
+
+# Cached tokens are refreshed this many seconds before they expire, so that a command started with a cached token
+# does not need to refresh it part way through
+TOKEN_EXPIRY_MARGIN_SECONDS = 5 * 60
+
+
+def get_instance_principals_signer(signer_kwargs, delegation_token=None):
+    """Returns a signer for instance principals authentication whose security token comes from the token cache.
+
+    The metadata service and the federation endpoint are only called when there is no cached token, or the cached token
+    is about to expire.
+    """
+    federation_client = CachedFederationClient(signer_kwargs)
+    return CachedInstancePrincipalsSecurityTokenSigner(federation_client, delegation_token=delegation_token)
+
+
+def is_token_valid(token, jitter=TOKEN_EXPIRY_MARGIN_SECONDS):
+    try:
+        return SecurityTokenContainer(None, token).valid_with_jitter(jitter)
+    except Exception:
+        return False
+
+
+class StaticSessionKeySupplier(object):
+    def __init__(self, private_key):
+        self.private_key = private_key
+
+    def get_key_pair(self):
+        return {'private': self.private_key, 'public': self.private_key.public_key()}
+
+
+class CachedFederationClient(object):
+    """Stands in for the X509FederationClient used by the SDK's instance principals signers.
+
+    The security token and the session key it was issued for are read from the token cache. When they need to be
+    refreshed a new token is fetched by an SDK InstancePrincipalsSecurityTokenSigner and written back to the cache.
+
+    Cached tokens are keyed by the host name of the instance as well as the federation endpoint, so a cache directory
+    shared between instances (e.g. a home directory on a shared file system) does not give one instance another's token.
+    The host name is used rather than the instance OCID as it is known without calling the metadata service, which is
+    only called when there is no cached token.
+    """
+
+    def __init__(self, signer_kwargs):
+        self.signer_kwargs = signer_kwargs
+        self.cache_key = {
+            'host': socket.gethostname(),
+            'federation_endpoint': signer_kwargs.get('federation_endpoint'),
+            'cert_bundle': signer_kwargs.get('federation_client_cert_bundle_verify')
+        }
+        self._refresh_lock = threading.Lock()
+        self._load_entry(self._get_entry())
+
+    def get_security_token(self):
+        if is_token_valid(self.security_token, jitter=SecurityTokenContainer.DEFAULT_EXPIRY_JITTER_SECONDS):
+            return self.security_token
+
+        return self.refresh_security_token()
+
+    def refresh_security_token(self):
+        with self._refresh_lock:
+            self._load_entry(self._get_entry(stale_token=self.security_token))
+            return self.security_token
+
+    def _get_entry(self, stale_token=None):
+        def is_valid(entry):
+            return entry.get('token') != stale_token and is_token_valid(entry.get('token'))
+
+        return TokenCache().get(INSTANCE_PRINCIPAL_CACHE_CATEGORY, self.cache_key, self._fetch_entry, is_valid)
+
+    def _fetch_entry(self):
+        signer = oci.auth.signers.InstancePrincipalsSecurityTokenSigner(**self.signer_kwargs)
+        private_key = signer.federation_client.session_key_supplier.get_key_pair()['private']
+        return {
+            'token': signer.federation_client.get_security_token(),
+            'private_key': private_key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()).decode('ascii'),
+            'region': signer.region,
+            'tenancy_id': signer.tenancy_id
+        }
+
+    def _load_entry(self, entry):
+        self.security_token = entry['token']
+        self.session_key_supplier = StaticSessionKeySupplier(serialization.load_pem_private_key(entry['private_key'].encode('ascii'), password=None, backend=default_backend()))
+        self.region = entry['region']
+        self.tenancy_id = entry['tenancy_id']
+
+
+class CachedInstancePrincipalsSecurityTokenSigner(X509FederationClientBasedSecurityTokenSigner):
+    """An instance principals signer backed by a CachedFederationClient.
+
+    If a delegation token is given, requests are made on behalf of the user it was issued for, as with the SDK's
+    InstancePrincipalsDelegationTokenSigner.
+    """
+
+    def __init__(self, federation_client, delegation_token=None):
+        self.region = federation_client.region
+        self.tenancy_id = federation_client.tenancy_id
+        self.delegation_token = delegation_token
+
+        generic_headers = ["date", "(request-target)", "host"]
+        if delegation_token:
+            generic_headers.append("opc-obo-token")
+
+        super(CachedInstancePrincipalsSecurityTokenSigner, self).__init__(federation_client, generic_headers=generic_headers)
+
+    def initialize_and_return_region(self):
+        return self.region
+
+    def do_request_sign(self, request, enforce_content_headers=True):
+        if self.delegation_token:
+            request.headers['opc-obo-token'] = self.delegation_token
+
+        return super(CachedInstancePrincipalsSecurityTokenSigner, self).do_request_sign(request, enforce_content_headers=enforce_content_headers)
@@ -3,6 +3,9 @@
 
 from .cli_root import cli
 from . import cli_session  # noqa: F401,E402
+from . import cli_batch  # noqa: F401
+from . import cli_daemon  # noqa: F401
+from . import cli_token_cache  # noqa: F401
 from . import cli_setup  # noqa: F401
 from . import cli_setup_bootstrap  # noqa: F401
 from . import raw_request_cli  # noqa: F401
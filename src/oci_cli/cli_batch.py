@@ -0,0 +1,193 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+from __future__ import print_function
+from .cli_root import cli
+from . import cli_util
+
+import click
+import io
+import json
+import shlex
+import six
+import sys
+import threading
+import traceback
+
+from timeit import default_timer as timer
+
+# Sentinel put on the work queue to tell a worker thread to exit
+_STOP = object()
+
+
+@cli.group('batch', help="""Commands for running many CLI commands in a single process.""")
+@cli_util.help_option_group
+def batch_group():
+    pass
+
+
+@batch_group.command('run', help="""Runs the CLI commands in a file, one command per line, in a single process and on a bounded pool of threads. Clients are built once per service and configuration and shared between the commands.
+
+Each line is parsed with shell quoting rules and may optionally start with "oci". Blank lines and lines starting with # are ignored. Each line is a complete command, so options given to "oci batch run" itself (such as --profile) are not applied to it. Commands which prompt for input are not supported.
+
+One JSON object is written per line as each command completes, so results are not necessarily in the order of the file. Each object contains the line number, the command, its status, exit code, duration, and its output and error output. Output which is valid JSON is included as JSON, otherwise it is included as a string. The exit code is non-zero if any command failed.""")
+@cli_util.option('--file', 'input_file', required=True, type=click.File('r'), help="""The file containing the commands to run. Use - to read the commands from stdin.""")
+@cli_util.option('--parallelism', type=click.IntRange(min=1), default=10, show_default=True, help="""The number of commands to run at the same time.""")
+@cli_util.help_option
+@click.pass_context
+@cli_util.wrap_exceptions
+def run(ctx, input_file, parallelism):
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = ThreadLocalStream(stdout, 0), ThreadLocalStream(stderr, 1)
+    try:
+        failed_count = run_commands(iter_commands(input_file), parallelism, stdout)
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+
+    if failed_count:
+        sys.exit(1)
+
+
+def iter_commands(input_file):
+    """Yields (line number, command line) for each command in the file. Commands are read as they are needed so that
+    a long running producer can stream them in through stdin."""
+    for line_number, line in enumerate(input_file, start=1):
+        line = line.strip()
+        if line and not line.startswith('#'):
+            yield line_number, line
+
+
+def run_commands(commands, parallelism, output):
+    """Runs the commands on a pool of worker threads and writes a result record to output for each one.
+
+    Returns the number of commands which failed.
+    """
+    work_queue = six.moves.queue.Queue(maxsize=parallelism * 2)
+    output_lock = threading.Lock()
+    failed = []
+
+    def worker():
+        while True:
+            item = work_queue.get()
+            if item is _STOP:
+                return
+
+            line_number, command_line = item
+            record = run_command(line_number, command_line)
+            with output_lock:
+                if record['status'] != 'succeeded':
+                    failed.append(line_number)
+                output.write(json.dumps(record) + '\n')
+                output.flush()
+
+    workers = [threading.Thread(target=worker) for _ in range(parallelism)]
+    for thread in workers:
+        thread.daemon = True
+        thread.start()
+
+    try:
+        for item in commands:
+            work_queue.put(item)
+    finally:
+        for _ in workers:
+            work_queue.put(_STOP)
+        for thread in workers:
+            thread.join()
+
+    return len(failed)
+
+
+def run_command(line_number, command_line):
+    """Runs a single command line in process with its output captured, and returns its result record."""
+    command_stdout = io.TextIOWrapper(io.BytesIO(), encoding='utf-8')
+    command_stderr = io.TextIOWrapper(io.BytesIO(), encoding='utf-8')
+
+    start = timer()
+    try:
+        args = shlex.split(command_line)
+    except ValueError as e:
+        command_stderr.write('Unable to parse command: {}\n'.format(str(e)))
+        return build_result_record(line_number, command_line, 2, timer() - start, command_stdout, command_stderr)
+
+    if args and args[0] == 'oci':
+        args = args[1:]
+
+    ThreadLocalStream.redirect(command_stdout, command_stderr)
+    try:
+        cli.main(args=args, prog_name='oci')
+        exit_code = 0
+    except SystemExit as e:
+        exit_code = cli_util.get_exit_code(e)
+    except Exception:
+        traceback.print_exc(file=sys.stderr)
+        exit_code = 1
+    finally:
+        ThreadLocalStream.reset()
+
+    return build_result_record(line_number, command_line, exit_code, timer() - start, command_stdout, command_stderr)
+
+
+def build_result_record(line_number, command_line, exit_code, duration, command_stdout, command_stderr):
+    return {
+        'line': line_number,
+        'command': command_line,
+        'status': 'succeeded' if exit_code == 0 else 'failed',
+        'exit-code': exit_code,
+        'duration-seconds': round(duration, 3),
+        'output': parse_output(get_captured_text(command_stdout)),
+        'error': get_captured_text(command_stderr)
+    }
+
+
+def get_captured_text(stream):
+    stream.flush()
+    return stream.buffer.getvalue().decode('utf-8', 'replace')
+
+
+def parse_output(text):
+    if not text.strip():
+        return None
+
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+class ThreadLocalStream(object):
+    """Stands in for sys.stdout or sys.stderr so that each thread running a command captures its own output.
+
+    Threads which are not running a command write to the original stream.
+    """
+
+    _local = threading.local()
+
+    def __init__(self, default_stream, index):
+        self._default_stream = default_stream
+
+        # 0 for stdout and 1 for stderr
+        self._index = index
+
+    @classmethod
+    def redirect(cls, stdout, stderr):
+        cls._local.streams = (stdout, stderr)
+
+    @classmethod
+    def reset(cls):
+        cls._local.streams = None
+
+    def _get_stream(self):
+        streams = getattr(self._local, 'streams', None)
+        if streams is None:
+            return self._default_stream
+
+        return streams[self._index]
+
+    def __getattr__(self, name):
+        return getattr(self._get_stream(), name)
+
+    def write(self, data):
+        return self._get_stream().write(data)
+
+    def flush(self):
+        return self._get_stream().flush()
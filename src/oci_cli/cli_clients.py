@@ -1,12 +1,14 @@
 # coding: utf-8
 # Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
 
+import importlib
 import os
 import pkgutil
 from os.path import abspath
 from inspect import getsourcefile
-CLIENT_MAP = {}
-MODULE_TO_TYPE_MAPPINGS = {}
+
+from . import service_index
+
 ALL_SERVICES_DIR = "services"
 
 this_file_path = abspath(getsourcefile(lambda: 0))
@@ -16,16 +18,38 @@ else:
     python_cli_root_dir = this_file_path[0:this_file_path.index("/src/oci_cli")]
 services_dir = os.path.join(python_cli_root_dir, ALL_SERVICES_DIR)
 
-# Import client mappings from platformization directories.
-# This imports the generated client_mappings which populates CLIENT_MAP and MODULE_TO_TYPE_MAPPINGS.
-for importer1, modname1, ispkg1 in pkgutil.iter_modules(path=[services_dir]):
-    for importer, modname, ispkg in pkgutil.iter_modules(path=[services_dir + '/' + modname1 + '/src']):
-        if ispkg and modname.startswith("oci_cli_"):
-            oci_cli_module_name = modname.split(".")[0]
-            service_name = oci_cli_module_name[8:]
-            oci_cli_module = __import__(ALL_SERVICES_DIR + '.' + modname1 + '.src.' + oci_cli_module_name)
-            services_dir = oci_cli_module.__path__[0]
-            service_dir = os.path.join(services_dir, modname1, 'src', oci_cli_module_name)
-            generated_module = "client_mappings"
-            if os.path.isfile(os.path.join(service_dir, 'generated', generated_module + ".py")):
-                __import__(ALL_SERVICES_DIR + '.' + modname1 + '.src.' + oci_cli_module_name + ".generated." + generated_module)
+
+def load_all_client_mappings():
+    # Import client mappings from platformization directories.
+    # This imports the generated client_mappings which populates CLIENT_MAP and MODULE_TO_TYPE_MAPPINGS.
+    for importer1, modname1, ispkg1 in pkgutil.iter_modules(path=[services_dir]):
+        for importer, modname, ispkg in pkgutil.iter_modules(path=[services_dir + '/' + modname1 + '/src']):
+            if ispkg and modname.startswith("oci_cli_"):
+                oci_cli_module_name = modname.split(".")[0]
+                service_dir = os.path.join(services_dir, modname1, 'src', oci_cli_module_name)
+                generated_module = "client_mappings"
+                if os.path.isfile(os.path.join(service_dir, 'generated', generated_module + ".py")):
+                    importlib.import_module(ALL_SERVICES_DIR + '.' + modname1 + '.src.' + oci_cli_module_name + ".generated." + generated_module)
+
+
+class LazyServiceMapping(dict):
+    """A dictionary which is populated by a service's generated client_mappings module the first time one of
+    the service's keys is looked up, rather than importing the client mappings for every service up front."""
+
+    def __init__(self, mapping_modules):
+        super(LazyServiceMapping, self).__init__()
+        self.mapping_modules = mapping_modules
+
+    def __missing__(self, key):
+        if key in self.mapping_modules:
+            importlib.import_module(self.mapping_modules[key])
+
+        if not dict.__contains__(self, key):
+            # The key may be missing from a stale service index, so fall back to loading everything
+            load_all_client_mappings()
+
+        return dict.__getitem__(self, key)
+
+
+CLIENT_MAP = LazyServiceMapping(service_index.CLIENT_MAPPINGS_MODULES)
+MODULE_TO_TYPE_MAPPINGS = LazyServiceMapping(service_index.TYPE_MAPPINGS_MODULES)
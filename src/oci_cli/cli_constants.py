@@ -3,6 +3,8 @@
 
 CLI_RC_FALLBACK_LOCATION = '~/.oci/cli-defaults'
 CLI_RC_DEFAULT_LOCATION = '~/.oci/oci_cli_rc'
+TOKEN_CACHE_DEFAULT_LOCATION = '~/.oci/token-cache'
+QUERY_CACHE_DEFAULT_LOCATION = '~/.oci/query-cache.json'
 CLI_RC_CANNED_QUERIES_SECTION_NAME = 'OCI_CLI_CANNED_QUERIES'
 CLI_RC_COMMAND_ALIASES_SECTION_NAME = 'OCI_CLI_COMMAND_ALIASES'
 CLI_RC_PARAM_ALIASES_SECTION_NAME = 'OCI_CLI_PARAM_ALIASES'
@@ -11,6 +13,9 @@ CLI_RC_GENERIC_SETTINGS_SECTION_NAME = 'OCI_CLI_SETTINGS'
 OCI_CLI_PROFILE_ENV_VAR = 'OCI_CLI_PROFILE'
 CLI_RC_GENERIC_SETTINGS_DEFAULT_PROFILE_KEY = 'default_profile'
 CLI_RC_GENERIC_SETTINGS_USE_CLICK_HELP = 'use_click_help'
+CLI_RC_GENERIC_SETTINGS_PAGE_PREFETCH_DEPTH = 'page_prefetch_depth'
+CLI_RC_GENERIC_SETTINGS_RAW_JSON = 'raw_json'
+CLI_RC_GENERIC_SETTINGS_OUTPUT_SAMPLE_ROWS = 'output_sample_rows'
 
 OCI_CLI_AUTH_ENV_VAR = 'OCI_CLI_AUTH'
 OCI_CLI_AUTH_INSTANCE_PRINCIPAL = 'instance_principal'
@@ -30,6 +35,9 @@ OCI_CLI_CERT_BUNDLE_ENV_VAR = 'OCI_CLI_CERT_BUNDLE'
 OCI_CLI_DELEGATION_TOKEN_FILE_ENV_VAR = 'OCI_CLI_DELEGATION_TOKEN_FILE'
 OCI_CLI_SECURITY_TOKEN_FILE_ENV_VAR = 'OCI_CLI_SECURITY_TOKEN_FILE'
 OCI_CLI_ENDPOINT_ENV_VAR = 'OCI_CLI_ENDPOINT'
+OCI_CLI_TOKEN_CACHE_DIR_ENV_VAR = 'OCI_CLI_TOKEN_CACHE_DIR'
+OCI_CLI_PAGE_PREFETCH_DEPTH_ENV_VAR = 'OCI_CLI_PAGE_PREFETCH_DEPTH'
+OCI_CLI_QUERY_CACHE_FILE_ENV_VAR = 'OCI_CLI_QUERY_CACHE_FILE'
 
 OCI_CONFIG_ENV_VARS = {
     OCI_CLI_USER_ENV_VAR: 'user',
@@ -48,3 +56,13 @@ OCI_CLI_PARAM_TO_ENV_MAP = {
 }
 
 MEBIBYTE = 1024 * 1024
+
+# The number of pages fetched ahead of the page being processed by list commands run with --all
+DEFAULT_PAGE_PREFETCH_DEPTH = 2
+
+# The number of items used to choose the columns and column widths when list commands run with --all write csv, tsv or
+# table output as the pages are received
+DEFAULT_OUTPUT_SAMPLE_ROWS = 1000
+
+# The size of the reads made when calculating the checksum of a file
+CHECKSUM_READ_SIZE = MEBIBYTE
@@ -0,0 +1,360 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+from __future__ import print_function
+from .cli_root import cli
+from . import cli_util
+from . import client_cache
+from . import service_loader
+from .aliasing import parameter_alias
+
+import click
+import errno
+import io
+import json
+import logging
+import os
+import six
+import socket
+import stat
+import struct
+import sys
+import time
+import traceback
+
+from oci import config
+
+import oci_cli_daemon_shim as daemon_protocol
+
+SOCKET_FILE_HELP = """The Unix domain socket the daemon listens on. Defaults to the value of the {} environment variable, or {} if that is not set.""".format(daemon_protocol.DAEMON_SOCKET_ENV_VAR, daemon_protocol.DEFAULT_SOCKET_FILE)
+
+STDOUT_BUFFER_SIZE = 64 * 1024
+
+# The daemon whose run_command is running the current command, if any. Daemon commands sent through the shim are
+# answered from it directly, as the daemon handles one connection at a time and so could never answer itself
+running_daemon = None
+
+
+@cli.group('daemon', help="""Commands for running the CLI as a long lived process.
+
+A running daemon keeps the CLI, its service modules and the clients built from your configuration loaded, so commands sent to it through the oci-shim entry point (or "python -m oci_cli_daemon_shim") avoid the cost of starting the CLI for every invocation. Clients are rebuilt when your config file or key files change. Commands which prompt for a private key passphrase are not supported through the daemon.
+
+A daemon runs one command at a time: commands sent to it while it is running another wait until that command has finished.""")
+@cli_util.help_option_group
+def daemon_group():
+    pass
+
+
+@daemon_group.command('start', help="""Starts a daemon which runs CLI commands sent to it over a Unix domain socket. The socket is only accessible by the current user.""")
+@cli_util.option('--socket-file', help=SOCKET_FILE_HELP)
+@cli_util.option('--foreground', is_flag=True, help="""Run the daemon in the foreground instead of detaching it from the terminal.""")
+@cli_util.help_option
+@click.pass_context
+@cli_util.wrap_exceptions
+def start(ctx, socket_file, foreground):
+    if not hasattr(socket, 'AF_UNIX'):
+        click.echo(click.style('The CLI daemon is not supported on this platform.', fg='red'), file=sys.stderr)
+        sys.exit(1)
+
+    if running_daemon:
+        click.echo(click.style('A CLI daemon cannot be started by a command run by a daemon', fg='red'), file=sys.stderr)
+        sys.exit(1)
+
+    socket_file = daemon_protocol.get_socket_file(socket_file)
+    if get_daemon_status(socket_file):
+        click.echo(click.style('A CLI daemon is already listening on {}'.format(socket_file), fg='red'), file=sys.stderr)
+        sys.exit(1)
+
+    server_socket = create_server_socket(socket_file)
+    if not foreground:
+        if not daemonize():
+            server_socket.close()
+            click.echo('Started CLI daemon listening on {}'.format(socket_file))
+            return
+    else:
+        click.echo('CLI daemon listening on {}'.format(socket_file), file=sys.stderr)
+
+    CliDaemon(server_socket, socket_file).serve_forever()
+
+
+@daemon_group.command('stop', help="""Stops a running daemon.""")
+@cli_util.option('--socket-file', help=SOCKET_FILE_HELP)
+@cli_util.help_option
+@click.pass_context
+@cli_util.wrap_exceptions
+def stop(ctx, socket_file):
+    socket_file = daemon_protocol.get_socket_file(socket_file)
+    if not send_control_command(socket_file, 'stop'):
+        click.echo(click.style('No CLI daemon is listening on {}'.format(socket_file), fg='red'), file=sys.stderr)
+        sys.exit(1)
+
+    click.echo('Stopped CLI daemon listening on {}'.format(socket_file))
+
+
+@daemon_group.command('status', help="""Shows whether a daemon is running, and if so how many commands it has run and how many clients it has cached.""")
+@cli_util.option('--socket-file', help=SOCKET_FILE_HELP)
+@cli_util.help_option
+@click.pass_context
+@cli_util.wrap_exceptions
+def status(ctx, socket_file):
+    socket_file = daemon_protocol.get_socket_file(socket_file)
+    daemon_status = get_daemon_status(socket_file)
+    if not daemon_status:
+        click.echo(click.style('No CLI daemon is listening on {}'.format(socket_file), fg='red'), file=sys.stderr)
+        sys.exit(1)
+
+    cli_util.render(daemon_status, None, ctx, display_all_headers=True)
+
+
+def send_control_command(socket_file, command):
+    """Sends a control command to the daemon listening on socket_file. Returns None if there is no daemon."""
+    if running_daemon and os.path.abspath(socket_file) == os.path.abspath(running_daemon.socket_file):
+        return running_daemon.control(command)
+
+    try:
+        sock = daemon_protocol.connect(socket_file)
+    except (IOError, OSError):
+        return None
+
+    try:
+        daemon_protocol.send_json(sock, daemon_protocol.MESSAGE_CONTROL, {'command': command})
+        message_type, payload = daemon_protocol.recv_message(sock)
+        if message_type != daemon_protocol.MESSAGE_CONTROL_RESPONSE:
+            return None
+
+        return json.loads(payload.decode('utf-8'))
+    finally:
+        sock.close()
+
+
+def get_daemon_status(socket_file):
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+
+    return send_control_command(socket_file, 'status')
+
+
+def create_server_socket(socket_file):
+    socket_dir = os.path.dirname(socket_file)
+    if not os.path.isdir(socket_dir):
+        os.makedirs(socket_dir, 0o700)
+
+    # Nothing answered on the socket so any file left there is from a daemon which didn't shut down cleanly
+    if os.path.exists(socket_file):
+        if not stat.S_ISSOCK(os.stat(socket_file).st_mode):
+            raise click.BadParameter(param_hint='socket_file', message='{} exists and is not a socket'.format(socket_file))
+        os.remove(socket_file)
+
+    server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        server_socket.bind(socket_file)
+    finally:
+        os.umask(old_umask)
+
+    os.chmod(socket_file, 0o600)
+    server_socket.listen(16)
+    return server_socket
+
+
+def daemonize():
+    """Detaches the current process from the terminal. Returns True in the daemon and False in the original process."""
+    pid = os.fork()
+    if pid > 0:
+        os.waitpid(pid, 0)
+        return False
+
+    os.setsid()
+    if os.fork() > 0:
+        os._exit(0)
+
+    os.chdir('/')
+    with open(os.devnull, 'r+b') as devnull:
+        for fd in [0, 1, 2]:
+            os.dup2(devnull.fileno(), fd)
+
+    return True
+
+
+class MessageWriter(io.RawIOBase):
+    """Sends everything written to it to the client as messages of a single type."""
+
+    def __init__(self, sock, message_type, isatty):
+        self.sock = sock
+        self.message_type = message_type
+        self._isatty = isatty
+
+    def writable(self):
+        return True
+
+    def isatty(self):
+        return self._isatty
+
+    def write(self, b):
+        data = bytes(b)
+        if data:
+            daemon_protocol.send_message(self.sock, self.message_type, data)
+        return len(data)
+
+
+class StdinReader(io.RawIOBase):
+    """Reads stdin from the client. Data is only requested from the client when the command reads from stdin."""
+
+    def __init__(self, sock, isatty):
+        self.sock = sock
+        self._isatty = isatty
+        self.eof = False
+
+    def readable(self):
+        return True
+
+    def isatty(self):
+        return self._isatty
+
+    def readinto(self, b):
+        if self.eof:
+            return 0
+
+        daemon_protocol.send_message(self.sock, daemon_protocol.MESSAGE_STDIN_REQUEST, str(len(b)).encode('ascii'))
+        message_type, payload = daemon_protocol.recv_message(self.sock)
+        if message_type != daemon_protocol.MESSAGE_STDIN or not payload:
+            self.eof = True
+            return 0
+
+        b[:len(payload)] = payload
+        return len(payload)
+
+
+class CliDaemon(object):
+    def __init__(self, server_socket, socket_file):
+        self.server_socket = server_socket
+        self.socket_file = socket_file
+        self.socket_file_inode = os.stat(socket_file).st_ino
+        self.start_time = time.time()
+        self.requests_served = 0
+        self.running = False
+
+    def serve_forever(self):
+        service_loader.load_all_services()
+
+        self.running = True
+        try:
+            # Connections are handled one at a time, so concurrent callers of the shim are served in turn
+            while self.running:
+                conn, _ = self.server_socket.accept()
+                try:
+                    if self.is_same_user(conn):
+                        self.handle_connection(conn)
+                except (IOError, OSError, EOFError):
+                    # The client went away part way through a command
+                    pass
+                finally:
+                    conn.close()
+        finally:
+            self.server_socket.close()
+            self.remove_socket_file()
+
+    def is_same_user(self, conn):
+        # The socket file is only accessible by the current user. Where the platform supports it, also check the
+        # credentials of the connecting process in case the socket was created in a directory others can read.
+        if not hasattr(socket, 'SO_PEERCRED'):
+            return True
+
+        creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+        _, uid, _ = struct.unpack('3i', creds)
+        return uid == os.getuid()
+
+    def remove_socket_file(self):
+        try:
+            if os.stat(self.socket_file).st_ino == self.socket_file_inode:
+                os.remove(self.socket_file)
+        except OSError as e:
+            if e.errno != errno.ENOENT:
+                raise
+
+    def handle_connection(self, conn):
+        message_type, payload = daemon_protocol.recv_message(conn)
+        if message_type == daemon_protocol.MESSAGE_CONTROL:
+            self.handle_control(conn, json.loads(payload.decode('utf-8')))
+        elif message_type == daemon_protocol.MESSAGE_REQUEST:
+            exit_code = self.run_command(conn, json.loads(payload.decode('utf-8')))
+            self.requests_served += 1
+            daemon_protocol.send_json(conn, daemon_protocol.MESSAGE_EXIT, {'exit_code': exit_code})
+
+    def handle_control(self, conn, request):
+        daemon_protocol.send_json(conn, daemon_protocol.MESSAGE_CONTROL_RESPONSE, self.control(request.get('command')))
+
+    def control(self, command):
+        """Runs a control command and returns the status of the daemon. A stopped daemon exits once the connection it is
+        handling has finished."""
+        if command == 'stop':
+            self.running = False
+
+        return {
+            'pid': os.getpid(),
+            'socket-file': self.socket_file,
+            'uptime-seconds': int(time.time() - self.start_time),
+            'commands-run': self.requests_served,
+            'cached-clients': client_cache.size()
+        }
+
+    def run_command(self, conn, request):
+        """Runs a CLI command in this process with the argv, environment, working directory and streams of the client.
+
+        Commands change process wide state (the standard streams, environment and working directory) while they run, so
+        the daemon only ever runs one at a time."""
+        global running_daemon
+        argv = request['argv']
+        stdout = io.TextIOWrapper(io.BufferedWriter(MessageWriter(conn, daemon_protocol.MESSAGE_STDOUT, request.get('stdout_isatty', False)), STDOUT_BUFFER_SIZE), encoding='utf-8')
+        stderr = io.TextIOWrapper(io.BufferedWriter(MessageWriter(conn, daemon_protocol.MESSAGE_STDERR, request.get('stderr_isatty', False))), encoding='utf-8', line_buffering=True)
+        stdin = io.TextIOWrapper(io.BufferedReader(StdinReader(conn, request.get('stdin_isatty', False))), encoding='utf-8')
+
+        saved_argv, saved_streams = sys.argv, (sys.stdin, sys.stdout, sys.stderr)
+        saved_environ, saved_cwd = dict(os.environ), os.getcwd()
+
+        # Running a command can change some global state (for example --endpoint removes region from the required
+        # config keys and --debug turns on HTTP logging), so put it back afterwards
+        saved_config_required = set(config.REQUIRED)
+        saved_http_debuglevel = six.moves.http_client.HTTPConnection.debuglevel
+        log_handlers = [handler for handler in logging.getLogger().handlers if isinstance(handler, logging.StreamHandler)]
+        saved_log_streams = [handler.stream for handler in log_handlers]
+
+        exit_code = 0
+        try:
+            running_daemon = self
+            sys.argv = ['oci'] + argv
+            sys.stdin, sys.stdout, sys.stderr = stdin, stdout, stderr
+            os.environ.clear()
+            os.environ.update(request.get('env', {}))
+            os.chdir(request.get('cwd', saved_cwd))
+            for handler in log_handlers:
+                handler.stream = stderr
+            parameter_alias.ALIASES = {}
+
+            try:
+                cli.main(args=argv, prog_name='oci')
+            except SystemExit as e:
+                exit_code = cli_util.get_exit_code(e)
+            except Exception:
+                traceback.print_exc(file=stderr)
+                exit_code = 1
+        finally:
+            for stream in [stdout, stderr]:
+                try:
+                    stream.flush()
+                except ValueError:
+                    pass
+
+            running_daemon = None
+            sys.argv = saved_argv
+            sys.stdin, sys.stdout, sys.stderr = saved_streams
+            os.environ.clear()
+            os.environ.update(saved_environ)
+            os.chdir(saved_cwd)
+            config.REQUIRED.clear()
+            config.REQUIRED.update(saved_config_required)
+            six.moves.http_client.HTTPConnection.debuglevel = saved_http_debuglevel
+            for handler, stream in zip(log_handlers, saved_log_streams):
+                handler.stream = stream
+
+        return exit_code
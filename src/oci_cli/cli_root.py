@@ -12,7 +12,8 @@ import six
 import importlib
 
 from .version import __version__
-from .aliasing import parameter_alias, CommandGroupWithAlias
+from .aliasing import parameter_alias
+from .service_loader import LazyServiceCommandGroup
 from . import help_text_producer
 from . import cli_util
 
@@ -174,10 +175,11 @@ def populate_parameter_aliases(ctx, parser_without_defaults):
     ctx.obj['parameter_aliases'] = canonical_param_to_alias
 
     parameter_alias.ALIASES = canonical_param_to_alias
+    parameter_alias.remove_redundant_aliases()
 
-    collisions = set()
-    collisions.update(parameter_alias.shim_in_aliases(ctx.command))
-    collisions.update(parameter_alias.add_alias_to_command_params(ctx.command.params))
+    # Only the root options get their aliases here. The options of other commands get theirs as each command
+    # on the invoked path is resolved (see final_command_processor.prepare_command)
+    collisions = parameter_alias.add_alias_to_command_params(ctx.command.params)
 
     if len(collisions) > 0:
         click.echo(click.style('\n'.join(collisions), fg='red'), file=sys.stderr)
@@ -199,7 +201,7 @@ def get_section_without_defaults(parser_without_defaults, section_name):
     return parser_without_defaults.items(section_name)
 
 
-@click.command(name='oci', cls=CommandGroupWithAlias, invoke_without_command=True,
+@click.command(name='oci', cls=LazyServiceCommandGroup, invoke_without_command=True,
                context_settings=dict(allow_interspersed_args=True, ignore_unknown_options=True),
                help="""Oracle Cloud Infrastructure command line interface, with support for Audit, Block Volume,
 Compute, Database, IAM, Load Balancing, Networking, DNS, File Storage, Email Delivery and Object Storage Services.
@@ -228,7 +230,7 @@ For information on configuration, see https://docs.cloud.oracle.com/Content/API/
 @click.option('--region', callback=read_values_from_env, help='The region to make calls against.  For a list of valid region names use the command: "oci iam region list".')
 @click.option('--endpoint', callback=read_values_from_env, help='The value to use as the service endpoint, including any required API version path. For example: "https://iaas.us-phoenix-1.oracle.com/20160918". This will override the default service endpoint / API version path. Note: The --region parameter is the recommended way of targeting different regions.')
 @click.option('--cert-bundle', callback=read_values_from_env, help='The full path to a CA certificate bundle to be used for SSL verification. This will override the default CA certificate bundle.')
-@click.option('--output', type=click.Choice(choices=['json', 'table']), help='The output format. [Default is json]')
+@click.option('--output', type=click.Choice(choices=['json', 'json-compact', 'table', 'ndjson', 'csv', 'tsv']), help='The output format. json-compact writes JSON without whitespace, with keys in the order they were received. ndjson writes one json-compact document per line for each item in a list. csv and tsv write a header line followed by a line for each item. With ndjson, csv, tsv and table output, list commands run with --all write the items of each page as soon as it is received, taking the columns and column widths from the first items (see output_sample_rows in the oci_cli_rc file). [Default is json]')
 @click.option('--query', help="""JMESPath query [http://jmespath.org/] to run on the response JSON before output.
 
 Queries can be entered directly on the command line or referenced from the [OCI_CLI_COMMAND_ALIASES] section of your configuration file by using the syntax query://<query_name>, for example query://get_id_and_name
@@ -241,11 +243,12 @@ This JSON document can be saved to a file, modified with the appropriate option
 @click.option('--generate-param-json-input', is_eager=True, help="""Complex input, such as arrays and objects, are passed in JSON format.
 
 When passed the name of an option which takes complex input, this will print out example JSON of what needs to be passed to that option.""")
+@click.option('--raw-json', is_flag=True, help='Convert the JSON returned by get and list commands directly to the output, without building SDK models. This can also be turned on with raw_json = True in the OCI_CLI_SETTINGS section of the oci_cli_rc file.')
 @click.option('--no-retry', is_flag=True, help='Disable retry logic for calls to services.')
 @click.option('-d', '--debug', is_flag=True, help='Show additional debug information.')
 @click.option('-?', '-h', '--help', is_flag=True, help='For detailed help on the individual OCI CLI command, enter <command> --help.')
 @click.pass_context
-def cli(ctx, config_file, profile, defaults_file, request_id, region, endpoint, cert_bundle, output, query, raw_output, auth, generate_full_command_json_input, generate_param_json_input, no_retry, debug, help):
+def cli(ctx, config_file, profile, defaults_file, request_id, region, endpoint, cert_bundle, output, query, raw_output, auth, generate_full_command_json_input, generate_param_json_input, raw_json, no_retry, debug, help):
     if sys.version_info[0] < 3 and not os.environ.get("SUPPRESS_PYTHON2_WARNING"):
         click.echo(click.style(PYTHON2_DEPRECATION_NOTICE, fg='red'), file=sys.stderr)
 
@@ -293,6 +296,7 @@ def cli(ctx, config_file, profile, defaults_file, request_id, region, endpoint,
         'generate_param_json_input': generate_param_json_input,
         'debug': debug,
         'no_retry': no_retry,
+        'raw_json': raw_json,
         'auth': auth
     }
 
@@ -0,0 +1,33 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+from .cli_root import cli
+from . import cli_constants
+from . import cli_util
+from .token_cache import TokenCache
+
+import click
+
+
+@cli.group('token-cache', help="""Commands for the on-disk cache of short lived credentials, such as the security tokens used for instance principals authentication.
+
+The cache is stored in {}, or the directory given by the {} environment variable. The cached credentials are written to files only the current user can read, in a directory only the current user can access if the CLI creates it. The entries are also encrypted, but the key is kept in the same directory, so anyone who can read the directory can read the credentials.""".format(cli_constants.TOKEN_CACHE_DEFAULT_LOCATION, cli_constants.OCI_CLI_TOKEN_CACHE_DIR_ENV_VAR))
+@cli_util.help_option_group
+def token_cache_group():
+    pass
+
+
+@token_cache_group.command('metrics', help="""Shows the number of times each kind of cached credential was reused (hits) and fetched (misses).""")
+@cli_util.help_option
+@click.pass_context
+@cli_util.wrap_exceptions
+def metrics(ctx):
+    cli_util.render(TokenCache().get_metrics(), None, ctx)
+
+
+@token_cache_group.command('clear', help="""Removes all cached credentials and the cache metrics.""")
+@cli_util.help_option
+@click.pass_context
+@cli_util.wrap_exceptions
+def clear(ctx):
+    TokenCache().clear()
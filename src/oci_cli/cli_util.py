@@ -45,6 +45,11 @@ from .version import __version__
 from . import string_utils
 from . import help_text_producer
 from . import cli_constants
+from . import cached_signers
+from . import client_cache
+from . import page_prefetcher
+from . import query_cache
+from . import streaming_output
 
 try:
     # PY3+
@@ -87,6 +92,14 @@ MODULE_TO_TYPE_MAPPINGS = MODULE_TO_TYPE_MAPPINGS
 
 LIST_NOT_ALL_ITEMS_RETURNED_WARNING = "WARNING: This operation supports pagination and not all resources were returned.  Re-run using the --all option to auto paginate and list all resources."
 
+JSON_COMPACT_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
+# The encoded JSON is gathered into writes of at least this many characters
+JSON_COMPACT_WRITE_SIZE = 64 * 1024
+
+# How many levels of nested dicts and lists are written an element at a time by write_json_compact
+JSON_COMPACT_STREAMED_DEPTH = 2
+
 TOKEN_PRESENT_BUT_NOT_USED_FOR_AUTH_WARNING = "WARNING: The active profile contains a value for 'security_token_file' which is not being used. To authenticate using the token, specify --auth {}".format(cli_constants.OCI_CLI_AUTH_SESSION_TOKEN)
 
 logger = logging.getLogger("{}".format(__name__))
@@ -253,13 +266,12 @@ def get_instance_principal_signer(ctx, client_config, delegation_token_auth):
                 raise IOError("ERROR: delegation_token_file not found at " + expanded_delegation_token_location)
             with open(expanded_delegation_token_location, 'r') as delegation_token_file:
                 delegation_token = delegation_token_file.read().strip()
-            signer_kwargs['delegation_token'] = delegation_token
             if delegation_token is None:
                 raise ValueError('ERROR: delegation_token was not provided.')
-            signer = oci.auth.signers.InstancePrincipalsDelegationTokenSigner(**signer_kwargs)
+            signer = cached_signers.get_instance_principals_signer(signer_kwargs, delegation_token=delegation_token)
         else:
             # Normal instance principals
-            signer = oci.auth.signers.InstancePrincipalsSecurityTokenSigner(**signer_kwargs)
+            signer = cached_signers.get_instance_principals_signer(signer_kwargs)
     except (ValueError, IOError) as ex:
         sys.exit(ex)
     except Exception as e:
@@ -367,47 +379,76 @@ def set_request_session_properties_from_context(session, ctx, uses_ssl=True):
             session.proxies = {'http': proxy_to_use}
 
 
-def build_raw_requests_session(ctx):
+def get_config_and_signer(ctx):
+    """Returns the config and signer for the click context, including a signer for API key authentication.
+
+    These are reused by every client built in the process with the same config file, profile and authentication
+    options so that the config file is only parsed and validated, and the private key only loaded, once.
+    """
+    cache_key = client_cache.build_cache_key(None, ctx)
+    cached = client_cache.get(cache_key)
+    if cached:
+        if not ctx.obj['request_id']:
+            ctx.obj['request_id'] = str(uuid.uuid4()).replace('-', '').upper()
+
+        return cached.value
+
     config_and_signer = create_config_and_signer_based_on_click_context(ctx)
-    signer = config_and_signer.signer
     client_config = config_and_signer.config
 
     if 'key_file' in client_config:
         FilePermissionChecker.warn_on_invalid_file_permissions(os.path.expanduser(client_config['key_file']))
 
-    if signer is None and config_and_signer.uses_instance_principals_auth:
-        raise click.ClickException('Invalid configuration detected: instance principals authentication is being used without a created signer')
+    if config_and_signer.signer is None:
+        if config_and_signer.uses_instance_principals_auth:
+            raise click.ClickException('Invalid configuration detected: instance principals authentication is being used without a created signer')
 
-    try:
-        if signer is None:
+        try:
             try:
-                signer = oci.Signer.from_config(client_config)
+                config_and_signer.signer = oci.Signer.from_config(client_config)
             except exceptions.MissingPrivateKeyPassphrase:
                 client_config['pass_phrase'] = prompt_for_passphrase()
-                signer = oci.Signer.from_config(client_config)
+                config_and_signer.signer = oci.Signer.from_config(client_config)
+        except exceptions.InvalidPrivateKey as bad_key:
+            sys.exit(str(bad_key))
 
-        session = requests.Session()
-        session.auth = signer
-        session.headers['opc-request-id'] = ctx.obj['request_id']
-        session.headers['user-agent'] = oci.base_client.build_user_agent(extra=client_config['additional_user_agent'])
-        set_request_session_properties_from_context(session, ctx)
+    client_cache.put(cache_key, config_and_signer, client_config)
 
-        return session
-    except exceptions.InvalidPrivateKey as bad_key:
-        sys.exit(str(bad_key))
+    return config_and_signer
 
 
-def build_client(service_name, ctx):
-    config_and_signer = create_config_and_signer_based_on_click_context(ctx)
+def build_raw_requests_session(ctx):
+    config_and_signer = get_config_and_signer(ctx)
     signer = config_and_signer.signer
     client_config = config_and_signer.config
 
-    kwargs = {}
-    if config_and_signer.signer:
-        kwargs['signer'] = signer
+    session = requests.Session()
+    session.auth = signer
+    session.headers['opc-request-id'] = ctx.obj['request_id']
+    session.headers['user-agent'] = oci.base_client.build_user_agent(extra=client_config['additional_user_agent'])
+    set_request_session_properties_from_context(session, ctx)
+
+    return session
 
-    if 'key_file' in client_config:
-        FilePermissionChecker.warn_on_invalid_file_permissions(os.path.expanduser(client_config['key_file']))
+
+def build_client(service_name, ctx):
+    from . import raw_json
+    use_raw_json = raw_json.is_enabled(ctx)
+
+    cache_key = client_cache.build_cache_key(service_name, ctx, raw_json=use_raw_json)
+    cached = client_cache.get(cache_key)
+    if cached:
+        ctx.obj["config"] = cached.client_config
+        if not ctx.obj['request_id']:
+            ctx.obj['request_id'] = str(uuid.uuid4()).replace('-', '').upper()
+
+        return cached.value
+
+    config_and_signer = get_config_and_signer(ctx)
+    signer = config_and_signer.signer
+    client_config = config_and_signer.config
+
+    kwargs = {'signer': signer}
 
     # Add to ctx for later by the operations.
     ctx.obj["config"] = client_config
@@ -432,15 +473,14 @@ def build_client(service_name, ctx):
         if service_name in SERVICES_REQUIRING_ENDPOINTS:
             kwargs['service_endpoint'] = ctx.obj.get('endpoint')
 
-        try:
-            client = client_class(client_config, **kwargs)
-        except exceptions.MissingPrivateKeyPassphrase:
-            client_config['pass_phrase'] = prompt_for_passphrase()
-            client = client_class(client_config, **kwargs)
+        client = client_class(client_config, **kwargs)
 
         if ctx.obj['endpoint']:
             client.base_client.endpoint = ctx.obj['endpoint']
 
+        if use_raw_json:
+            raw_json.install(client)
+
         cert_bundle = ctx.obj['cert_bundle']
         if cert_bundle:
             cert_bundle = os.path.expanduser(cert_bundle)
@@ -450,6 +490,9 @@ def build_client(service_name, ctx):
             # TODO: Update this once alternate certs are exposed in the SDK.
             client.base_client.session.verify = cert_bundle
 
+        client_cache.share_session(client)
+        client_cache.put(cache_key, client, client_config)
+
         return client
     except exceptions.InvalidPrivateKey as bad_key:
         sys.exit(str(bad_key))
@@ -554,6 +597,39 @@ def render(data, headers, ctx, display_all_headers=False, nest_data_in_data_attr
                 if ctx.obj['debug']:
                     end_format = timer()
                     logger.debug(oci.base_client.utc_now() + 'Time elapsed printing response data: {}'.format(str(end_format - start_format)))
+        elif ctx.obj['output'] == 'json-compact':
+            if ctx.obj['raw_output'] and isinstance(display_data, six.string_types):
+                print(display_data)
+            else:
+                start_format = timer()
+                write_json_compact(display_data, sys.stdout)
+                if ctx.obj['debug']:
+                    end_format = timer()
+                    logger.debug(oci.base_client.utc_now() + 'Time elapsed printing response data: {}'.format(str(end_format - start_format)))
+        elif ctx.obj['output'] == 'ndjson':
+            # As with table output, the items in 'data' are written rather than the top level response object
+            ndjson_data = display_data
+            if not expression and 'data' in display_data:
+                ndjson_data = display_data['data']
+            print_ndjson(ndjson_data)
+
+            if not expression and 'data' in display_dictionary:
+                for key in display_dictionary:
+                    if key != 'data':
+                        click.echo('{}: {}'.format(key, display_dictionary[key]), file=sys.stderr)
+        elif ctx.obj['output'] in ['csv', 'tsv']:
+            delimited_data = display_data
+            if not expression and 'data' in display_data:
+                delimited_data = display_data['data']
+
+            # All of the items are used to choose the columns, as with table output
+            writer = streaming_output.get_writer(ctx.obj['output'], sys.stdout, None)
+            streaming_output.write_all(writer, delimited_data)
+
+            if not expression and 'data' in display_dictionary:
+                for key in display_dictionary:
+                    if key != 'data':
+                        click.echo('{}: {}'.format(key, display_dictionary[key]), file=sys.stderr)
         elif ctx.obj['output'] == 'table':
             table_data = display_data
 
@@ -641,6 +717,64 @@ def print_table(data):
     print(AsciiTable(table_data).table)
 
 
+def write_json_compact(data, stream):
+    """Writes data to the stream as JSON without whitespace, keeping keys in the order they are in the dicts.
+
+    The JSON is written as it is encoded rather than built up as one string, which for large responses would hold a
+    second copy of the response in memory.
+    """
+    chunks = []
+    size = 0
+    for chunk in _iterencode_compact(data, 0):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= JSON_COMPACT_WRITE_SIZE:
+            stream.write(''.join(chunks))
+            chunks = []
+            size = 0
+
+    chunks.append('\n')
+    stream.write(''.join(chunks))
+
+
+def _iterencode_compact(data, depth):
+    # The outer dicts and lists (e.g. the response and its list of items) are encoded an element at a time, and the
+    # elements themselves are encoded in one go by the json module's C encoder, which is much faster than encoding
+    # every value separately
+    if depth < JSON_COMPACT_STREAMED_DEPTH:
+        if isinstance(data, list):
+            yield '['
+            for index, item in enumerate(data):
+                if index:
+                    yield ','
+                for chunk in _iterencode_compact(item, depth + 1):
+                    yield chunk
+            yield ']'
+            return
+        elif isinstance(data, dict) and all(isinstance(key, six.string_types) for key in data):
+            yield '{'
+            for index, (key, value) in enumerate(six.iteritems(data)):
+                yield (',' if index else '') + JSON_COMPACT_ENCODER.encode(key) + ':'
+                for chunk in _iterencode_compact(value, depth + 1):
+                    yield chunk
+            yield '}'
+            return
+
+    yield JSON_COMPACT_ENCODER.encode(data)
+
+
+def print_ndjson(data):
+    if isinstance(data, list):
+        for item in data:
+            print(ndjson_format(item))
+    else:
+        print(ndjson_format(data))
+
+
+def ndjson_format(d):
+    return json.dumps(d, separators=(',', ':'))
+
+
 def build_table_headers(data):
     # data is either a list of dicts or a dict
     # we can build the column headers from all keys on all objects (de-duped)
@@ -663,17 +797,25 @@ def to_dict(obj):
         * Underscores are replaced by hyphens in dictionary
           key only.
     """
+    # Common types are converted by looking up their exact class, which avoids the slower checks in
+    # _to_dict_generic for the bulk of the values in a response
+    converter = _TO_DICT_CONVERTERS.get(obj.__class__)
+    if converter:
+        return converter(obj)
+
+    field_plan = _MODEL_FIELD_PLANS.get(obj.__class__)
+    if field_plan is not None:
+        return _model_to_dict(obj, field_plan)
+
+    return _to_dict_generic(obj)
+
+
+def _to_dict_generic(obj):
     # Shortcut strings so they don't count as Iterables
     if isinstance(obj, six.string_types):
         return obj
     elif isinstance(obj, (datetime.datetime, datetime.time)):
-        # always use UTC
-        if not obj.tzinfo:
-            obj = pytz.utc.localize(obj)
-        if isinstance(obj, datetime.datetime):
-            # only datetime.datetime takes a separator
-            return obj.isoformat(sep="T")
-        return obj.isoformat()
+        return _datetime_to_str(obj)
     elif isinstance(obj, datetime.date):
         # datetime.date doesn't have a timezone
         return obj.isoformat()
@@ -685,16 +827,63 @@ def to_dict(obj):
     elif not hasattr(obj, "swagger_types"):
         return obj
 
-    # Collect attrs from obj according to swagger_types into a dict
+    # Every instance of a model class has the same swagger_types, so work out the attributes to collect and the
+    # keys to output them under once per class
+    field_plan = tuple((key, key.replace("_", "-")) for key in obj.swagger_types)
+    _MODEL_FIELD_PLANS[obj.__class__] = field_plan
+    return _model_to_dict(obj, field_plan)
+
+
+def _model_to_dict(obj, field_plan):
+    # Collect attrs from obj according to its field plan into a dict
     as_dict = {}
-    for key in six.iterkeys(obj.swagger_types):
+    for key, output_key in field_plan:
         value = getattr(obj, key, missing_attr)
-        if value is not missing_attr:
-            key = key.replace("_", "-")
-            as_dict[key] = to_dict(value)
+        if value is missing_attr:
+            continue
+
+        if value.__class__ in _TO_DICT_PRIMITIVE_TYPES:
+            as_dict[output_key] = value
+        else:
+            as_dict[output_key] = to_dict(value)
     return as_dict
 
 
+def _datetime_to_str(obj):
+    # always use UTC
+    if not obj.tzinfo:
+        obj = pytz.utc.localize(obj)
+    if isinstance(obj, datetime.datetime):
+        # only datetime.datetime takes a separator
+        return obj.isoformat(sep="T")
+    return obj.isoformat()
+
+
+def _identity(obj):
+    return obj
+
+
+def register_to_dict_converter(cls, converter):
+    """Sets the function used by to_dict to convert instances of exactly the given class."""
+    _TO_DICT_CONVERTERS[cls] = converter
+
+
+_TO_DICT_PRIMITIVE_TYPES = frozenset(set(six.string_types) | set(six.integer_types) | {six.text_type, float, bool, type(None)})
+
+_TO_DICT_CONVERTERS = {primitive_type: _identity for primitive_type in _TO_DICT_PRIMITIVE_TYPES}
+_TO_DICT_CONVERTERS.update({
+    datetime.datetime: _datetime_to_str,
+    datetime.time: _datetime_to_str,
+    datetime.date: lambda obj: obj.isoformat(),
+    dict: lambda obj: {k: to_dict(v) for k, v in six.iteritems(obj)},
+    list: lambda obj: [to_dict(v) for v in obj],
+    tuple: lambda obj: [to_dict(v) for v in obj]
+})
+
+# Model class -> tuple of (attribute name, output key) for each attribute in its swagger_types
+_MODEL_FIELD_PLANS = {}
+
+
 def formatted_flat_dict(model):
     """Returns a string of the model flattened as a dict, sorted"""
     return pretty_print_format(to_dict(model))
@@ -761,6 +950,22 @@ def wrap_exceptions(func):
     return wrapped_call
 
 
+def get_exit_code(system_exit):
+    """Returns the exit code for a SystemExit raised while running a command in process.
+
+    As for an uncaught sys.exit('message'), a non-integer code is printed to stderr and treated as a failure.
+    """
+    code = system_exit.code
+    if code is None:
+        return 0
+
+    if isinstance(code, six.integer_types):
+        return code
+
+    click.echo(code, file=sys.stderr)
+    return 1
+
+
 def parse_json_parameter(parameter_name, parameter_value, default=None, camelize_keys=True):
     if parameter_value is None:
         return default
@@ -1479,12 +1684,16 @@ def is_windows():
 def get_jmespath_expression_from_context(ctx):
     if ctx.obj['query']:
         search_path = resolve_jmespath_query(ctx, ctx.obj['query'])
-        return jmespath.compile(search_path)
+        return query_cache.compile_query(search_path, persist=is_canned_query(ctx.obj['query']))
     return None
 
 
+def is_canned_query(query):
+    return query.startswith('query://')
+
+
 def resolve_jmespath_query(ctx, query):
-    if query.startswith('query://'):
+    if is_canned_query(query):
         query_name = query[len('query://'):]
         if query_name in ctx.obj['canned_queries']:
             return ctx.obj['canned_queries'][query_name]
@@ -1673,8 +1882,7 @@ def list_call_get_up_to_limit(list_func_ref, record_limit, page_size, **func_kwa
     return final_response
 
 
-def list_call_get_all_results(list_func_ref, ctx=None, is_json=False, stream_output=False, **func_kwargs):
-    keep_paginating = True
+def list_call_get_all_results(list_func_ref, ctx=None, is_json=False, stream_output=False, stream_items=False, **func_kwargs):
     call_result = None
     aggregated_results = []
     is_dns_record_collection = False
@@ -1688,11 +1896,23 @@ def list_call_get_all_results(list_func_ref, ctx=None, is_json=False, stream_out
             ctx.obj['expression'] = build_query_expression(ctx)
         stream_header(is_json, ctx)
     ex = None
+    command_ctx = ctx or click.get_current_context(silent=True)
+    item_query = None
+    output_writer = None
+    if stream_items and not stream_output:
+        item_query = get_streamed_item_query(command_ctx, func_kwargs)
+        if item_query:
+            output_writer = streaming_output.get_writer(command_ctx.obj['output'], sys.stdout, get_output_sample_rows(command_ctx))
+
+    # Later pages are fetched in the background while earlier ones are processed
+    prefetch_depth = page_prefetcher.get_prefetch_depth(command_ctx)
+    pages = page_prefetcher.iterate_pages(list_func_ref, prefetch_depth, **func_kwargs)
     try:
-        while keep_paginating:
-            call_result = list_func_ref(**func_kwargs)
+        for call_result in pages:
             start = timer()
-            if isinstance(call_result.data, dns.models.RecordCollection) or isinstance(call_result.data, dns.models.RRSet):
+            if output_writer:
+                stream_output_page(call_result, item_query, output_writer)
+            elif isinstance(call_result.data, dns.models.RecordCollection) or isinstance(call_result.data, dns.models.RRSet):
                 is_dns_record_collection = True
                 dns_record_collection_class = call_result.data.__class__
                 aggregated_results.extend(call_result.data.items)
@@ -1704,10 +1924,6 @@ def list_call_get_all_results(list_func_ref, ctx=None, is_json=False, stream_out
                 else:
                     aggregated_results.extend(call_result.data)
 
-            if call_result.next_page is not None:
-                func_kwargs['page'] = call_result.next_page
-
-            keep_paginating = call_result.has_next_page
             if ctx and ctx.obj['debug']:
                 end = timer()
                 logger.debug(oci.base_client.utc_now() + 'time elapsed evaluating logic after page {}: {}'.format(str(page_index), str(end - start)))
@@ -1717,6 +1933,10 @@ def list_call_get_all_results(list_func_ref, ctx=None, is_json=False, stream_out
         ex = e
         raise e
     finally:
+        pages.close()
+        if output_writer:
+            # Writes any rows still held for the sample, so the items received before an error are still shown
+            output_writer.close()
         if stream_output:
             if ex and ctx and ctx.obj['debug']:
                 print(str(ex).replace("'", '"'), file=sys.stderr)
@@ -1738,6 +1958,10 @@ def list_call_get_all_results(list_func_ref, ctx=None, is_json=False, stream_out
     if ctx and ctx.obj['debug']:
         print("", file=sys.stderr)
 
+    if output_writer:
+        # Every item has already been written, so there is nothing left to render
+        return Response(call_result.status, None, [], call_result.request)
+
     post_processed_results = aggregated_results
     if 'sort_by' in func_kwargs:
         if func_kwargs['sort_by'].upper() == 'DISPLAYNAME':
@@ -1846,11 +2070,91 @@ def stream_page(is_json, page_index, call_result, ctx, previous_page_has_data):
     return previous_page_has_data
 
 
+def get_streamed_item_query(ctx, func_kwargs):
+    """Returns a function giving the values to write for each item when the results of a list call made with --all can
+    be written while the pages are received (for ndjson, csv, tsv and table output), otherwise returns None and the
+    results are rendered once they have all been fetched.
+
+    This is only used for list calls made with stream_items=True, which the generated list commands pass because they
+    render the results as they are. Results are written as they are received if they do not need to be sorted by the
+    CLI, and the --query (if any) can be applied to each item on its own.
+    """
+    if not ctx or not ctx.obj or ctx.obj.get('output') not in streaming_output.STREAMED_OUTPUT_FORMATS:
+        return None
+
+    if (func_kwargs.get('sort_by') or '').upper() in ['DISPLAYNAME', 'TIMECREATED']:
+        return None
+
+    if not ctx.obj['query']:
+        return lambda item: [item]
+
+    return build_item_query(build_query_expression(ctx))
+
+
+def get_output_sample_rows(ctx):
+    """Returns how many items are used to choose the columns (and for tables, the column widths) when csv, tsv or table
+    output is written as the pages of a list call are received.
+
+    This comes from the output_sample_rows setting in the OCI_CLI_SETTINGS section of the oci_cli_rc file.
+    """
+    sample_rows = ctx.obj.get('settings', {}).get(cli_constants.CLI_RC_GENERIC_SETTINGS_OUTPUT_SAMPLE_ROWS)
+    try:
+        return max(1, int(sample_rows)) if sample_rows is not None else cli_constants.DEFAULT_OUTPUT_SAMPLE_ROWS
+    except ValueError:
+        return cli_constants.DEFAULT_OUTPUT_SAMPLE_ROWS
+
+
+def build_item_query(expression):
+    """Returns a function which applies a JMESPath query written against the response ({"data": [...]}) to a single
+    item of the data, and returns the list of values that the item contributes to the query result.
+
+    This works for queries which project or filter the data (e.g. data[*].name or data[?state=='RUNNING']). Returns None
+    for queries which need all of the data at once (e.g. data[0] or length(data)).
+    """
+    ast = expression.parsed
+    if _is_data_field(ast):
+        return lambda item: [item]
+
+    if ast['type'] not in ['projection', 'filter_projection']:
+        return None
+
+    # Run the projection over a list holding just the item, instead of over the data
+    identity = {'type': 'identity', 'children': []}
+    left = ast['children'][0]
+    if _is_data_field(left):
+        item_left = identity
+    elif left['type'] == 'flatten' and _is_data_field(left['children'][0]):
+        item_left = {'type': 'flatten', 'children': [identity]}
+    else:
+        return None
+
+    item_ast = dict(ast, children=[item_left] + ast['children'][1:])
+    item_expression = jmespath.parser.ParsedResult(expression.expression, item_ast)
+    return lambda item: item_expression.search([item])
+
+
+def _is_data_field(ast):
+    return ast['type'] == 'field' and ast['value'] == 'data'
+
+
+# Writes the values for each item in a page of results with the output writer
+def stream_output_page(call_result, item_query, writer):
+    items = call_result.data
+    if isinstance(items, dns.models.RecordCollection) or isinstance(items, dns.models.RRSet):
+        items = items.items
+
+    for item in items:
+        for value in item_query(to_dict(item)):
+            writer.write(value)
+
+    writer.flush()
+
+
 def build_query_expression(ctx):
     expression = None
     search_path = resolve_jmespath_query(ctx, ctx.obj['query'])
     try:
-        expression = jmespath.compile(search_path)
+        expression = query_cache.compile_query(search_path, persist=is_canned_query(ctx.obj['query']))
     # Print an appropriate helpful error message for improper escaping of user input by the user.
     except jmespath.exceptions.LexerError as e:
         if 'Unknown token' in e.message:
@@ -1869,6 +2173,11 @@ def build_query_expression(ctx):
 # Retrieves an attribute and returns a default value if it doesn't exist. This default be specified as a keyword argument, but if none is given
 # then the method can vend a default value (the min datetime for the time_created field and an empty string otherwise)
 def retrieve_attribute_for_sort(target_obj, attribute_name, **kwargs):
+    if isinstance(target_obj, dict):
+        # Results of commands run with --raw-json are already in the output format, where datetimes are strings
+        getattr_result = target_obj.get(attribute_name.replace('_', '-'))
+        return getattr_result if getattr_result is not None else kwargs.get('default', '')
+
     getattr_result = getattr(target_obj, attribute_name)
     if getattr_result is not None:
         return getattr_result
@@ -1945,49 +2254,119 @@ def to_jwk(key_obj):
     return json.dumps(obj)
 
 
-def verify_checksum(filename, no_multipart, ma):
+def verify_checksum(filename, no_multipart, ma, parallel_count=1):
+    """Returns the checksum of the local file in the form Object Storage reports it for the uploaded object.
+
+    For multipart uploads this is built from the MD5 hashes of the parts, which were calculated from the local file by
+    the upload (in ma.manifest['parts']), so the file is not read again. Parts without a local hash are hashed from the
+    file, parallel_count at a time.
+    """
     try:
-        with open(filename, 'rb') as f:
-            checksum_func = checksum_hashlib
-            fips_libcrypto_file = os.getenv("OCI_CLI_FIPS_LIBCRYPTO_FILE")
-            if fips_libcrypto_file:
-                checksum_func = checksum_fips
-            if no_multipart:
-                multipart_hash = checksum_func(f, no_multipart, ma)
-            else:
-                hash_list, multipart_hash = checksum_func(f, no_multipart, ma)
+        if no_multipart:
+            return get_file_md5(filename)
+
+        return get_multipart_checksum(get_part_md5s(filename, ma.manifest['parts'], parallel_count))
     except IOError:
         print('Cannot open file to generate hash')
         sys.exit(1)
     except Exception as e:
         print('Encountered exception when generating hash' + str(e))
         sys.exit(1)
-    multipart_hash = codecs.encode(codecs.decode(multipart_hash, 'hex'), 'base64').decode().strip()
-    if not no_multipart:
-        multipart_hash += '-' + str(len(hash_list))
-    return multipart_hash
+
+
+def get_file_md5(filename):
+    """Returns the base64 encoded MD5 hash of the content of a file, as given in the opc-content-md5 header."""
+    with open(filename, 'rb') as f:
+        checksum_func = checksum_fips if os.getenv("OCI_CLI_FIPS_LIBCRYPTO_FILE") else checksum_hashlib
+        return format_md5_checksum(checksum_func(f, True, None))
 
 
 def checksum_fips(f, no_multipart, ma):
-    m = pymd5.md5()
-    if no_multipart:
-        m.update(f.read())
-        return m.hexdigest()
-    else:
-        hash_list = [codecs.decode(codecs.encode(base64.b64decode(part['opc_md5']), 'hex').strip(), 'hex') for part
-                     in ma.manifest['parts']]
-        m.update(b''.join(hash_list))
-        return hash_list, m.hexdigest()
+    return _checksum_file(pymd5.md5(), f)
 
 
 def checksum_hashlib(f, no_multipart, ma):
     import hashlib
-    if no_multipart:
-        return hashlib.md5(f.read()).hexdigest()
-    else:
-        hash_list = [codecs.decode(codecs.encode(base64.b64decode(part['opc_md5']), 'hex').strip(), 'hex') for part in
-                     ma.manifest['parts']]
-        return hash_list, hashlib.md5(b''.join(hash_list)).hexdigest()
+    return _checksum_file(hashlib.md5(), f)
+
+
+def _checksum_file(m, f):
+    # Read a chunk at a time, so hashing a large file uses constant memory
+    while True:
+        chunk = f.read(cli_constants.CHECKSUM_READ_SIZE)
+        if not chunk:
+            return m.hexdigest()
+        m.update(chunk)
+
+
+def new_md5():
+    """Returns a new MD5 hash object, using the bundled implementation in FIPS mode."""
+    if os.getenv("OCI_CLI_FIPS_LIBCRYPTO_FILE"):
+        return pymd5.md5()
+
+    import hashlib
+    return hashlib.md5()
+
+
+def format_md5_checksum(hexdigest):
+    """Returns an MD5 hex digest in base64, as it is given in the opc-content-md5 header."""
+    return codecs.encode(codecs.decode(hexdigest, 'hex'), 'base64').decode().strip()
+
+
+def get_multipart_checksum(part_md5s):
+    """Returns the checksum of a multipart object (as given in the opc-multipart-md5 header) from the base64 encoded
+    MD5 hashes of its parts."""
+    m = new_md5()
+    m.update(b''.join(base64.b64decode(part_md5) for part_md5 in part_md5s))
+    return '{}-{}'.format(format_md5_checksum(m.hexdigest()), len(part_md5s))
+
+
+def get_part_md5s(filename, parts, parallel_count=1):
+    """Returns the base64 encoded MD5 hash of each part of a multipart upload of the file.
+
+    Each part is a dict with the offset and size of the part in the file. Hashes calculated by the upload (in 'hash')
+    are used as they are, and the others are calculated from the file, parallel_count parts at a time.
+    """
+    from oci.object_storage.transfer.internal.multipart_object_assembler import MultipartObjectAssembler
+
+    def part_md5(part):
+        if part.get('hash'):
+            return part['hash']
+        return MultipartObjectAssembler.calculate_md5(filename, part['offset'], part['size'])
+
+    missing = [part for part in parts if not part.get('hash')]
+    if parallel_count <= 1 or len(missing) <= 1:
+        return [part_md5(part) for part in parts]
+
+    # hashlib releases the GIL while hashing, so threads hash parts in parallel
+    from multiprocessing.dummy import Pool
+    pool = Pool(min(parallel_count, len(missing)))
+    try:
+        return pool.map(part_md5, parts)
+    finally:
+        pool.close()
+        pool.join()
+
+
+# A file-like object which updates a hash with the data read through it. This is used to calculate the checksum of a
+# file while it is uploaded, rather than reading it again afterwards
+class HashingReader(object):
+    def __init__(self, file_object, hasher=None):
+        self._file_object = file_object
+        self.mode = getattr(file_object, 'mode', 'rb')
+        self.hasher = hasher if hasher is not None else new_md5()
+
+    def read(self, n=-1):
+        data = self._file_object.read(n)
+        self.hasher.update(data)
+        return data
+
+    # this is used by 'requests' to determine the Content-Length header using fstat
+    def fileno(self):
+        return self._file_object.fileno()
+
+    def get_checksum(self):
+        return format_md5_checksum(self.hasher.hexdigest())
 
 
 def get_checksum_message(response_headers, checksum):
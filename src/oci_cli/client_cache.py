@@ -0,0 +1,138 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import os
+import six
+import threading
+
+from oci import config
+
+from . import cli_constants
+
+# The resource principals signer is configured entirely through environment variables with this prefix
+RESOURCE_PRINCIPAL_ENV_VAR_PREFIX = 'OCI_RESOURCE_PRINCIPAL'
+
+# Clients, and the config and signer they are built from, are reused within a process. This avoids re-reading the
+# config file and re-loading the private key when a command builds more than one client (e.g. through ctx.invoke),
+# and lets long lived processes (e.g. "oci daemon start" and "oci batch run") reuse them across commands.
+_cache = {}
+_lock = threading.Lock()
+
+# One requests session, and so one connection pool, per endpoint host
+_sessions = {}
+
+
+class CacheEntry(object):
+    def __init__(self, value, client_config, dependent_files):
+        self.value = value
+        self.client_config = client_config
+
+        # (path, mtime) of the files the value was built from, such as the config and private key files
+        self.dependent_files = dependent_files
+
+
+def clear():
+    with _lock:
+        _cache.clear()
+        _sessions.clear()
+
+
+def size():
+    return len(_cache)
+
+
+def build_cache_key(service_name, ctx, raw_json=False):
+    """Builds a key from everything in the click context which affects how a client is constructed.
+
+    Pass None as the service_name for the key of the config and signer shared by all of the clients. raw_json is True
+    for clients which convert responses with the raw_json module.
+    """
+    env_vars = set(cli_constants.OCI_CONFIG_ENV_VARS)
+    env_vars.update(env for env in os.environ if env.startswith(RESOURCE_PRINCIPAL_ENV_VAR_PREFIX))
+    env_overrides = tuple((env, os.environ.get(env)) for env in sorted(env_vars))
+    return (
+        service_name,
+        _get_config_file_location(ctx.obj.get('config_file')),
+        ctx.obj.get('profile'),
+        ctx.obj.get('region'),
+        ctx.obj.get('endpoint'),
+        ctx.obj.get('cert_bundle'),
+        ctx.obj.get('auth'),
+        bool(ctx.obj.get('debug')),
+        bool(ctx.obj.get('no_retry')),
+        bool(ctx.obj.get('skip_deserialization')),
+        raw_json,
+        ctx.obj.get('proxy'),
+        ctx.obj.get('settings', {}).get('proxy'),
+        env_overrides
+    )
+
+
+def get(cache_key):
+    """Returns the CacheEntry for the key, or None if there isn't one or a file it was built from has changed."""
+    with _lock:
+        cached = _cache.get(cache_key)
+        if cached is None:
+            return None
+
+        for path, mtime in cached.dependent_files:
+            if _get_mtime(path) != mtime:
+                del _cache[cache_key]
+                return None
+
+        return cached
+
+
+def put(cache_key, value, client_config):
+    dependent_files = [(path, _get_mtime(path)) for path in _get_dependent_files(cache_key, client_config)]
+    with _lock:
+        _cache[cache_key] = CacheEntry(value, client_config, dependent_files)
+
+
+def share_session(client):
+    """Makes the client use the requests session of other clients for the same endpoint host, if there are any.
+
+    Requests are signed individually so the session only holds connection pools, TLS and proxy settings, which are
+    keyed on here along with the host.
+    """
+    base_client = client.base_client
+    endpoint = six.moves.urllib.parse.urlparse(base_client.endpoint)
+    session_key = (
+        endpoint.scheme.lower(),
+        endpoint.netloc.lower(),
+        base_client.session.verify,
+        tuple(sorted(base_client.session.proxies.items())),
+        base_client.session.trust_env
+    )
+    with _lock:
+        session = _sessions.get(session_key)
+        if session is None:
+            _sessions[session_key] = base_client.session
+        else:
+            base_client.session = session
+
+
+def _get_dependent_files(cache_key, client_config):
+    files = [cache_key[1]]
+    for file_key in ['key_file', 'security_token_file', 'delegation_token_file']:
+        if client_config.get(file_key):
+            files.append(os.path.expanduser(client_config[file_key]))
+
+    return files
+
+
+def _get_config_file_location(config_file):
+    if not config_file:
+        return None
+
+    try:
+        return os.path.abspath(config._get_config_path_with_fallback(config_file))
+    except Exception:
+        return os.path.abspath(os.path.expanduser(config_file))
+
+
+def _get_mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except (OSError, TypeError):
+        return None
@@ -5,6 +5,11 @@ from .. import cli_util
 
 import six
 
+# The output of a bulk operation is given as a single document for these output formats, and as a list of records, one
+# for each item, for the rest
+DOCUMENT_OUTPUT_FORMATS = ['json', 'json-compact']
+RECORD_OUTPUT_FORMATS = ['table', 'ndjson', 'csv', 'tsv']
+
 
 class BulkObjectStorageOperationOutput(object):
     def __init__(self):
@@ -17,8 +22,8 @@ class BulkObjectStorageOperationOutput(object):
         return len(self._failures) > 0
 
     def validate_output_format(self, output_format):
-        if output_format != 'json' and output_format != 'table':
-            raise RuntimeError('Unrecognised output format: {}. Supported formats are json and table'.format(output_format))
+        if output_format not in DOCUMENT_OUTPUT_FORMATS and output_format not in RECORD_OUTPUT_FORMATS:
+            raise RuntimeError('Unrecognised output format: {}. Supported formats are {}'.format(output_format, ', '.join(DOCUMENT_OUTPUT_FORMATS + RECORD_OUTPUT_FORMATS)))
 
 
 class BulkPutOperationOutput(BulkObjectStorageOperationOutput):
@@ -33,6 +38,7 @@ class BulkPutOperationOutput(BulkObjectStorageOperationOutput):
         super(BulkPutOperationOutput, self).__init__()
         self._uploaded = {}
         self._skipped = []
+        self._packed = {}
 
     def add_uploaded(self, uploaded_object, **kwargs):
         result, checksum = kwargs.get('work_pool_task_result')
@@ -51,16 +57,23 @@ class BulkPutOperationOutput(BulkObjectStorageOperationOutput):
     def add_skipped(self, skipped):
         self._skipped.append(skipped)
 
+    def add_packed(self, archive, packed_files):
+        for packed_file in packed_files:
+            self._packed[packed_file] = archive
+
     def get_output(self, output_format):
         self.validate_output_format(output_format)
 
-        if output_format == 'json':
-            return {
+        if output_format in DOCUMENT_OUTPUT_FORMATS:
+            output = {
                 'uploaded-objects': self._uploaded,
                 'upload-failures': self._failures,
                 'skipped-objects': self._skipped
             }
-        elif output_format == 'table':
+            if self._packed:
+                output['packed-objects'] = self._packed
+            return output
+        elif output_format in RECORD_OUTPUT_FORMATS:
             consolidated_result = []
 
             for uploaded_object, result in six.iteritems(self._uploaded):
@@ -75,6 +88,9 @@ class BulkPutOperationOutput(BulkObjectStorageOperationOutput):
                     'error-message': failure
                 })
 
+            for packed_file, archive in six.iteritems(self._packed):
+                consolidated_result.append({'action': 'Packed', 'file': packed_file, 'archive': archive})
+
             for skip in self._skipped:
                 consolidated_result.append({'action': 'Skipped', 'file': skip})
 
@@ -85,19 +101,26 @@ class BulkGetOperationOutput(BulkObjectStorageOperationOutput):
     def __init__(self):
         super(BulkGetOperationOutput, self).__init__()
         self._skipped = []
+        self._unpacked = {}
 
     def add_skipped(self, skipped):
         self._skipped.append(skipped)
 
+    def add_unpacked(self, archive, unpacked_files):
+        self._unpacked[archive] = unpacked_files
+
     def get_output(self, output_format):
         self.validate_output_format(output_format)
 
-        if output_format == 'json':
-            return {
+        if output_format in DOCUMENT_OUTPUT_FORMATS:
+            output = {
                 'download-failures': self._failures,
                 'skipped-objects': self._skipped
             }
-        elif output_format == 'table':
+            if self._unpacked:
+                output['unpacked-objects'] = self._unpacked
+            return output
+        elif output_format in RECORD_OUTPUT_FORMATS:
             consolidated_result = []
 
             for downloaded_obj, failure in six.iteritems(self._failures):
@@ -107,6 +130,10 @@ class BulkGetOperationOutput(BulkObjectStorageOperationOutput):
                     'error-message': failure
                 })
 
+            for archive, unpacked_files in six.iteritems(self._unpacked):
+                for unpacked_file in unpacked_files:
+                    consolidated_result.append({'action': 'Unpacked', 'object': unpacked_file, 'archive': archive})
+
             for skip in self._skipped:
                 consolidated_result.append({'action': 'Skipped', 'object': skip})
 
@@ -124,12 +151,12 @@ class BulkDeleteOperationOutput(BulkObjectStorageOperationOutput):
     def get_output(self, output_format, dry_run=False):
         self.validate_output_format(output_format)
 
-        if output_format == 'json':
+        if output_format in DOCUMENT_OUTPUT_FORMATS:
             return {
                 'delete-failures': self._failures,
                 'deleted-objects': self._deleted
             }
-        elif output_format == 'table':
+        elif output_format in RECORD_OUTPUT_FORMATS:
             consolidated_result = []
 
             for deleted_obj, failure in six.iteritems(self._failures):
@@ -146,3 +173,85 @@ class BulkDeleteOperationOutput(BulkObjectStorageOperationOutput):
                     consolidated_result.append({'action': 'Deleted', 'object': deleted})
 
             return consolidated_result
+
+
+class BulkSyncOperationOutput(BulkObjectStorageOperationOutput):
+    def __init__(self, transferred_action):
+        super(BulkSyncOperationOutput, self).__init__()
+        self._transferred_action = transferred_action
+        self._transferred = []
+        self._deleted = []
+        self._unchanged_count = 0
+
+    def add_transferred(self, transferred, **kwargs):
+        self._transferred.append(transferred)
+
+    def add_deleted(self, deleted, **kwargs):
+        self._deleted.append(deleted)
+
+    def add_unchanged(self):
+        self._unchanged_count += 1
+
+    def get_output(self, output_format, dry_run=False):
+        self.validate_output_format(output_format)
+
+        if output_format in DOCUMENT_OUTPUT_FORMATS:
+            return {
+                'transferred-items': sorted(self._transferred),
+                'deleted-items': sorted(self._deleted),
+                'unchanged-count': self._unchanged_count,
+                'sync-failures': self._failures
+            }
+        elif output_format in RECORD_OUTPUT_FORMATS:
+            consolidated_result = []
+
+            for item, failure in six.iteritems(self._failures):
+                consolidated_result.append({
+                    'action': 'Failed',
+                    'item': item,
+                    'error-message': failure
+                })
+
+            for transferred in sorted(self._transferred):
+                consolidated_result.append({'action': 'Dry Run ({})'.format(self._transferred_action) if dry_run else self._transferred_action, 'item': transferred})
+
+            for deleted in sorted(self._deleted):
+                consolidated_result.append({'action': 'Dry Run (Deleted)' if dry_run else 'Deleted', 'item': deleted})
+
+            return consolidated_result
+
+
+class BulkCopyOperationOutput(BulkObjectStorageOperationOutput):
+    def __init__(self):
+        super(BulkCopyOperationOutput, self).__init__()
+        self._copied = {}
+
+    def add_copied(self, copied, destination_object_name, work_request_id=None):
+        self._copied[copied] = {'destination-object-name': destination_object_name}
+        if work_request_id:
+            self._copied[copied]['work-request-id'] = work_request_id
+
+    def get_output(self, output_format, dry_run=False):
+        self.validate_output_format(output_format)
+
+        if output_format in DOCUMENT_OUTPUT_FORMATS:
+            return {
+                'copied-objects': self._copied,
+                'copy-failures': self._failures
+            }
+        elif output_format in RECORD_OUTPUT_FORMATS:
+            consolidated_result = []
+
+            for copied_obj, failure in six.iteritems(self._failures):
+                consolidated_result.append({
+                    'action': 'Failed',
+                    'object': copied_obj,
+                    'error-message': failure
+                })
+
+            for copied_obj, result in six.iteritems(self._copied):
+                output_result = {'action': 'Dry Run' if dry_run else 'Copied', 'object': copied_obj}
+                output_result.update(result)
+                consolidated_result.append(output_result)
+
+            return consolidated_result
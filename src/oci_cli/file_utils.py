@@ -0,0 +1,16 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import os
+
+
+# Renames source over destination, replacing destination if it exists. Used to write a file to a temporary path and then
+# move it into place, so that readers never see a partially written file
+def replace_file(source, destination):
+    if hasattr(os, 'replace'):
+        os.replace(source, destination)
+    else:
+        # Python 2 only has os.rename, which does not overwrite an existing file on Windows
+        if os.name == 'nt' and os.path.exists(destination):
+            os.remove(destination)
+        os.rename(source, destination)
@@ -2,7 +2,11 @@
 # Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
 
 from __future__ import print_function
-from . import cli_root, cli_util
+import click
+import sys
+import threading
+
+from .aliasing import parameter_alias
 
 # Map parameter variable names to shortcuts.
 PARAMETER_SHORTCUT = {
@@ -12,34 +16,54 @@ PARAMETER_SHORTCUT = {
 # Services such as object storage and identity register special code to execute.
 SERVICE_FUNCTIONS_TO_EXECUTE = []
 
+# Commands are shared between threads when several run in one process (e.g. "oci batch run")
+_prepare_lock = threading.Lock()
+
+
+def add_shortcuts(command):
+    for param in command.params:
+        shortcut = PARAMETER_SHORTCUT.get(param.name)
+
+        # "shortcut not in param.opts" is For where we use the cli_util.copy_params_from_generated_command
+        # and the source command already contains the parameter shortcut, we don't want to shove it in again.
+        #
+        # This is used in scenarios like:
+        #
+        # The `import_image_from_object` command is annotated with `@cli_util.copy_params_from_generated_command`.
+        # The command we copy from has --compartment-id as one of the options
+        #
+        # When we fall into this code for the `import_image_from_object` command, the command we copy from has
+        # already had a shortcut applied to the --compartment-id option. If we do not check for the shortcut's
+        # presence we would append the shortcut again so the help looks like:
+        #
+        #     -c, -c, -c, --compartment-id TEXT
+        #
+        # Instead of:
+        #     -c, --compartment-id TEXT
+        if shortcut and shortcut not in param.opts:
+            param.opts.append(shortcut)
+
+
+def prepare_command(command):
+    """Adds parameter shortcuts and aliases from the OCI CLI rc file to a leaf command.
+
+    This is called by CommandGroupWithAlias as each command on the invoked path is resolved, so that we don't
+    walk every command in the tree on each invocation.
+    """
+    if isinstance(command, click.MultiCommand):
+        return
+
+    with _prepare_lock:
+        add_shortcuts(command)
+        collisions = parameter_alias.apply_aliases_to_command(command)
 
-def add_shortcuts():
-    commands = cli_util.collect_commands(cli_root.cli)
-    for command in commands:
-        for param in command.params:
-            shortcut = PARAMETER_SHORTCUT.get(param.name)
-
-            # "shortcut not in param.opts" is For where we use the cli_util.copy_params_from_generated_command
-            # and the source command already contains the parameter shortcut, we don't want to shove it in again.
-            #
-            # This is used in scenarios like:
-            #
-            # The `import_image_from_object` command is annotated with `@cli_util.copy_params_from_generated_command`.
-            # The command we copy from has --compartment-id as one of the options
-            #
-            # When we fall into this code for the `import_image_from_object` command, the command we copy from has
-            # already had a shortcut applied to the --compartment-id option. If we do not check for the shortcut's
-            # presence we would append the shortcut again so the help looks like:
-            #
-            #     -c, -c, -c, --compartment-id TEXT
-            #
-            # Instead of:
-            #     -c, --compartment-id TEXT
-            if shortcut and shortcut not in param.opts:
-                param.opts.append(shortcut)
+    if len(collisions) > 0:
+        click.echo(click.style('\n'.join(collisions), fg='red'), file=sys.stderr)
 
 
+# Services are loaded on demand (see service_loader), so this runs once at startup and then again as each service
+# is loaded.
 def process():
-    add_shortcuts()
-    for f in SERVICE_FUNCTIONS_TO_EXECUTE:
-        f()
+    # Functions are registered when a service is imported, so only run the ones which haven't been run yet
+    while SERVICE_FUNCTIONS_TO_EXECUTE:
+        SERVICE_FUNCTIONS_TO_EXECUTE.pop(0)()
@@ -0,0 +1,105 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import os
+import sys
+import six
+import threading
+
+from six.moves import queue
+
+from . import cli_constants
+
+# How often a fetcher blocked on a full queue checks whether the consumer has stopped reading pages
+STOP_POLL_INTERVAL_SECONDS = 0.1
+
+
+def get_prefetch_depth(ctx):
+    """Returns how many pages may be fetched ahead of the page being processed when listing with --all.
+
+    This comes from the OCI_CLI_PAGE_PREFETCH_DEPTH environment variable, or the page_prefetch_depth setting in the
+    OCI_CLI_SETTINGS section of the oci_cli_rc file. A depth of 0 fetches pages one after another on the calling
+    thread.
+    """
+    depth = os.environ.get(cli_constants.OCI_CLI_PAGE_PREFETCH_DEPTH_ENV_VAR)
+    if depth is None and ctx and ctx.obj:
+        depth = ctx.obj.get('settings', {}).get(cli_constants.CLI_RC_GENERIC_SETTINGS_PAGE_PREFETCH_DEPTH)
+
+    if depth is None:
+        return cli_constants.DEFAULT_PAGE_PREFETCH_DEPTH
+
+    try:
+        return max(0, int(depth))
+    except ValueError:
+        return cli_constants.DEFAULT_PAGE_PREFETCH_DEPTH
+
+
+def iterate_pages(list_func_ref, prefetch_depth, **func_kwargs):
+    """Yields the response for each page of a list call.
+
+    Page tokens are opaque so pages are still requested one after another, but with a prefetch depth greater than 0
+    they are requested (and deserialized) by a background thread. The caller can then process a page while the
+    following ones are being fetched, with at most prefetch_depth fetched pages waiting to be processed.
+
+    An error fetching a page is raised by this generator once the pages before it have been yielded.
+    """
+    if prefetch_depth <= 0:
+        for call_result in _fetch_pages(list_func_ref, func_kwargs):
+            yield call_result
+        return
+
+    pages = queue.Queue(maxsize=prefetch_depth)
+    stopped = threading.Event()
+
+    fetcher = threading.Thread(target=_prefetch_pages, args=(list_func_ref, func_kwargs, pages, stopped))
+    fetcher.daemon = True
+    fetcher.start()
+
+    try:
+        while True:
+            call_result, exc_info = pages.get()
+            if exc_info:
+                six.reraise(*exc_info)
+            if call_result is None:
+                return
+
+            yield call_result
+    finally:
+        # Lets the fetcher finish if the caller stops reading pages early
+        stopped.set()
+
+
+def _fetch_pages(list_func_ref, func_kwargs):
+    while True:
+        call_result = list_func_ref(**func_kwargs)
+        yield call_result
+
+        if call_result.next_page is not None:
+            func_kwargs['page'] = call_result.next_page
+
+        if not call_result.has_next_page:
+            return
+
+
+def _prefetch_pages(list_func_ref, func_kwargs, pages, stopped):
+    try:
+        for call_result in _fetch_pages(list_func_ref, func_kwargs):
+            if not _put(pages, (call_result, None), stopped):
+                return
+    except Exception:
+        _put(pages, (None, sys.exc_info()), stopped)
+        return
+
+    # The end of the pages
+    _put(pages, (None, None), stopped)
+
+
+def _put(pages, item, stopped):
+    while not stopped.is_set():
+        try:
+            pages.put(item, timeout=STOP_POLL_INTERVAL_SECONDS)
+            return True
+        except queue.Full:
+            pass
+
+    return False
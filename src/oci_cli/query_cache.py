@@ -0,0 +1,208 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import errno
+import json
+import os
+import tempfile
+import threading
+
+import jmespath
+import six
+from jmespath.parser import ParsedResult
+
+from . import cli_constants
+from .file_utils import replace_file
+
+# Compiled expressions for the queries used by this process
+_compiled = {}
+
+# The ASTs in the on-disk cache, loaded the first time a canned query is compiled
+_persisted_asts = None
+
+_lock = threading.Lock()
+
+
+def compile_query(query, persist=False):
+    """Returns the compiled JMESPath expression for the query.
+
+    Expressions are memoized for the life of the process. If persist is True (e.g. for the canned queries in the
+    oci_cli_rc file) the parsed AST is also kept in an on-disk cache, so later processes do not need to parse it again.
+    """
+    expression = _compiled.get(query)
+    if expression is not None:
+        return expression
+
+    ast = None
+    if persist:
+        ast = _get_persisted_asts().get(query)
+
+    if ast is None:
+        ast = jmespath.compile(query).parsed
+        if persist:
+            _persist_ast(query, ast)
+
+    expression = ProjectionQuery.optimize(query, ast)
+    _compiled[query] = expression
+    return expression
+
+
+def clear():
+    """Forgets the expressions compiled by this process. The on-disk cache is left alone."""
+    global _persisted_asts
+    with _lock:
+        _compiled.clear()
+        _persisted_asts = None
+
+
+def get_cache_file():
+    return os.path.abspath(os.path.expanduser(os.environ.get(cli_constants.OCI_CLI_QUERY_CACHE_FILE_ENV_VAR, cli_constants.QUERY_CACHE_DEFAULT_LOCATION)))
+
+
+def _get_persisted_asts():
+    global _persisted_asts
+    with _lock:
+        if _persisted_asts is None:
+            _persisted_asts = _read_cache_file()
+        return _persisted_asts
+
+
+def _read_cache_file():
+    try:
+        with open(get_cache_file(), 'r') as f:
+            cache = json.load(f)
+    except (IOError, OSError, ValueError):
+        return {}
+
+    # ASTs from another version of jmespath may not be understood by this one
+    if not isinstance(cache, dict) or cache.get('jmespath_version') != jmespath.__version__:
+        return {}
+
+    return cache.get('asts', {})
+
+
+def _persist_ast(query, ast):
+    with _lock:
+        # Merge with anything written by other processes since the cache was loaded
+        asts = _read_cache_file()
+        asts[query] = ast
+        if _persisted_asts is not None:
+            _persisted_asts[query] = ast
+
+        cache_file = get_cache_file()
+        try:
+            _write_cache_file(cache_file, {'jmespath_version': jmespath.__version__, 'asts': asts})
+        except (IOError, OSError, TypeError, ValueError):
+            # The cache is only an optimization
+            pass
+
+
+def _write_cache_file(cache_file, cache):
+    cache_dir = os.path.dirname(cache_file)
+    if not os.path.isdir(cache_dir):
+        try:
+            os.makedirs(cache_dir)
+        except OSError as e:
+            # Another process may have created it first
+            if e.errno != errno.EEXIST:
+                raise
+
+    # Write to a temporary file and rename the complete file over the cache, so readers never see a partially written one
+    fd, temp_path = tempfile.mkstemp(dir=cache_dir)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(cache, f)
+        replace_file(temp_path, cache_file)
+    except Exception:
+        os.remove(temp_path)
+        raise
+
+
+class ProjectionQuery(ParsedResult):
+    """A compiled expression which projects the items in the response's data, optionally filtering them first, e.g.
+
+        data[*].{name: "display-name", state: "lifecycle-state"}
+        data[?"lifecycle-state"=='RUNNING']
+        data[?shape=='VM.Standard2.1'].id
+
+    These are evaluated with a list comprehension over the items instead of the generic interpreter, which visits
+    every node of the AST for every item. The results are the same as ParsedResult.search.
+    """
+
+    def __init__(self, expression, parsed, filter_field, filter_value, filter_equal, project):
+        super(ProjectionQuery, self).__init__(expression, parsed)
+        self._filter_field = filter_field
+        self._filter_value = filter_value
+        self._filter_equal = filter_equal
+        self._project = project
+
+    @classmethod
+    def optimize(cls, expression, ast):
+        """Returns a ProjectionQuery for the AST if it has one of the supported shapes, otherwise a ParsedResult."""
+        if ast['type'] in ['projection', 'filter_projection'] and _is_field(ast['children'][0], 'data'):
+            project = _build_projection(ast['children'][1])
+
+            filter_args = (None, None, None)
+            if ast['type'] == 'filter_projection':
+                filter_args = _parse_comparator(ast['children'][2])
+
+            if project and filter_args:
+                return cls(expression, ast, *(filter_args + (project,)))
+
+        return ParsedResult(expression, ast)
+
+    def search(self, value, options=None):
+        items = value.get('data') if isinstance(value, dict) else None
+        if not isinstance(items, list):
+            return None
+
+        if self._filter_field is not None:
+            field = self._filter_field
+            if self._filter_equal:
+                items = [item for item in items if isinstance(item, dict) and item.get(field) == self._filter_value]
+            else:
+                items = [item for item in items if not isinstance(item, dict) or item.get(field) != self._filter_value]
+
+        project = self._project
+        return [result for result in (project(item) for item in items) if result is not None]
+
+
+def _is_field(node, name=None):
+    return node['type'] == 'field' and (name is None or node['value'] == name)
+
+
+def _field_value(item, field):
+    return item.get(field) if isinstance(item, dict) else None
+
+
+def _build_projection(node):
+    # Returns a function applying the right hand side of the projection to an item, or None if it is not supported
+    if node['type'] == 'identity':
+        return lambda item: item
+    elif _is_field(node):
+        field = node['value']
+        return lambda item: _field_value(item, field)
+    elif node['type'] == 'multi_select_dict' and all(_is_field(pair['children'][0]) for pair in node['children']):
+        keys = [(pair['value'], pair['children'][0]['value']) for pair in node['children']]
+        return lambda item: None if item is None else {key: _field_value(item, field) for key, field in keys}
+    elif node['type'] == 'multi_select_list' and all(_is_field(child) for child in node['children']):
+        fields = [child['value'] for child in node['children']]
+        return lambda item: None if item is None else [_field_value(item, field) for field in fields]
+
+    return None
+
+
+def _parse_comparator(node):
+    # Supports == and != between a field and a string literal (comparisons of numbers and booleans have special cases
+    # in JMESPath, so they are left to the interpreter). Returns (field, value, is_equality) or None.
+    if node['type'] != 'comparator' or node['value'] not in ['eq', 'ne']:
+        return None
+
+    left, right = node['children']
+    if right['type'] == 'field':
+        left, right = right, left
+
+    if _is_field(left) and right['type'] == 'literal' and isinstance(right['value'], six.string_types):
+        return left['value'], right['value'], node['value'] == 'eq'
+
+    return None
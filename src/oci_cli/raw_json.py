@@ -0,0 +1,137 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import datetime
+import functools
+import json
+import re
+
+import dateutil.parser
+import oci
+import six
+
+from . import cli_constants
+from . import cli_util
+
+# Responses which the list helpers in cli_util expect as models, so they are always deserialized
+DESERIALIZED_RESPONSE_TYPES = frozenset(['RecordCollection', 'RRSet'])
+
+LIST_TYPE_MATCHER = re.compile(r'list\[(.*)\]')
+DICT_TYPE_MATCHER = re.compile(r'dict\(([^,]*), (.*)\)')
+
+# The format the services use for datetimes, e.g. 2019-11-12T10:30:00.123Z
+DATETIME_MATCHER = re.compile(r'^(\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d)\.(\d{1,6})Z$')
+
+
+class RawJsonDict(dict):
+    """A response model which has been converted straight from the service's JSON to the CLI's output format."""
+    pass
+
+
+class RawJsonList(list):
+    """A list of response values which have been converted straight from the service's JSON to the CLI's output
+    format."""
+    pass
+
+
+# Both are already in the output format, so cli_util.to_dict returns them as they are
+cli_util.register_to_dict_converter(RawJsonDict, lambda obj: obj)
+cli_util.register_to_dict_converter(RawJsonList, lambda obj: obj)
+
+
+def is_enabled(ctx):
+    """Returns whether responses for the invoked command should be converted directly from JSON to the output format,
+    instead of being deserialized into SDK models which are then converted by cli_util.to_dict.
+
+    This is turned on by --raw-json or the raw_json setting in the OCI_CLI_SETTINGS section of the oci_cli_rc file. It
+    only applies to generated get and list commands, which render the response without using the models.
+    """
+    if not ctx.obj.get('raw_json') and not cli_util.parse_boolean(ctx.obj.get('settings', {}).get(cli_constants.CLI_RC_GENERIC_SETTINGS_RAW_JSON, False)):
+        return False
+
+    callback = getattr(ctx.command, 'callback', None)
+    if callback is None:
+        return False
+
+    return '.generated.' in callback.__module__ and callback.__name__.startswith(('get_', 'list_'))
+
+
+def install(client):
+    """Makes the client convert the JSON in its responses directly to the output format."""
+    base_client = client.base_client
+    base_client.deserialize_response_data = functools.partial(deserialize_response_data, base_client)
+
+
+def deserialize_response_data(base_client, response_data, response_type):
+    if response_type in DESERIALIZED_RESPONSE_TYPES:
+        return oci.base_client.BaseClient.deserialize_response_data(base_client, response_data, response_type)
+
+    # Load the JSON the same way as the SDK does before deserializing it, which leaves responses declared as strings
+    # (e.g. the namespace name) as they are unless they are JSON strings
+    data = response_data.decode('utf8')
+    try:
+        json_response = json.loads(data)
+        if response_type != 'str' or isinstance(json_response, six.text_type):
+            data = json_response
+    except ValueError:
+        pass
+
+    return convert(data, response_type, base_client.type_mappings)
+
+
+def convert(data, data_type, type_mappings):
+    """Converts JSON data of the given swagger type (e.g. list[Instance]) to the dicts, lists and strings that
+    cli_util.to_dict would give for the deserialized models."""
+    if data is None:
+        return None
+
+    if data_type.startswith('list['):
+        item_type = LIST_TYPE_MATCHER.match(data_type).group(1)
+        return RawJsonList(convert(item, item_type, type_mappings) for item in data)
+
+    if data_type.startswith('dict('):
+        value_type = DICT_TYPE_MATCHER.match(data_type).group(2)
+        return {k: convert(v, value_type, type_mappings) for k, v in six.iteritems(data)}
+
+    cls = type_mappings[data_type]
+    if hasattr(cls, 'get_subtype'):
+        # Use the discriminator value to get the correct subtype.
+        cls = type_mappings[cls.get_subtype(data)]
+
+    if cls == datetime.datetime:
+        return _convert_datetime(data)
+    elif cls == datetime.date:
+        return dateutil.parser.parse(data).date().isoformat()
+    elif cls in [int, float, bool, object] or not isinstance(cls, type):
+        # Primitives (the mapping for str is a function rather than a type)
+        return data
+
+    as_dict = RawJsonDict()
+    for json_key, output_key, value_type in _get_field_plan(cls):
+        as_dict[output_key] = convert(data.get(json_key), value_type, type_mappings)
+    return as_dict
+
+
+def _convert_datetime(value):
+    # Reformat datetimes in the services' usual format without parsing them
+    match = DATETIME_MATCHER.match(value)
+    if match:
+        microseconds = int(match.group(2).ljust(6, '0'))
+        if microseconds:
+            return '{}.{:06d}+00:00'.format(match.group(1), microseconds)
+        return match.group(1) + '+00:00'
+
+    return cli_util.to_dict(dateutil.parser.parse(value))
+
+
+_FIELD_PLANS = {}
+
+
+def _get_field_plan(cls):
+    # Model class -> tuple of (JSON key, output key, swagger type) for each attribute of the model
+    field_plan = _FIELD_PLANS.get(cls)
+    if field_plan is None:
+        model = cls()
+        field_plan = tuple((model.attribute_map[attr], attr.replace('_', '-'), attr_type) for attr, attr_type in six.iteritems(model.swagger_types))
+        _FIELD_PLANS[cls] = field_plan
+    return field_plan
@@ -0,0 +1,158 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+# This file is generated by oci_cli.service_loader.write_service_index(). Do not edit it by hand.
+# It lets the CLI resolve top level commands and clients without importing every service.
+
+COMMAND_TO_SERVICE_DIR = {
+    'analytics': 'analytics',
+    'announce': 'announcements_service',
+    'audit': 'audit',
+    'autoscaling': 'autoscaling',
+    'budgets': 'budget',
+    'bv': 'core',
+    'ce': 'container_engine',
+    'compute': 'core',
+    'compute-management': 'core',
+    'db': 'database',
+    'dns': 'dns',
+    'dts': 'dts',
+    'email': 'email',
+    'events': 'events',
+    'fn': 'functions',
+    'fs': 'file_storage',
+    'health-checks': 'healthchecks',
+    'iam': 'identity',
+    'integration': 'integration',
+    'kms': 'key_management',
+    'lb': 'load_balancer',
+    'limits': 'limits',
+    'monitoring': 'monitoring',
+    'network': 'core',
+    'oce': 'oce',
+    'oda': 'oda',
+    'ons': 'ons',
+    'os': 'object_storage',
+    'resource-manager': 'resource_manager',
+    'search': 'resource_search',
+    'streaming': 'streaming',
+    'waas': 'waas',
+    'work-requests': 'work_requests'
+}
+
+COMMAND_SHORT_HELP = {
+    'analytics': 'Analytics',
+    'announce': 'Announcements Service',
+    'audit': 'Audit',
+    'autoscaling': 'Autoscaling',
+    'budgets': 'Budgets',
+    'bv': 'Block Volume Service',
+    'ce': 'Container Engine for Kubernetes',
+    'compute': 'Compute Service',
+    'compute-management': 'Compute Management Service',
+    'db': 'Database Service',
+    'dns': 'DNS',
+    'dts': 'Data Transfer Service',
+    'email': 'Email Delivery',
+    'events': 'Events',
+    'fn': 'Functions Service',
+    'fs': 'File Storage Service',
+    'health-checks': 'Health Checks',
+    'iam': 'Identity and Access Management Service',
+    'integration': 'Oracle Integration',
+    'kms': 'Key Management Service',
+    'lb': 'Load Balancing',
+    'limits': 'Service limits',
+    'monitoring': 'Monitoring',
+    'network': 'Networking Service',
+    'oce': 'OceInstance',
+    'oda': 'Digital Assistant Control Plane',
+    'ons': 'Notifications',
+    'os': 'Object Storage Service',
+    'resource-manager': 'Resource Manager',
+    'search': 'Search Service',
+    'streaming': 'Streaming Service',
+    'waas': 'Web Application Acceleration and Security Services',
+    'work-requests': 'Work Requests'
+}
+
+CLIENT_MAPPINGS_MODULES = {
+    'analytics': 'services.analytics.src.oci_cli_analytics.generated.client_mappings',
+    'announcement': 'services.announcements_service.src.oci_cli_announcement.generated.client_mappings',
+    'audit': 'services.audit.src.oci_cli_audit.generated.client_mappings',
+    'auto_scaling': 'services.autoscaling.src.oci_cli_auto_scaling.generated.client_mappings',
+    'blockstorage': 'services.core.src.oci_cli_blockstorage.generated.client_mappings',
+    'budget': 'services.budget.src.oci_cli_budget.generated.client_mappings',
+    'compute': 'services.core.src.oci_cli_compute.generated.client_mappings',
+    'compute_management': 'services.core.src.oci_cli_compute_management.generated.client_mappings',
+    'container_engine': 'services.container_engine.src.oci_cli_container_engine.generated.client_mappings',
+    'database': 'services.database.src.oci_cli_database.generated.client_mappings',
+    'dns': 'services.dns.src.oci_cli_dns.generated.client_mappings',
+    'email': 'services.email.src.oci_cli_email.generated.client_mappings',
+    'events': 'services.events.src.oci_cli_events.generated.client_mappings',
+    'file_storage': 'services.file_storage.src.oci_cli_file_storage.generated.client_mappings',
+    'functions_invoke': 'services.functions.src.oci_cli_functions_invoke.generated.client_mappings',
+    'functions_management': 'services.functions.src.oci_cli_functions_management.generated.client_mappings',
+    'health_checks': 'services.healthchecks.src.oci_cli_health_checks.generated.client_mappings',
+    'identity': 'services.identity.src.oci_cli_identity.generated.client_mappings',
+    'integration_instance': 'services.integration.src.oci_cli_integration_instance.generated.client_mappings',
+    'kms_crypto': 'services.key_management.src.oci_cli_kms_crypto.generated.client_mappings',
+    'kms_management': 'services.key_management.src.oci_cli_kms_management.generated.client_mappings',
+    'kms_vault': 'services.key_management.src.oci_cli_kms_vault.generated.client_mappings',
+    'limits': 'services.limits.src.oci_cli_limits.generated.client_mappings',
+    'load_balancer': 'services.load_balancer.src.oci_cli_load_balancer.generated.client_mappings',
+    'monitoring': 'services.monitoring.src.oci_cli_monitoring.generated.client_mappings',
+    'notification_control_plane': 'services.ons.src.oci_cli_notification_control_plane.generated.client_mappings',
+    'notification_data_plane': 'services.ons.src.oci_cli_notification_data_plane.generated.client_mappings',
+    'object_storage': 'services.object_storage.src.oci_cli_object_storage.generated.client_mappings',
+    'oce_instance': 'services.oce.src.oci_cli_oce_instance.generated.client_mappings',
+    'oda': 'services.oda.src.oci_cli_oda.generated.client_mappings',
+    'quotas': 'services.limits.src.oci_cli_quotas.generated.client_mappings',
+    'redirect': 'services.waas.src.oci_cli_redirect.generated.client_mappings',
+    'resource_manager': 'services.resource_manager.src.oci_cli_resource_manager.generated.client_mappings',
+    'resource_search': 'services.resource_search.src.oci_cli_resource_search.generated.client_mappings',
+    'shipping_vendors': 'services.dts.src.oci_cli_shipping_vendors.generated.client_mappings',
+    'stream': 'services.streaming.src.oci_cli_stream.generated.client_mappings',
+    'stream_admin': 'services.streaming.src.oci_cli_stream_admin.generated.client_mappings',
+    'transfer_appliance': 'services.dts.src.oci_cli_transfer_appliance.generated.client_mappings',
+    'transfer_appliance_entitlement': 'services.dts.src.oci_cli_transfer_appliance_entitlement.generated.client_mappings',
+    'transfer_device': 'services.dts.src.oci_cli_transfer_device.generated.client_mappings',
+    'transfer_job': 'services.dts.src.oci_cli_transfer_job.generated.client_mappings',
+    'transfer_package': 'services.dts.src.oci_cli_transfer_package.generated.client_mappings',
+    'virtual_network': 'services.core.src.oci_cli_virtual_network.generated.client_mappings',
+    'waas': 'services.waas.src.oci_cli_waas.generated.client_mappings',
+    'work_request': 'services.work_requests.src.oci_cli_work_request.generated.client_mappings'
+}
+
+TYPE_MAPPINGS_MODULES = {
+    'analytics': 'services.analytics.src.oci_cli_analytics.generated.client_mappings',
+    'announcements_service': 'services.announcements_service.src.oci_cli_announcement.generated.client_mappings',
+    'audit': 'services.audit.src.oci_cli_audit.generated.client_mappings',
+    'autoscaling': 'services.autoscaling.src.oci_cli_auto_scaling.generated.client_mappings',
+    'budget': 'services.budget.src.oci_cli_budget.generated.client_mappings',
+    'container_engine': 'services.container_engine.src.oci_cli_container_engine.generated.client_mappings',
+    'core': 'services.core.src.oci_cli_blockstorage.generated.client_mappings',
+    'database': 'services.database.src.oci_cli_database.generated.client_mappings',
+    'dns': 'services.dns.src.oci_cli_dns.generated.client_mappings',
+    'dts': 'services.dts.src.oci_cli_shipping_vendors.generated.client_mappings',
+    'email': 'services.email.src.oci_cli_email.generated.client_mappings',
+    'events': 'services.events.src.oci_cli_events.generated.client_mappings',
+    'file_storage': 'services.file_storage.src.oci_cli_file_storage.generated.client_mappings',
+    'functions': 'services.functions.src.oci_cli_functions_invoke.generated.client_mappings',
+    'healthchecks': 'services.healthchecks.src.oci_cli_health_checks.generated.client_mappings',
+    'identity': 'services.identity.src.oci_cli_identity.generated.client_mappings',
+    'integration': 'services.integration.src.oci_cli_integration_instance.generated.client_mappings',
+    'key_management': 'services.key_management.src.oci_cli_kms_crypto.generated.client_mappings',
+    'limits': 'services.limits.src.oci_cli_limits.generated.client_mappings',
+    'load_balancer': 'services.load_balancer.src.oci_cli_load_balancer.generated.client_mappings',
+    'monitoring': 'services.monitoring.src.oci_cli_monitoring.generated.client_mappings',
+    'object_storage': 'services.object_storage.src.oci_cli_object_storage.generated.client_mappings',
+    'oce': 'services.oce.src.oci_cli_oce_instance.generated.client_mappings',
+    'oda': 'services.oda.src.oci_cli_oda.generated.client_mappings',
+    'ons': 'services.ons.src.oci_cli_notification_control_plane.generated.client_mappings',
+    'resource_manager': 'services.resource_manager.src.oci_cli_resource_manager.generated.client_mappings',
+    'resource_search': 'services.resource_search.src.oci_cli_resource_search.generated.client_mappings',
+    'streaming': 'services.streaming.src.oci_cli_stream.generated.client_mappings',
+    'waas': 'services.waas.src.oci_cli_redirect.generated.client_mappings',
+    'work_requests': 'services.work_requests.src.oci_cli_work_request.generated.client_mappings'
+}
@@ -0,0 +1,190 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import importlib
+import os
+import pkgutil
+import re
+import six
+import threading
+
+from .aliasing import CommandGroupWithAlias
+from . import service_index
+
+ALL_SERVICES_DIR = "services"
+
+# Directories under services/ whose generated and extended modules have already been imported
+LOADED_SERVICE_DIRS = set()
+
+# Commands can be resolved from several threads at once (e.g. by "oci batch run")
+_load_lock = threading.RLock()
+
+CLIENT_MAPPINGS_MODULE_PATTERN = re.compile(r'^(CLIENT_MAP|MODULE_TO_TYPE_MAPPINGS)\["([^"]+)"\]', re.MULTILINE)
+
+
+def get_services_dir():
+    # Inline import as the package sets up the platformization directories on the python path before importing us
+    import oci_cli
+    return oci_cli.services_dir
+
+
+def list_service_dirs():
+    return [modname for _, modname, _ in pkgutil.iter_modules(path=[get_services_dir()])]
+
+
+def iter_service_packages(service_dir_name):
+    """Yields (package module name, package directory) for each oci_cli_<service> package in a service directory."""
+    src_dir = os.path.join(get_services_dir(), service_dir_name, 'src')
+    for _, modname, ispkg in pkgutil.iter_modules(path=[src_dir]):
+        if ispkg and modname.startswith("oci_cli_"):
+            yield '{}.{}.src.{}'.format(ALL_SERVICES_DIR, service_dir_name, modname), os.path.join(src_dir, modname)
+
+
+def iter_service_module_names(service_dir_name):
+    """Yields the generated and extended modules for a service directory, in the order they need to be imported."""
+    for package_name, package_dir in iter_service_packages(service_dir_name):
+        yield package_name
+
+        service_name = package_name.split('.')[-1][8:]
+        generated_module = service_name.replace('_', '') + "_cli"
+        if os.path.isfile(os.path.join(package_dir, 'generated', generated_module + ".py")):
+            yield package_name + ".generated." + generated_module
+
+        for file_name in os.listdir(package_dir):
+            if 'extended' in file_name and os.path.isfile(os.path.join(package_dir, file_name)):
+                yield package_name + "." + file_name[:-3]
+
+
+def load_service(service_dir_name):
+    """Imports the generated and extended code for a single directory under services/."""
+    # Inline import to avoid a circular dependency
+    from . import final_command_processor
+
+    with _load_lock:
+        if service_dir_name in LOADED_SERVICE_DIRS:
+            return
+
+        LOADED_SERVICE_DIRS.add(service_dir_name)
+        for module_name in iter_service_module_names(service_dir_name):
+            importlib.import_module(module_name)
+
+        final_command_processor.process()
+
+
+def load_all_services():
+    for service_dir_name in list_service_dirs():
+        load_service(service_dir_name)
+
+
+def load_services_for_command(cmd_name):
+    """Loads the service which provides the given top level command.
+
+    Returns False if the command is not in the service index, which is the case when the index is stale or the command
+    does not exist at all.
+    """
+    service_dir_name = service_index.COMMAND_TO_SERVICE_DIR.get(cmd_name)
+    if service_dir_name is None:
+        return False
+
+    load_service(service_dir_name)
+    return True
+
+
+class LazyServiceCommandGroup(CommandGroupWithAlias):
+    """The root command group. Services are only imported when one of their top level commands is invoked.
+
+    The names and short help of top level commands come from service_index.py so that "oci --help" can list every
+    command without importing any of the generated code.
+    """
+
+    def list_commands(self, ctx):
+        return sorted(set(self.commands) | set(service_index.COMMAND_TO_SERVICE_DIR))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands:
+            candidate_names = [cmd_name]
+            if ctx.obj:
+                candidate_names.append(ctx.obj.get('global_command_alias', {}).get(cmd_name))
+                candidate_names.append(ctx.obj.get('command_sequence_alias', {}).get(self.get_command_chain(ctx), {}).get(cmd_name))
+
+            loaded = False
+            for name in candidate_names:
+                if name and name not in self.commands:
+                    loaded = load_services_for_command(name) or loaded
+
+            if not loaded:
+                # Either the command doesn't exist or the index is out of date, so fall back to loading everything
+                load_all_services()
+
+        return CommandGroupWithAlias.get_command(self, ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        rows = []
+        for subcommand in self.list_commands(ctx):
+            cmd = self.commands.get(subcommand)
+            if cmd is not None:
+                rows.append((subcommand, cmd.short_help or ''))
+            else:
+                rows.append((subcommand, service_index.COMMAND_SHORT_HELP.get(subcommand, '')))
+
+        if rows:
+            with formatter.section('Commands'):
+                formatter.write_dl(rows)
+
+
+def build_service_index():
+    """Loads every service and returns the contents of service_index.py as a dictionary."""
+    from . import cli_root
+
+    load_all_services()
+
+    command_to_service_dir = {}
+    command_short_help = {}
+    for name, command in six.iteritems(cli_root.cli.commands):
+        module_name = command.callback.__module__ if command.callback else ''
+        if not module_name.startswith(ALL_SERVICES_DIR + '.'):
+            # Commands defined in oci_cli itself (e.g. setup, session) are always loaded
+            continue
+
+        command_to_service_dir[name] = module_name.split('.')[1]
+        command_short_help[name] = command.short_help or ''
+
+    client_mappings_modules = {}
+    type_mappings_modules = {}
+    for service_dir_name in sorted(list_service_dirs()):
+        for package_name, package_dir in iter_service_packages(service_dir_name):
+            client_mappings_file = os.path.join(package_dir, 'generated', 'client_mappings.py')
+            if not os.path.isfile(client_mappings_file):
+                continue
+
+            with open(client_mappings_file, 'r') as f:
+                contents = f.read()
+
+            for mapping, key in CLIENT_MAPPINGS_MODULE_PATTERN.findall(contents):
+                target = client_mappings_modules if mapping == 'CLIENT_MAP' else type_mappings_modules
+                target.setdefault(key, package_name + '.generated.client_mappings')
+
+    return {
+        'COMMAND_TO_SERVICE_DIR': command_to_service_dir,
+        'COMMAND_SHORT_HELP': command_short_help,
+        'CLIENT_MAPPINGS_MODULES': client_mappings_modules,
+        'TYPE_MAPPINGS_MODULES': type_mappings_modules
+    }
+
+
+def write_service_index(file_location=None):
+    if file_location is None:
+        file_location = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'service_index.py')
+
+    index = build_service_index()
+    with open(file_location, 'w') as f:
+        f.write('# coding: utf-8\n')
+        f.write('# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.\n\n')
+        f.write('# This file is generated by oci_cli.service_loader.write_service_index(). Do not edit it by hand.\n')
+        f.write('# It lets the CLI resolve top level commands and clients without importing every service.\n')
+        for name in ['COMMAND_TO_SERVICE_DIR', 'COMMAND_SHORT_HELP', 'CLIENT_MAPPINGS_MODULES', 'TYPE_MAPPINGS_MODULES']:
+            f.write('\n{} = {{\n'.format(name))
+            entries = sorted(six.iteritems(index[name]))
+            for i, (key, value) in enumerate(entries):
+                f.write('    {!r}: {!r}{}\n'.format(str(key), str(value), ',' if i < len(entries) - 1 else ''))
+            f.write('}\n')
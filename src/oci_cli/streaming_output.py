@@ -0,0 +1,230 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import csv
+import json
+
+import six
+from terminaltables import AsciiTable
+from terminaltables.width_and_alignment import max_dimensions, visible_width
+
+try:
+    import collections.abc as abc
+except ImportError:
+    import collections as abc
+
+# Output formats which can be written an item at a time as the pages of a list call are received
+STREAMED_OUTPUT_FORMATS = ['ndjson', 'csv', 'tsv', 'table']
+
+# Marks the end of a cell which is too wide for the column widths taken from the sample of rows
+TRUNCATION_MARKER = '...'
+
+
+def get_writer(output, stream, sample_rows):
+    """Returns the writer for the output format.
+
+    The delimited and table writers take their columns (and for tables, the column widths) from the first sample_rows
+    items, so at most that many items are held in memory. Items which come later are written using the same columns.
+    """
+    if output == 'ndjson':
+        return NdjsonWriter(stream)
+    elif output == 'csv':
+        return DelimitedWriter(stream, ',', sample_rows)
+    elif output == 'tsv':
+        return DelimitedWriter(stream, '\t', sample_rows)
+    elif output == 'table':
+        return TableWriter(stream, sample_rows)
+
+    raise ValueError('Output format {} cannot be streamed'.format(output))
+
+
+def write_all(writer, data):
+    """Writes the data (a list of items, or a single item) with the writer."""
+    if isinstance(data, list):
+        for item in data:
+            writer.write(item)
+    else:
+        writer.write(data)
+
+    writer.close()
+
+
+class NdjsonWriter(object):
+    """Writes each item as a line of compact JSON."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, item):
+        self.stream.write(json.dumps(item, separators=(',', ':')) + '\n')
+
+    def flush(self):
+        self.stream.flush()
+
+    def close(self):
+        self.flush()
+
+
+class SampledRowWriter(object):
+    """Base class for writers which lay items out in columns.
+
+    The columns are chosen the same way as for --output table: the sorted keys of dicts, Column1..ColumnN for lists,
+    and Column1 for strings and other values. They are taken from the first sample_rows items (or all of the items if
+    sample_rows is None), which are held until the sample is complete.
+    """
+
+    def __init__(self, stream, sample_rows):
+        self.stream = stream
+        self.sample_rows = sample_rows
+        self.sample = []
+        self.columns = None
+        self.is_mapping = False
+
+    def write(self, item):
+        if self.columns is not None:
+            self.write_row(self.build_row(item))
+            return
+
+        self.sample.append(item)
+        if self.sample_rows is not None and len(self.sample) >= self.sample_rows:
+            self._start()
+
+    def flush(self):
+        self.stream.flush()
+
+    def close(self):
+        if self.columns is None and self.sample:
+            self._start()
+
+        if self.columns is not None:
+            self.write_end()
+        self.flush()
+
+    def build_row(self, item):
+        if self.is_mapping:
+            if isinstance(item, abc.Mapping):
+                return [item.get(key, '') for key in self.columns]
+            return [item]
+        elif isinstance(item, list):
+            return item[:len(self.columns)]
+
+        return [item]
+
+    def _start(self):
+        first = self.sample[0]
+        if isinstance(first, abc.Mapping):
+            self.is_mapping = True
+            keys = set()
+            for item in self.sample:
+                if isinstance(item, abc.Mapping):
+                    keys.update(item.keys())
+            self.columns = sorted(keys)
+        elif isinstance(first, list):
+            self.columns = ['Column{}'.format(number) for number in range(1, len(first) + 1)]
+        else:
+            self.columns = ['Column1']
+
+        sample = self.sample
+        self.sample = None
+        self.write_start([self.build_row(item) for item in sample])
+
+    def write_start(self, sample_rows):
+        raise NotImplementedError()
+
+    def write_row(self, row):
+        raise NotImplementedError()
+
+    def write_end(self):
+        pass
+
+
+class DelimitedWriter(SampledRowWriter):
+    """Writes a header line with the columns, then a line for each item. Values which are not strings are written as
+    JSON, and missing values are left empty."""
+
+    def __init__(self, stream, delimiter, sample_rows):
+        super(DelimitedWriter, self).__init__(stream, sample_rows)
+        self.writer = csv.writer(stream, delimiter=delimiter, lineterminator='\n')
+
+    def write_start(self, sample_rows):
+        self.writer.writerow(self.columns)
+        for row in sample_rows:
+            self.write_row(row)
+
+    def write_row(self, row):
+        self.writer.writerow([_format_delimited_value(value) for value in row])
+
+
+def _format_delimited_value(value):
+    if value is None:
+        return ''
+    elif isinstance(value, six.string_types):
+        return value
+
+    return json.dumps(value, sort_keys=True, separators=(',', ':'))
+
+
+class TableWriter(SampledRowWriter):
+    """Writes the same table as terminaltables.AsciiTable, with the column widths measured over the sample of rows.
+
+    Once the sample has been written each later row is written as it arrives, with any cell lines wider than the
+    column cut short and ending in '...'. If all of the items fit in the sample, the table is exactly the one that
+    AsciiTable would give.
+    """
+
+    def __init__(self, stream, sample_rows):
+        super(TableWriter, self).__init__(stream, sample_rows)
+        self.table = AsciiTable([])
+        self.inner_widths = None
+        self.bottom_border = None
+
+    def write_start(self, sample_rows):
+        table_data = [self.columns] + sample_rows
+        self.table.table_data = table_data
+        self.inner_widths, inner_heights, outer_widths = max_dimensions(table_data, self.table.padding_left, self.table.padding_right)[:3]
+
+        # The bottom border is held back until the rows after the sample have been written. Lines are joined as they
+        # are generated, since terminaltables reuses the lists it yields for multi-line rows
+        lines = [''.join(line) for line in self.table.gen_table(self.inner_widths, inner_heights, outer_widths)]
+        self.bottom_border = lines.pop()
+        for line in lines:
+            self._write_line(line)
+
+    def write_row(self, row):
+        row = [self._fit_cell(cell, width) for cell, width in zip(row, self.inner_widths)]
+        height = max([cell.count('\n') + 1 for cell in row if cell] or [0])
+        for line in self.table.gen_row_lines(row, 'row', self.inner_widths, height):
+            self._write_line(line)
+
+    def write_end(self):
+        self._write_line(self.bottom_border)
+
+    def _write_line(self, line):
+        self.stream.write(''.join(line) + '\n')
+
+    @staticmethod
+    def _fit_cell(cell, width):
+        if not hasattr(cell, 'count') or not hasattr(cell, 'splitlines'):
+            cell = str(cell)
+
+        return '\n'.join(truncate(line, width) for line in cell.splitlines()) if cell else cell
+
+
+def truncate(line, width):
+    """Returns the line, cut short with '...' if it is wider than width when displayed."""
+    if visible_width(line) <= width:
+        return line
+
+    marker = TRUNCATION_MARKER if width > len(TRUNCATION_MARKER) else ''
+    available = width - len(marker)
+
+    # Find the longest prefix which fits (display widths only increase with the length of the prefix)
+    low, high = 0, len(line)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if visible_width(line[:middle]) <= available:
+            low = middle
+        else:
+            high = middle - 1
+
+    return line[:low] + marker
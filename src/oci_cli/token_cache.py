@@ -0,0 +1,195 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import contextlib
+import errno
+import hashlib
+import json
+import os
+import tempfile
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from . import cli_constants
+from .file_utils import replace_file
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+KEY_FILE_NAME = '.key'
+METRICS_FILE_NAME = 'metrics.json'
+ENTRY_FILE_SUFFIX = '.token'
+LOCK_FILE_SUFFIX = '.lock'
+
+
+class TokenCache(object):
+    """An encrypted on-disk cache of short lived credentials, shared by all of the CLI processes run by a user.
+
+    The credentials are protected by file permissions: the entries are written as files only the current user can read
+    and write (0600), and a cache directory created by the CLI is only accessible by the current user (0700). Entries are
+    also encrypted, but with a key kept in the cache directory, so the encryption only stops the credentials being read
+    by accident (e.g. by tools searching files for tokens). It is not a security boundary: anyone who can read the cache
+    directory can decrypt the entries.
+
+    Fetching a new entry holds an exclusive lock on it, so when many CLI processes start at the same time only one of
+    them fetches the credential and the others wait and reuse it.
+
+    Problems reading or writing the cache are not fatal, the credential is just fetched without caching it.
+    """
+
+    def __init__(self, cache_dir=None):
+        if not cache_dir:
+            cache_dir = os.environ.get(cli_constants.OCI_CLI_TOKEN_CACHE_DIR_ENV_VAR, cli_constants.TOKEN_CACHE_DEFAULT_LOCATION)
+
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        self._fernet = None
+
+    def get(self, category, key, fetch, is_valid):
+        """Returns the cached entry for the key if is_valid(entry) is true. Otherwise calls fetch() for a new entry,
+        and caches and returns it.
+
+        :param str category: The kind of credential (e.g. instance_principal). This is used to name the cache files
+            and to group the cache metrics.
+        :param dict key: Identifies the entry within the category. It must be serializable to JSON.
+        :param fetch: A function returning a new entry as a dictionary which can be serialized to JSON.
+        :param is_valid: A function which returns whether an entry can be used.
+        """
+        try:
+            self._prepare()
+        except (IOError, OSError, ValueError):
+            return fetch()
+
+        name = self._get_entry_name(category, key)
+        entry = self._read_entry(name)
+        if entry is not None and is_valid(entry):
+            self._record(category, 'hits')
+            return entry
+
+        with self._locked(name):
+            # Another process may have fetched the entry while we were waiting for the lock
+            entry = self._read_entry(name)
+            if entry is not None and is_valid(entry):
+                self._record(category, 'hits')
+                return entry
+
+            entry = fetch()
+            self._write_entry(name, entry)
+            self._record(category, 'misses')
+            return entry
+
+    def get_metrics(self):
+        """Returns the number of hits and misses for each category of credential."""
+        try:
+            with open(os.path.join(self.cache_dir, METRICS_FILE_NAME), 'r') as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def clear(self):
+        """Removes every entry, the metrics and the encryption key from the cache."""
+        if not os.path.isdir(self.cache_dir):
+            return
+
+        for file_name in os.listdir(self.cache_dir):
+            if file_name.endswith(ENTRY_FILE_SUFFIX) or file_name in [KEY_FILE_NAME, METRICS_FILE_NAME]:
+                os.remove(os.path.join(self.cache_dir, file_name))
+
+        self._fernet = None
+
+    def _prepare(self):
+        if not os.path.isdir(self.cache_dir):
+            # Only a directory the CLI creates is restricted to the current user. The permissions of a directory chosen
+            # with OCI_CLI_TOKEN_CACHE_DIR are left as they are
+            try:
+                os.makedirs(self.cache_dir, 0o700)
+                os.chmod(self.cache_dir, 0o700)
+            except OSError as e:
+                # Another process may have created it first
+                if e.errno != errno.EEXIST:
+                    raise
+
+        if self._fernet is None:
+            key_file = os.path.join(self.cache_dir, KEY_FILE_NAME)
+            if not os.path.isfile(key_file):
+                with self._locked(KEY_FILE_NAME):
+                    if not os.path.isfile(key_file):
+                        self._write_file(key_file, Fernet.generate_key())
+
+            with open(key_file, 'rb') as f:
+                self._fernet = Fernet(f.read().strip())
+
+    def _get_entry_name(self, category, key):
+        key_hash = hashlib.sha256(json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()
+        return '{}-{}'.format(category, key_hash[:32])
+
+    def _read_entry(self, name):
+        try:
+            with open(os.path.join(self.cache_dir, name + ENTRY_FILE_SUFFIX), 'rb') as f:
+                return json.loads(self._fernet.decrypt(f.read()).decode('utf-8'))
+        except (IOError, OSError, InvalidToken, ValueError):
+            return None
+
+    def _write_entry(self, name, entry):
+        try:
+            self._write_file(os.path.join(self.cache_dir, name + ENTRY_FILE_SUFFIX), self._fernet.encrypt(json.dumps(entry).encode('utf-8')))
+        except (IOError, OSError):
+            pass
+
+    def _record(self, category, event):
+        try:
+            with self._locked(METRICS_FILE_NAME):
+                metrics = self.get_metrics()
+                counters = metrics.setdefault(category, {})
+                counters[event] = counters.get(event, 0) + 1
+                self._write_file(os.path.join(self.cache_dir, METRICS_FILE_NAME), json.dumps(metrics, sort_keys=True).encode('utf-8'))
+        except (IOError, OSError):
+            pass
+
+    def _write_file(self, path, data):
+        # Write to a temporary file (which mkstemp creates with 0600 permissions) and rename it over the target, so
+        # readers never see a partially written file
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            replace_file(temp_path, path)
+        except Exception:
+            os.remove(temp_path)
+            raise
+
+    @contextlib.contextmanager
+    def _locked(self, name):
+        try:
+            lock_file = open(os.path.join(self.cache_dir, name + LOCK_FILE_SUFFIX), 'a+')
+        except (IOError, OSError):
+            # Carry on without the lock, at worst more than one process fetches the same credential
+            yield
+            return
+
+        try:
+            _lock(lock_file)
+            try:
+                yield
+            finally:
+                _unlock(lock_file)
+        finally:
+            lock_file.close()
+
+
+def _lock(f):
+    if fcntl:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock(f):
+    if fcntl:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
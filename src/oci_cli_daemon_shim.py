@@ -0,0 +1,157 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+"""Lightweight client for the OCI CLI daemon (see "oci daemon start").
+
+This module deliberately only uses the standard library so that it starts quickly. It forwards the command line,
+environment, working directory and (on demand) stdin of the current process to the daemon over a Unix domain socket
+and streams stdout, stderr and the exit code back. If no daemon is running the command is run in process instead.
+
+Messages in both directions are framed as a 1 byte message type followed by a 4 byte big endian payload length.
+"""
+
+import json
+import os
+import socket
+import struct
+import sys
+
+DAEMON_SOCKET_ENV_VAR = 'OCI_CLI_DAEMON_SOCKET'
+DEFAULT_SOCKET_FILE = os.path.join('~', '.oci', 'cli-daemon.sock')
+
+# Sent by the client
+MESSAGE_REQUEST = b'R'
+MESSAGE_CONTROL = b'C'
+MESSAGE_STDIN = b'I'
+
+# Sent by the daemon
+MESSAGE_STDOUT = b'O'
+MESSAGE_STDERR = b'E'
+MESSAGE_STDIN_REQUEST = b'N'
+MESSAGE_EXIT = b'X'
+MESSAGE_CONTROL_RESPONSE = b'S'
+
+HEADER = struct.Struct('>cI')
+STDIN_CHUNK_SIZE = 64 * 1024
+
+
+def get_socket_file(socket_file=None):
+    return os.path.abspath(os.path.expanduser(socket_file or os.environ.get(DAEMON_SOCKET_ENV_VAR) or DEFAULT_SOCKET_FILE))
+
+
+def connect(socket_file):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_file)
+    except Exception:
+        sock.close()
+        raise
+
+    return sock
+
+
+def send_message(sock, message_type, payload=b''):
+    sock.sendall(HEADER.pack(message_type, len(payload)) + payload)
+
+
+def send_json(sock, message_type, obj):
+    send_message(sock, message_type, json.dumps(obj).encode('utf-8'))
+
+
+def recv_message(sock):
+    """Returns a (message type, payload) tuple, or (None, None) if the other side closed the connection."""
+    header = _recv_exactly(sock, HEADER.size)
+    if header is None:
+        return None, None
+
+    message_type, length = HEADER.unpack(header)
+    payload = _recv_exactly(sock, length) if length else b''
+    if payload is None:
+        raise EOFError('Connection closed before the end of a message')
+
+    return message_type, payload
+
+
+def _recv_exactly(sock, length):
+    chunks = []
+    remaining = length
+    while remaining:
+        chunk = sock.recv(min(remaining, STDIN_CHUNK_SIZE))
+        if not chunk:
+            if remaining == length:
+                return None
+            raise EOFError('Connection closed before the end of a message')
+
+        chunks.append(chunk)
+        remaining -= len(chunk)
+
+    return b''.join(chunks)
+
+
+def _isatty(stream):
+    try:
+        return stream.isatty()
+    except Exception:
+        return False
+
+
+def forward_command(sock, argv):
+    """Runs a command in the daemon, copying its output to this process. Returns the exit code of the command."""
+    send_json(sock, MESSAGE_REQUEST, {
+        'argv': argv,
+        'env': dict(os.environ),
+        'cwd': os.getcwd(),
+        'stdin_isatty': _isatty(sys.stdin),
+        'stdout_isatty': _isatty(sys.stdout),
+        'stderr_isatty': _isatty(sys.stderr)
+    })
+
+    stdout = getattr(sys.stdout, 'buffer', sys.stdout)
+    stderr = getattr(sys.stderr, 'buffer', sys.stderr)
+    while True:
+        message_type, payload = recv_message(sock)
+        if message_type is None:
+            raise EOFError('The OCI CLI daemon closed the connection without returning an exit code')
+        elif message_type == MESSAGE_STDOUT:
+            stdout.write(payload)
+            stdout.flush()
+        elif message_type == MESSAGE_STDERR:
+            stderr.write(payload)
+            stderr.flush()
+        elif message_type == MESSAGE_STDIN_REQUEST:
+            # stdin is only read when the command asks for it so that commands run in a loop such as
+            # "while read line; do oci ...; done < file" don't consume input meant for the loop
+            stdout.flush()
+            try:
+                chunk = os.read(sys.stdin.fileno(), min(int(payload), STDIN_CHUNK_SIZE))
+            except Exception:
+                chunk = b''
+            send_message(sock, MESSAGE_STDIN, chunk)
+        elif message_type == MESSAGE_EXIT:
+            return json.loads(payload.decode('utf-8'))['exit_code']
+
+
+def main():
+    sock = None
+    if hasattr(socket, 'AF_UNIX'):
+        try:
+            sock = connect(get_socket_file())
+        except (IOError, OSError):
+            sock = None
+
+    if sock is None:
+        # No daemon is running so run the command in this process
+        from oci_cli.cli import cli
+        cli(prog_name='oci')
+        return
+
+    try:
+        exit_code = forward_command(sock, sys.argv[1:])
+    finally:
+        sock.close()
+
+    sys.exit(exit_code)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import json
+import six
+import sys
+import unittest
+from oci_cli import cli_batch
+
+
+class TestCliBatch(unittest.TestCase):
+
+    def run_batch(self, lines, parallelism=4):
+        output = six.StringIO()
+        stdout, stderr = sys.stdout, sys.stderr
+        sys.stdout, sys.stderr = cli_batch.ThreadLocalStream(stdout, 0), cli_batch.ThreadLocalStream(stderr, 1)
+        try:
+            failed_count = cli_batch.run_commands(cli_batch.iter_commands(lines), parallelism, output)
+        finally:
+            sys.stdout, sys.stderr = stdout, stderr
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        return failed_count, {record['line']: record for record in records}
+
+    def test_records_per_command(self):
+        lines = [
+            '# comment\n',
+            'oci os ns get --help\n',
+            '\n',
+            'not-a-command\n',
+            'os object put "unbalanced\n'
+        ]
+        lines.extend(['iam region list --help\n'] * 20)
+
+        failed_count, records = self.run_batch(lines)
+        self.assertEqual(2, failed_count)
+        self.assertEqual(23, len(records))
+
+        self.assertEqual('succeeded', records[2]['status'])
+        self.assertEqual(0, records[2]['exit-code'])
+        self.assertIn('Usage: oci os ns get', records[2]['output'])
+
+        self.assertEqual('failed', records[4]['status'])
+        self.assertEqual(2, records[4]['exit-code'])
+        self.assertIn('No such command', records[4]['error'])
+
+        self.assertEqual('failed', records[5]['status'])
+        self.assertIn('Unable to parse command', records[5]['error'])
+
+        # Output from commands running at the same time must not be mixed up
+        for line_number in range(6, 26):
+            self.assertIn('Usage: oci iam region list', records[line_number]['output'])
+            self.assertNotIn('oci os ns get', records[line_number]['output'])
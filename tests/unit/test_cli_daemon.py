@@ -0,0 +1,91 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import io
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import unittest
+from oci_cli import cli_daemon
+import oci_cli_daemon_shim as daemon_protocol
+
+
+class TestCliDaemon(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.socket_file = os.path.join(self.temp_dir, 'daemon.sock')
+        self.server_socket = cli_daemon.create_server_socket(self.socket_file)
+        self.daemon = cli_daemon.CliDaemon(self.server_socket, self.socket_file)
+
+    def tearDown(self):
+        self.server_socket.close()
+        shutil.rmtree(self.temp_dir)
+
+    def run_in_daemon(self, argv):
+        client, server = socket.socketpair()
+        thread = threading.Thread(target=self.daemon.handle_connection, args=(server,))
+        thread.start()
+
+        daemon_protocol.send_json(client, daemon_protocol.MESSAGE_REQUEST, {'argv': argv, 'env': dict(os.environ), 'cwd': os.getcwd()})
+        output = {daemon_protocol.MESSAGE_STDOUT: b'', daemon_protocol.MESSAGE_STDERR: b''}
+        while True:
+            message_type, payload = daemon_protocol.recv_message(client)
+            if message_type == daemon_protocol.MESSAGE_EXIT:
+                break
+            output[message_type] += payload
+
+        thread.join()
+        client.close()
+        server.close()
+        return json.loads(payload.decode('utf-8'))['exit_code'], output[daemon_protocol.MESSAGE_STDOUT], output[daemon_protocol.MESSAGE_STDERR]
+
+    def test_socket_file_is_only_accessible_by_owner(self):
+        self.assertEqual(0o600, os.stat(self.socket_file).st_mode & 0o777)
+
+    def test_run_command(self):
+        exit_code, stdout, stderr = self.run_in_daemon(['os', 'ns', 'get', '--help'])
+        self.assertEqual(0, exit_code)
+        self.assertIn(b'Usage: oci os ns get', stdout)
+
+        exit_code, stdout, stderr = self.run_in_daemon(['not-a-command'])
+        self.assertEqual(2, exit_code)
+        self.assertIn(b'No such command', stderr)
+        self.assertEqual(2, self.daemon.requests_served)
+
+    def test_daemon_commands_are_answered_by_the_daemon_running_them(self):
+        self.daemon.running = True
+        exit_code, stdout, stderr = self.run_in_daemon(['daemon', 'status', '--socket-file', self.socket_file])
+        self.assertEqual(0, exit_code)
+        self.assertEqual(os.getpid(), json.loads(stdout.decode('utf-8'))['data']['pid'])
+        self.assertTrue(self.daemon.running)
+
+        exit_code, stdout, stderr = self.run_in_daemon(['daemon', 'start', '--socket-file', self.socket_file])
+        self.assertEqual(1, exit_code)
+        self.assertIn(b'cannot be started by a command run by a daemon', stderr)
+
+        exit_code, stdout, stderr = self.run_in_daemon(['daemon', 'stop', '--socket-file', self.socket_file])
+        self.assertEqual(0, exit_code)
+        self.assertIn(b'Stopped CLI daemon', stdout)
+        self.assertFalse(self.daemon.running)
+        self.assertIsNone(cli_daemon.running_daemon)
+
+    def test_stdin_is_read_on_demand(self):
+        client, server = socket.socketpair()
+        stdin = io.TextIOWrapper(io.BufferedReader(cli_daemon.StdinReader(server, False)), encoding='utf-8')
+
+        def serve_stdin():
+            for chunk in [b'first\n', b'second\n', b'']:
+                message_type, payload = daemon_protocol.recv_message(client)
+                self.assertEqual(daemon_protocol.MESSAGE_STDIN_REQUEST, message_type)
+                daemon_protocol.send_message(client, daemon_protocol.MESSAGE_STDIN, chunk)
+
+        thread = threading.Thread(target=serve_stdin)
+        thread.start()
+        self.assertEqual('first\nsecond\n', stdin.read())
+        thread.join()
+        client.close()
+        server.close()
@@ -1,8 +1,12 @@
 # coding: utf-8
 # Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
 
+import base64
 import click
+import hashlib
 import oci
+import os
+import six
 import tempfile
 import unittest
 from oci_cli import cli_util
@@ -141,3 +145,27 @@ class TestCliUtil(unittest.TestCase):
 
         subtype = cli_util.get_possible_subtype_based_on_payload(oci.core.models.InstanceConfigurationInstanceDetails, 'core', payload)
         assert subtype.__class__.__name__ == 'ComputeInstanceDetails'
+
+    def test_verify_checksum(self):
+        data = os.urandom(3000)
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(data)
+        try:
+            expected = base64.b64encode(hashlib.md5(data).digest()).decode('utf-8')
+            self.assertEqual(expected, cli_util.verify_checksum(f.name, True, None))
+
+            reader = cli_util.HashingReader(six.BytesIO(data))
+            while reader.read(1000):
+                pass
+            self.assertEqual(expected, reader.get_checksum())
+
+            # The hashes which the upload calculated for the parts are used, and missing ones are calculated from the file
+            part_md5s = [base64.b64encode(hashlib.md5(data[offset:offset + 1000]).digest()).decode('utf-8') for offset in range(0, 3000, 1000)]
+            multipart_md5 = base64.b64encode(hashlib.md5(b''.join(base64.b64decode(md5) for md5 in part_md5s)).digest()).decode('utf-8') + '-3'
+            parts = [{'offset': offset, 'size': 1000, 'hash': part_md5s[0] if offset == 0 else None} for offset in range(0, 3000, 1000)]
+            ma = Obj()
+            ma.manifest = {'parts': parts}
+            self.assertEqual(multipart_md5, cli_util.verify_checksum(f.name, False, ma))
+            self.assertEqual(multipart_md5, cli_util.verify_checksum(f.name, False, ma, parallel_count=4))
+        finally:
+            os.remove(f.name)
@@ -0,0 +1,116 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import mock
+import oci
+import os
+import shutil
+import tempfile
+import unittest
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from oci_cli import cli_util, client_cache
+
+# Other tests replace cli_util.build_config without restoring it, so keep a reference to the real one
+BUILD_CONFIG = cli_util.build_config
+
+CONFIG_TEMPLATE = """[DEFAULT]
+user=ocid1.user.oc1..aaaaaaaa
+fingerprint=11:22:33:44:55:66:77:88:99:00:aa:bb:cc:dd:ee:ff
+key_file={key_file}
+tenancy=ocid1.tenancy.oc1..aaaaaaaa
+region=us-phoenix-1
+"""
+
+
+class TestClientCache(unittest.TestCase):
+
+    def setUp(self):
+        client_cache.clear()
+        self.build_config_patch = mock.patch.object(cli_util, 'build_config', BUILD_CONFIG)
+        self.build_config_patch.start()
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.key_file = os.path.join(self.temp_dir, 'key.pem')
+        self.config_file = os.path.join(self.temp_dir, 'config')
+
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048, backend=default_backend())
+        with open(self.key_file, 'wb') as f:
+            f.write(private_key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.TraditionalOpenSSL, serialization.NoEncryption()))
+        with open(self.config_file, 'w') as f:
+            f.write(CONFIG_TEMPLATE.format(key_file=self.key_file))
+        os.chmod(self.key_file, 0o600)
+        os.chmod(self.config_file, 0o600)
+
+        self.ctx = mock.MagicMock()
+        self.ctx.obj = {
+            'config_file': self.config_file,
+            'profile': 'DEFAULT',
+            'region': None,
+            'endpoint': None,
+            'cert_bundle': None,
+            'auth': None,
+            'debug': False,
+            'no_retry': False,
+            'request_id': None
+        }
+
+    def tearDown(self):
+        self.build_config_patch.stop()
+        client_cache.clear()
+        shutil.rmtree(self.temp_dir)
+
+    def touch(self, path):
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+    def test_clients_and_signers_are_reused(self):
+        compute_client = cli_util.build_client('compute', self.ctx)
+        self.assertIs(compute_client, cli_util.build_client('compute', self.ctx))
+
+        # Clients for other services share the signer, and the connection pool if they use the same host
+        network_client = cli_util.build_client('virtual_network', self.ctx)
+        object_storage_client = cli_util.build_client('object_storage', self.ctx)
+        self.assertIsNot(compute_client, network_client)
+        self.assertIs(compute_client.base_client.signer, network_client.base_client.signer)
+        self.assertIs(compute_client.base_client.signer, object_storage_client.base_client.signer)
+        self.assertIs(compute_client.base_client.session, network_client.base_client.session)
+        self.assertIsNot(compute_client.base_client.session, object_storage_client.base_client.session)
+
+        self.ctx.obj['region'] = 'us-ashburn-1'
+        self.assertIsNot(compute_client, cli_util.build_client('compute', self.ctx))
+
+    def test_entry_invalidated_when_files_change(self):
+        compute_client = cli_util.build_client('compute', self.ctx)
+
+        self.touch(self.key_file)
+        rebuilt_client = cli_util.build_client('compute', self.ctx)
+        self.assertIsNot(compute_client, rebuilt_client)
+        self.assertIsNot(compute_client.base_client.signer, rebuilt_client.base_client.signer)
+
+        self.touch(self.config_file)
+        self.assertIsNot(rebuilt_client, cli_util.build_client('compute', self.ctx))
+
+    def test_sessions_are_shared_only_with_the_same_proxies(self):
+        def client_with_proxies(proxies):
+            client = mock.MagicMock()
+            client.base_client.endpoint = 'https://iaas.us-phoenix-1.oraclecloud.com'
+            client.base_client.session = oci._vendor.requests.Session()
+            client.base_client.session.proxies = proxies
+            return client
+
+        first = client_with_proxies({'https': 'http://proxy-a:80'})
+        client_cache.share_session(first)
+
+        same_proxy = client_with_proxies({'https': 'http://proxy-a:80'})
+        client_cache.share_session(same_proxy)
+        self.assertIs(first.base_client.session, same_proxy.base_client.session)
+
+        other_proxy = client_with_proxies({'https': 'http://proxy-b:80'})
+        client_cache.share_session(other_proxy)
+        self.assertIsNot(first.base_client.session, other_proxy.base_client.session)
+
+        no_proxy = client_with_proxies({})
+        client_cache.share_session(no_proxy)
+        self.assertIsNot(first.base_client.session, no_proxy.base_client.session)
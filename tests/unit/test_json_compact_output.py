@@ -0,0 +1,32 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import collections
+import json
+import mock
+import six
+import unittest
+from oci_cli import cli_util
+
+
+class TestJsonCompactOutput(unittest.TestCase):
+
+    def test_write_json_compact(self):
+        item = collections.OrderedDict([('z', 1), ('a', [True, None, 1.5]), ('m', {'nested': {'deep': 'value'}})])
+        for data in [{'data': [item, item], 'etag': 'abc'}, [item], {1: 'non-string key'}, 'string', None, [], {}]:
+            stream = mock.MagicMock()
+            with mock.patch.object(cli_util, 'JSON_COMPACT_WRITE_SIZE', 8):
+                cli_util.write_json_compact(data, stream)
+
+            # The output is written in several chunks, and keys stay in their original order
+            output = ''.join(call[0][0] for call in stream.write.call_args_list)
+            self.assertEqual(json.dumps(data, separators=(',', ':')) + '\n', output)
+
+        self.assertGreater(stream.write.call_count, 0)
+
+    def test_render(self):
+        ctx = mock.MagicMock()
+        ctx.obj = {'output': 'json-compact', 'query': None, 'debug': False, 'raw_output': False}
+        with mock.patch('sys.stdout', new_callable=six.StringIO) as stdout:
+            cli_util.render([{'display_name': 'b', 'id': 'a'}], {'etag': 'abc'}, ctx)
+        self.assertEqual('{"data":[{"display_name":"b","id":"a"}],"etag":"abc"}\n', stdout.getvalue())
@@ -0,0 +1,92 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import json
+import mock
+import six
+import unittest
+import jmespath
+import oci
+import oci_cli
+from click.testing import CliRunner
+from oci_cli import cli_util, streaming_output
+
+
+def list_instances(**kwargs):
+    pages = [
+        [{'name': 'a', 'state': 'RUNNING'}, {'name': 'b', 'state': 'STOPPED'}],
+        [{'name': 'c', 'state': 'RUNNING'}]
+    ]
+    index = int(kwargs.get('page') or 0)
+    response = oci.response.Response(200, {}, pages[index], None)
+    if index + 1 < len(pages):
+        response.next_page = str(index + 1)
+    return response
+
+
+class TestNdjsonOutput(unittest.TestCase):
+
+    def setUp(self):
+        self.ctx = mock.MagicMock()
+        self.ctx.obj = {'output': 'ndjson', 'query': None, 'debug': False, 'canned_queries': {}}
+
+    def list_all(self, stream_items=True, **kwargs):
+        with mock.patch('sys.stdout', new_callable=six.StringIO) as stdout:
+            result = cli_util.list_call_get_all_results(list_instances, ctx=self.ctx, stream_items=stream_items, **kwargs)
+        return result, [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+    def test_items_written_as_pages_are_received(self):
+        result, lines = self.list_all()
+        self.assertEqual(['a', 'b', 'c'], [line['name'] for line in lines])
+        self.assertEqual([], result.data)
+
+    def test_query_applied_per_item(self):
+        self.ctx.obj['query'] = "data[?state=='RUNNING'].name"
+        result, lines = self.list_all()
+        self.assertEqual(['a', 'c'], lines)
+
+    def test_results_gathered_when_they_cannot_be_streamed(self):
+        # Queries over all of the data, sorting, and calls which do not opt in (e.g. those made by extended commands to
+        # gather data) use the aggregated results
+        self.ctx.obj['query'] = 'data[0]'
+        result, lines = self.list_all()
+        self.assertEqual([], lines)
+        self.assertEqual(3, len(result.data))
+
+        self.ctx.obj['query'] = None
+        result, lines = self.list_all(stream_items=False)
+        self.assertEqual([], lines)
+        self.assertEqual(3, len(result.data))
+
+    def test_keys_kept_in_the_order_received(self):
+        item = {'state': 'RUNNING', 'name': 'a', 'defined-tags': {'z': 1, 'a': 2}}
+        self.assertEqual('{"state":"RUNNING","name":"a","defined-tags":{"z":1,"a":2}}', cli_util.ndjson_format(item))
+
+        stream = six.StringIO()
+        streaming_output.NdjsonWriter(stream).write(item)
+        self.assertEqual(cli_util.ndjson_format(item) + '\n', stream.getvalue())
+
+    def test_generated_list_commands_stream_items(self):
+        client = mock.Mock()
+        client.list_users.side_effect = list_instances
+        with mock.patch.object(cli_util, 'build_client', return_value=client):
+            with mock.patch.object(cli_util, 'render_response') as render_response:
+                result = CliRunner().invoke(oci_cli.cli, ['iam', 'user', 'list', '--compartment-id', 'ocid1.tenancy.oc1..aaaaaaaa', '--all', '--output', 'ndjson'])
+
+        self.assertEqual(0, result.exit_code, result.output)
+        self.assertEqual(['a', 'b', 'c'], [json.loads(line)['name'] for line in result.output.splitlines()])
+        self.assertEqual([], render_response.call_args[0][0].data)
+
+    def test_build_item_query(self):
+        item = {'name': 'a', 'state': 'RUNNING', 'tags': ['x', 'y']}
+        for query, values in [('data', [item]),
+                              ('data[*]', [item]),
+                              ('data[]', [item]),
+                              ('data[*].name', ['a']),
+                              ('data[*].missing', []),
+                              ("data[?state=='RUNNING'].{n: name}", [{'n': 'a'}]),
+                              ("data[?state=='STOPPED']", [])]:
+            self.assertEqual(values, cli_util.build_item_query(jmespath.compile(query))(item), query)
+
+        for query in ['data[0]', 'length(data)', 'data[*].name | [0]', 'etag']:
+            self.assertIsNone(cli_util.build_item_query(jmespath.compile(query)), query)
@@ -0,0 +1,91 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import mock
+import os
+import threading
+import time
+import unittest
+import oci
+from oci import dns
+from oci_cli import cli_util, page_prefetcher
+
+
+class FakeListCall(object):
+    """Returns the given pages of data, recording the page token of each call."""
+
+    def __init__(self, pages, fail_on_page=None):
+        self.pages = pages
+        self.fail_on_page = fail_on_page
+        self.requested_pages = []
+        self.lock = threading.Lock()
+
+    def __call__(self, **kwargs):
+        page = kwargs.get('page')
+        with self.lock:
+            self.requested_pages.append(page)
+        index = int(page) if page else 0
+        if index == self.fail_on_page:
+            raise RuntimeError('failed to fetch page {}'.format(index))
+
+        response = oci.response.Response(200, {}, self.pages[index], None)
+        if index + 1 < len(self.pages):
+            response.next_page = str(index + 1)
+        return response
+
+
+class TestPagePrefetcher(unittest.TestCase):
+
+    def test_pages_returned_in_order(self):
+        for depth in [0, 1, 3]:
+            list_call = FakeListCall([[1, 2], [3], [4, 5]])
+            pages = list(page_prefetcher.iterate_pages(list_call, depth, compartment_id='c'))
+            self.assertEqual([[1, 2], [3], [4, 5]], [page.data for page in pages])
+            self.assertEqual([None, '1', '2'], list_call.requested_pages)
+
+    def test_pages_fetched_while_processing(self):
+        list_call = FakeListCall([[i] for i in range(10)])
+        pages = page_prefetcher.iterate_pages(list_call, 2)
+
+        next(pages)
+        time.sleep(0.5)
+        # The page being processed, two queued pages and one waiting to be queued
+        self.assertEqual(4, len(list_call.requested_pages))
+
+        # Stopping early stops the fetcher
+        pages.close()
+        time.sleep(0.5)
+        self.assertEqual(4, len(list_call.requested_pages))
+
+    def test_error_raised_after_earlier_pages(self):
+        list_call = FakeListCall([[1], [2], [3]], fail_on_page=2)
+        pages = page_prefetcher.iterate_pages(list_call, 2)
+        self.assertEqual([1], next(pages).data)
+        self.assertEqual([2], next(pages).data)
+        with self.assertRaises(RuntimeError):
+            next(pages)
+
+    def test_prefetch_depth(self):
+        ctx = mock.MagicMock()
+        ctx.obj = {'settings': {'page_prefetch_depth': '5'}}
+        self.assertEqual(5, page_prefetcher.get_prefetch_depth(ctx))
+        with mock.patch.dict(os.environ, {'OCI_CLI_PAGE_PREFETCH_DEPTH': '0'}):
+            self.assertEqual(0, page_prefetcher.get_prefetch_depth(ctx))
+        ctx.obj = {}
+        self.assertEqual(2, page_prefetcher.get_prefetch_depth(ctx))
+
+    def test_list_call_get_all_results(self):
+        Item = type('Item', (object,), {})
+        items = []
+        for name in ['b', 'c', 'a']:
+            item = Item()
+            item.display_name = name
+            items.append(item)
+
+        result = cli_util.list_call_get_all_results(FakeListCall([items[:2], items[2:]]), sort_by='DISPLAYNAME')
+        self.assertEqual(['a', 'b', 'c'], [item.display_name for item in result.data])
+
+        record_pages = [dns.models.RecordCollection(items=[1, 2]), dns.models.RecordCollection(items=[3])]
+        result = cli_util.list_call_get_all_results(FakeListCall(record_pages))
+        self.assertIsInstance(result.data, dns.models.RecordCollection)
+        self.assertEqual([1, 2, 3], result.data.items)
@@ -0,0 +1,86 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import json
+import jmespath
+import mock
+import os
+import shutil
+import tempfile
+import unittest
+from oci_cli import query_cache
+
+DATA = {
+    'data': [
+        {'display-name': 'a', 'lifecycle-state': 'RUNNING', 'shape': 'VM.Standard2.1', 'count': 1},
+        {'display-name': 'b', 'lifecycle-state': 'STOPPED', 'shape': None},
+        {'lifecycle-state': 'RUNNING'},
+        None,
+        'not a dict',
+        ['a', 'list']
+    ]
+}
+
+
+class TestQueryCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.temp_dir, 'oci', 'query-cache.json')
+        self.env_patch = mock.patch.dict(os.environ, {'OCI_CLI_QUERY_CACHE_FILE': self.cache_file})
+        self.env_patch.start()
+        query_cache.clear()
+
+    def tearDown(self):
+        query_cache.clear()
+        self.env_patch.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def test_projection_queries_match_interpreter(self):
+        queries = [
+            'data[*]',
+            'data[*].shape',
+            'data[*].{name: "display-name", state: "lifecycle-state"}',
+            'data[*].["display-name", shape]',
+            'data[?"lifecycle-state"==\'RUNNING\']',
+            'data[?\'RUNNING\'!="lifecycle-state"]."display-name"',
+            'data[?shape==`"VM.Standard2.1"`].{name: "display-name"}',
+            'data[?shape!=\'VM.Standard2.1\'].[shape]'
+        ]
+        for query in queries:
+            expression = query_cache.compile_query(query)
+            self.assertIsInstance(expression, query_cache.ProjectionQuery, query)
+            self.assertEqual(jmespath.search(query, DATA), expression.search(DATA), query)
+            self.assertEqual(jmespath.search(query, {'data': 'not a list'}), expression.search({'data': 'not a list'}), query)
+
+        # Other shapes, and comparisons which have special cases, use the interpreter
+        for query in ['data[0]', 'data[*].tags.a', 'data[?count==`1`]', 'data[?a==b]', 'length(data)', 'etag']:
+            expression = query_cache.compile_query(query)
+            self.assertNotIsInstance(expression, query_cache.ProjectionQuery, query)
+            self.assertEqual(jmespath.search(query, DATA), expression.search(DATA), query)
+
+    def test_expressions_memoized(self):
+        self.assertIs(query_cache.compile_query('data[*].id'), query_cache.compile_query('data[*].id'))
+        self.assertFalse(os.path.exists(self.cache_file))
+
+    def test_canned_query_asts_persisted(self):
+        query = 'data[?"lifecycle-state"==\'RUNNING\'] | [0]'
+        expression = query_cache.compile_query(query, persist=True)
+        query_cache.compile_query('data[*].id', persist=True)
+
+        with open(self.cache_file, 'r') as f:
+            cache = json.load(f)
+        self.assertEqual(jmespath.__version__, cache['jmespath_version'])
+        self.assertEqual(['data[*].id', query], sorted(cache['asts']))
+
+        # A new process loads the AST instead of parsing the query
+        query_cache.clear()
+        with mock.patch('jmespath.compile', side_effect=AssertionError('query was parsed')):
+            self.assertEqual(expression.search(DATA), query_cache.compile_query(query, persist=True).search(DATA))
+
+    def test_failed_write_leaves_no_temporary_file(self):
+        with mock.patch.object(query_cache, 'replace_file', side_effect=OSError('Rename failed')):
+            expression = query_cache.compile_query('data[*].id', persist=True)
+
+        self.assertEqual(jmespath.search('data[*].id', DATA), expression.search(DATA))
+        self.assertEqual([], os.listdir(os.path.dirname(self.cache_file)))
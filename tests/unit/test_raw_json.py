@@ -0,0 +1,72 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import json
+import mock
+import unittest
+import oci
+from oci_cli import cli_util, raw_json
+from services.core.src.oci_cli_compute.generated import compute_cli
+
+INSTANCES = [
+    {
+        'id': 'ocid1.instance.oc1..aaaaaaaa',
+        'displayName': 'instance',
+        'lifecycleState': 'RUNNING',
+        'timeCreated': '2019-11-12T10:30:00.123Z',
+        'freeformTags': {'key_with_underscores': 'value'},
+        'definedTags': {'Operations': {'CostCenter': '42'}},
+        'sourceDetails': {'sourceType': 'image', 'imageId': 'ocid1.image.oc1..aaaaaaaa', 'bootVolumeSizeInGBs': 50},
+        'launchOptions': {'firmware': 'UEFI_64', 'isPvEncryptionInTransitEnabled': False}
+    },
+    {
+        'id': 'ocid1.instance.oc1..bbbbbbbb',
+        'timeCreated': '2019-11-12T10:30:00.000Z',
+        'sourceDetails': {'sourceType': 'bootVolume', 'bootVolumeId': 'ocid1.bootvolume.oc1..aaaaaaaa'}
+    },
+    {
+        'id': 'ocid1.instance.oc1..cccccccc',
+        'timeCreated': '2019-11-12T10:30:00+01:00'
+    }
+]
+
+
+class TestRawJson(unittest.TestCase):
+
+    def setUp(self):
+        self.client = oci.core.ComputeClient({'region': 'us-phoenix-1'}, signer=mock.MagicMock(spec=oci.auth.signers.SecurityTokenSigner))
+        self.response_content = json.dumps(INSTANCES).encode('utf-8')
+
+    def test_output_matches_deserialized_models(self):
+        models = self.client.base_client.deserialize_response_data(self.response_content, 'list[Instance]')
+
+        raw_json.install(self.client)
+        data = self.client.base_client.deserialize_response_data(self.response_content, 'list[Instance]')
+
+        self.assertIsInstance(data, raw_json.RawJsonList)
+        self.assertIs(data, cli_util.to_dict(data))
+        self.assertEqual(cli_util.to_dict(models), data)
+        self.assertEqual('2019-11-12T10:30:00.123000+00:00', data[0]['time-created'])
+        self.assertEqual('2019-11-12T10:30:00+00:00', data[1]['time-created'])
+        self.assertEqual('ocid1.bootvolume.oc1..aaaaaaaa', data[1]['source-details']['boot-volume-id'])
+
+    def test_sort_raw_json_items(self):
+        raw_json.install(self.client)
+        data = self.client.base_client.deserialize_response_data(self.response_content, 'list[Instance]')
+        self.assertEqual(['', '', 'instance'], sorted(cli_util.retrieve_attribute_for_sort(item, 'display_name') for item in data))
+
+    def test_is_enabled(self):
+        ctx = mock.MagicMock()
+        ctx.obj = {'raw_json': True}
+        ctx.command = compute_cli.list_instances
+        self.assertTrue(raw_json.is_enabled(ctx))
+
+        # Commands which may use the response models are not changed
+        ctx.command = compute_cli.launch_instance
+        self.assertFalse(raw_json.is_enabled(ctx))
+
+        ctx.command = compute_cli.get_instance
+        ctx.obj = {'raw_json': False, 'settings': {'raw_json': 'True'}}
+        self.assertTrue(raw_json.is_enabled(ctx))
+        ctx.obj = {'raw_json': False}
+        self.assertFalse(raw_json.is_enabled(ctx))
@@ -0,0 +1,73 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import click
+import json
+import subprocess
+import sys
+import unittest
+from oci_cli import service_index, service_loader
+from oci_cli.aliasing import CommandGroupWithAlias, parameter_alias
+
+
+class TestServiceLoader(unittest.TestCase):
+
+    def test_service_index_is_up_to_date(self):
+        index = service_loader.build_service_index()
+
+        message = 'service_index.py is out of date, regenerate it with oci_cli.service_loader.write_service_index()'
+        self.assertEqual(service_index.COMMAND_TO_SERVICE_DIR, index['COMMAND_TO_SERVICE_DIR'], message)
+        self.assertEqual(service_index.COMMAND_SHORT_HELP, index['COMMAND_SHORT_HELP'], message)
+        self.assertEqual(service_index.CLIENT_MAPPINGS_MODULES, index['CLIENT_MAPPINGS_MODULES'], message)
+        self.assertEqual(service_index.TYPE_MAPPINGS_MODULES, index['TYPE_MAPPINGS_MODULES'], message)
+
+    def test_only_invoked_service_is_loaded(self):
+        # Run in a separate interpreter, as the test session has already loaded every service
+        script = """
+import json, sys
+import oci_cli
+from click.testing import CliRunner
+result = CliRunner().invoke(oci_cli.cli, ['os', 'object', 'put', '--help'])
+services = sorted(set(m.split('.')[1] for m in sys.modules if m.startswith('services.')))
+print(json.dumps({'exit_code': result.exit_code, 'services': services}))
+"""
+        output = subprocess.check_output([sys.executable, '-c', script])
+        result = json.loads(output.decode('utf-8').strip().splitlines()[-1])
+
+        self.assertEqual(0, result['exit_code'])
+        self.assertEqual(['object_storage'], result['services'])
+
+    def test_shortcuts_and_aliases_only_applied_to_resolved_commands(self):
+        @click.group(cls=CommandGroupWithAlias)
+        def group():
+            pass
+
+        @group.command('invoked')
+        @click.option('--compartment-id')
+        @click.option('--availability-domain')
+        def invoked(compartment_id, availability_domain):
+            pass
+
+        @group.command('not-invoked')
+        @click.option('--compartment-id')
+        @click.option('--availability-domain')
+        def not_invoked(compartment_id, availability_domain):
+            pass
+
+        original_aliases = parameter_alias.ALIASES
+        try:
+            parameter_alias.ALIASES = {'--availability-domain': ['--ad']}
+
+            ctx = click.Context(group, obj={'global_command_alias': {}, 'command_sequence_alias': {}})
+            resolved = group.get_command(ctx, 'invoked')
+
+            self.assertEqual(['--compartment-id', '-c'], resolved.params[0].opts)
+            self.assertEqual(['--availability-domain', '--ad'], resolved.params[1].opts)
+            self.assertEqual(['--compartment-id'], not_invoked.params[0].opts)
+            self.assertEqual(['--availability-domain'], not_invoked.params[1].opts)
+
+            # Resolving the command again doesn't add the alias twice
+            group.get_command(ctx, 'invoked')
+            self.assertEqual(['--availability-domain', '--ad'], resolved.params[1].opts)
+        finally:
+            parameter_alias.ALIASES = original_aliases
@@ -0,0 +1,98 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import copy
+import mock
+import six
+import unittest
+import oci
+from oci_cli import cli_util, streaming_output
+
+
+def list_instances(**kwargs):
+    pages = [
+        [{'name': 'a', 'state': 'RUNNING'}, {'name': 'b', 'state': 'STOPPED'}],
+        [{'name': 'a-much-longer-name', 'state': 'RUNNING', 'shape': 'VM'}]
+    ]
+    index = int(kwargs.get('page') or 0)
+    response = oci.response.Response(200, {}, pages[index], None)
+    if index + 1 < len(pages):
+        response.next_page = str(index + 1)
+    return response
+
+
+class TestStreamingOutput(unittest.TestCase):
+
+    def write(self, output, data, sample_rows=None):
+        stream = six.StringIO()
+        streaming_output.write_all(streaming_output.get_writer(output, stream, sample_rows), data)
+        return stream.getvalue()
+
+    def test_table_matches_print_table_when_items_fit_in_sample(self):
+        for data in [[{'name': 'a', 'count': 1, 'tags': {'x': 1}}, {'name': 'multi\nline', 'count': None}, {'name': 'c', 'extra': True}],
+                     ['a', 'b\nc'],
+                     [[1, 2], [3, 'x\ny']],
+                     {'name': 'a', 'ids': [1, 2]}]:
+            with mock.patch('sys.stdout', new_callable=six.StringIO) as stdout:
+                # print_table adds the headers to lists of lists
+                cli_util.print_table(copy.deepcopy(data))
+            self.assertEqual(stdout.getvalue(), self.write('table', data))
+            self.assertEqual(stdout.getvalue(), self.write('table', data, sample_rows=10))
+
+    def test_table_rows_after_sample_fit_sample_widths(self):
+        data = [{'name': 'abcdef', 'id': 1}, {'name': 'a-much-longer-name', 'id': 22}, {'name': 'ab', 'shape': 'VM'}]
+        self.assertEqual('+----+--------+\n'
+                         '| id | name   |\n'
+                         '+----+--------+\n'
+                         '| 1  | abcdef |\n'
+                         '| 22 | a-m... |\n'
+                         '|    | ab     |\n'
+                         '+----+--------+\n', self.write('table', data, sample_rows=1))
+
+    def test_truncate(self):
+        self.assertEqual('abcdef', streaming_output.truncate('abcdef', 6))
+        self.assertEqual('abc...', streaming_output.truncate('abcdefg', 6))
+        self.assertEqual('ab', streaming_output.truncate('abcdefg', 2))
+        # Wide characters take two columns
+        self.assertEqual(u'漢字...', streaming_output.truncate(u'漢字漢字', 7))
+
+    def test_delimited(self):
+        data = [{'name': 'a,b', 'count': 1, 'tags': {'x': 'y'}}, {'name': 'c\td', 'count': None, 'enabled': False}]
+        self.assertEqual('count,enabled,name,tags\n'
+                         '1,,"a,b","{""x"":""y""}"\n'
+                         ',false,c\td,\n', self.write('csv', data))
+        self.assertEqual('count\tenabled\tname\ttags\n'
+                         '1\t\ta,b\t"{""x"":""y""}"\n'
+                         '\tfalse\t"c\td"\t\n', self.write('tsv', data))
+        self.assertEqual('Column1\na\nb\n', self.write('csv', ['a', 'b'], sample_rows=1))
+        self.assertEqual('', self.write('csv', []))
+
+    def test_rows_written_as_pages_are_received(self):
+        ctx = mock.MagicMock()
+        ctx.obj = {'output': 'csv', 'query': None, 'debug': False, 'canned_queries': {}, 'settings': {'output_sample_rows': '2'}}
+
+        with mock.patch('sys.stdout', new_callable=six.StringIO) as stdout:
+            result = cli_util.list_call_get_all_results(list_instances, ctx=ctx, stream_items=True)
+        self.assertEqual([], result.data)
+        # The columns come from the first two items
+        self.assertEqual('name,state\na,RUNNING\nb,STOPPED\na-much-longer-name,RUNNING\n', stdout.getvalue())
+
+        ctx.obj['output'] = 'table'
+        ctx.obj['query'] = "data[?state=='RUNNING'].name"
+        with mock.patch('sys.stdout', new_callable=six.StringIO) as stdout:
+            cli_util.list_call_get_all_results(list_instances, ctx=ctx, stream_items=True)
+        self.assertEqual('+--------------------+\n'
+                         '| Column1            |\n'
+                         '+--------------------+\n'
+                         '| a                  |\n'
+                         '| a-much-longer-name |\n'
+                         '+--------------------+\n', stdout.getvalue())
+
+    def test_output_sample_rows(self):
+        ctx = mock.MagicMock()
+        ctx.obj = {'settings': {'output_sample_rows': '50'}}
+        self.assertEqual(50, cli_util.get_output_sample_rows(ctx))
+        ctx.obj = {'settings': {'output_sample_rows': 'many'}}
+        self.assertEqual(1000, cli_util.get_output_sample_rows(ctx))
+        ctx.obj = {}
+        self.assertEqual(1000, cli_util.get_output_sample_rows(ctx))
@@ -0,0 +1,47 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import datetime
+import pytz
+import unittest
+from oci import core, object_storage
+from oci_cli import cli_util
+
+
+class TestToDict(unittest.TestCase):
+
+    def test_models(self):
+        instance = core.models.Instance(
+            id='ocid1.instance.oc1..aaaaaaaa',
+            defined_tags={'Operations': {'CostCenter': 42}},
+            metadata={'key_with_underscores': 'value'},
+            source_details=core.models.InstanceSourceViaImageDetails(source_type='image', boot_volume_size_in_gbs=50),
+            time_created=datetime.datetime(2019, 11, 12, 10, 30, 0)
+        )
+
+        for i in range(2):
+            # The second conversion uses the field plans cached by the first
+            as_dict = cli_util.to_dict([instance, (instance,)])
+            self.assertEqual(as_dict[0], as_dict[1][0])
+            instance_dict = as_dict[0]
+            self.assertEqual('ocid1.instance.oc1..aaaaaaaa', instance_dict['id'])
+            self.assertEqual({'Operations': {'CostCenter': 42}}, instance_dict['defined-tags'])
+            self.assertEqual({'key_with_underscores': 'value'}, instance_dict['metadata'])
+            self.assertEqual({'source-type': 'image', 'boot-volume-size-in-gbs': 50, 'image-id': None, 'kms-key-id': None}, instance_dict['source-details'])
+            self.assertEqual('2019-11-12T10:30:00+00:00', instance_dict['time-created'])
+            self.assertIsNone(instance_dict['display-name'])
+            self.assertEqual(set(k.replace('_', '-') for k in instance.swagger_types), set(instance_dict))
+
+    def test_values(self):
+        tz = pytz.timezone('US/Pacific')
+        self.assertEqual('2019-11-12T10:30:00-08:00', cli_util.to_dict(tz.localize(datetime.datetime(2019, 11, 12, 10, 30))))
+        self.assertEqual('10:30:00+00:00', cli_util.to_dict(datetime.time(10, 30)))
+        self.assertEqual('2019-11-12', cli_util.to_dict(datetime.date(2019, 11, 12)))
+        self.assertEqual([True, 1, 1.5, None, 'a'], cli_util.to_dict([True, 1, 1.5, None, 'a']))
+        self.assertEqual([{'name': 'a', 'size': None, 'md5': None, 'time-created': None}], cli_util.to_dict(iter([object_storage.models.ObjectSummary(name='a')])))
+
+    def test_missing_attributes_skipped(self):
+        summary = object_storage.models.ObjectSummary(name='a', size=1)
+        del summary._md5
+        del summary._time_created
+        self.assertEqual({'name': 'a', 'size': 1}, cli_util.to_dict(summary))
@@ -0,0 +1,152 @@
+# coding: utf-8
+# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+
+import mock
+import os
+import shutil
+import stat
+import tempfile
+import threading
+import time
+import unittest
+import oci._vendor.jwt as jwt
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.asymmetric import rsa
+from oci_cli import cached_signers
+from oci_cli.token_cache import TokenCache
+
+
+def build_token(expires_in):
+    token = jwt.encode({'exp': int(time.time()) + expires_in}, 'secret', algorithm='HS256')
+    return token.decode('ascii') if isinstance(token, bytes) else token
+
+
+class TestTokenCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = os.path.join(tempfile.mkdtemp(), 'token-cache')
+        self.fetch_count = 0
+
+    def tearDown(self):
+        shutil.rmtree(os.path.dirname(self.cache_dir))
+
+    def fetch(self):
+        self.fetch_count += 1
+        time.sleep(0.1)
+        return {'token': 'token-{}'.format(self.fetch_count)}
+
+    def test_entries_are_reused_and_encrypted(self):
+        cache = TokenCache(self.cache_dir)
+        self.assertEqual({'token': 'token-1'}, cache.get('test', {'id': 1}, self.fetch, lambda entry: True))
+        self.assertEqual({'token': 'token-1'}, TokenCache(self.cache_dir).get('test', {'id': 1}, self.fetch, lambda entry: True))
+        self.assertEqual({'token': 'token-2'}, cache.get('test', {'id': 2}, self.fetch, lambda entry: True))
+        self.assertEqual({'token': 'token-3'}, cache.get('test', {'id': 1}, self.fetch, lambda entry: False))
+        self.assertEqual({'test': {'hits': 1, 'misses': 3}}, cache.get_metrics())
+
+        self.assertEqual(0o700, stat.S_IMODE(os.stat(self.cache_dir).st_mode))
+        for file_name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, file_name)
+            if file_name.endswith('.token') or file_name == '.key':
+                self.assertEqual(0o600, stat.S_IMODE(os.stat(path).st_mode))
+                with open(path, 'rb') as f:
+                    self.assertNotIn(b'token-', f.read())
+
+        cache.clear()
+        self.assertEqual({}, cache.get_metrics())
+        self.assertEqual({'token': 'token-4'}, cache.get('test', {'id': 1}, self.fetch, lambda entry: True))
+
+    def test_permissions_of_an_existing_directory_are_kept(self):
+        os.makedirs(self.cache_dir, 0o750)
+        os.chmod(self.cache_dir, 0o750)
+        self.assertEqual({'token': 'token-1'}, TokenCache(self.cache_dir).get('test', {'id': 1}, self.fetch, lambda entry: True))
+        self.assertEqual(0o750, stat.S_IMODE(os.stat(self.cache_dir).st_mode))
+
+    def test_concurrent_refresh_fetches_once(self):
+        results = []
+
+        def get():
+            results.append(TokenCache(self.cache_dir).get('test', {'id': 1}, self.fetch, lambda entry: True))
+
+        threads = [threading.Thread(target=get) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(1, self.fetch_count)
+        self.assertEqual([{'token': 'token-1'}] * 8, results)
+
+
+class TestCachedInstancePrincipalsSigner(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.env_patch = mock.patch.dict(os.environ, {'OCI_CLI_TOKEN_CACHE_DIR': self.cache_dir})
+        self.env_patch.start()
+        self.host_patch = mock.patch('socket.gethostname', return_value='first-instance')
+        self.host_patch.start()
+
+    def tearDown(self):
+        self.host_patch.stop()
+        self.env_patch.stop()
+        shutil.rmtree(self.cache_dir)
+
+    def mock_sdk_signer(self, token):
+        sdk_signer = mock.MagicMock()
+        sdk_signer.region = 'us-phoenix-1'
+        sdk_signer.tenancy_id = 'ocid1.tenancy.oc1..aaaaaaaa'
+        sdk_signer.federation_client.get_security_token.return_value = token
+        sdk_signer.federation_client.session_key_supplier.get_key_pair.return_value = {
+            'private': rsa.generate_private_key(public_exponent=65537, key_size=2048, backend=default_backend())
+        }
+        return sdk_signer
+
+    @mock.patch('oci.auth.signers.InstancePrincipalsSecurityTokenSigner')
+    def test_token_reused_until_close_to_expiry(self, sdk_signer_class):
+        first_token = build_token(20 * 60)
+        sdk_signer_class.return_value = self.mock_sdk_signer(first_token)
+
+        signer = cached_signers.get_instance_principals_signer({})
+        self.assertEqual('ST$' + first_token, signer.api_key)
+        self.assertEqual('us-phoenix-1', signer.region)
+
+        delegation_signer = cached_signers.get_instance_principals_signer({}, delegation_token='obo')
+        self.assertEqual('ST$' + first_token, delegation_signer.api_key)
+        self.assertEqual('obo', delegation_signer.delegation_token)
+        self.assertEqual(1, sdk_signer_class.call_count)
+
+        # Tokens within the expiry margin are refreshed
+        second_token = build_token(20 * 60)
+        with mock.patch('time.time', return_value=time.time() + 16 * 60):
+            sdk_signer_class.return_value = self.mock_sdk_signer(second_token)
+            signer = cached_signers.get_instance_principals_signer({})
+
+        self.assertEqual('ST$' + second_token, signer.api_key)
+        self.assertEqual(2, sdk_signer_class.call_count)
+
+    @mock.patch('oci.auth.signers.InstancePrincipalsSecurityTokenSigner')
+    def test_tokens_are_not_shared_between_instances(self, sdk_signer_class):
+        first_token = build_token(20 * 60)
+        sdk_signer_class.return_value = self.mock_sdk_signer(first_token)
+        self.assertEqual('ST$' + first_token, cached_signers.get_instance_principals_signer({}).api_key)
+
+        second_token = build_token(20 * 60)
+        sdk_signer_class.return_value = self.mock_sdk_signer(second_token)
+        with mock.patch('socket.gethostname', return_value='second-instance'):
+            self.assertEqual('ST$' + second_token, cached_signers.get_instance_principals_signer({}).api_key)
+
+        self.assertEqual('ST$' + first_token, cached_signers.get_instance_principals_signer({}).api_key)
+        self.assertEqual(2, sdk_signer_class.call_count)
+
+    @mock.patch('oci.auth.signers.InstancePrincipalsSecurityTokenSigner')
+    def test_cache_hit_makes_no_metadata_requests(self, sdk_signer_class):
+        token = build_token(20 * 60)
+        sdk_signer_class.return_value = self.mock_sdk_signer(token)
+        cached_signers.get_instance_principals_signer({})
+
+        with mock.patch('oci._vendor.requests.Session.request', side_effect=AssertionError('The metadata service was called')) as request:
+            signer = cached_signers.get_instance_principals_signer({})
+
+        self.assertEqual('ST$' + token, signer.api_key)
+        self.assertFalse(request.called)
+        self.assertEqual(1, sdk_signer_class.call_count)